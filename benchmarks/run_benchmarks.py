@@ -0,0 +1,353 @@
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from queue import Empty
+
+import numpy as np
+import pandas as pd
+
+# Depo kökünden çalıştırılmadığında da modüllerin bulunabilmesi için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def make_ohlcv(bars, seed=42, freq="min"):
+    """
+    Sentetik OHLCV verisi üretir (geometrik rastgele yürüyüş).
+
+    Args:
+        bars (int): Bar sayısı.
+        seed (int): Rastgele sayı üreteci tohumu.
+        freq (str): Bar aralığı.
+
+    Returns:
+        pandas.DataFrame: time, open, high, low, close, volume sütunları.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.0005, bars)))
+    open_ = np.empty_like(close)
+    open_[0] = close[0]
+    open_[1:] = close[:-1]
+    spread = np.abs(rng.normal(0, 0.0003, bars)) * close
+    return pd.DataFrame({
+        "time": pd.date_range("2000-01-01", periods=bars, freq=freq),
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": rng.integers(1, 1000, bars).astype(np.float64),
+    })
+
+
+# --- Bileşenler: her biri veriyi hazırlar ve ölçülecek fonksiyonu döner ---
+
+def _executor_incremental(df, tmp_dir):
+    from core.executer import Executor
+    from strategy.exp_moving_average import MovingAverageStrategy
+    data = df.set_index("time")
+    return lambda: Executor(MovingAverageStrategy, data).run()
+
+
+def _executor_full(df, tmp_dir):
+    from core.executer import Executor
+    from strategy.exp_moving_average import MovingAverageStrategy
+    data = df.set_index("time")
+    return lambda: Executor(MovingAverageStrategy, data, incremental=False).run()
+
+
+def _strategy_on_bar(df, tmp_dir):
+    from strategy.exp_moving_average import MovingAverageStrategy
+    data = df.set_index("time")
+
+    def run():
+        strategy = MovingAverageStrategy(data)
+        for bar in data.itertuples():
+            strategy.on_bar(bar)
+            strategy.execute()
+    return run
+
+
+def _strategy_vectorized(df, tmp_dir):
+    from strategy.exp_moving_average import MovingAverageStrategy
+    data = df.set_index("time")
+    return lambda: MovingAverageStrategy(data).generate_positions(data)
+
+
+def _strategy_kernel(df, tmp_dir):
+    from strategy.exp_moving_average import MovingAverageStrategy
+    # İz süren stop derlenmiş çekirdekle hesaplanır; JIT derlemesi ölçüme dahil edilmez
+    data = df.set_index("time")
+    MovingAverageStrategy(data, trailing_stop=0.01).generate_positions(data.iloc[:1000])
+    return lambda: MovingAverageStrategy(data, trailing_stop=0.01).generate_positions(data)
+
+
+def _vectorized_connector(df, tmp_dir):
+    from connectors.vectorized_connector import VectorizedConnector
+    from strategy.exp_moving_average import MovingAverageStrategy
+    data = df.set_index("time")
+    return lambda: VectorizedConnector(MovingAverageStrategy, data).run()
+
+
+def _vectorized_execution(df, tmp_dir):
+    from connectors.vectorized_connector import VectorizedConnector
+    from strategy.exp_moving_average import MovingAverageStrategy
+    # Tüm maliyet modelleri açık: spread sütunu, hacme bağlı kayma, gecikme ve kısmi dolum
+    data = df.set_index("time").assign(spread=((df["high"] - df["low"]).to_numpy() * 1e4).round())
+    execution = {"point": 0.0001, "slippage": 1, "impact": 5, "volume_column": "volume",
+                 "max_participation": 0.001, "latency_bars": 1, "deviation": 20}
+    return lambda: VectorizedConnector(MovingAverageStrategy, data, execution=execution).run()
+
+
+def _backtester_connector(df, tmp_dir):
+    from connectors.backtester_connector import BacktesterConnector, create_data_feed
+    from strategy.exp_moving_average import MovingAverageStrategy
+    return lambda: BacktesterConnector(MovingAverageStrategy, create_data_feed(df, "time", "close")).run()
+
+
+def _csv_load(df, tmp_dir):
+    csv_path = os.path.join(tmp_dir, "bench.csv")
+    df.to_csv(csv_path, index=False)
+    return lambda: pd.read_csv(csv_path, parse_dates=["time"])
+
+
+def _bar_store_load(df, tmp_dir):
+    from data.bar_store import load_bars
+    csv_path = os.path.join(tmp_dir, "bench.csv")
+    df.to_csv(csv_path, index=False)
+    load_bars(csv_path, "time")  # CSV ilk kullanımda depoya dönüştürülür
+    return lambda: load_bars(csv_path, "time")["close"].sum()
+
+
+def _tick_replay(df, tmp_dir):
+    from core.tick_replay import TickReplay
+    from data.tick_store import TickStore
+    from strategy.exp_moving_average import MovingAverageStrategy
+    # Her satır bir tick olarak kullanılır; ask, bid'in üzerine yarım spread eklenerek üretilir
+    store = TickStore(tmp_dir)
+    store.append("BENCH", pd.DataFrame({
+        "time": df["time"],
+        "bid": df["close"].round(5),
+        "ask": (df["close"] + (df["high"] - df["low"]) / 2).round(5),
+    }), digits=5)
+    return lambda: TickReplay(MovingAverageStrategy, store, "BENCH", "M5").run()
+
+
+# Bileşen adı -> (hazırlık fonksiyonu, en fazla bar sayısı). O(n²) veya bar başına
+# yavaş yollar büyük boyutlarda saatler süreceği için sınırlandırılır.
+COMPONENTS = {
+    "executor_incremental": (_executor_incremental, 1_000_000),
+    "executor_full": (_executor_full, 10_000),
+    "strategy_on_bar": (_strategy_on_bar, 1_000_000),
+    "strategy_vectorized": (_strategy_vectorized, None),
+    "strategy_kernel": (_strategy_kernel, None),
+    "vectorized_connector": (_vectorized_connector, None),
+    "vectorized_execution": (_vectorized_execution, None),
+    "backtester_connector": (_backtester_connector, 100_000),
+    "csv_load": (_csv_load, None),
+    "bar_store_load": (_bar_store_load, None),
+    "tick_replay": (_tick_replay, None),
+}
+
+
+def _peak_rss_mb():
+    """
+    Sürecin en yüksek RSS değerini (MB) döner. resource modülü olmayan platformlarda (Windows)
+    psutil kullanılır; o da yoksa None döner ve RSS karşılaştırması atlanır.
+    """
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        memory = psutil.Process().memory_info()
+        # Windows'ta peak_wset en yüksek çalışma kümesidir; diğerlerinde anlık RSS kullanılır
+        return getattr(memory, "peak_wset", memory.rss) / 2 ** 20
+    # ru_maxrss Linux'ta kilobayt, macOS'ta bayt cinsindendir
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def _receive(process, queue, timeout):
+    # Ölçüm sürecinin sonucunu bekler; (sonuç, hata) döner ve sonuç alınamazsa hata açıklaması verilir
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        try:
+            return queue.get(timeout=1.0), None
+        except Empty:
+            if process.exitcode is not None:
+                # Süreç çıkmadan hemen önce yazdığı sonuç hâlâ kuyrukta olabilir
+                try:
+                    return queue.get(timeout=1.0), None
+                except Empty:
+                    return None, f"çıkış kodu {process.exitcode}"
+            if deadline is not None and time.monotonic() > deadline:
+                process.terminate()
+                return None, f"{timeout:g} sn süre doldu"
+
+
+def _measure(component, bars, allocations, queue):
+    # Her ölçüm ayrı süreçte yapılır; böylece en yüksek RSS bileşene özgü olur
+    logging.disable(logging.CRITICAL)
+    setup, _ = COMPONENTS[component]
+    df = make_ohlcv(bars)
+    tmp_dir = tempfile.mkdtemp()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = setup(df, tmp_dir)
+        started = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - started
+
+        alloc_peak = None
+        if allocations:
+            tracemalloc.start()
+            run()
+            alloc_peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    peak_rss = _peak_rss_mb()
+    queue.put({
+        "component": component,
+        "bars": bars,
+        "seconds": seconds,
+        "bars_per_second": bars / seconds if seconds > 0 else float("inf"),
+        "peak_rss_mb": peak_rss,
+        "alloc_peak_mb": alloc_peak,
+    })
+
+
+def run_suite(sizes=None, components=None, allocations=True, timeout=3600):
+    """
+    Seçilen bileşenleri verilen boyutlarda ölçer. Çöken (ör: bellek yetersizliğinden öldürülen)
+    veya süresi dolan ölçümler askıda kalmaz; 'error' alanıyla başarısız olarak raporlanır.
+
+    Args:
+        sizes (list, optional): Bar sayıları; varsayılan 10k/100k/1M/10M.
+        components (list, optional): Bileşen adları; varsayılan tümü.
+        allocations (bool): tracemalloc ile ayrı bir koşuda bellek ayırma zirvesini ölç.
+        timeout (float, optional): Tek bir ölçümün en uzun süresi (saniye); None ise sınırsız.
+
+    Returns:
+        list: Her (bileşen, boyut) için ölçüm sözlükleri.
+    """
+    context = multiprocessing.get_context("fork" if sys.platform != "win32" else "spawn")
+    results = []
+    for component in components or list(COMPONENTS):
+        _, max_bars = COMPONENTS[component]
+        for bars in sizes or DEFAULT_SIZES:
+            if max_bars is not None and bars > max_bars:
+                continue
+            queue = context.Queue()
+            process = context.Process(target=_measure, args=(component, bars, allocations, queue))
+            process.start()
+            result, reason = _receive(process, queue, timeout)
+            process.join()
+            if result is None:
+                result = {"component": component, "bars": bars, "seconds": None, "bars_per_second": None,
+                          "peak_rss_mb": None, "alloc_peak_mb": None, "error": f"ölçüm başarısız ({reason})"}
+                print(f"{component:>22} {bars:>10} bar: {result['error']}")
+            else:
+                rss = "-" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f}"
+                print(f"{component:>22} {bars:>10} bar: {result['bars_per_second']:>14,.0f} bar/sn, "
+                      f"RSS {rss} MB")
+            results.append(result)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25):
+    """
+    Sonuçları temel ölçümlerle karşılaştırır.
+
+    Args:
+        results (list): run_suite çıktısı.
+        baseline (list): Daha önce kaydedilmiş run_suite çıktısı.
+        tolerance (float): İzin verilen göreli kötüleşme (0.25 = %25).
+
+    Returns:
+        list: Gerileme açıklamaları (başarısız ölçümler dahil); boşsa gerileme yoktur.
+    """
+    reference = {(item["component"], item["bars"]): item for item in baseline if not item.get("error")}
+    regressions = []
+    for result in results:
+        if result.get("error"):
+            regressions.append(f"{result['component']} @ {result['bars']} bar: {result['error']}")
+            continue
+        base = reference.get((result["component"], result["bars"]))
+        if base is None:
+            continue
+        if result["bars_per_second"] < base["bars_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result['component']} @ {result['bars']} bar: hız {base['bars_per_second']:,.0f} → "
+                f"{result['bars_per_second']:,.0f} bar/sn")
+        if result["peak_rss_mb"] is None or base["peak_rss_mb"] is None:
+            continue
+        if result["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{result['component']} @ {result['bars']} bar: RSS {base['peak_rss_mb']:.0f} → "
+                f"{result['peak_rss_mb']:.0f} MB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executor, strateji ve veri yükleme performans ölçümleri")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--components", nargs="+", choices=list(COMPONENTS))
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları temel ölçüm olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--no-allocations", action="store_true", help="tracemalloc ölçümünü atla")
+    parser.add_argument("--timeout", type=float, default=3600, help="Tek ölçümün en uzun süresi (saniye)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.components, allocations=not args.no_allocations, timeout=args.timeout)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Sonuçlar kaydedildi → {args.output}")
+
+    if args.save_baseline:
+        shutil.copyfile(args.output, args.baseline)
+        print(f"Temel ölçüm güncellendi → {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Temel ölçüm bulunamadı; karşılaştırma atlandı (--save-baseline ile oluşturun).")
+        return 0
+
+    with open(args.baseline, "r") as f:
+        regressions = compare_to_baseline(results, json.load(f)["results"], args.tolerance)
+    if regressions:
+        print("❌ PERFORMANS GERİLEMESİ:")
+        for regression in regressions:
+            print("  " + regression)
+        return 1
+    print("✅ Temel ölçüme göre gerileme yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
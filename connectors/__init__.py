@@ -1,5 +1,7 @@
 from .backtester_connector import BacktesterConnector
 from .mt5_connector import MetaTrader5Connector
 from .binance_connector import BinanceConnector
+from .async_binance_connector import AsyncBinanceConnector
+from .vectorized_connector import VectorizedConnector
 
-__all__ = ['BacktesterConnector', 'MetaTrader5Connector', 'BinanceConnector']
+__all__ = ['BacktesterConnector', 'MetaTrader5Connector', 'BinanceConnector', 'AsyncBinanceConnector', 'VectorizedConnector']
@@ -0,0 +1,199 @@
+import asyncio
+
+import ccxt
+import ccxt.async_support as ccxt_async
+
+from core.logger import Logger
+from core.rate_limiter import AsyncTokenBucket
+
+
+class AsyncBinanceConnector:
+    def __init__(self, exchange_name, api_key, secret, config=None, rate_limiter=None):
+        """
+        ccxt.async_support tabanlı, asyncio ile çalışan borsa bağlantısı.
+        Borsa başına tek bir ccxt nesnesi (ve dolayısıyla tek HTTP oturumu) kullanılır;
+        tüm istekler borsanın hız sınırına göre ayarlanan bir token kovasından geçer.
+
+        Args:
+            exchange_name (str): Bağlanılacak borsanın adı (örn: 'binance').
+            api_key (str): API anahtarı.
+            secret (str): API gizli anahtarı.
+            config (dict, optional): Ek borsa yapılandırma ayarları.
+            rate_limiter (AsyncTokenBucket, optional): Hız sınırlayıcı; belirtilmezse borsanın
+                `rateLimit` değerinden oluşturulur.
+        """
+        self.exchange_name = exchange_name
+        self.api_key = api_key
+        self.secret = secret
+        self.config = config if config else {}
+        self.rate_limiter = rate_limiter
+        self.exchange = None
+        self.logger = Logger(__name__)
+
+    async def initialize(self):
+        """
+        Borsa bağlantısını başlatır ve market verilerini yükler.
+
+        Returns:
+            bool: Bağlantı başarılı ise True, başarısız ise False.
+        """
+        try:
+            if self.exchange is None:
+                exchange_class = getattr(ccxt_async, self.exchange_name)
+                self.exchange = exchange_class({
+                    'apiKey': self.api_key,
+                    'secret': self.secret,
+                    # Hız sınırı ccxt'nin sıralı kısıtlayıcısı yerine token kovasıyla uygulanır
+                    'enableRateLimit': False,
+                    **self.config
+                })
+            if self.rate_limiter is None:
+                self.rate_limiter = AsyncTokenBucket.from_rate_limit(getattr(self.exchange, 'rateLimit', 50))
+            await self._call('load_markets')
+            print(f"{self.exchange_name} bağlantısı başarılı.")
+            return True
+        except Exception as e:
+            print("Exchange bağlantısı başarısız:", e)
+            return False
+
+    async def close(self):
+        """
+        Paylaşılan HTTP oturumunu kapatır.
+        """
+        if self.exchange is not None:
+            await self.exchange.close()
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _call(self, method, *args, cost=1, **kwargs):
+        await self.rate_limiter.acquire(cost)
+        return await getattr(self.exchange, method)(*args, **kwargs)
+
+    async def _logged_call(self, message, method, *args, **kwargs):
+        try:
+            return await self._call(method, *args, **kwargs)
+        except ccxt.BaseError as e:
+            # Borsa hataları kayda geçirilir ve çağırana iletilir; hata türüne göre (ör: NetworkError)
+            # yeniden deneme kararı çağırandadır
+            self.logger.error("%s: %s", message, e)
+            raise
+
+    @staticmethod
+    def _gathered(results):
+        # Toplu sorgularda borsanın reddettiği tekil istekler None olur; diğer hatalar iletilir
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, ccxt.BaseError):
+                raise result
+        return [None if isinstance(result, ccxt.BaseError) else result for result in results]
+
+    async def fetch_ticker(self, symbol):
+        """
+        Belirtilen sembol için en güncel fiyat bilgilerini getirir.
+
+        Raises:
+            ccxt.BaseError: Borsa isteği başarısız olduğunda.
+        """
+        return await self._logged_call("Ticker alınamadı", 'fetch_ticker', symbol)
+
+    async def fetch_tickers(self, symbols):
+        """
+        Birden fazla sembolün fiyat bilgilerini getirir. Borsa destekliyorsa tek bir toplu
+        istek kullanılır; desteklemiyorsa istekler hız sınırı içinde eşzamanlı gönderilir.
+
+        Args:
+            symbols (list): İşlem sembolleri.
+
+        Returns:
+            dict: Sembol -> ticker verisi (tekil isteklerde alınamayanlar için None).
+
+        Raises:
+            ccxt.BaseError: Toplu istek başarısız olduğunda.
+        """
+        if self.exchange.has.get('fetchTickers'):
+            tickers = await self._logged_call("Tickerlar alınamadı", 'fetch_tickers', symbols)
+            return {symbol: tickers.get(symbol) for symbol in symbols}
+        results = await asyncio.gather(*(self.fetch_ticker(symbol) for symbol in symbols), return_exceptions=True)
+        return dict(zip(symbols, self._gathered(results)))
+
+    async def create_order(self, symbol, order_type, side, amount, price=None):
+        """
+        Emir gönderir.
+
+        Args:
+            symbol (str): İşlem sembolü.
+            order_type (str): 'market' veya 'limit' gibi emir tipi.
+            side (str): 'buy' veya 'sell' işlemi.
+            amount (float): Emir miktarı.
+            price (float, optional): Limit emirlerinde gerekli; market emirlerinde kullanılmaz.
+
+        Returns:
+            dict: Gönderilen emirle ilgili sonuç.
+
+        Raises:
+            ccxt.BaseError: Borsa emri reddettiğinde veya istek başarısız olduğunda.
+        """
+        if order_type == 'market':
+            return await self._logged_call("Emir gönderilemedi", 'create_market_order', symbol, side, amount)
+        elif order_type == 'limit':
+            if price is None:
+                print("Limit emirinde fiyat belirtilmelidir.")
+                return None
+            return await self._logged_call("Emir gönderilemedi", 'create_limit_order', symbol, side, amount, price)
+        print("Desteklenmeyen emir tipi:", order_type)
+        return None
+
+    async def fetch_order(self, order_id, symbol):
+        """
+        Belirtilen emir bilgisini getirir.
+
+        Raises:
+            ccxt.BaseError: Borsa isteği başarısız olduğunda.
+        """
+        return await self._logged_call("Emir bilgisi alınamadı", 'fetch_order', order_id, symbol)
+
+    async def fetch_orders(self, orders):
+        """
+        Birden fazla emrin durumunu hız sınırı içinde eşzamanlı olarak sorgular.
+
+        Args:
+            orders (list): (emir ID'si, sembol) demetleri.
+
+        Returns:
+            dict: Emir ID'si -> emir detayları (alınamayanlar için None).
+        """
+        results = await asyncio.gather(*(self.fetch_order(order_id, symbol) for order_id, symbol in orders),
+                                       return_exceptions=True)
+        return {order_id: result for (order_id, _), result in zip(orders, self._gathered(results))}
+
+    async def cancel_order(self, order_id, symbol):
+        """
+        Belirtilen emri iptal eder.
+
+        Raises:
+            ccxt.BaseError: Borsa isteği başarısız olduğunda.
+        """
+        return await self._logged_call("Emir iptal edilemedi", 'cancel_order', order_id, symbol)
+
+    async def fetch_balance(self):
+        """
+        Hesap bakiyelerini getirir.
+
+        Raises:
+            ccxt.BaseError: Borsa isteği başarısız olduğunda.
+        """
+        return await self._logged_call("Bakiye bilgileri alınamadı", 'fetch_balance')
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        """
+        Belirtilen sembol için OHLCV mum verilerini getirir.
+
+        Raises:
+            ccxt.BaseError: Borsa isteği başarısız olduğunda.
+        """
+        return await self._logged_call("OHLCV verisi alınamadı", 'fetch_ohlcv', symbol, timeframe,
+                                       since=since, limit=limit)
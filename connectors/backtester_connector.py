@@ -1,43 +1,331 @@
+import functools
+from collections import namedtuple
+
 import backtrader as bt
-from strategy.base_strategy import BaseStrategy
+import pandas as pd
+from core.journal import EVENT_FILL, EVENT_SIGNAL
+from core.profiler import get_profiler
+from strategy.base_strategy import BaseStrategy, Bar
+
+
+class StrategyAdapter(bt.Strategy):
+    """
+    BaseStrategy tabanlı stratejileri Cerebro içinde çalıştırır.
+    Her veri akışı için ayrı bir strateji örneği tutulur; akışa yeni bar geldiğinde
+    strateji on_bar ile artımlı olarak güncellenir ve pozisyonu değiştiğinde o akış
+    için hedef pozisyona göre piyasa emri verilir.
+    """
+    params = (
+        ('strategy_class', None),
+        ('strategy_params', None),
+        ('stake', 1),
+        ('journal', None),
+    )
+
+    def __init__(self):
+        params = self.p.strategy_params or {}
+        self.strategies = [self.p.strategy_class(None, **params) for _ in self.datas]
+        self.strategy = self.strategies[0]
+        self._seen = [0] * len(self.datas)
+        self.profiler = get_profiler()
+        self.journal = self.p.journal
+        if self.journal is not None:
+            # Veri akışları karşılaştırma operatörlerini ezdiği için kimlikler id() ile eşlenir
+            self._journal_ids = {id(data): self.journal.strategy_id(data._name or self.p.strategy_class.__name__)
+                                 for data in self.datas}
+        # Varlık başına kapanan işlem sayısı ve komisyon sonrası gerçekleşen kâr/zarar
+        self.trade_stats = {data._name: {'trade_count': 0, 'realized_pnl': 0.0} for data in self.datas}
+        # Kapanan işlemler: (kapanış zamanı, varlık adı, komisyon sonrası kâr/zarar)
+        self.closed_trades = []
+        # Ek çizgiler (ör: create_data_feed ile eklenen yüksek zaman dilimi sütunları) bara alan olarak eklenir
+        self._bar_types, self._extra_lines = [], []
+        for data in self.datas:
+            extras = [name for name in data.lines.getlinealiases() if name not in Bar._fields + ('openinterest',)]
+            self._bar_types.append(namedtuple('Bar', Bar._fields + tuple(extras)) if extras else Bar)
+            self._extra_lines.append([getattr(data.lines, name) for name in extras])
+
+    def prenext(self):
+        # Akışlar farklı zamanlarda başladığında, başlamış olanlar beklemeden işlenir
+        self.next()
+
+    def next(self):
+        profiler = self.profiler
+        for i, data in enumerate(self.datas):
+            if len(data) == self._seen[i]:
+                # Bu akış için yeni bar yok
+                continue
+            self._seen[i] = len(data)
+
+            strategy = self.strategies[i]
+            bar = self._bar_types[i](
+                data.datetime.datetime(0),
+                data.open[0],
+                data.high[0],
+                data.low[0],
+                data.close[0],
+                data.volume[0],
+                *[line[0] for line in self._extra_lines[i]],
+            )
+            previous_position = strategy.position
+            profiler.count("bars")
+            with profiler.stage("indicators"):
+                strategy.on_bar(bar)
+            with profiler.stage("signals"):
+                strategy.execute()
+            if strategy.position != previous_position:
+                target = strategy.position * self.p.stake
+                if self.journal is not None:
+                    self.journal.record(bar.datetime, EVENT_SIGNAL, (target > 0) - (target < 0), bar.close,
+                                        target, self._journal_ids[id(data)])
+                with profiler.stage("orders"):
+                    self.order_target_size(data=data, target=target)
+
+    def notify_order(self, order):
+        if order.status == order.Completed:
+            self.profiler.count("orders_filled")
+            self.profiler.count("commission", order.executed.comm)
+            if self.journal is not None:
+                size = order.executed.size
+                self.journal.record(bt.num2date(order.executed.dt), EVENT_FILL, 1 if size > 0 else -1,
+                                    order.executed.price, abs(size),
+                                    self._journal_ids[id(order.data)])
+
+    def notify_trade(self, trade):
+        if trade.isclosed:
+            stats = self.trade_stats[trade.data._name]
+            stats['trade_count'] += 1
+            stats['realized_pnl'] += trade.pnlcomm
+            self.closed_trades.append((bt.num2date(trade.dtclose), trade.data._name, trade.pnlcomm))
 
 
 class BacktesterConnector:
-    def __init__(self, strategy, data_feed, cash=10000, commission=0.001):
+    def __init__(self, strategy, data_feed, cash=10000, commission=0.001, stake=1, strategy_params=None,
+                 journal=None, exactbars=False):
         """
         Backtesting ortamını başlatır.
 
         Args:
-            strategy (class): Çalıştırılacak strateji sınıfı.
-            data_feed (bt.feeds.DataBase): Backtrader için uygun veri akışı.
+            strategy (class): Çalıştırılacak strateji sınıfı (bt.Strategy veya BaseStrategy alt sınıfı).
+            data_feed (bt.feeds.DataBase or dict): Backtrader için uygun veri akışı; çoklu varlık
+                için varlık adı -> veri akışı sözlüğü.
             cash (float): Başlangıç sermayesi.
             commission (float): Komisyon oranı.
+            stake (float): BaseStrategy stratejilerinde pozisyon başına işlem miktarı.
+            strategy_params (dict, optional): Stratejiye iletilecek parametreler.
+            journal (TradeJournal, optional): Sinyal ve emir gerçekleşmelerinin kaydedileceği günlük.
+            exactbars (bool or int): Cerebro'nun bellek tasarrufu modu; açıkken çizgi tamponları
+                yalnızca gereken son değerleri tutar (akışlı veri akışlarıyla birlikte kullanılır).
         """
-        self.cerebro = bt.Cerebro()
+        self.cerebro = bt.Cerebro(exactbars=exactbars)
         self.strategy = strategy
         self.data_feed = data_feed
         self.cash = cash
         self.commission = commission
+        self.stake = stake
+        self.strategy_params = strategy_params or {}
+        self.journal = journal
 
     def setup(self):
-        # Stratejiyi ekle
-        self.cerebro.addstrategy(self.strategy)
+        # Stratejiyi ekle; BaseStrategy tabanlı stratejiler adaptör üzerinden çalıştırılır
+        if issubclass(self.strategy, BaseStrategy):
+            self.cerebro.addstrategy(StrategyAdapter, strategy_class=self.strategy,
+                                     strategy_params=self.strategy_params, stake=self.stake,
+                                     journal=self.journal)
+        else:
+            self.cerebro.addstrategy(self.strategy, **self.strategy_params)
         # Başlangıç sermayesini belirle
         self.cerebro.broker.setcash(self.cash)
         # Komisyon oranını ayarla
         self.cerebro.broker.setcommission(commission=self.commission)
-        # Veri akışını ekle
-        self.cerebro.adddata(self.data_feed)
+        # Veri akışını (çoklu varlıkta tüm akışları) ekle
+        if isinstance(self.data_feed, dict):
+            for name, data_feed in self.data_feed.items():
+                self.cerebro.adddata(data_feed, name=name)
+        else:
+            self.cerebro.adddata(self.data_feed)
+        # Performans metrikleri için analizörleri ekle
+        self.cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe', timeframe=bt.TimeFrame.Days,
+                                 annualize=True, riskfreerate=0.0)
+        self.cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
+        self.cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+        self._profile_broker()
         print("Backtrader bağlantısı ayarlandı.")
 
+    def _profile_broker(self):
+        # Emir eşleştirme ve komisyon hesabı broker.next içinde yapılır; profil açıksa süresi ölçülür
+        profiler = get_profiler()
+        if not profiler.enabled:
+            return
+        broker = self.cerebro.broker
+        broker_next = broker.next
+
+        def timed_next():
+            with profiler.stage("broker"):
+                broker_next()
+        broker.next = timed_next
+
     def run(self):
         """
         Backtesting sürecini başlatır ve sonuçları döner.
         """
         self.setup()
         print("Backtesting başlatılıyor...")
-        results = self.cerebro.run()
+        with get_profiler().stage("backtest"):
+            results = self.cerebro.run()
         print("Backtesting tamamlandı.")
         # Son portföy değerini yazdırır
         print('Final Portfolio Value: %.2f' % self.cerebro.broker.getvalue())
         return results
+
+    def summarize(self, results):
+        """
+        run metodunun döndürdüğü sonuçlardan performans metriklerini çıkarır.
+
+        Args:
+            results (list): cerebro.run() sonucu.
+
+        Returns:
+            dict: final_value, sharpe, max_drawdown (yüzde) ve trade_count değerleri.
+        """
+        with get_profiler().stage("aggregation"):
+            return self._summarize(results)
+
+    def trades(self, results):
+        """
+        run metodunun döndürdüğü sonuçlardan kapanan işlemleri çıkarır (yalnızca BaseStrategy
+        tabanlı stratejiler).
+
+        Args:
+            results (list): cerebro.run() sonucu.
+
+        Returns:
+            pandas.DataFrame: exit_time, asset ve pnl_net sütunları.
+        """
+        closed = getattr(results[0], 'closed_trades', [])
+        return pd.DataFrame(closed, columns=['exit_time', 'asset', 'pnl_net'])
+
+    def _summarize(self, results):
+        analyzers = results[0].analyzers
+        trades = analyzers.trades.get_analysis()
+        return {
+            'final_value': self.cerebro.broker.getvalue(),
+            'sharpe': analyzers.sharpe.get_analysis().get('sharperatio'),
+            'max_drawdown': analyzers.drawdown.get_analysis().max.drawdown,
+            'trade_count': trades.get('total', {}).get('closed', 0),
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _extra_feed_class(columns):
+    # Her sütun için aynı adlı bir çizgi ve o sütunu eşleyen parametre tanımlanır
+    return type('PandasDataExtra', (bt.feeds.PandasData,), {
+        'lines': columns,
+        'params': tuple((name, name) for name in columns),
+    })
+
+
+def create_data_feed(df, date_column, price_column, extra_columns=None):
+    """
+    DataFrame'i backtrader'ın veri feed'ine çevirir.
+    CSV sadece tarih ve fiyat bilgisi içerdiğinden open, high, low değerleri
+    price_column olarak ayarlanır.
+
+    Args:
+        df (pandas.DataFrame): Tarih ve fiyat sütunlarını içeren veri.
+        date_column (str): Tarih sütunu.
+        price_column (str): Fiyat sütunu.
+        extra_columns (list, optional): Ayrı çizgiler olarak eklenecek sütunlar (ör: add_timeframes
+            ile eklenen "close_H4"); stratejinin on_bar metoduna gelen barda aynı adla bulunur.
+
+    Returns:
+        bt.feeds.PandasData: Backtrader veri akışı.
+
+    Raises:
+        ValueError: Ek sütun adı geçerli bir çizgi adı değilse veya mevcut bir çizgiyle çakışıyorsa.
+    """
+    feed_class = bt.feeds.PandasData
+    if extra_columns:
+        columns = tuple(extra_columns)
+        reserved = set(Bar._fields) | {'openinterest'}
+        invalid = [name for name in columns if not str(name).isidentifier() or name in reserved]
+        if invalid:
+            raise ValueError(f"Ek sütunlar veri akışına çizgi olarak eklenemiyor: {invalid}")
+        feed_class = _extra_feed_class(columns)
+    with get_profiler().stage("feed_conversion"):
+        return feed_class(
+            dataname=df,
+            datetime=date_column,
+            open=price_column,
+            high=price_column,
+            low=price_column,
+            close=price_column,
+            volume=-1,
+            openinterest=-1
+        )
+
+
+class StreamingDataFeed(bt.feed.DataBase):
+    """
+    Barları parça parça okuyan backtrader veri akışı. Veri kaynağı, her gezinmede DataFrame
+    parçaları üreten bir nesnedir (ör: BarStream); aynı anda yalnızca bir parça bellekte tutulur.
+    Fiyatlar create_data_feed ile aynı şekilde eşlenir: open, high, low ve close price_column olur.
+    """
+    params = (
+        ('stream', None),
+        ('date_column', 'time'),
+        ('price_column', 'close'),
+    )
+
+    def qbuffer(self, savemem=0, replaying=False):
+        super().qbuffer(savemem=savemem, replaying=replaying)
+        # Bellek tasarrufu modunda tampon tek bar tutar; akış diğerlerinden önce bittiğinde son
+        # okuma denemesi geri alınırken tampon boşalır ve açık pozisyonun tarihi okunamaz.
+        # Bir bar fazladan tutulması bunu önler.
+        for line in self.lines:
+            line.minbuffer(2)
+
+    def start(self):
+        super().start()
+        self._chunks = iter(self.p.stream)
+        self._rows = iter(())
+
+    def _next_chunk(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        times = pd.DatetimeIndex(chunk[self.p.date_column]).to_pydatetime()
+        # Tarih dönüşümü PandasData ile aynı fonksiyonla yapılır; sonuçlar birebir aynıdır
+        self._rows = zip([bt.date2num(dt) for dt in times], chunk[self.p.price_column].tolist())
+        return True
+
+    def _load(self):
+        row = next(self._rows, None)
+        while row is None:
+            if not self._next_chunk():
+                return False
+            row = next(self._rows, None)
+        dtnum, price = row
+        lines = self.lines
+        lines.datetime[0] = dtnum
+        lines.open[0] = price
+        lines.high[0] = price
+        lines.low[0] = price
+        lines.close[0] = price
+        return True
+
+
+def create_streaming_feed(stream, date_column, price_column):
+    """
+    Parça parça okunan bir veri kaynağını backtrader veri akışına çevirir. Geçmişin tamamı
+    belleğe alınmaz; BacktesterConnector exactbars ile birlikte kullanıldığında bellek
+    kullanımı geçmiş uzunluğundan bağımsız kalır.
+
+    Args:
+        stream (iterable): Her gezinmede DataFrame parçaları üreten kaynak (ör: BarStream).
+        date_column (str): Tarih sütunu.
+        price_column (str): Fiyat sütunu.
+
+    Returns:
+        StreamingDataFeed: Backtrader veri akışı.
+    """
+    return StreamingDataFeed(stream=stream, date_column=date_column, price_column=price_column)
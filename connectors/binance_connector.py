@@ -57,6 +57,25 @@ class BinanceConnector:
             print("Ticker alınamadı:", e)
             return None
 
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        """
+        Belirtilen sembol için OHLCV mum verilerini getirir.
+
+        Args:
+            symbol (str): İşlem sembolü (örn: 'BTC/USDT').
+            timeframe (str): Mum aralığı (örn: '1m', '1h').
+            since (int, optional): Başlangıç zamanı (ms).
+            limit (int, optional): En fazla mum sayısı.
+
+        Returns:
+            list: [zaman (ms), açılış, yüksek, düşük, kapanış, hacim] listeleri.
+        """
+        try:
+            return self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+        except Exception as e:
+            print("OHLCV verisi alınamadı:", e)
+            return None
+
     def create_order(self, symbol, order_type, side, amount, price=None):
         """
         Emir gönderir.
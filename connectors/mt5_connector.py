@@ -55,6 +55,35 @@ class MetaTrader5Connector:
         data['time'] = pd.to_datetime(data['time'], unit='s')
         return data
 
+    def get_latest_bars(self, symbol, timeframe, count, start_pos=1):
+        """
+        Son barları terminalin konumsal sorgusuyla getirir. Varsayılan start_pos=1 ile oluşum
+        halindeki son bar atlanır ve yalnızca kapanmış barlar döner.
+
+        Args:
+            symbol (str): İşlem sembolü.
+            timeframe: mt5.TIMEFRAME_* değeri.
+            count (int): Bar sayısı.
+            start_pos (int): En yeni bardan geriye doğru başlangıç konumu.
+
+        Returns:
+            pandas.DataFrame: Zamana göre sıralı barlar; alınamazsa None.
+        """
+        rates = mt5.copy_rates_from_pos(symbol, timeframe, start_pos, count)
+        if rates is None:
+            print("Veri alınamadı, hata:", mt5.last_error())
+            return None
+        data = pd.DataFrame(rates)
+        if len(data):
+            data['time'] = pd.to_datetime(data['time'], unit='s')
+        return data
+
+    def get_tick(self, symbol):
+        """
+        Sembolün son tickini (time_msc, bid, ask alanları) getirir; alınamazsa None.
+        """
+        return mt5.symbol_info_tick(symbol)
+
     def send_order(self, symbol, order_type, volume, price, slippage=20, magic=0, comment=""):
         """
         MetaTrader 5 üzerinden bir emir gönderir.
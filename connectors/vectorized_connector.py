@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+
+from core.execution import FillSimulator
+from core.journal import EVENT_FILL, EVENT_SIGNAL
+from core.profiler import get_profiler
+
+
+class VectorizedConnector:
+    def __init__(self, strategy, data, cash=10000, commission=0.001, stake=1,
+                 price_column='close', open_column=None, strategy_params=None, journal=None, name=None,
+                 execution=None):
+        """
+        Vektörel backtest motoru. Stratejinin generate_positions metoduyla tüm seri için
+        pozisyonları tek seferde alır; emirleri, komisyonu, sermaye eğrisini ve işlemleri
+        bar döngüsü olmadan NumPy dizi işlemleriyle hesaplar.
+
+        Emir modeli BacktesterConnector ile aynıdır: bar kapanışında oluşan sinyal bir
+        sonraki barın açılış fiyatından gerçekleşir, komisyon işlem tutarının oranıdır.
+        execution verilirse spread, kayma, gecikme ve kısmi dolum FillSimulator ile uygulanır.
+
+        Args:
+            strategy (class): generate_positions metodunu uygulayan BaseStrategy alt sınıfı.
+            data (pandas.DataFrame): Fiyat verileri; index zaman damgalarıdır.
+            cash (float): Başlangıç sermayesi.
+            commission (float): Komisyon oranı.
+            stake (float): Pozisyon başına işlem miktarı.
+            price_column (str): Değerleme için kullanılan fiyat sütunu; strateji bu sütunu 'close' adıyla görür.
+            open_column (str, optional): Emirlerin gerçekleştiği fiyat sütunu;
+                belirtilmezse price_column kullanılır.
+            strategy_params (dict, optional): Stratejiye iletilecek parametreler.
+            journal (TradeJournal, optional): Sinyal ve emir gerçekleşmelerinin kaydedileceği günlük.
+            name (str, optional): Günlükteki strateji/varlık adı; varsayılan strateji sınıfının adı.
+            execution (FillSimulator or dict, optional): Gerçekleşme modeli veya FillSimulator
+                parametreleri.
+        """
+        self.strategy = strategy
+        self.data = data
+        self.cash = cash
+        self.commission = commission
+        self.stake = stake
+        self.price_column = price_column
+        self.open_column = open_column or price_column
+        self.strategy_params = strategy_params or {}
+        self.journal = journal
+        self.name = name or strategy.__name__
+        self.execution = FillSimulator(**execution) if isinstance(execution, dict) else execution
+
+    def run(self):
+        """
+        Vektörel backtesti çalıştırır ve sonuçları döner.
+
+        Returns:
+            dict: 'final_value', 'equity' (pandas.Series), 'positions' (pandas.Series)
+                ve 'trades' (pandas.DataFrame) anahtarlarını içeren sonuçlar.
+        """
+        print("Vektörel backtesting başlatılıyor...")
+        data = self._strategy_data()
+        strategy = self.strategy(data, **self.strategy_params)
+        if not strategy.supports_vectorized():
+            raise ValueError(f"{self.strategy.__name__} vektörel modu desteklemiyor.")
+
+        profiler = get_profiler()
+        profiler.count("bars", len(self.data))
+        with profiler.stage("signals"):
+            targets = np.asarray(strategy.generate_positions(data), dtype=np.float64) * self.stake
+        results = self.simulate(targets)
+        print("Vektörel backtesting tamamlandı.")
+        print('Final Portfolio Value: %.2f' % results['final_value'])
+        return results
+
+    def _strategy_data(self):
+        # Stratejiler fiyatı 'close' sütunundan okur (backtrader akışındaki close çizgisi gibi); farklı bir
+        # fiyat sütunu kopyalanmadan 'close' adıyla verilir, böylece indikatör önbelleği de paylaşılır
+        if self.price_column == 'close':
+            return self.data
+        columns = {name: self.data[name].to_numpy() for name in self.data.columns if name != 'close'}
+        columns['close'] = self.data[self.price_column].to_numpy()
+        return pd.DataFrame(columns, index=self.data.index, copy=False)
+
+    def simulate(self, targets):
+        """
+        Her bar sonundaki hedef pozisyonlardan emirleri, sermaye eğrisini ve işlemleri hesaplar.
+
+        Args:
+            targets (numpy.ndarray): Her bar için hedef pozisyon miktarı.
+
+        Returns:
+            dict: run metodu ile aynı yapıda sonuçlar; gerçekleşme modeli varsa ek olarak
+                'execution_cost' (ödenen spread ve kayma toplamı).
+        """
+        profiler = get_profiler()
+        index = self.data.index
+        close = self.data[self.price_column].to_numpy(dtype=np.float64)
+        fill_price = self.data[self.open_column].to_numpy(dtype=np.float64)
+
+        execution = self.execution
+        with profiler.stage("broker"):
+            if execution is None:
+                # Bar i'de verilen hedef, bar i+1'de gerçekleşir
+                holdings = np.zeros_like(targets)
+                holdings[1:] = targets[:-1]
+                delta = np.diff(holdings, prepend=0.0)
+            else:
+                holdings = execution.holdings(targets, self.data)
+                delta = np.diff(holdings, prepend=0.0)
+                fill_price, costs = execution.fill_prices(delta, fill_price, self.data)
+
+            traded_value = delta * fill_price
+            fees = np.abs(traded_value) * self.commission
+            cash = self.cash - np.cumsum(traded_value + fees)
+            equity = cash + holdings * close
+        if profiler.enabled:
+            profiler.count("orders_filled", int(np.count_nonzero(delta)))
+            profiler.count("commission", float(fees.sum()))
+        if self.journal is not None:
+            self._record_journal(targets, delta, close, fill_price, index)
+
+        with profiler.stage("aggregation"):
+            results = {
+                'final_value': float(equity[-1]) if len(equity) else float(self.cash),
+                'equity': pd.Series(equity, index=index, name='equity'),
+                'positions': pd.Series(holdings, index=index, name='position'),
+                'trades': self._build_trades(holdings, fill_price, index),
+            }
+            if execution is not None:
+                results['execution_cost'] = float(costs.sum())
+            return results
+
+    def _record_journal(self, targets, delta, close, fill_price, index):
+        # Hedef değişimleri sinyal, pozisyon değişimleri gerçekleşme olarak yazılır. Olaylar
+        # backtrader ile aynı sırada tutulur: aynı bardaki gerçekleşme, yeni sinyalden önce gelir.
+        times = index.to_numpy()
+        signals = np.flatnonzero(np.diff(targets, prepend=0.0) != 0)
+        fills = np.flatnonzero(delta)
+        bars = np.concatenate([signals, fills])
+        kinds = np.concatenate([np.full(len(signals), EVENT_SIGNAL), np.full(len(fills), EVENT_FILL)])
+        order = np.lexsort((-kinds, bars))
+        bars, kinds = bars[order], kinds[order]
+        is_fill = kinds == EVENT_FILL
+        amounts = np.where(is_fill, delta[bars], targets[bars])
+        self.journal.record_many(
+            times[bars], kinds, np.sign(amounts), np.where(is_fill, fill_price[bars], close[bars]),
+            np.where(is_fill, np.abs(amounts), amounts), self.journal.strategy_id(self.name)
+        )
+
+    def _build_trades(self, holdings, fill_price, index):
+        # Pozisyonun sıfırdan açılıp sıfıra döndüğü (veya yön değiştirdiği) her bölüm bir işlemdir.
+        # Kısmi dolumlar ve aynı yöndeki büyütme / küçültmeler işlemin giriş ve çıkış bacaklarıdır;
+        # fiyatlar miktar ağırlıklı ortalamadır ve komisyon gerçekleşen miktarlar üzerinden hesaplanır.
+        previous = np.concatenate(([0.0], holdings[:-1]))
+        sign, previous_sign = np.sign(holdings), np.sign(previous)
+        opens = (sign != 0) & (sign != previous_sign)
+        count = int(opens.sum())
+        if count == 0:
+            return pd.DataFrame(columns=['entry_time', 'exit_time', 'size', 'entry_price',
+                                         'exit_price', 'pnl', 'pnl_net'])
+
+        delta = holdings - previous
+        trade = np.cumsum(opens) - 1
+        closes = (previous_sign != 0) & (sign != previous_sign)
+        continuing = (sign != 0) & (sign == previous_sign) & (delta != 0)
+        grows = continuing & (np.abs(holdings) > np.abs(previous))
+
+        entry_qty = np.where(opens, np.abs(holdings), 0.0) + np.where(grows, np.abs(delta), 0.0)
+        exit_qty = np.where(closes, np.abs(previous), 0.0) + np.where(continuing & ~grows, np.abs(delta), 0.0)
+        # Yön değiştiren barda kapanan işlem bir önceki işlemdir
+        exit_trade = trade - opens
+        entries, exits = entry_qty > 0, exit_qty > 0
+        entry_value = np.bincount(trade[entries], (entry_qty * fill_price)[entries], minlength=count)
+        exit_value = np.bincount(exit_trade[exits], (exit_qty * fill_price)[exits], minlength=count)
+        entry_amount = np.bincount(trade[entries], entry_qty[entries], minlength=count)
+        exit_amount = np.bincount(exit_trade[exits], exit_qty[exits], minlength=count)
+
+        exit_bars = np.full(count, -1)
+        exit_bars[exit_trade[closes]] = np.flatnonzero(closes)
+        closed = exit_bars >= 0
+        peak = np.zeros(count)
+        np.maximum.at(peak, trade[sign != 0], np.abs(holdings[sign != 0]))
+        direction = sign[opens]
+
+        entry_price = entry_value / entry_amount
+        exit_price = np.where(closed, exit_value / np.where(exit_amount > 0, exit_amount, 1.0), np.nan)
+        pnl = np.where(closed, direction * (exit_value - entry_value), np.nan)
+        fees = (entry_value + exit_value) * self.commission
+
+        return pd.DataFrame({
+            'entry_time': index[opens],
+            'exit_time': pd.Series(index[exit_bars]).where(closed).to_numpy(),
+            'size': direction * peak,
+            'entry_price': entry_price,
+            'exit_price': exit_price,
+            'pnl': pnl,
+            'pnl_net': pnl - fees,
+        })
@@ -0,0 +1,376 @@
+import hashlib
+import importlib
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from core.logger import Logger
+from core.optimizer import check_execution, evaluate_params, expand_grid, prepare_data, rank_rows
+from core.walk_forward import date_range_positions, evaluate_out_of_sample, walk_forward_windows
+from core.work_queue import WorkQueue
+from data.bar_store import load_bars
+
+
+def strategy_path(strategy_class):
+    """
+    Strateji sınıfının içe aktarma yolunu döner (ör: "strategy.exp_moving_average:MovingAverageStrategy").
+    """
+    return f"{strategy_class.__module__}:{strategy_class.__qualname__}"
+
+
+def load_strategy(path):
+    """
+    strategy_path çıktısından strateji sınıfını yükler.
+    """
+    module, name = path.split(":")
+    return importlib.import_module(module).__dict__[name]
+
+
+def load_symbol(base_path, symbol, timeframe, date_column, start_date=None, end_date=None):
+    """
+    Sembolün barlarını ortak bar deposundan yükler ve tarih aralığına kısaltır.
+
+    Args:
+        base_path (str): Kök klasör (<base_path>/<sembol>/<zaman dilimi>.csv veya .bars).
+        symbol (str): Sembol.
+        timeframe (str): Zaman dilimi.
+        date_column (str): Tarih sütunu.
+        start_date (str, optional): Başlangıç tarihi.
+        end_date (str, optional): Bitiş tarihi (gün dahil).
+
+    Returns:
+        pandas.DataFrame: Bar verisi.
+    """
+    df = load_bars(os.path.join(base_path, symbol, f"{timeframe}.csv"), date_column)
+    lo, hi = date_range_positions(df[date_column].to_numpy(dtype="datetime64[ns]"), start_date, end_date)
+    return df.iloc[lo:hi]
+
+
+def _timestamp(times, position):
+    # Pencere sınırları konum yerine zaman damgası olarak saklanır; son sınır serinin sonudur
+    return None if position >= len(times) else str(pd.Timestamp(times[position]))
+
+
+def _position(times, timestamp):
+    if timestamp is None:
+        return len(times)
+    return int(np.searchsorted(times, np.datetime64(pd.Timestamp(timestamp)), "left"))
+
+
+class DistributedSweep:
+    def __init__(self, queue, strategy_class, symbols, timeframe, date_column, price_column, cash=10000,
+                 commission=0.001, stake=1, engine="vectorized", base_path="data/historic_data",
+                 start_date=None, end_date=None, execution=None):
+        """
+        Dağıtık parametre taraması koordinatörü. Sembol x parametre (x walk-forward penceresi)
+        işlerini kalıcı iş kuyruğuna yazar, ilerlemeyi izler ve işçilerin yazdığı sonuçları
+        birleştirir. İşler QueueWorker süreçleri tarafından (aynı veya farklı makinelerde)
+        çalıştırılır; işçiler veriyi ortak bar deposundan kendileri yükler.
+
+        Args:
+            queue (WorkQueue): İş kuyruğu.
+            strategy_class (class): Çalıştırılacak strateji sınıfı (işçilerde içe aktarılabilir olmalı).
+            symbols (list): Semboller.
+            timeframe (str): Zaman dilimi (ör: "M5").
+            date_column (str): Tarih sütunu.
+            price_column (str): Fiyat sütunu.
+            cash (float): Başlangıç sermayesi.
+            commission (float): Komisyon oranı.
+            stake (float): Pozisyon başına işlem miktarı.
+            engine (str): "vectorized" veya "backtrader".
+            base_path (str): Ortak bar deposunun kök klasörü.
+            start_date (str, optional): Değerlendirilecek aralığın başlangıcı.
+            end_date (str, optional): Değerlendirilecek aralığın bitişi (gün dahil).
+            execution (dict, optional): FillSimulator parametreleri (yalnızca vektörel motor).
+        """
+        check_execution(engine, execution)
+        self.logger = Logger(__name__)
+        self.queue = queue
+        self.symbols = list(symbols)
+        self.settings = {
+            "strategy": strategy_path(strategy_class),
+            "timeframe": timeframe,
+            "date_column": date_column,
+            "price_column": price_column,
+            "cash": cash,
+            "commission": commission,
+            "stake": stake,
+            "engine": engine,
+            "execution": execution,
+            "base_path": base_path,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+
+    def submit(self, grid, constraint=None, in_sample=None, out_of_sample=None, step=None, anchored=False,
+               warmup=0):
+        """
+        İşleri oluşturup kuyruğa yazar. Pencere uzunlukları verilirse her sembol için
+        walk_forward_windows ile pencereler üretilir ve her iş bir kombinasyonu bir pencerenin
+        örneklem içi ve örneklem dışı bölümlerinde değerlendirir.
+
+        Tarama adı ayarlardan ve işlerden türetilir; aynı tarama tekrar gönderildiğinde yeni iş
+        eklenmez ve tamamlanmış işler yeniden çalıştırılmaz.
+
+        Args:
+            grid (dict): expand_grid formatında parametre ızgarası.
+            constraint (callable, optional): Kombinasyonu kabul edip etmeyeceğini dönen fonksiyon.
+            in_sample, out_of_sample, step, anchored: walk_forward_windows parametreleri.
+            warmup (int): Örneklem dışı pencereden önce eklenen ısınma barı sayısı (vektörel motor).
+
+        Returns:
+            str: Tarama adı.
+        """
+        if warmup and self.settings["engine"] != "vectorized":
+            raise ValueError("Isınma barları yalnızca vektörel motorla kullanılabilir.")
+        combinations = expand_grid(grid)
+        if constraint is not None:
+            combinations = [params for params in combinations if constraint(params)]
+        settings = {**self.settings, "warmup": warmup}
+
+        jobs = []
+        for symbol in self.symbols:
+            windows = [None]
+            if in_sample is not None:
+                df = load_symbol(settings["base_path"], symbol, settings["timeframe"], settings["date_column"],
+                                 settings["start_date"], settings["end_date"])
+                times = df[settings["date_column"]].to_numpy(dtype="datetime64[ns]")
+                windows = [[_timestamp(times, position) for position in window]
+                           for window in walk_forward_windows(times, in_sample, out_of_sample, step, anchored)]
+            jobs.extend({"symbol": symbol, "params": params, "window": window}
+                        for window in windows for params in combinations)
+
+        sweep = hashlib.blake2b(json.dumps([settings, jobs], sort_keys=True, default=str).encode(),
+                                digest_size=8).hexdigest()
+        added = self.queue.submit(sweep, settings, jobs)
+        self.logger.info("Tarama %s: %d iş (%d yeni) kuyruğa yazıldı.", sweep, len(jobs), added)
+        return sweep
+
+    def wait(self, sweep, poll_interval=5.0, timeout=None, report=None):
+        """
+        Taramadaki tüm işler tamamlanana veya başarısız olana kadar bekler ve ilerlemeyi raporlar.
+
+        Args:
+            sweep (str): Tarama adı.
+            poll_interval (float): Kontrol aralığı (saniye).
+            timeout (float, optional): En fazla bekleme süresi (saniye).
+            report (callable, optional): Her kontrolde ilerleme sözlüğüyle çağrılır; varsayılan loglama.
+
+        Returns:
+            dict: Son ilerleme (WorkQueue.progress çıktısı).
+        """
+        report = report or self._log_progress
+        started = time.monotonic()
+        while True:
+            progress = self.queue.progress(sweep)
+            elapsed = time.monotonic() - started
+            progress["elapsed"] = elapsed
+            report(progress)
+            if progress["pending"] + progress["running"] == 0:
+                return progress
+            if timeout is not None and elapsed >= timeout:
+                return progress
+            time.sleep(poll_interval)
+
+    def _log_progress(self, progress):
+        finished = progress["done"] + progress["failed"]
+        percent = 100.0 * finished / progress["total"] if progress["total"] else 100.0
+        self.logger.info("İlerleme: %d/%d (%%%.1f), çalışan: %d, başarısız: %d, süre: %.0f sn",
+                         finished, progress["total"], percent, progress["running"], progress["failed"],
+                         progress["elapsed"])
+
+    def collect(self, sweep, rank_by="final_value"):
+        """
+        Tamamlanan işlerin sonuçlarını tabloya dönüştürür.
+
+        Pencere içermeyen taramalarda her sembolün kombinasyonları metriğe göre sıralanır.
+        Walk-forward taramalarında her sembol ve pencere için örneklem içi en iyi kombinasyon
+        seçilir ve örneklem dışı sonuçları raporlanır (WalkForward pencere tablosuyla aynı sütunlar).
+
+        Args:
+            sweep (str): Tarama adı.
+            rank_by (str): Sıralama / seçim metriği.
+
+        Returns:
+            pandas.DataFrame: Sonuç tablosu.
+        """
+        results = self.queue.results(sweep)
+        if not results:
+            return pd.DataFrame()
+        if results[0][0]["window"] is None:
+            tables = []
+            for symbol in self.symbols:
+                rows = [{**job["params"], **result["metrics"]} for job, result in results if job["symbol"] == symbol]
+                if rows:
+                    tables.append(rank_rows(rows, rank_by).assign(symbol=symbol))
+            table = pd.concat(tables, ignore_index=True)
+            return table[["symbol"] + [name for name in table.columns if name != "symbol"]]
+
+        groups = OrderedDict()
+        for job, result in results:
+            groups.setdefault((job["symbol"], tuple(job["window"][:2])), []).append((job, result))
+        rows = []
+        for (symbol, _), entries in groups.items():
+            ranked = rank_rows([{"entry": i, **result["is_metrics"]} for i, (_, result) in enumerate(entries)],
+                               rank_by)
+            job, result = entries[int(ranked.iloc[0]["entry"])]
+            rows.append({"symbol": symbol, **result["window"], **job["params"],
+                         "is_score": ranked.iloc[0][rank_by], **result["oos"]})
+        return pd.DataFrame(rows)
+
+
+class _Heartbeat(threading.Thread):
+    # Uzun süren işlerde kirayı ayrı bir bağlantı üzerinden düzenli olarak uzatır
+    def __init__(self, path, job_id, worker, lease_seconds):
+        super().__init__(name="work-queue-heartbeat", daemon=True)
+        self.path = path
+        self.job_id = job_id
+        self.worker = worker
+        self.lease_seconds = lease_seconds
+        self.stopped = threading.Event()
+
+    def run(self):
+        queue = WorkQueue(self.path, lease_seconds=self.lease_seconds)
+        try:
+            while not self.stopped.wait(self.lease_seconds / 3):
+                if not queue.heartbeat(self.job_id, self.worker):
+                    return
+        finally:
+            queue.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class QueueWorker:
+    def __init__(self, queue_path, name=None, base_path=None, lease_seconds=300, max_attempts=3,
+                 poll_interval=1.0, cache_size=2):
+        """
+        Kuyruktan iş kiralayıp çalıştıran işçi. Aynı kuyruğa istenen sayıda makineden ve süreçten
+        işçi bağlanabilir. Sembol verisi ortak bar deposundan bellek eşleme ile yüklenir ve aynı
+        sembolün ardışık işleri için tekrar okunmaz.
+
+        Args:
+            queue_path (str): Kuyruk veritabanı dosyası.
+            name (str, optional): İşçi adı; varsayılan "<makine>-<süreç no>".
+            base_path (str, optional): Bar deposunun bu makinedeki kök klasörü; varsayılan taramadaki yol.
+            lease_seconds (float): Kira süresi (saniye); işler çalışırken heartbeat ile uzatılır.
+            max_attempts (int): Bir işin en fazla deneme sayısı.
+            poll_interval (float): Kuyruk boşken bekleme aralığı (saniye).
+            cache_size (int): Bellekte tutulan sembol verisi sayısı.
+        """
+        self.logger = Logger(__name__)
+        self.queue_path = queue_path
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.base_path = base_path
+        self.lease_seconds = lease_seconds
+        self.queue = WorkQueue(queue_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+        self.poll_interval = poll_interval
+        self.cache_size = cache_size
+        self._settings = {}
+        self._data = OrderedDict()
+
+    def run(self, sweep=None, max_jobs=None, idle_timeout=None):
+        """
+        Kuyruktaki işleri çalıştırır.
+
+        Args:
+            sweep (str, optional): Yalnızca bu taramanın işleri.
+            max_jobs (int, optional): Çalıştırılacak en fazla iş sayısı.
+            idle_timeout (float, optional): Kuyruk bu süre boyunca boş kalırsa durulur (saniye);
+                None ise iş beklemeye devam edilir.
+
+        Returns:
+            int: Tamamlanan iş sayısı.
+        """
+        completed = 0
+        idle_since = time.monotonic()
+        try:
+            while max_jobs is None or completed < max_jobs:
+                job = self.queue.lease(self.name, sweep)
+                if job is None:
+                    if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+                heartbeat = _Heartbeat(self.queue_path, job["id"], self.name, self.lease_seconds)
+                heartbeat.start()
+                try:
+                    result = self.evaluate(job)
+                except Exception as e:
+                    heartbeat.stop()
+                    self.logger.error("İş %d başarısız (deneme %d): %s", job["id"], job["attempts"], e)
+                    self.queue.fail(job["id"], self.name, "".join(traceback.format_exception_only(e)).strip())
+                else:
+                    heartbeat.stop()
+                    if self.queue.complete(job["id"], self.name, result):
+                        completed += 1
+                idle_since = time.monotonic()
+        finally:
+            self.queue.close()
+        self.logger.info("İşçi %s: %d iş tamamlandı.", self.name, completed)
+        return completed
+
+    def _sweep_settings(self, sweep):
+        if sweep not in self._settings:
+            settings = self.queue.settings(sweep)
+            settings["strategy_class"] = load_strategy(settings["strategy"])
+            if self.base_path is not None:
+                settings["base_path"] = self.base_path
+            self._settings[sweep] = settings
+        return self._settings[sweep]
+
+    def _symbol_data(self, settings, symbol):
+        key = (settings["base_path"], symbol, settings["timeframe"], settings["date_column"],
+               settings["start_date"], settings["end_date"], settings["engine"])
+        if key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+        df = load_symbol(settings["base_path"], symbol, settings["timeframe"], settings["date_column"],
+                         settings["start_date"], settings["end_date"])
+        entry = (df[settings["date_column"]].to_numpy(dtype="datetime64[ns]"), prepare_data(df, settings))
+        self._data[key] = entry
+        while len(self._data) > self.cache_size:
+            self._data.popitem(last=False)
+        return entry
+
+    def evaluate(self, job):
+        """
+        Tek bir işi çalıştırır.
+
+        Returns:
+            dict: Pencere yoksa {'metrics'}; walk-forward işlerinde {'window', 'is_metrics', 'oos'}.
+        """
+        settings = self._sweep_settings(job["sweep"])
+        payload = job["payload"]
+        times, data = self._symbol_data(settings, payload["symbol"])
+        params = payload["params"]
+        if payload["window"] is None:
+            return {"metrics": evaluate_params(data, settings, params)[0]}
+
+        is_start, oos_start, oos_end = (_position(times, value) for value in payload["window"])
+        is_metrics = evaluate_params(data.iloc[is_start:oos_start], settings, params)[0]
+        growth, _, oos_metrics = evaluate_out_of_sample(data, settings, params, oos_start, oos_end)
+        return {
+            "window": {
+                "is_start": str(pd.Timestamp(times[is_start])),
+                "is_end": str(pd.Timestamp(times[oos_start - 1])),
+                "oos_start": str(pd.Timestamp(times[oos_start])),
+                "oos_end": str(pd.Timestamp(times[oos_end - 1])),
+            },
+            "is_metrics": is_metrics,
+            "oos": {
+                "oos_return": (growth - 1.0) * 100.0,
+                "oos_sharpe": oos_metrics.get("sharpe"),
+                "oos_max_drawdown": oos_metrics.get("max_drawdown"),
+                "oos_trade_count": oos_metrics.get("trade_count"),
+            },
+        }
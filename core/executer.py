@@ -1,33 +1,131 @@
+from collections import Counter
+
 import pandas as pd
 from strategy.exp_moving_average import MovingAverageStrategy
-from core.logger import Logger
+from core.journal import EVENT_SIGNAL
+from core.logger import Logger, SignalLog
+from core.profiler import get_profiler
 
 
 class Executor:
-    def __init__(self, strategy_class, data):
+    def __init__(self, strategy_class, data, incremental=True, log_every=None, journal=None,
+                 strategy_params=None):
         """
         Executor sınıfı, verilen stratejiyi kullanarak ticaret işlemlerini yürütür.
 
         Args:
             strategy_class (class): Örneğin, MovingAverageStrategy gibi kullanılacak strateji sınıfı.
             data (pandas.DataFrame): Stratejinin çalışacağı tarihsel veri.
+            incremental (bool): True ise ve strateji on_bar metodunu destekliyorsa,
+                barlar tek tek iletilir ve strateji bar başına sabit maliyetle güncellenir.
+                False ise her adımda o ana kadarki veri dilimi yeniden işlenir.
+            log_every (int, optional): Sinyallerin kaç barda bir özetlenerek loglanacağı;
+                belirtilmezse config'teki "signal_log_every" kullanılır.
+            journal (TradeJournal, optional): Pozisyon değiştiren sinyallerin kaydedileceği günlük.
+            strategy_params (dict, optional): Stratejiye iletilecek parametreler.
         """
         self.logger = Logger(__name__)
-        self.strategy = strategy_class(data)
+        self.profiler = get_profiler()
+        self.log_every = log_every
+        self.journal = journal
+        self.strategy = strategy_class(data, **(strategy_params or {}))
+        self.strategy_id = journal.strategy_id(strategy_class.__name__) if journal is not None else 0
+        self.incremental = incremental and self.strategy.supports_incremental()
 
     def run(self):
         """
         Stratejiyi çalıştırır. Veri üzerinde adım adım ilerleyerek, stratejinin
-        ürettiği sinyalleri loglar.
+        ürettiği sinyalleri periyodik özetler halinde loglar.
+
+        Returns:
+            list: Her bar için üretilen sinyaller.
         """
         self.logger.info("Executor başlatıldı.")
+        signal_log = SignalLog(self.logger, self.log_every)
 
-        # Strateji verisi üzerinde adım adım döngü simülasyonu
-        for i in range(len(self.strategy.data)):
-            # Her adımda mevcut veri dilimini güncelle
-            current_data = self.strategy.data.iloc[:i + 1]
-            self.strategy.on_data(current_data)
-            signal = self.strategy.execute()
-            self.logger.info(f"Adım {i}: Üretilen sinyal: {signal}")
+        if self.incremental:
+            signals = self._run_incremental(signal_log)
+        else:
+            signals = self._run_full(signal_log)
+        signal_log.close()
+
+        self.profiler.count("bars", len(signals))
+        self.logger.info("Executor tamamlandı.")
+        return signals
+
+    def run_stream(self, chunks, date_column="time"):
+        """
+        Stratejiyi parça parça gelen veri üzerinde artımlı modda çalıştırır. İndikatör durumu
+        strateji içinde tutulduğu için parça sınırlarında kaybolmaz; sinyaller liste yerine
+        sayılarak tutulur ve bellek kullanımı veri uzunluğundan bağımsız kalır.
+
+        Args:
+            chunks (iterable): DataFrame parçaları (ör: BarStream).
+            date_column (str): Parçalarda index'e taşınacak tarih sütunu.
+
+        Returns:
+            collections.Counter: Sinyal -> bar sayısı.
+        """
+        if not self.incremental:
+            raise ValueError(f"{type(self.strategy).__name__} artımlı modu desteklemiyor; akışlı çalıştırılamaz.")
+        self.logger.info("Executor akışlı modda başlatıldı.")
+        signal_log = SignalLog(self.logger, self.log_every)
+        counts = Counter()
+        step = 0
+        for chunk in chunks:
+            if date_column in chunk.columns:
+                chunk = chunk.set_index(date_column)
+            # Strateji yalnızca içinde bulunduğu parçayı görür
+            self.strategy.data = chunk
+            counts.update(self._iter_incremental(chunk, step, signal_log))
+            step += len(chunk)
+        signal_log.close()
 
+        self.profiler.count("bars", step)
         self.logger.info("Executor tamamlandı.")
+        return counts
+
+    def _run_incremental(self, signal_log):
+        return list(self._iter_incremental(self.strategy.data, 0, signal_log))
+
+    def _iter_incremental(self, data, start, signal_log):
+        # Her adımda yalnızca yeni bar stratejiye iletilir
+        profiler = self.profiler
+        strategy = self.strategy
+        for i, bar in enumerate(data.itertuples(), start):
+            previous_position = getattr(strategy, 'position', 0)
+            with profiler.stage("indicators"):
+                strategy.on_bar(bar)
+            with profiler.stage("signals"):
+                signal = strategy.execute()
+            signal_log.record(i, signal)
+            if self.journal is not None and getattr(strategy, 'position', 0) != previous_position:
+                self._record_signal(bar.Index, bar.close)
+            yield signal
+
+    def _run_full(self, signal_log):
+        # Strateji verisi üzerinde adım adım döngü simülasyonu.
+        # on_data strateji verisini değiştirdiği için dilimler orijinal veriden alınır.
+        profiler = self.profiler
+        strategy = self.strategy
+        data = strategy.data
+        signals = []
+        for i in range(len(data)):
+            # Her adımda mevcut veri dilimini güncelle
+            current_data = data.iloc[:i + 1]
+            previous_position = getattr(strategy, 'position', 0)
+            with profiler.stage("indicators"):
+                strategy.on_data(current_data)
+            with profiler.stage("signals"):
+                signal = strategy.execute()
+            signals.append(signal)
+            signal_log.record(i, signal)
+            if self.journal is not None and getattr(strategy, 'position', 0) != previous_position:
+                self._record_signal(data.index[i], data['close'].iat[i])
+        return signals
+
+    def _record_signal(self, time, price):
+        # Hedef pozisyon değiştiğinde yön ve yeni hedef günlüğe yazılır
+        position = self.strategy.position
+        self.journal.record(time, EVENT_SIGNAL, (position > 0) - (position < 0), price, position,
+                            self.strategy_id)
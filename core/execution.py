@@ -0,0 +1,141 @@
+import numpy as np
+
+
+def shift_targets(targets, bars):
+    """
+    Hedef pozisyonları `bars` bar sonraya kaydırır; ilk barlarda pozisyon yoktur.
+    """
+    holdings = np.zeros_like(targets)
+    if bars < len(targets):
+        holdings[bars:] = targets[:len(targets) - bars]
+    return holdings
+
+
+def fill_partially(desired, capacity):
+    """
+    Hedef pozisyona bar başına en fazla `capacity` kadar yaklaşarak gerçekleşen pozisyonları hesaplar.
+    Karşılanamayan miktar sonraki barlara taşınır; hedef değiştiğinde yeni hedefe o andaki
+    pozisyondan devam edilir.
+
+    Döngü bar sayısı kadar değil, hedef değişimi (emir) sayısı kadar döner; her emrin dolum
+    aralığı kümülatif kapasite üzerinde searchsorted ile bulunur ve dilim olarak yazılır.
+
+    Args:
+        desired (numpy.ndarray): Her bar için ulaşılmak istenen pozisyon.
+        capacity (numpy.ndarray): Her barda gerçekleşebilecek en büyük miktar (mutlak).
+
+    Returns:
+        numpy.ndarray: Her bar sonundaki gerçekleşmiş pozisyon.
+    """
+    count = len(desired)
+    holdings = np.zeros(count, dtype=np.float64)
+    cumulative = np.concatenate([[0.0], np.cumsum(capacity, dtype=np.float64)])
+    changes = np.flatnonzero(np.diff(desired, prepend=0.0))
+    bounds = np.append(changes, count)
+    current = 0.0
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        target = desired[start]
+        need = target - current
+        if need == 0:
+            holdings[start:end] = current
+            continue
+        # start..j barlarında birikmiş kapasite; ilk yeterli olduğu bar emrin tamamlandığı bardır
+        available = cumulative[start + 1:end + 1] - cumulative[start]
+        reached = int(np.searchsorted(available, abs(need) * (1 - 1e-12), "left"))
+        holdings[start:start + reached] = current + np.sign(need) * available[:reached]
+        holdings[start + reached:end] = target
+        current = target if reached < end - start else holdings[end - 1]
+    return holdings
+
+
+class FillSimulator:
+    def __init__(self, point=0.00001, spread_column="spread", spread=0.0, slippage=0.0, impact=0.0,
+                 volume_column="tick_volume", max_participation=None, latency_bars=0, deviation=None):
+        """
+        Vektörel motor için gerçekçi emir gerçekleşme modeli. Tüm maliyetler seri boyunca dizi
+        işlemleriyle uygulanır; bar başına Python döngüsü yoktur (kısmi dolumda döngü yalnızca
+        emir sayısı kadar döner).
+
+        - Spread: MT5 barları bid fiyatlarıdır; alımlar ask (fiyat + spread) fiyatından, satışlar
+          bid fiyatından gerçekleşir. Spread barın `spread_column` sütunundan (puan) okunur; sütun
+          yoksa sabit `spread` kullanılır.
+        - Kayma: her emirde sabit `slippage` puanına ek olarak emir miktarının bar hacmine oranıyla
+          büyüyen `impact` puanı ters yönde uygulanır. `deviation` verilirse kayma bu değerle
+          (MT5 emir isteğindeki deviation) sınırlanır.
+        - Gecikme: sinyal, bir sonraki bar yerine `latency_bars` bar daha sonra gerçekleşir.
+        - Kısmi dolum: `max_participation` verilirse bir barda en fazla bar hacminin bu oranı
+          kadar işlem yapılır; kalan miktar sonraki barlarda tamamlanır.
+
+        Args:
+            point (float): Bir puanın fiyat karşılığı (MT5 symbol_info.point; ör: 5 basamak için 0.00001).
+            spread_column (str): Bar başına spread sütunu (puan).
+            spread (float): Spread sütunu yoksa kullanılacak sabit spread (puan).
+            slippage (float): Emir başına sabit kayma (puan).
+            impact (float): Bar hacminin tamamı kadar emirde eklenen kayma (puan); hacim oranıyla doğrusal.
+            volume_column (str): Bar hacmi sütunu.
+            max_participation (float, optional): Bar başına işlenebilecek hacim oranı (0-1].
+            latency_bars (int): Emir gecikmesi (bar).
+            deviation (float, optional): Kabul edilen en büyük kayma (puan).
+        """
+        if max_participation is not None and not 0 < max_participation:
+            raise ValueError("max_participation pozitif olmalıdır.")
+        if latency_bars < 0:
+            raise ValueError("latency_bars negatif olamaz.")
+        self.point = point
+        self.spread_column = spread_column
+        self.spread = spread
+        self.slippage = slippage
+        self.impact = impact
+        self.volume_column = volume_column
+        self.max_participation = max_participation
+        self.latency_bars = int(latency_bars)
+        self.deviation = deviation
+
+    def _volume(self, data):
+        if self.volume_column not in data:
+            raise ValueError(f"Hacim sütunu bulunamadı: {self.volume_column}")
+        # Hacmi sıfır olan barlar (ör: veri boşlukları) tek birim kabul edilir
+        return np.maximum(data[self.volume_column].to_numpy(dtype=np.float64), 1.0)
+
+    def holdings(self, targets, data):
+        """
+        Bar sonu hedeflerinden her bar sonunda gerçekleşmiş pozisyonları hesaplar.
+
+        Args:
+            targets (numpy.ndarray): Her bar için hedef pozisyon miktarı.
+            data (pandas.DataFrame): Bar verisi.
+
+        Returns:
+            numpy.ndarray: Gerçekleşmiş pozisyonlar.
+        """
+        desired = shift_targets(targets, 1 + self.latency_bars)
+        if self.max_participation is None:
+            return desired
+        return fill_partially(desired, self._volume(data) * self.max_participation)
+
+    def fill_prices(self, delta, prices, data):
+        """
+        Pozisyon değişimlerinin spread ve kayma dahil gerçekleşme fiyatlarını hesaplar.
+
+        Args:
+            delta (numpy.ndarray): Her bardaki pozisyon değişimi.
+            prices (numpy.ndarray): Maliyetsiz gerçekleşme fiyatları (bid).
+            data (pandas.DataFrame): Bar verisi.
+
+        Returns:
+            tuple: (gerçekleşme fiyatları, bar başına spread + kayma maliyeti)
+        """
+        if self.spread_column in data:
+            spread = data[self.spread_column].to_numpy(dtype=np.float64)
+        else:
+            spread = np.full(len(delta), float(self.spread))
+        size = np.abs(delta)
+        slippage = np.full(len(delta), float(self.slippage))
+        if self.impact:
+            slippage = slippage + self.impact * size / self._volume(data)
+        if self.deviation is not None:
+            slippage = np.minimum(slippage, self.deviation)
+        # Alımda spread ve kayma fiyatı artırır, satışta yalnızca kayma fiyatı düşürür
+        points = np.where(delta > 0, spread + slippage, np.where(delta < 0, slippage, 0.0))
+        adjustment = np.sign(delta) * points * self.point
+        return prices + adjustment, size * points * self.point
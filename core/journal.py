@@ -0,0 +1,176 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data.bar_store import append_bars, read_bars, write_bars
+
+# Olay türleri
+EVENT_SIGNAL = 0  # Stratejinin hedef pozisyonu değişti
+EVENT_FILL = 1    # Emir gerçekleşti
+
+# Yön: 1 = alım, -1 = satış, 0 = pozisyon kapatma (yalnızca sinyallerde)
+SIDE_BUY = 1
+SIDE_SELL = -1
+SIDE_FLAT = 0
+
+COLUMNS = {
+    'time': np.int64,  # epoch'tan bu yana nanosaniye
+    'kind': np.int8,
+    'side': np.int8,
+    'price': np.float64,
+    'size': np.float64,
+    'strategy_id': np.int32,
+}
+STRATEGIES_FILE = "strategies.json"
+
+
+def _to_nanoseconds(times):
+    values = np.asarray(times)
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ns]').view(np.int64)
+    if values.dtype.kind in 'iu':
+        return values.astype(np.int64)
+    return pd.to_datetime(values).to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+class TradeJournal:
+    def __init__(self, path=None, chunk_size=65536):
+        """
+        Sinyal ve emir gerçekleşmelerini tipli, sütunlu bir tamponda tutan günlük.
+        Olaylar önceden ayrılmış NumPy dizilerine yazılır; tampon dolduğunda parça halinde
+        bar deposu biçiminde diske eklenir ve okunurken bellek eşleme ile açılır.
+
+        Args:
+            path (str, optional): Günlük klasörü (ör: results/journal.bars); belirtilmezse
+                parçalar bellekte tutulur. Mevcut günlük yeni çalıştırmada değiştirilir.
+            chunk_size (int): Tampon kapasitesi (olay sayısı).
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self._buffers = {name: np.empty(chunk_size, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._size = 0
+        self._total = 0
+        self._chunks = []
+        self._flushed = False
+        self.strategies = {}
+
+    def strategy_id(self, name):
+        """
+        Strateji (veya varlık) adı için kalıcı bir tamsayı kimlik döner.
+        """
+        if name not in self.strategies:
+            self.strategies[name] = len(self.strategies)
+        return self.strategies[name]
+
+    def record(self, time, kind, side, price, size, strategy_id=0):
+        """
+        Tek bir olay ekler.
+
+        Args:
+            time (pandas.Timestamp or datetime or numpy.datetime64): Olay zamanı.
+            kind (int): EVENT_SIGNAL veya EVENT_FILL.
+            side (int): SIDE_BUY, SIDE_SELL veya SIDE_FLAT.
+            price (float): Sinyal fiyatı veya gerçekleşme fiyatı.
+            size (float): Hedef pozisyon (sinyal) veya gerçekleşen miktar (mutlak değer).
+            strategy_id (int): strategy_id ile alınan kimlik.
+        """
+        if self._size == self.chunk_size:
+            self.flush()
+        i = self._size
+        buffers = self._buffers
+        buffers['time'][i] = pd.Timestamp(time).value
+        buffers['kind'][i] = kind
+        buffers['side'][i] = side
+        buffers['price'][i] = price
+        buffers['size'][i] = size
+        buffers['strategy_id'][i] = strategy_id
+        self._size = i + 1
+        self._total += 1
+
+    def record_many(self, times, kind, sides, prices, sizes, strategy_id=0):
+        """
+        Birden fazla olayı dizi işlemleriyle ekler (vektörel motor için).
+
+        Args:
+            times (array-like): Olay zamanları.
+            kind (int or array-like): Tüm olaylar için veya olay başına EVENT_SIGNAL / EVENT_FILL.
+            sides, prices, sizes (array-like): Olay başına yön, fiyat ve miktar.
+            strategy_id (int): strategy_id ile alınan kimlik.
+        """
+        columns = {
+            'time': _to_nanoseconds(times),
+            'kind': kind if np.ndim(kind) == 0 else np.asarray(kind),
+            'side': np.asarray(sides),
+            'price': np.asarray(prices),
+            'size': np.asarray(sizes),
+            'strategy_id': strategy_id,
+        }
+        total = len(columns['time'])
+        start = 0
+        while start < total:
+            if self._size == self.chunk_size:
+                self.flush()
+            count = min(self.chunk_size - self._size, total - start)
+            for name, values in columns.items():
+                target = self._buffers[name][self._size:self._size + count]
+                target[:] = values if np.ndim(values) == 0 else values[start:start + count]
+            self._size += count
+            start += count
+        self._total += total
+
+    def __len__(self):
+        return self._total
+
+    def _pending_frame(self):
+        frame = pd.DataFrame({name: values[:self._size].copy() for name, values in self._buffers.items()})
+        frame['time'] = frame['time'].to_numpy().view('datetime64[ns]')
+        return frame
+
+    def flush(self):
+        """
+        Tampondaki olayları diske (veya bellekteki parça listesine) aktarır.
+        """
+        if self.path is None:
+            if self._size:
+                self._chunks.append(self._pending_frame())
+        else:
+            if not self._flushed:
+                # İlk parça mevcut günlüğün yerine yazılır
+                write_bars(self.path, self._pending_frame())
+                self._flushed = True
+            elif self._size:
+                append_bars(self.path, self._pending_frame())
+            with open(os.path.join(self.path, STRATEGIES_FILE), 'w') as f:
+                json.dump(self.strategies, f)
+        self._size = 0
+
+    def close(self):
+        self.flush()
+
+    def to_frame(self):
+        """
+        Tüm olayları tek bir DataFrame olarak döner (time, kind, side, price, size, strategy_id).
+        Diske yazılmış olaylar kopyalanmadan bellek eşleme ile okunur.
+        """
+        if self.path is not None:
+            self.flush()
+            return read_bars(self.path)
+        frames = self._chunks + [self._pending_frame()]
+        return pd.concat(frames, ignore_index=True)
+
+
+def read_journal(path):
+    """
+    Diske yazılmış bir günlüğü okur.
+
+    Args:
+        path (str): Günlük klasörü.
+
+    Returns:
+        tuple: (olaylar DataFrame'i, strateji adı -> kimlik sözlüğü)
+    """
+    with open(os.path.join(path, STRATEGIES_FILE), 'r') as f:
+        strategies = json.load(f)
+    return read_bars(path), strategies
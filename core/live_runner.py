@@ -0,0 +1,366 @@
+import queue
+import threading
+import time
+from time import perf_counter_ns
+
+import numpy as np
+import pandas as pd
+
+from core.journal import EVENT_FILL, EVENT_SIGNAL
+from core.logger import Logger
+from core.profiler import get_profiler
+from data.resample import timeframe_seconds
+from strategy.base_strategy import Bar
+
+_STOP = object()
+
+
+def _rates_to_bars(rates):
+    # MT5 bar DataFrame'ini (time, open, high, low, close, tick_volume) Bar listesine çevirir
+    return [Bar(*row) for row in zip(rates["time"], rates["open"], rates["high"], rates["low"],
+                                     rates["close"], rates["tick_volume"])]
+
+
+class MT5BarSource:
+    def __init__(self, connector, symbol, timeframe, mt5_module=None):
+        """
+        MetaTrader5 terminalinden kapanmış barları artımlı olarak okuyan kaynak. Her döngüde
+        yalnızca son tick (symbol_info_tick) sorgulanır; barlar yalnızca tick zamanı açık barın
+        kapanışını geçtiğinde ve yalnızca eksik olan kadar (copy_rates_from_pos) istenir.
+
+        Args:
+            connector (MetaTrader5Connector): Açık terminal oturumu.
+            symbol (str): Sembol.
+            timeframe (str): Zaman dilimi adı (ör: "M1", "H1").
+            mt5_module (module, optional): MetaTrader5 modülü; varsayılan bağlantının kullandığı modül.
+        """
+        if mt5_module is None:
+            from connectors import mt5_connector
+            mt5_module = mt5_connector.mt5
+        self.connector = connector
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.mt5_timeframe = getattr(mt5_module, f"TIMEFRAME_{timeframe}")
+        self.seconds = timeframe_seconds(timeframe)
+        self.last_time = None
+
+    def history(self, count):
+        """
+        Isınma için son `count` kapanmış barı döner ve kaynağı bu noktadan itibaren izlemeye başlar.
+        """
+        bars = self.connector.get_latest_bars(self.symbol, self.mt5_timeframe, count)
+        if bars is None or len(bars) == 0:
+            return []
+        self.last_time = bars["time"].iloc[-1]
+        return _rates_to_bars(bars)
+
+    def poll(self):
+        """
+        Son okumadan bu yana kapanan barları döner (yoksa boş liste).
+        """
+        tick = self.connector.get_tick(self.symbol)
+        if tick is None or self.last_time is None:
+            return []
+        now = pd.Timestamp(tick.time_msc, unit="ms")
+        next_close = self.last_time + pd.Timedelta(seconds=2 * self.seconds)
+        if now < next_close:
+            # Son kapanmış barın ardından açılan bar henüz kapanmadı
+            return []
+        missing = int((now - self.last_time) // pd.Timedelta(seconds=self.seconds))
+        bars = self.connector.get_latest_bars(self.symbol, self.mt5_timeframe, missing)
+        if bars is None:
+            return []
+        bars = bars[bars["time"] > self.last_time]
+        if len(bars):
+            self.last_time = bars["time"].iloc[-1]
+        return _rates_to_bars(bars)
+
+
+class BinanceBarSource:
+    def __init__(self, connector, symbol, timeframe="1m"):
+        """
+        ccxt tabanlı borsadan kapanmış mumları artımlı olarak okuyan kaynak. Her döngüde yalnızca
+        son okunan mumdan sonraki mumlar (since) istenir; oluşum halindeki son mum atlanır.
+
+        Args:
+            connector (BinanceConnector): Açık borsa bağlantısı.
+            symbol (str): İşlem sembolü (örn: 'BTC/USDT').
+            timeframe (str): ccxt mum aralığı (örn: '1m', '1h').
+        """
+        self.connector = connector
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.last_ms = None
+
+    def _fetch(self, since=None, limit=None):
+        rows = self.connector.fetch_ohlcv(self.symbol, self.timeframe, since=since, limit=limit)
+        if not rows:
+            return []
+        # Son mum oluşum halindedir
+        rows = [row for row in rows[:-1] if self.last_ms is None or row[0] > self.last_ms]
+        if rows:
+            self.last_ms = rows[-1][0]
+        return [Bar(pd.Timestamp(row[0], unit="ms"), *row[1:6]) for row in rows]
+
+    def history(self, count):
+        """
+        Isınma için son `count` kapanmış mumu döner ve kaynağı bu noktadan itibaren izlemeye başlar.
+        """
+        return self._fetch(limit=count + 1)
+
+    def poll(self):
+        """
+        Son okumadan bu yana kapanan mumları döner (yoksa boş liste).
+        """
+        since = None if self.last_ms is None else self.last_ms + 1
+        return self._fetch(since=since)
+
+
+class MT5OrderRouter:
+    def __init__(self, connector, symbol, volume=0.1, slippage=20, magic=0, mt5_module=None):
+        """
+        Hedef pozisyon değişimlerini MetaTrader5 piyasa emirlerine çevirir. Fiyat, emrin
+        gönderildiği anda son tickten alınır (alımda ask, satışta bid).
+
+        Args:
+            connector (MetaTrader5Connector): Açık terminal oturumu.
+            symbol (str): Sembol.
+            volume (float): Pozisyon birimi başına lot.
+            slippage (int): Maksimum kayma (puan).
+            magic (int): Magic numarası.
+            mt5_module (module, optional): MetaTrader5 modülü; varsayılan bağlantının kullandığı modül.
+        """
+        if mt5_module is None:
+            from connectors import mt5_connector
+            mt5_module = mt5_connector.mt5
+        self.mt5 = mt5_module
+        self.connector = connector
+        self.symbol = symbol
+        self.volume = volume
+        self.slippage = slippage
+        self.magic = magic
+
+    def send(self, delta):
+        """
+        Pozisyonu `delta` birim değiştiren emri gönderir.
+
+        Returns:
+            tuple: (gerçekleşme fiyatı, terminal sonucu); emir gönderilemediyse fiyat None.
+        """
+        tick = self.connector.get_tick(self.symbol)
+        if tick is None:
+            return None, None
+        buy = delta > 0
+        price = tick.ask if buy else tick.bid
+        order_type = self.mt5.ORDER_TYPE_BUY if buy else self.mt5.ORDER_TYPE_SELL
+        result = self.connector.send_order(self.symbol, order_type, abs(delta) * self.volume, price,
+                                           slippage=self.slippage, magic=self.magic)
+        if result is None or result.retcode != self.mt5.TRADE_RETCODE_DONE:
+            return None, result
+        return result.price or price, result
+
+
+class BinanceOrderRouter:
+    def __init__(self, connector, symbol, amount=1.0):
+        """
+        Hedef pozisyon değişimlerini ccxt piyasa emirlerine çevirir.
+
+        Args:
+            connector (BinanceConnector): Açık borsa bağlantısı.
+            symbol (str): İşlem sembolü.
+            amount (float): Pozisyon birimi başına miktar.
+        """
+        self.connector = connector
+        self.symbol = symbol
+        self.amount = amount
+
+    def send(self, delta):
+        """
+        Pozisyonu `delta` birim değiştiren emri gönderir.
+
+        Returns:
+            tuple: (gerçekleşme fiyatı, borsa sonucu); emir gönderilemediyse fiyat None.
+        """
+        side = 'buy' if delta > 0 else 'sell'
+        order = self.connector.create_order(self.symbol, 'market', side, abs(delta) * self.amount)
+        if order is None:
+            return None, None
+        return order.get('average') or order.get('price'), order
+
+
+class LiveRunner:
+    def __init__(self, strategy_class, source, router, stake=1, strategy_params=None, warmup=200,
+                 poll_interval=0.05, journal=None, name=None, clock=perf_counter_ns):
+        """
+        Canlı işlem döngüsü. Bağlantı oturumu açık tutulur; kaynak her döngüde yalnızca yeni
+        kapanan barlar için sorgulanır ve strateji on_bar ile artımlı olarak güncellenir, geçmiş
+        hiçbir döngüde yeniden çekilmez. Hedef pozisyon değiştiğinde emir bir kuyruğa bırakılır
+        ve ayrı bir iş parçacığında gönderilir; veri döngüsü emir gönderimini beklemez.
+
+        Her emir için barın alındığı andan emrin kuyruğa bırakılmasına (karar) ve gönderiminin
+        tamamlanmasına (emir) kadar geçen süre ölçülür; latency_report ile raporlanır.
+
+        Args:
+            strategy_class (class): on_bar metodunu uygulayan BaseStrategy alt sınıfı.
+            source: history(count) ve poll() metodlarına sahip veri kaynağı (ör: MT5BarSource).
+            router: send(delta) metoduna sahip emir yönlendirici (ör: MT5OrderRouter).
+            stake (float): Pozisyon başına işlem miktarı.
+            strategy_params (dict, optional): Stratejiye iletilecek parametreler.
+            warmup (int): Başlangıçta stratejiye emir verilmeden iletilecek geçmiş bar sayısı.
+            poll_interval (float): Yeni veri olmadığında döngüler arası bekleme (saniye).
+            journal (TradeJournal, optional): Sinyal ve emir gerçekleşmelerinin kaydedileceği günlük.
+            name (str, optional): Günlükteki strateji/varlık adı; varsayılan strateji sınıfının adı.
+            clock (callable): Gecikme ölçümünde kullanılan nanosaniye saati.
+        """
+        self.logger = Logger(__name__)
+        self.strategy = strategy_class(None, **(strategy_params or {}))
+        if not self.strategy.supports_incremental():
+            raise ValueError(f"{strategy_class.__name__} artımlı modu desteklemiyor.")
+        self.source = source
+        self.router = router
+        self.stake = stake
+        self.warmup = warmup
+        self.poll_interval = poll_interval
+        self.journal = journal
+        self.clock = clock
+        self._strategy_id = journal.strategy_id(name or strategy_class.__name__) if journal is not None else 0
+        self.holdings = 0
+        self.bars = 0
+        self.fills = []
+        self._orders = queue.Queue()
+        self._decision_ns = []
+        self._order_ns = []
+        self._dispatcher = None
+
+    def start(self):
+        """
+        Stratejiyi geçmiş barlarla ısıtır ve emir gönderim iş parçacığını başlatır.
+        Isınma sonunda strateji pozisyondaysa ilk emir bir sonraki pozisyon değişikliğinde verilir.
+        """
+        history = self.source.history(self.warmup)
+        for bar in history:
+            self.strategy.on_bar(bar)
+            self.strategy.execute()
+        # Hesaptaki pozisyon sıfırdan başlar; ısınmada oluşan hedef yeni bir sinyal değildir
+        self._position = getattr(self.strategy, 'position', 0)
+        self._dispatcher = threading.Thread(target=self._dispatch, name="order-dispatch", daemon=True)
+        self._dispatcher.start()
+        self.logger.info("Canlı döngü %d geçmiş barla başlatıldı.", len(history))
+
+    def step(self):
+        """
+        Kaynağı bir kez sorgular ve gelen yeni barları stratejiye iletir.
+
+        Returns:
+            int: İşlenen bar sayısı.
+        """
+        bars = self.source.poll()
+        received = self.clock()
+        profiler = get_profiler()
+        strategy = self.strategy
+        for bar in bars:
+            strategy.on_bar(bar)
+            strategy.execute()
+            position = getattr(strategy, 'position', 0)
+            if position == self._position:
+                continue
+            self._position = position
+            if self.journal is not None:
+                self.journal.record(bar.datetime, EVENT_SIGNAL, (position > 0) - (position < 0), bar.close,
+                                    position, self._strategy_id)
+            self._orders.put((position * self.stake, received))
+            self._decision_ns.append(self.clock() - received)
+        self.bars += len(bars)
+        profiler.count("bars", len(bars))
+        return len(bars)
+
+    def _dispatch(self):
+        # Kuyruktaki hedefler sırayla gönderilir; her emir o ana kadarki gerçekleşmiş pozisyona göre hesaplanır
+        while True:
+            item = self._orders.get()
+            if item is _STOP:
+                self._orders.task_done()
+                break
+            try:
+                self._send(*item)
+            finally:
+                self._orders.task_done()
+
+    def _send(self, target, received):
+        delta = target - self.holdings
+        if delta == 0:
+            return
+        try:
+            price, _ = self.router.send(delta)
+        except Exception as e:
+            self.logger.error("Emir gönderilemedi: %s", e)
+            price = None
+        self._order_ns.append(self.clock() - received)
+        if price is None:
+            return
+        self.holdings += delta
+        now = pd.Timestamp.now()
+        self.fills.append((now, delta, price))
+        get_profiler().count("orders_filled")
+        if self.journal is not None:
+            self.journal.record(now, EVENT_FILL, 1 if delta > 0 else -1, price, abs(delta), self._strategy_id)
+
+    def wait_orders(self):
+        """
+        Kuyruğa bırakılmış tüm emirlerin gönderilmesini bekler.
+        """
+        self._orders.join()
+
+    def stop(self):
+        """
+        Kuyruktaki emirler gönderildikten sonra emir iş parçacığını durdurur.
+        """
+        if self._dispatcher is not None:
+            self._orders.put(_STOP)
+            self._dispatcher.join()
+            self._dispatcher = None
+
+    def run(self, max_cycles=None, duration=None):
+        """
+        Döngüyü çalıştırır; Ctrl+C, max_cycles veya duration (saniye) ile durur.
+
+        Returns:
+            dict: latency_report çıktısı.
+        """
+        self.start()
+        deadline = None if duration is None else time.monotonic() + duration
+        cycles = 0
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                cycles += 1
+                if self.step() == 0:
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            self.logger.info("Canlı döngü kullanıcı tarafından durduruldu.")
+        finally:
+            self.stop()
+        report = self.latency_report()
+        print("Canlı döngü: %d bar, %d emir; bar->emir p50 %.1f µs, p99 %.1f µs" % (
+            self.bars, report['orders'], report['order_p50_us'], report['order_p99_us']))
+        return report
+
+    def latency_report(self):
+        """
+        Bar alımından karar ve emir gönderimine kadar geçen sürelerin istatistikleri (mikrosaniye).
+
+        Returns:
+            dict: 'orders' ve karar/emir için ortalama, p50, p99 ve en büyük gecikme.
+        """
+        report = {'bars': self.bars, 'orders': len(self._order_ns)}
+        for name, samples in (('decision', self._decision_ns), ('order', self._order_ns)):
+            durations = np.asarray(samples, dtype=np.float64) / 1000.0
+            if len(durations):
+                p50, p99 = np.percentile(durations, [50, 99])
+                stats = (float(durations.mean()), float(p50), float(p99), float(durations.max()))
+            else:
+                stats = (0.0, 0.0, 0.0, 0.0)
+            for key, value in zip(('mean_us', 'p50_us', 'p99_us', 'max_us'), stats):
+                report[f'{name}_{key}'] = value
+        return report
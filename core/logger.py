@@ -1,30 +1,244 @@
+import atexit
 import logging
+import os
+import queue
+import sys
+import threading
+from collections import Counter
+from logging.handlers import QueueHandler
+
+_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_STOP = object()
+
+# configure_logging ile güncellenen ayarlar
+_settings = {
+    'level': logging.INFO,
+    'log_file': None,
+    'console': True,
+    'batch_size': 256,
+    'signal_log_every': 1000,
+}
+
+
+class _BatchWriter(threading.Thread):
+    """
+    Kuyruktaki kayıtları arka planda toplu halde biçimlendirip yazar. Kuyrukta bekleyen
+    tüm kayıtlar (en fazla batch_size) tek bir write çağrısıyla dosyaya ve konsola aktarılır.
+    """
+    def __init__(self, records, log_file, console, batch_size):
+        super().__init__(name="log-writer", daemon=True)
+        self.records = records
+        self.console = console
+        self.batch_size = batch_size
+        self.formatter = logging.Formatter(_FORMAT)
+        self.file = None
+        if log_file:
+            os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+            self.file = open(log_file, 'a', encoding='utf-8')
+
+    def run(self):
+        stopped = False
+        while not stopped:
+            batch = [self.records.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.records.get_nowait())
+                except queue.Empty:
+                    break
+            stopped = self._write(batch)
+        if self.file:
+            self.file.close()
+
+    def _write(self, batch):
+        lines = []
+        waiters = []
+        stopped = False
+        for item in batch:
+            if item is _STOP:
+                stopped = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                # Mesaj yalnızca burada, yazıcı iş parçacığında biçimlendirilir
+                lines.append(self.formatter.format(item))
+
+        if lines:
+            text = "\n".join(lines) + "\n"
+            if self.file:
+                self.file.write(text)
+                self.file.flush()
+            if self.console:
+                try:
+                    sys.stderr.write(text)
+                except ValueError:
+                    # Konsol akışı kapatılmışsa (ör: test yakalayıcısı) dosyaya yazım sürer
+                    pass
+        for waiter in waiters:
+            waiter.set()
+        return stopped
+
+
+class _LazyQueueHandler(QueueHandler):
+    # QueueHandler.prepare mesajı çağıran iş parçacığında biçimlendirir; kayıt aynı süreçte
+    # tüketildiği için biçimlendirme yazıcı iş parçacığına bırakılır.
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        _ensure_writer()
+        self.queue.put_nowait(record)
+
+
+_records = queue.SimpleQueue()
+_handler = _LazyQueueHandler(_records)
+_writer = None
+_writer_lock = threading.Lock()
+_loggers = set()
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _BatchWriter(_records, _settings['log_file'], _settings['console'],
+                                       _settings['batch_size'])
+                _writer.start()
+
+
+def flush_logging(timeout=5.0):
+    """
+    Kuyruktaki tüm kayıtlar yazılana kadar bekler.
+
+    Args:
+        timeout (float): En fazla bekleme süresi (saniye).
+
+    Returns:
+        bool: Kayıtlar süre içinde yazıldıysa True.
+    """
+    if _writer is None or not _writer.is_alive():
+        return True
+    done = threading.Event()
+    _records.put(done)
+    return done.wait(timeout)
+
+
+def shutdown_logging(timeout=5.0):
+    """
+    Bekleyen kayıtları yazar ve yazıcı iş parçacığını durdurur. Çıkışta otomatik çağrılır.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is not None and _writer.is_alive():
+            _records.put(_STOP)
+            _writer.join(timeout)
+        _writer = None
+
+
+def configure_logging(logging_config):
+    """
+    Config'in "logging" bölümüne göre seviye, log dosyası ve toplu yazım ayarlarını uygular.
+
+    Args:
+        logging_config (dict): "level", "log_file", "console", "batch_size" ve
+            "signal_log_every" (bar başına sinyallerin kaç barda bir özetleneceği; 0 = kapalı) alanları.
+    """
+    shutdown_logging()
+    level = logging_config.get('level', 'INFO')
+    _settings.update({
+        'level': logging.getLevelName(level) if isinstance(level, str) else level,
+        'log_file': logging_config.get('log_file'),
+        'console': logging_config.get('console', True),
+        'batch_size': logging_config.get('batch_size', 256),
+        'signal_log_every': logging_config.get('signal_log_every', 1000),
+    })
+    for name in _loggers:
+        logging.getLogger(name).setLevel(_settings['level'])
+
+
+def _reset_after_fork():
+    # Çatallanan süreçte yazıcı iş parçacığı yoktur; ilk kayıtta yeniden başlatılır
+    global _records, _writer, _writer_lock
+    _records = queue.SimpleQueue()
+    _handler.queue = _records
+    _writer = None
+    _writer_lock = threading.Lock()
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class Logger:
-    def __init__(self, name, level=logging.INFO):
+    def __init__(self, name, level=None):
         """
         Logger sınıfı, uygulamanın loglama işlemlerini yönetmek için yapılandırılmıştır.
+        Kayıtlar kuyruk üzerinden arka plandaki yazıcıya iletilir; mesajlar yalnızca seviye
+        açıksa ve yazıcı iş parçacığında biçimlendirilir.
 
         Args:
             name (str): Logger ismi.
-            level (int): Loglama seviyesi (varsayılan olarak INFO).
+            level (int, optional): Loglama seviyesi (varsayılan olarak config'teki seviye).
         """
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
+        self.logger.setLevel(level if level is not None else _settings['level'])
+        _loggers.add(name)
 
         # Henüz handler eklenmediyse ekle
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+        if _handler not in self.logger.handlers:
+            self.logger.addHandler(_handler)
+            self.logger.propagate = False
+
+    def is_enabled(self, level):
+        return self.logger.isEnabledFor(level)
+
+    def info(self, message, *args):
+        self.logger.info(message, *args)
 
-    def info(self, message):
-        self.logger.info(message)
+    def debug(self, message, *args):
+        self.logger.debug(message, *args)
 
-    def debug(self, message):
-        self.logger.debug(message)
+    def error(self, message, *args):
+        self.logger.error(message, *args)
 
-    def error(self, message):
-        self.logger.error(message)
+
+class SignalLog:
+    def __init__(self, logger, every=None):
+        """
+        Bar başına üretilen sinyalleri her bar için ayrı satır yazmak yerine periyodik
+        özetler halinde loglar. DEBUG seviyesi açıksa her bar ayrıca loglanır.
+
+        Args:
+            logger (Logger): Kayıtların yazılacağı logger.
+            every (int, optional): Kaç barda bir özet yazılacağı; 0 ise özet yazılmaz.
+                Belirtilmezse config'teki "signal_log_every" kullanılır.
+        """
+        self.logger = logger
+        self.every = _settings['signal_log_every'] if every is None else every
+        self.per_bar = logger.is_enabled(logging.DEBUG)
+        self.counts = Counter()
+        self.first_step = None
+        self.last_step = None
+
+    def record(self, step, signal):
+        if self.per_bar:
+            self.logger.debug("Adım %d: Üretilen sinyal: %s", step, signal)
+        if not self.every:
+            return
+        if self.first_step is None:
+            self.first_step = step
+        self.last_step = step
+        self.counts[signal] += 1
+        if step - self.first_step + 1 >= self.every:
+            self.close()
+
+    def close(self):
+        """
+        Henüz yazılmamış özeti loglar.
+        """
+        if self.counts:
+            self.logger.info("Adım %d-%d sinyal özeti: %s", self.first_step, self.last_step,
+                             ", ".join(f"{signal}: {count}" for signal, count in self.counts.items()))
+        self.counts = Counter()
+        self.first_step = None
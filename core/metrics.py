@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+
+def sharpe_ratio(equity, periods_per_year=252):
+    """
+    Sermaye eğrisinin günlük getirilerinden yıllıklandırılmış Sharpe oranını hesaplar
+    (risksiz faiz 0 kabul edilir).
+
+    Args:
+        equity (pandas.Series): Zaman damgası indeksli sermaye eğrisi.
+        periods_per_year (int): Yıllıklandırma için yıllık gün sayısı.
+
+    Returns:
+        float: Sharpe oranı; hesaplanamıyorsa None.
+    """
+    daily = equity.resample('D').last().dropna()
+    returns = daily.pct_change().dropna().to_numpy()
+    if len(returns) < 2:
+        return None
+    std = returns.std()
+    if std == 0:
+        return None
+    return float(returns.mean() / std * np.sqrt(periods_per_year))
+
+
+def max_drawdown(equity):
+    """
+    Sermaye eğrisindeki en büyük düşüşü yüzde olarak hesaplar.
+
+    Args:
+        equity (pandas.Series or numpy.ndarray): Sermaye eğrisi.
+
+    Returns:
+        float: En büyük düşüş (yüzde).
+    """
+    values = np.asarray(equity, dtype=np.float64)
+    if len(values) == 0:
+        return 0.0
+    peaks = np.maximum.accumulate(values)
+    return float(np.max((peaks - values) / peaks) * 100.0)
+
+
+def summarize_vectorized(results):
+    """
+    VectorizedConnector sonuçlarından BacktesterConnector.summarize ile aynı metrikleri çıkarır.
+
+    Args:
+        results (dict): VectorizedConnector.run sonucu.
+
+    Returns:
+        dict: final_value, sharpe, max_drawdown (yüzde) ve trade_count değerleri.
+    """
+    equity = results['equity']
+    return {
+        'final_value': results['final_value'],
+        'sharpe': sharpe_ratio(equity) if isinstance(equity.index, pd.DatetimeIndex) else None,
+        'max_drawdown': max_drawdown(equity),
+        'trade_count': int(results['trades']['exit_price'].notna().sum()),
+    }
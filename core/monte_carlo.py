@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+
+from core.logger import Logger
+
+# Dağılım özetlerinde raporlanan yüzdelikler
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _drawdowns(paths):
+    # Her satır bir simülasyonun sermaye yoludur; en büyük düşüş yüzde olarak döner
+    peaks = np.maximum.accumulate(paths, axis=1)
+    return np.max((peaks - paths) / peaks, axis=1) * 100.0
+
+
+def summarize_simulations(returns, drawdowns, ruined):
+    """
+    Simülasyon sonuçlarının dağılım özetini çıkarır.
+
+    Args:
+        returns (numpy.ndarray): Simülasyon başına toplam getiri (yüzde).
+        drawdowns (numpy.ndarray): Simülasyon başına en büyük düşüş (yüzde).
+        ruined (numpy.ndarray): Simülasyon başına iflas eşiğine değip değmediği.
+
+    Returns:
+        dict: simulations, return_mean, return_p5 ... return_p95, drawdown_mean,
+            drawdown_p5 ... drawdown_p95, prob_loss ve risk_of_ruin değerleri.
+    """
+    summary = {'simulations': len(returns)}
+    for name, values in (('return', returns), ('drawdown', drawdowns)):
+        summary[f'{name}_mean'] = float(np.mean(values)) if len(values) else np.nan
+        for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES) if len(values)
+                                     else [np.nan] * len(PERCENTILES)):
+            summary[f'{name}_p{percentile}'] = float(value)
+    summary['prob_loss'] = float(np.mean(returns < 0)) if len(returns) else np.nan
+    summary['risk_of_ruin'] = float(np.mean(ruined)) if len(ruined) else np.nan
+    return summary
+
+
+class MonteCarlo:
+    def __init__(self, equity=None, trades=None, cash=10000, ruin_level=0.5, frequency="D", seed=None,
+                 max_memory_mb=256):
+        """
+        Backtest sonuçları üzerinde Monte Carlo / bootstrap sağlamlık analizi. İşlem kâr/zararları
+        veya sermaye eğrisinin getirileri binlerce kez yeniden örneklenir; her yöntem için toplam
+        getiri, en büyük düşüş ve iflas riski dağılımları hesaplanır.
+
+        Simülasyonlar (simülasyon x adım) boyutlu 2 boyutlu NumPy dizileriyle birlikte işlenir;
+        simülasyon döngüsü yoktur. Bellek kullanımı max_memory_mb ile sınırlanır: simülasyonlar
+        bu sınıra sığan parçalar halinde üretilir ve yalnızca özet değerleri saklanır.
+
+        Args:
+            equity (pandas.Series, optional): Sermaye eğrisi (ör: VectorizedConnector sonucu 'equity').
+            trades (pandas.DataFrame or numpy.ndarray, optional): İşlemler ('pnl_net' veya 'pnl'
+                sütunu) ya da işlem başına kâr/zarar dizisi. Kapanmamış işlemler atlanır.
+            cash (float): Başlangıç sermayesi (işlem tabanlı yöntemlerde).
+            ruin_level (float): İflas eşiği; sermaye başlangıcın bu oranına düştüğünde iflas sayılır.
+            frequency (str, optional): Getiri tabanlı yöntemlerde sermaye eğrisinin yeniden
+                örnekleneceği aralık (ör: "D"); None ise bar getirileri kullanılır.
+            seed (int, optional): Rastgele sayı üreteci tohumu.
+            max_memory_mb (float): Bir parçadaki simülasyon dizilerinin en büyük boyutu.
+        """
+        self.logger = Logger(__name__)
+        self.cash = float(cash)
+        self.ruin_level = ruin_level
+        self.max_memory_mb = max_memory_mb
+        self.rng = np.random.default_rng(seed)
+        self.pnl = self._trade_pnl(trades)
+        self.returns = self._equity_returns(equity, frequency)
+
+    @staticmethod
+    def _trade_pnl(trades):
+        if trades is None:
+            return None
+        if isinstance(trades, pd.DataFrame):
+            column = 'pnl_net' if 'pnl_net' in trades else 'pnl'
+            values = trades[column].to_numpy(dtype=np.float64)
+        else:
+            values = np.asarray(trades, dtype=np.float64)
+        return values[~np.isnan(values)]
+
+    @staticmethod
+    def _equity_returns(equity, frequency):
+        if equity is None:
+            return None
+        if frequency is not None and isinstance(equity.index, pd.DatetimeIndex):
+            equity = equity.resample(frequency).last().dropna()
+        values = equity.to_numpy(dtype=np.float64)
+        return values[1:] / values[:-1] - 1.0
+
+    def _chunks(self, simulations, steps):
+        # Parça başına birkaç adet (simülasyon x adım) float64 dizisi oluşur
+        per_simulation = max(steps, 1) * 8 * 4
+        size = max(1, int(self.max_memory_mb * 1024 * 1024 // per_simulation))
+        for start in range(0, simulations, size):
+            yield min(size, simulations - start)
+
+    def _collect(self, simulations, steps, make_paths):
+        returns, drawdowns, ruined = [], [], []
+        for size in self._chunks(simulations, steps):
+            paths = make_paths(size)
+            returns.append((paths[:, -1] / paths[:, 0] - 1.0) * 100.0)
+            drawdowns.append(_drawdowns(paths))
+            ruined.append(paths.min(axis=1) <= paths[:, 0] * self.ruin_level)
+        returns, drawdowns, ruined = (np.concatenate(values) for values in (returns, drawdowns, ruined))
+        return {'returns': returns, 'max_drawdown': drawdowns, 'ruined': ruined,
+                'summary': summarize_simulations(returns, drawdowns, ruined)}
+
+    def _trade_paths(self, pnl):
+        # Başlangıç sermayesi ilk sütundur
+        paths = np.empty((pnl.shape[0], pnl.shape[1] + 1))
+        paths[:, 0] = self.cash
+        np.cumsum(pnl, axis=1, out=paths[:, 1:])
+        paths[:, 1:] += self.cash
+        return paths
+
+    def _return_paths(self, returns):
+        paths = np.empty((returns.shape[0], returns.shape[1] + 1))
+        paths[:, 0] = 1.0
+        np.cumprod(1.0 + returns, axis=1, out=paths[:, 1:])
+        return paths
+
+    def _require(self, values, name):
+        if values is None or len(values) == 0:
+            raise ValueError(f"Bu yöntem için {name} gerekli.")
+        return values
+
+    def shuffle_trades(self, simulations=10000):
+        """
+        İşlemlerin sırasını karıştırır. Toplam getiri değişmez; düşüş ve iflas riski işlem
+        sırasına ne kadar bağlı olduğunu gösterir.
+        """
+        pnl = self._require(self.pnl, "işlemler")
+        return self._collect(simulations, len(pnl),
+                             lambda size: self._trade_paths(self.rng.permuted(np.tile(pnl, (size, 1)), axis=1)))
+
+    def bootstrap_trades(self, simulations=10000):
+        """
+        İşlemleri yerine koyarak yeniden örnekler (aynı işlem sayısıyla).
+        """
+        pnl = self._require(self.pnl, "işlemler")
+        return self._collect(simulations, len(pnl),
+                             lambda size: self._trade_paths(pnl[self.rng.integers(0, len(pnl), (size, len(pnl)))]))
+
+    def block_bootstrap(self, simulations=10000, block_size=20):
+        """
+        Getirileri ardışık bloklar halinde yeniden örnekler; blok içi otokorelasyon (ör: volatilite
+        kümelenmesi) korunur.
+
+        Args:
+            simulations (int): Simülasyon sayısı.
+            block_size (int): Blok uzunluğu (getiri adımı).
+        """
+        returns = self._require(self.returns, "sermaye eğrisi")
+        count = len(returns)
+        block_size = max(1, min(block_size, count))
+        blocks = -(-count // block_size)
+        offsets = np.arange(block_size)
+
+        def make_paths(size):
+            starts = self.rng.integers(0, count - block_size + 1, (size, blocks))
+            index = (starts[:, :, None] + offsets).reshape(size, -1)[:, :count]
+            return self._return_paths(returns[index])
+        return self._collect(simulations, count, make_paths)
+
+    def random_starts(self, simulations=10000, length=None):
+        """
+        Sermaye eğrisinin rastgele başlangıç tarihlerinden itibaren sabit uzunluklu pencerelerini
+        değerlendirir; sonucun başlangıç zamanına duyarlılığını gösterir.
+
+        Args:
+            simulations (int): Simülasyon sayısı.
+            length (int, optional): Pencere uzunluğu (getiri adımı); varsayılan serinin yarısı.
+        """
+        returns = self._require(self.returns, "sermaye eğrisi")
+        count = len(returns)
+        length = max(1, min(length or count // 2, count))
+        offsets = np.arange(length)
+
+        def make_paths(size):
+            starts = self.rng.integers(0, count - length + 1, size)
+            return self._return_paths(returns[starts[:, None] + offsets])
+        return self._collect(simulations, length, make_paths)
+
+    def run(self, simulations=10000, block_size=20, length=None):
+        """
+        Verilen girdilere uygun tüm yöntemleri çalıştırır (işlemler varsa karıştırma ve bootstrap,
+        sermaye eğrisi varsa blok bootstrap ve rastgele başlangıç).
+
+        Returns:
+            pandas.DataFrame: Yöntem adı indeksli özet tablo (summarize_simulations sütunları).
+        """
+        rows = {}
+        if self.pnl is not None and len(self.pnl):
+            rows['trade_shuffle'] = self.shuffle_trades(simulations)['summary']
+            rows['trade_bootstrap'] = self.bootstrap_trades(simulations)['summary']
+        if self.returns is not None and len(self.returns):
+            rows['block_bootstrap'] = self.block_bootstrap(simulations, block_size)['summary']
+            rows['random_start'] = self.random_starts(simulations, length)['summary']
+        self.logger.info("%d yöntem için %d simülasyon tamamlandı.", len(rows), simulations)
+        return pd.DataFrame.from_dict(rows, orient='index')
@@ -0,0 +1,255 @@
+import contextlib
+import io
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from connectors.backtester_connector import BacktesterConnector, create_data_feed
+from connectors.vectorized_connector import VectorizedConnector
+from core.logger import Logger
+from core.metrics import summarize_vectorized
+from core.result_store import KIND_SWEEP, data_hash, run_key
+from data.shared_bars import SharedBarsHandle, SharedBarsRegistry, attach_frame, can_share
+
+
+# Her işçi sürecinde bir kez yüklenen veri ve ayarlar
+_worker_data = None
+_worker_settings = None
+
+
+def expand_grid(grid):
+    """
+    Parametre ızgarasını tüm kombinasyonların listesine açar.
+
+    Her parametre için tek bir değer, değer listesi veya {"start", "stop", "step"}
+    şeklinde (stop dahil) bir aralık verilebilir.
+
+    Args:
+        grid (dict): Parametre adı -> değer(ler).
+
+    Returns:
+        list: Her kombinasyon için parametre sözlükleri.
+    """
+    names = list(grid)
+    values = []
+    for name in names:
+        spec = grid[name]
+        if isinstance(spec, dict):
+            start, stop, step = spec["start"], spec["stop"], spec.get("step", 1)
+            if step <= 0:
+                raise ValueError(f"{name} için adım pozitif olmalıdır.")
+            count = int(round((stop - start) / step)) + 1
+            values.append([start + i * step for i in range(count)])
+        elif isinstance(spec, (list, tuple)):
+            values.append(list(spec))
+        else:
+            values.append([spec])
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def prepare_data(data, settings):
+    """
+    Veriyi motorun beklediği düzene bir kez getirir. Vektörel motor zaman indeksli veri
+    kullanır; indeks burada kurulduğu için sonraki dilimler kopyalanmadan alınabilir.
+
+    Args:
+        data (pandas.DataFrame): Tarih ve fiyat sütunlarını içeren veri.
+        settings (dict): ParameterSweep ayarları.
+
+    Returns:
+        pandas.DataFrame: Motorun doğrudan kullanabileceği veri.
+    """
+    if settings["engine"] == "vectorized":
+        return data.set_index(settings["date_column"])
+    return data
+
+
+def evaluate_params(data, settings, params):
+    """
+    Tek bir parametre kombinasyonunu prepare_data ile hazırlanmış veri (veya dilimi) üzerinde çalıştırır.
+
+    Args:
+        data (pandas.DataFrame): prepare_data çıktısı veya onun bir dilimi.
+        settings (dict): ParameterSweep ayarları.
+        params (dict): Strateji parametreleri.
+
+    Returns:
+        tuple: (metrikler, vektörel motorda VectorizedConnector sonuçları, aksi halde None)
+    """
+    # Binlerce koşuda bağlantı/strateji çıktıları tabloyu boğmasın diye susturulur
+    with contextlib.redirect_stdout(io.StringIO()):
+        if settings["engine"] == "vectorized":
+            connector = VectorizedConnector(
+                settings["strategy_class"],
+                data,
+                cash=settings["cash"],
+                commission=settings["commission"],
+                stake=settings["stake"],
+                price_column=settings["price_column"],
+                strategy_params=params,
+                execution=settings.get("execution")
+            )
+            results = connector.run()
+            return summarize_vectorized(results), results
+
+        connector = BacktesterConnector(
+            settings["strategy_class"],
+            create_data_feed(data, settings["date_column"], settings["price_column"]),
+            cash=settings["cash"],
+            commission=settings["commission"],
+            stake=settings["stake"],
+            strategy_params=params
+        )
+        return connector.summarize(connector.run()), None
+
+
+def check_execution(engine, execution):
+    """
+    Gerçekleşme modelinin motorla birlikte kullanılabildiğini doğrular; spread, kayma ve kısmi
+    dolum bar serisi üzerinde toplu uygulandığı için yalnızca vektörel motor desteklenir.
+    """
+    if execution and engine != "vectorized":
+        raise ValueError("Gerçekleşme modeli yalnızca vektörel motorla kullanılabilir.")
+
+
+def rank_rows(rows, rank_by):
+    """
+    Sonuç satırlarını metriğe göre en iyiden en kötüye sıralar (düşüş için küçük değer daha iyidir).
+    """
+    ascending = rank_by == "max_drawdown"
+    table = pd.DataFrame(rows).sort_values(rank_by, ascending=ascending, na_position="last")
+    return table.reset_index(drop=True)
+
+
+def share_data(registry, data):
+    """
+    İşçilere gönderilecek veriyi hazırlar: sayısal / tarih sütunlarından oluşan tablolar paylaşımlı
+    belleğe bir kez yüklenir ve işçilere yalnızca tanımı gönderilir; diğer tablolar olduğu gibi
+    (serileştirilerek) gönderilir.
+
+    Args:
+        registry (SharedBarsRegistry): Blokların ömrünü yöneten kayıt.
+        data (pandas.DataFrame): Veri.
+
+    Returns:
+        SharedBarsHandle or pandas.DataFrame: İşçi başlatıcısına verilecek değer.
+    """
+    if not can_share(data):
+        return data
+    return registry.publish("sweep", "data", data)
+
+
+def worker_data(data):
+    """
+    share_data çıktısını işçi sürecinde tabloya çevirir (paylaşımlı bellekte ise kopyasız bağlanır).
+    """
+    return attach_frame(data) if isinstance(data, SharedBarsHandle) else data
+
+
+def _init_worker(data, settings):
+    global _worker_data, _worker_settings
+    _worker_data = worker_data(data)
+    _worker_settings = settings
+
+
+def _run_single(params):
+    metrics, _ = evaluate_params(_worker_data, _worker_settings, params)
+    return {**params, **metrics}
+
+
+class ParameterSweep:
+    def __init__(self, strategy_class, data, date_column, price_column, cash=10000,
+                 commission=0.001, stake=1, engine="backtrader", max_workers=None, store=None, execution=None):
+        """
+        Strateji parametre kombinasyonlarını işçi süreçlere dağıtarak paralel backtest yapar.
+        Veri ana süreçte motorun düzenine getirilir (prepare_data) ve paylaşımlı belleğe bir kez yüklenir;
+        işçiler süreç başlatılırken kopyasız bağlanır, veri koşu veya işçi başına kopyalanmaz ya da
+        serileştirilmez.
+
+        Args:
+            strategy_class (class): Çalıştırılacak strateji sınıfı.
+            data (pandas.DataFrame): Tarih ve fiyat sütunlarını içeren veri.
+            date_column (str): Tarih sütunu.
+            price_column (str): Fiyat sütunu.
+            cash (float): Başlangıç sermayesi.
+            commission (float): Komisyon oranı.
+            stake (float): Pozisyon başına işlem miktarı.
+            engine (str): "backtrader" veya "vectorized".
+            max_workers (int, optional): İşçi sayısı; belirtilmezse çekirdek sayısı kullanılır.
+            store (ResultStore, optional): Sonuç deposu; verilirse daha önce aynı veri, kod ve
+                parametrelerle çalıştırılmış kombinasyonlar yeniden hesaplanmaz.
+            execution (dict, optional): FillSimulator parametreleri (yalnızca vektörel motor).
+        """
+        check_execution(engine, execution)
+        self.logger = Logger(__name__)
+        self.data = data
+        self.store = store
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.settings = {
+            "strategy_class": strategy_class,
+            "date_column": date_column,
+            "price_column": price_column,
+            "cash": cash,
+            "commission": commission,
+            "stake": stake,
+            "engine": engine,
+            "execution": execution,
+        }
+
+    def run(self, grid, rank_by="final_value", constraint=None):
+        """
+        Izgaradaki tüm kombinasyonları çalıştırır ve sıralı sonuç tablosunu döner.
+
+        Args:
+            grid (dict): expand_grid formatında parametre ızgarası.
+            rank_by (str): Sıralama metriği (final_value, sharpe, max_drawdown, trade_count).
+            constraint (callable, optional): Kombinasyonu kabul edip etmeyeceğini dönen fonksiyon.
+
+        Returns:
+            pandas.DataFrame: Metriğe göre en iyiden en kötüye sıralı sonuçlar.
+        """
+        combinations = expand_grid(grid)
+        if constraint is not None:
+            combinations = [params for params in combinations if constraint(params)]
+        if not combinations:
+            return pd.DataFrame()
+
+        cached = {}
+        if self.store is not None:
+            digest = data_hash(self.data)
+            keys = [run_key(digest, self.settings["strategy_class"], params, self.settings)
+                    for params in combinations]
+            found = self.store.get_metrics(keys)
+            cached = {i: {**params, **found[key]} for i, (key, params) in enumerate(zip(keys, combinations))
+                      if key in found}
+            if cached:
+                self.logger.info("%d kombinasyon sonuç deposundan alındı.", len(cached))
+        pending_indices = [i for i in range(len(combinations)) if i not in cached]
+        pending = [combinations[i] for i in pending_indices]
+
+        rows = []
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            chunksize = max(1, len(pending) // (workers * 4))
+            self.logger.info("%d kombinasyon %d işçi ile çalıştırılıyor.", len(pending), workers)
+
+            with SharedBarsRegistry() as registry, ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker,
+                    initargs=(share_data(registry, prepare_data(self.data, self.settings)), self.settings)) as executor:
+                rows = list(executor.map(_run_single, pending, chunksize=chunksize))
+
+        if self.store is not None and rows:
+            with self.store.batch():
+                for params, row in zip(pending, rows):
+                    metrics = {name: value for name, value in row.items() if name not in params}
+                    self.store.put(run_key(digest, self.settings["strategy_class"], params, self.settings),
+                                   KIND_SWEEP, self.settings["strategy_class"], params, self.settings, metrics,
+                                   data_digest=digest)
+
+        # Satırlar kombinasyon sırasıyla birleştirilir; eşit skorlarda sıralama önbellekten bağımsızdır
+        cached.update(zip(pending_indices, rows))
+        table = rank_rows([cached[i] for i in range(len(combinations))], rank_by)
+        self.logger.info("Parametre taraması tamamlandı.")
+        return table
@@ -0,0 +1,189 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from connectors.backtester_connector import BacktesterConnector, create_data_feed, create_streaming_feed
+from connectors.vectorized_connector import VectorizedConnector
+from core.logger import Logger
+from data.bar_store import BarStream, load_bars
+
+
+def asset_name(entry):
+    """
+    Portföy girdisi için varlık adını döner (ör: {"symbol": "EURUSD", "timeframe": "M5"} -> "EURUSD_M5").
+    """
+    if "name" in entry:
+        return entry["name"]
+    if "symbol" in entry:
+        return f"{entry['symbol']}_{entry['timeframe']}"
+    return os.path.splitext(os.path.basename(entry["file_path"]))[0]
+
+
+def load_portfolio(entries, date_column, base_path="data/historic_data", chunk_size=None):
+    """
+    Portföydeki tüm varlıkların verisini bir kez yükler.
+
+    Args:
+        entries (list): {"symbol", "timeframe"} veya {"file_path"} alanlarını içeren girdiler.
+        date_column (str): Tarih sütunu.
+        base_path (str): Sembol/zaman dilimi girdileri için kök klasör.
+        chunk_size (int, optional): Verilirse veriler yüklenmez; her varlık için bu boyutta
+            parçalar üreten BarStream döner (akışlı mod).
+
+    Returns:
+        dict: Varlık adı -> tarih sütunu içeren DataFrame (veya BarStream).
+    """
+    frames = {}
+    for entry in entries:
+        file_path = entry.get("file_path") or os.path.join(base_path, entry["symbol"], f"{entry['timeframe']}.csv")
+        if chunk_size:
+            frames[asset_name(entry)] = BarStream(file_path, date_column, chunk_size)
+        else:
+            frames[asset_name(entry)] = load_bars(file_path, date_column)
+    return frames
+
+
+def align_to_index(index, times, values, fill_before=np.nan):
+    """
+    Bir varlığın değerlerini ortak zaman indeksine yerleştirir ve ileri doldurur.
+    Yeniden indeksleme yerine searchsorted ile tek geçişte konumlandırma yapılır.
+
+    Args:
+        index (numpy.ndarray): Sıralı ortak zaman damgaları (datetime64).
+        times (numpy.ndarray): Varlığın sıralı zaman damgaları (indeksin alt kümesi).
+        values (numpy.ndarray): Varlığın değerleri.
+        fill_before (float): Varlığın ilk barından önceki değer.
+
+    Returns:
+        numpy.ndarray: Ortak indeks uzunluğunda, ileri doldurulmuş değerler.
+    """
+    positions = np.searchsorted(index, times)
+    # Her ortak zaman damgası için o ana kadarki son bar
+    last_bar = np.full(len(index), -1, dtype=np.int64)
+    last_bar[positions] = np.arange(len(times))
+    last_bar = np.maximum.accumulate(last_bar)
+    aligned = np.asarray(values, dtype=np.float64)[np.maximum(last_bar, 0)]
+    aligned[last_bar < 0] = fill_before
+    return aligned
+
+
+class PortfolioBacktest:
+    def __init__(self, strategy_class, frames, date_column, price_column, cash=10000,
+                 commission=0.001, stake=1, engine="vectorized", strategy_params=None, journal=None):
+        """
+        Çok varlıklı portföy backtesti. Tüm varlıklar tek bir Cerebro içinde (ortak nakit ile)
+        veya vektörel motorla çalıştırılır; sonuçlar varlık bazında ve toplam olarak döner.
+
+        Args:
+            strategy_class (class): Her varlık için ayrı örneklenen BaseStrategy alt sınıfı.
+            frames (dict): Varlık adı -> tarih ve fiyat sütunlarını içeren DataFrame veya BarStream.
+                BarStream verilen varlıklar parça parça okunur (yalnızca backtrader motoru).
+            date_column (str): Tarih sütunu.
+            price_column (str): Fiyat sütunu.
+            cash (float): Portföyün başlangıç sermayesi.
+            commission (float): Komisyon oranı.
+            stake (float): Pozisyon başına işlem miktarı.
+            engine (str): "backtrader" veya "vectorized".
+            strategy_params (dict, optional): Stratejiye iletilecek parametreler.
+            journal (TradeJournal, optional): Varlık adıyla sinyal ve emirlerin kaydedileceği günlük.
+        """
+        self.logger = Logger(__name__)
+        self.strategy_class = strategy_class
+        self.frames = frames
+        self.date_column = date_column
+        self.price_column = price_column
+        self.cash = cash
+        self.commission = commission
+        self.stake = stake
+        self.engine = engine
+        self.strategy_params = strategy_params or {}
+        self.journal = journal
+
+    def shared_index(self):
+        """
+        Tüm varlıkların zaman damgalarının sıralı birleşimini bir kez hesaplar.
+        """
+        return np.unique(np.concatenate([
+            frame[self.date_column].to_numpy(dtype="datetime64[ns]") for frame in self.frames.values()
+        ]))
+
+    def run(self):
+        """
+        Portföy backtestini çalıştırır.
+
+        Returns:
+            dict: 'final_value', 'equity' (vektörel motorda ortak indeksli toplam sermaye eğrisi)
+                ve 'assets' (varlık bazında sonuç tablosu) anahtarlarını içeren sonuçlar.
+        """
+        self.logger.info("%d varlıklı portföy backtesti başlatıldı (%s).", len(self.frames), self.engine)
+        if self.engine == "backtrader":
+            return self._run_backtrader()
+        if any(isinstance(frame, BarStream) for frame in self.frames.values()):
+            raise ValueError("Akışlı veri yalnızca backtrader motoruyla kullanılabilir.")
+        return self._run_vectorized()
+
+    def _run_vectorized(self):
+        index = self.shared_index()
+        total_pnl = np.zeros(len(index))
+        rows = []
+        for name, frame in self.frames.items():
+            data = frame.set_index(self.date_column)
+            results = VectorizedConnector(
+                self.strategy_class, data, cash=self.cash, commission=self.commission, stake=self.stake,
+                price_column=self.price_column, strategy_params=self.strategy_params,
+                journal=self.journal, name=name
+            ).run()
+            # Ortak nakit varsayımıyla her varlığın katkısı kendi kâr/zararıdır
+            pnl = results['equity'].to_numpy() - self.cash
+            total_pnl += align_to_index(index, data.index.to_numpy(dtype="datetime64[ns]"), pnl, fill_before=0.0)
+            trades = results['trades']
+            rows.append({
+                'asset': name,
+                'bars': len(data),
+                'pnl': float(pnl[-1]) if len(pnl) else 0.0,
+                'trade_count': int(trades['exit_price'].notna().sum()),
+                'position': float(results['positions'].iloc[-1]) if len(data) else 0.0,
+            })
+
+        equity = pd.Series(self.cash + total_pnl, index=pd.DatetimeIndex(index), name='equity')
+        return {
+            'final_value': float(equity.iloc[-1]) if len(equity) else float(self.cash),
+            'equity': equity,
+            'assets': pd.DataFrame(rows).set_index('asset'),
+        }
+
+    def _run_backtrader(self):
+        feeds = {}
+        streaming = False
+        for name, frame in self.frames.items():
+            if isinstance(frame, BarStream):
+                feeds[name] = create_streaming_feed(frame, self.date_column, self.price_column)
+                streaming = True
+            else:
+                feeds[name] = create_data_feed(frame, self.date_column, self.price_column)
+        # Akışlı varlık varsa Cerebro çizgi tamponlarını sınırlı tutar
+        connector = BacktesterConnector(self.strategy_class, feeds, cash=self.cash, commission=self.commission,
+                                        stake=self.stake, strategy_params=self.strategy_params,
+                                        journal=self.journal, exactbars=streaming)
+        results = connector.run()
+        strategy = results[0]
+        broker = connector.cerebro.broker
+
+        rows = []
+        for data in strategy.datas:
+            position = strategy.getposition(data)
+            stats = strategy.trade_stats[data._name]
+            rows.append({
+                'asset': data._name,
+                'bars': len(data),
+                'pnl': stats['realized_pnl'] + position.size * (data.close[0] - position.price),
+                'trade_count': stats['trade_count'],
+                'position': position.size,
+            })
+        return {
+            'final_value': broker.getvalue(),
+            'equity': None,
+            'assets': pd.DataFrame(rows).set_index('asset'),
+            'metrics': connector.summarize(results),
+        }
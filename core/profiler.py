@@ -0,0 +1,144 @@
+import json
+import os
+from collections import defaultdict
+from time import perf_counter_ns
+
+import numpy as np
+
+
+class _NullStage:
+    # Profil kapalıyken tüm aşamalar için paylaşılan, hiçbir şey yapmayan bağlam
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('samples', 'started')
+
+    def __init__(self, samples):
+        self.samples = samples
+
+    def __enter__(self):
+        self.started = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.samples.append(perf_counter_ns() - self.started)
+        return False
+
+
+class Profiler:
+    def __init__(self, enabled=False, report_path=None):
+        """
+        Backtest aşamalarının (veri yükleme, feed dönüşümü, indikatör, sinyal, broker,
+        sonuç toplama) sürelerini ve sayaçlarını toplar.
+
+        Kapalıyken stage() paylaşılan boş bir bağlam döner ve count() hemen döner;
+        sıcak döngülerdeki maliyet tek bir metod çağrısıdır.
+
+        Args:
+            enabled (bool): Ölçüm yapılıp yapılmayacağı.
+            report_path (str, optional): write_report için varsayılan dosya yolu.
+        """
+        self.enabled = enabled
+        self.report_path = report_path
+        self.reset()
+
+    def reset(self):
+        self._samples = defaultdict(list)
+        self._counters = defaultdict(int)
+
+    def stage(self, name):
+        """
+        Bir aşamanın süresini ölçen bağlam yöneticisi döner.
+
+        Args:
+            name (str): Aşama adı (ör: "indicators").
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self._samples[name])
+
+    def count(self, name, value=1):
+        """
+        Bir sayacı artırır (ör: işlenen bar, verilen emir, ödenen komisyon).
+        """
+        if self.enabled:
+            self._counters[name] += value
+
+    def report(self):
+        """
+        Aşama bazında çağrı sayısı, toplam süre ve yüzdelik gecikmeleri döner.
+
+        Returns:
+            dict: 'stages' (aşama adı -> istatistikler, süreler mikro/milisaniye) ve 'counters'.
+        """
+        stages = {}
+        for name, samples in self._samples.items():
+            if not samples:
+                continue
+            durations = np.asarray(samples, dtype=np.float64) / 1000.0  # ns -> µs
+            p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+            stages[name] = {
+                'calls': len(durations),
+                'total_ms': float(durations.sum() / 1000.0),
+                'mean_us': float(durations.mean()),
+                'p50_us': float(p50),
+                'p90_us': float(p90),
+                'p99_us': float(p99),
+                'max_us': float(durations.max()),
+            }
+        return {'stages': stages, 'counters': dict(self._counters)}
+
+    def write_report(self, path=None):
+        """
+        Raporu JSON olarak kaydeder. Profil kapalıysa hiçbir şey yapmaz.
+
+        Args:
+            path (str, optional): Dosya yolu; belirtilmezse report_path kullanılır.
+
+        Returns:
+            str: Yazılan dosya yolu veya None.
+        """
+        path = path or self.report_path
+        if not self.enabled or not path:
+            return None
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"Profil raporu kaydedildi → {path}")
+        return path
+
+
+_profiler = Profiler()
+
+
+def get_profiler():
+    """
+    Uygulama genelinde paylaşılan Profiler örneğini döner.
+    """
+    return _profiler
+
+
+def configure_profiler(logging_config):
+    """
+    Config'in "logging" bölümüne göre paylaşılan profiler'ı açar veya kapatır.
+
+    Args:
+        logging_config (dict): "profile" (bool) ve "profile_report" (rapor yolu) alanları.
+
+    Returns:
+        Profiler: Yapılandırılmış paylaşılan profiler.
+    """
+    _profiler.enabled = bool(logging_config.get("profile", False))
+    _profiler.report_path = logging_config.get("profile_report", "results/profile_report.json")
+    _profiler.reset()
+    return _profiler
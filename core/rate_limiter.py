@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    def __init__(self, rate, capacity=None):
+        """
+        asyncio için token kovası hız sınırlayıcısı. Kova saniyede `rate` token ile dolar
+        ve en fazla `capacity` token biriktirir; böylece sınır aşılmadan kısa patlamalara
+        izin verilir. Bekleyen istekler geliş sırasıyla sıraya alınır.
+
+        Args:
+            rate (float): Saniyede eklenen token sayısı.
+            capacity (float, optional): Kova kapasitesi; varsayılan bir saniyelik token.
+        """
+        if rate <= 0:
+            raise ValueError("Token hızı pozitif olmalıdır.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = None
+
+    @classmethod
+    def from_rate_limit(cls, rate_limit_ms, capacity=None):
+        """
+        ccxt'nin `rateLimit` değerinden (istekler arası milisaniye) kova oluşturur.
+        """
+        return cls(1000.0 / rate_limit_ms, capacity)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, cost=1):
+        """
+        `cost` kadar token alınana kadar bekler.
+
+        Args:
+            cost (float): İsteğin ağırlığı.
+
+        Raises:
+            ValueError: Ağırlık kova kapasitesini aşıyorsa (kova hiçbir zaman o kadar dolmaz).
+        """
+        if cost > self.capacity:
+            raise ValueError(f"İstek ağırlığı ({cost}) kova kapasitesini ({self.capacity}) aşıyor.")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self.tokens < cost:
+                await asyncio.sleep((cost - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= cost
@@ -0,0 +1,341 @@
+import contextlib
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from data.bar_store import read_bars, write_bars
+
+DEFAULT_PATH = os.path.join("results", "result_store")
+INDEX_FILE = "runs.sqlite"
+
+# Koşu türleri
+KIND_BACKTEST = "backtest"
+KIND_SWEEP = "sweep"
+KIND_WALK_FORWARD = "walk_forward"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    params TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    frames TEXT NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def _json(value):
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def data_hash(df):
+    """
+    Veri diliminin içerik özetini hesaplar. Sütun adları, tipleri ve ham değerleri özetlenir;
+    aynı içerikli iki dilim (farklı dosyalardan okunmuş olsalar bile) aynı özeti verir.
+
+    Args:
+        df (pandas.DataFrame): Tarih ve fiyat sütunlarını içeren veri.
+
+    Returns:
+        str: Onaltılık özet.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_json([len(df), list(map(str, df.columns))]).encode())
+    for name in df.columns:
+        series = df[name]
+        digest.update(str(series.dtype).encode())
+        if series.dtype.kind in "biufcmM":
+            values = series.to_numpy()
+            if values.dtype.kind in "mM":
+                values = values.view(np.int64)
+            # Sütunlar kopyalanmadan tampon olarak özetlenir
+            digest.update(memoryview(np.ascontiguousarray(values)).cast("B"))
+        else:
+            digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy())
+    return digest.hexdigest()
+
+
+# Sonucu etkileyen motor modülleri; bunlardaki değişiklikler de kod sürümünü değiştirir
+ENGINE_MODULES = ("connectors", "core.execution", "core.metrics", "core.optimizer", "core.walk_forward")
+
+_code_versions = {}
+
+
+def _source_files(name):
+    # Modülün kaynak dosyası; paketler için paketteki tüm .py dosyaları (yüklenmemiş olsalar bile)
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return []
+    if spec.submodule_search_locations:
+        return sorted(os.path.join(folder, file) for folder in spec.submodule_search_locations
+                      for file in os.listdir(folder) if file.endswith(".py"))
+    return [spec.origin] if spec.origin and spec.origin.endswith(".py") else []
+
+
+def code_version(strategy_class):
+    """
+    Stratejinin kod sürümünü döner: strateji sınıfının bulunduğu paketteki yüklü tüm modüllerin
+    (ör: strategy.exp_moving_average, strategy.indicators, strategy.base_strategy) ve motor
+    modüllerinin (ENGINE_MODULES) kaynak dosyalarının özeti. Strateji, kullandığı indikatörler veya
+    emir / metrik hesapları değiştiğinde sürüm de değişir ve eski sonuçlar önbellekten dönmez.
+    Sınıfın kendi kaynak dosyası (paket dışındaki veya __main__'deki stratejiler dahil) her zaman
+    özete girer.
+    """
+    module = strategy_class.__module__
+    if module in _code_versions:
+        return _code_versions[module]
+    package = module.split(".")[0]
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        source_file = inspect.getsourcefile(strategy_class)
+    except (TypeError, OSError):
+        source_file = None
+    # Önbellek modül başınadır: aynı paketten sonradan yüklenen bir stratejinin özeti, önceki
+    # stratejinin hesaplandığı andaki sys.modules içeriğine bağlı kalmamalıdır
+    names = sorted(name for name in sys.modules if name == package or name.startswith(package + "."))
+    sources = [(f"{module}:source", source_file)]
+    sources += [(name, getattr(sys.modules[name], "__file__", None)) for name in names]
+    sources += [(f"{name}:{os.path.basename(path)}", path) for name in ENGINE_MODULES for path in _source_files(name)]
+    for name, path in sources:
+        if not path or not path.endswith(".py") or not os.path.exists(path):
+            continue
+        digest.update(name.encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    _code_versions[module] = digest.hexdigest()
+    return _code_versions[module]
+
+
+def _plain_settings(settings):
+    # Strateji sınıfı gibi nesneler anahtara ayrıca (ad ve kod sürümüyle) girer
+    return {name: value for name, value in settings.items() if not isinstance(value, type) and not callable(value)}
+
+
+def run_key(data_digest, strategy_class, params, settings):
+    """
+    Bir koşunun önbellek anahtarını üretir: veri özeti, strateji kod sürümü, parametreler ve
+    sonucu etkileyen motor ayarları (sermaye, komisyon, motor vb.).
+
+    Args:
+        data_digest (str): data_hash çıktısı.
+        strategy_class (class): Strateji sınıfı.
+        params (dict): Strateji parametreleri.
+        settings (dict): Motor ayarları; sınıf ve fonksiyon değerleri yok sayılır.
+
+    Returns:
+        str: Onaltılık anahtar.
+    """
+    settings = _plain_settings(settings)
+    payload = _json({
+        "data": data_digest,
+        "strategy": f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+        "code": code_version(strategy_class),
+        "params": params,
+        "settings": settings,
+    })
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _to_frame(value):
+    """
+    Tabloyu bar deposu biçimine çevirir. Seriler indeksleriyle birlikte yazılır; nesne sütunlarından
+    sayı ve tarih içerenler (None değerler NaN / NaT olur) sayısal sütuna, metin içerenler (ör:
+    ma_type, asset) etiket kodlarına çevrilir.
+
+    Returns:
+        tuple: (DataFrame, sütun adı -> etiket listesi)
+
+    Raises:
+        TypeError: Sütun birden fazla türden değer içeriyorsa.
+    """
+    frame = value.reset_index() if isinstance(value, pd.Series) else value.reset_index(drop=True)
+    labels = {}
+    for name in frame.columns:
+        if frame[name].dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(frame[name], skipna=True)
+        if kind in ("integer", "floating", "mixed-integer-float", "decimal", "boolean", "empty"):
+            frame[name] = pd.to_numeric(frame[name], errors="coerce")
+        elif kind in ("datetime", "datetime64", "date"):
+            frame[name] = pd.to_datetime(frame[name])
+        elif kind == "string":
+            codes, categories = pd.factorize(frame[name])
+            frame[name] = codes.astype(np.int32)
+            labels[str(name)] = categories.tolist()
+        else:
+            raise TypeError(f"'{name}' sütunu saklanamıyor: karışık türde değerler ({kind}).")
+    return frame, labels
+
+
+def _from_frame(frame, labels):
+    # Etiket kodları (-1: eksik değer) metin sütunlarına geri çevrilir
+    for name, categories in labels.items():
+        codes = frame[name].to_numpy()
+        frame[name] = pd.Series(np.asarray(categories, dtype=object)[np.maximum(codes, 0)],
+                                index=frame.index).where(codes >= 0, None)
+    return frame
+
+
+class ResultStore:
+    def __init__(self, path=None):
+        """
+        Koşu sonuçlarının kalıcı deposu. Her koşu, veri özeti + strateji kod sürümü + parametreler
+        + motor ayarlarından üretilen anahtarla saklanır; aynı girdilerle yapılan koşular yeniden
+        hesaplanmadan döner.
+
+        Metrikler, parametreler ve ayarlar SQLite dizininde (runs.sqlite) tutulur ve runs ile
+        sorgulanabilir; sermaye eğrisi ve işlemler gibi tablolar <path>/<anahtar>/<ad>.bars
+        altında bar deposu biçiminde yazılır ve bellek eşleme ile okunur.
+
+        Args:
+            path (str, optional): Depo klasörü; varsayılan results/result_store.
+        """
+        self.path = path or DEFAULT_PATH
+        os.makedirs(self.path, exist_ok=True)
+        self._connection = sqlite3.connect(os.path.join(self.path, INDEX_FILE))
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+        self._batching = False
+
+    def close(self):
+        self._connection.close()
+
+    def _frame_path(self, key, name):
+        return os.path.join(self.path, key, f"{name}.bars")
+
+    def put(self, key, kind, strategy_class, params, settings, metrics, frames=None, data_digest=""):
+        """
+        Bir koşunun sonuçlarını kaydeder; aynı anahtarlı kayıt varsa değiştirilir.
+
+        Args:
+            key (str): run_key çıktısı.
+            kind (str): KIND_BACKTEST, KIND_SWEEP veya KIND_WALK_FORWARD.
+            strategy_class (class): Strateji sınıfı.
+            params (dict): Strateji parametreleri (veya walk-forward için ızgara).
+            settings (dict): Motor ayarları.
+            metrics (dict): Koşu metrikleri.
+            frames (dict, optional): Ad -> DataFrame/Series (ör: "equity", "trades").
+            data_digest (str): Verinin data_hash özeti.
+        """
+        # Tablolar önce çevrilir; saklanamayan bir sütun varsa hiçbir dosya yazılmaz
+        converted = {name: _to_frame(value) for name, value in (frames or {}).items()}
+        for name, (frame, _) in converted.items():
+            write_bars(self._frame_path(key, name), frame)
+        settings = _plain_settings(settings)
+        # Metrikler sütun sırası korunacak şekilde yazılır
+        self._connection.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, kind, strategy_class.__name__, code_version(strategy_class), data_digest, _json(params),
+             _json(settings), json.dumps(metrics, default=str),
+             _json({name: labels for name, (_, labels) in converted.items()}), time.time()))
+        if not self._batching:
+            self._connection.commit()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Blok içindeki tüm put çağrılarını tek bir işlemde (commit) yazar; çok sayıda küçük
+        koşunun (ör: parametre taraması) kaydını hızlandırır.
+        """
+        self._batching = True
+        try:
+            yield self
+            self._connection.commit()
+        finally:
+            self._batching = False
+
+    def get(self, key):
+        """
+        Anahtarın kaydını döner; yoksa None.
+
+        Returns:
+            dict: 'key', 'kind', 'strategy', 'params', 'settings', 'metrics' ve kaydedilen her tablo
+                için adıyla bir DataFrame (bellek eşlemeli).
+        """
+        row = self._connection.execute(
+            "SELECT key, kind, strategy, params, settings, metrics, frames FROM runs WHERE key = ?",
+            (key,)).fetchone()
+        if row is None:
+            return None
+        record = {"key": row[0], "kind": row[1], "strategy": row[2], "params": json.loads(row[3]),
+                  "settings": json.loads(row[4]), "metrics": json.loads(row[5])}
+        frames = json.loads(row[6])
+        if isinstance(frames, list):
+            # Etiket bilgisi olmayan eski kayıtlar
+            frames = dict.fromkeys(frames, {})
+        for name, labels in frames.items():
+            path = self._frame_path(key, name)
+            if not os.path.isdir(path):
+                # Tablo dosyaları silinmişse kayıt eksiktir ve yeniden hesaplanmalıdır
+                return None
+            record[name] = _from_frame(read_bars(path), labels)
+        return record
+
+    def get_metrics(self, keys):
+        """
+        Birden çok anahtarın metriklerini tek sorguda döner (tablolar okunmaz).
+
+        Returns:
+            dict: Bulunan anahtarlar için anahtar -> metrikler.
+        """
+        keys = list(keys)
+        found = {}
+        for start in range(0, len(keys), 500):
+            part = keys[start:start + 500]
+            placeholders = ",".join("?" * len(part))
+            for key, metrics in self._connection.execute(
+                    f"SELECT key, metrics FROM runs WHERE key IN ({placeholders})", part):
+                found[key] = json.loads(metrics)
+        return found
+
+    def runs(self, kind=None, strategy=None, data_digest=None):
+        """
+        Kayıtlı koşuları karşılaştırma için tablo olarak döner; parametreler ve metrikler
+        ayrı sütunlara açılır.
+
+        Args:
+            kind (str, optional): Koşu türü filtresi.
+            strategy (str, optional): Strateji sınıfı adı filtresi.
+            data_digest (str, optional): Veri özeti filtresi.
+
+        Returns:
+            pandas.DataFrame: key, kind, strategy, data_hash, created, engine, parametre ve metrik sütunları.
+        """
+        clauses, values = [], []
+        for column, value in (("kind", kind), ("strategy", strategy), ("data_hash", data_digest)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                values.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection.execute(
+            f"SELECT key, kind, strategy, data_hash, created, settings, params, metrics FROM runs{where} "
+            "ORDER BY created", values).fetchall()
+        records = []
+        for key, kind_, strategy_, digest, created, settings, params, metrics in rows:
+            records.append({"key": key, "kind": kind_, "strategy": strategy_, "data_hash": digest,
+                            "created": pd.Timestamp(created, unit="s"),
+                            "engine": json.loads(settings).get("engine"), **json.loads(params),
+                            **json.loads(metrics)})
+        return pd.DataFrame(records)
+
+    def delete(self, key):
+        """
+        Bir koşuyu ve tablolarını siler.
+        """
+        self._connection.execute("DELETE FROM runs WHERE key = ?", (key,))
+        self._connection.commit()
+        shutil.rmtree(os.path.join(self.path, key), ignore_errors=True)
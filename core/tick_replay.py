@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+from core.journal import EVENT_FILL, EVENT_SIGNAL
+from core.logger import Logger
+from core.profiler import get_profiler
+from data.resample import timeframe_seconds
+from strategy.base_strategy import Bar
+
+
+class TickReplay:
+    def __init__(self, strategy_class, store, symbol, timeframe="M1", cash=10000, commission=0.001, stake=1,
+                 strategy_params=None, start=None, end=None, journal=None, name=None):
+        """
+        Tick düzeyinde yeniden oynatma motoru. Tickler depodan günlük parçalar halinde okunur;
+        barlar parça içinde dizi işlemleriyle oluşturulur ve her tamamlanan bar stratejinin
+        on_bar metoduna iletilir. Bar kapanışında değişen hedef pozisyon, bir sonraki tickte
+        alımda ask, satışta bid fiyatından gerçekleşir; böylece spread ve bar içi gerçekleşme
+        fiyatları sonuçlara yansır.
+
+        Tick başına Python döngüsü yoktur: tickler yalnızca parça bazında NumPy ile işlenir,
+        Python döngüsü bar sayısı kadar döner.
+
+        Args:
+            strategy_class (class): on_bar metodunu uygulayan BaseStrategy alt sınıfı.
+            store (TickStore): Tick deposu.
+            symbol (str): Sembol.
+            timeframe (str): Stratejiye iletilecek barların zaman dilimi (ör: "M1", "M5").
+            cash (float): Başlangıç sermayesi.
+            commission (float): Komisyon oranı.
+            stake (float): Pozisyon başına işlem miktarı.
+            strategy_params (dict, optional): Stratejiye iletilecek parametreler.
+            start (str, optional): Başlangıç zamanı (dahil).
+            end (str, optional): Bitiş zamanı (hariç).
+            journal (TradeJournal, optional): Sinyal ve emir gerçekleşmelerinin kaydedileceği günlük.
+            name (str, optional): Günlükteki strateji/varlık adı; varsayılan strateji sınıfının adı.
+        """
+        self.logger = Logger(__name__)
+        self.strategy_class = strategy_class
+        self.store = store
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.step = timeframe_seconds(timeframe) * 1_000_000_000
+        self.cash = cash
+        self.commission = commission
+        self.stake = stake
+        self.strategy_params = strategy_params or {}
+        self.start = start
+        self.end = end
+        self.journal = journal
+        self.name = name or strategy_class.__name__
+
+    def run(self):
+        """
+        Tickleri yeniden oynatır ve sonuçları döner.
+
+        Returns:
+            dict: VectorizedConnector.run ile aynı yapıdaki 'final_value', 'equity', 'positions'
+                ve 'trades' anahtarlarına ek olarak 'fills' (gerçekleşmeler), 'ticks' (işlenen tick
+                sayısı) ve 'spread_cost' (gerçekleşmelerde ödenen yarı spread toplamı).
+        """
+        # Tick replay'de strateji veriyi yalnızca on_bar ile alır
+        strategy = self.strategy_class(None, **self.strategy_params)
+        if not strategy.supports_incremental():
+            raise ValueError(f"{self.strategy_class.__name__} artımlı modu desteklemiyor.")
+        self.logger.info("%s tickleri %s barlarıyla yeniden oynatılıyor.", self.symbol, self.timeframe)
+
+        profiler = get_profiler()
+        self._strategy = strategy
+        self._strategy_id = self.journal.strategy_id(self.name) if self.journal is not None else 0
+        self._cash = float(self.cash)
+        self._holdings = 0.0
+        self._spread_cost = 0.0
+        self._bars = []
+        self._fills = []
+        carry = None
+        ticks = 0
+
+        chunks = self.store.iter_chunks(self.symbol, self.start, self.end)
+        while True:
+            with profiler.stage("ticks"):
+                columns = next(chunks, None)
+            if columns is None:
+                break
+            ticks += len(columns["time"])
+            with profiler.stage("bars"):
+                bars, carry = self._build_bars(columns, carry)
+            with profiler.stage("signals"):
+                self._process(bars, columns)
+        if carry is not None:
+            # Son bar veri bittiğinde tamamlanır; verdiği emir gerçekleşecek tick kalmamıştır
+            self._process({key: np.array([value]) for key, value in carry.items()}, None)
+        profiler.count("ticks", ticks)
+        profiler.count("bars", len(self._bars))
+
+        with profiler.stage("aggregation"):
+            results = self._results(ticks)
+        self.logger.info("%d tick, %d bar işlendi.", ticks, len(self._bars))
+        print('Final Portfolio Value: %.2f' % results['final_value'])
+        return results
+
+    def _build_bars(self, columns, carry):
+        # Parçadaki tickler bar başlangıcına göre gruplanır; son (henüz kapanmamış) bar bir sonraki
+        # parçaya taşınır. Önceki parçadan taşınan bar aynı zaman aralığındaysa ilk grupla birleştirilir.
+        times = columns["time"].view(np.int64)
+        bid = columns["bid"]
+        ask = columns["ask"]
+        buckets = times // self.step * self.step
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        ends = np.append(starts[1:], len(times)) - 1
+        bars = {
+            "start": buckets[starts],
+            "open": bid[starts],
+            "high": np.maximum.reduceat(bid, starts),
+            "low": np.minimum.reduceat(bid, starts),
+            "close": bid[ends],
+            "close_ask": ask[ends],
+            "volume": np.diff(np.append(starts, len(times))).astype(np.float64),
+            # Barın kapanışında verilen emrin gerçekleşeceği tick: sonraki barın ilk ticki
+            "next_tick": np.append(starts[1:], -1),
+        }
+        if carry is not None:
+            if carry["start"] == bars["start"][0]:
+                bars["open"][0] = carry["open"]
+                bars["high"][0] = max(bars["high"][0], carry["high"])
+                bars["low"][0] = min(bars["low"][0], carry["low"])
+                bars["volume"][0] += carry["volume"]
+            else:
+                carry["next_tick"] = 0
+                bars = {key: np.concatenate([[carry[key]], values]) for key, values in bars.items()}
+        carry = {key: values[-1] for key, values in bars.items()}
+        return {key: values[:-1] for key, values in bars.items()}, carry
+
+    def _process(self, bars, columns):
+        strategy = self._strategy
+        journal = self.journal
+        stake = self.stake
+        starts = bars["start"].view("datetime64[ns]")
+        for i in range(len(starts)):
+            holdings = self._holdings
+            close = bars["close"][i]
+            mark = close if holdings >= 0 else bars["close_ask"][i]
+            self._bars.append((starts[i], self._cash + holdings * mark, holdings))
+
+            previous_position = getattr(strategy, 'position', 0)
+            strategy.on_bar(Bar(starts[i], bars["open"][i], bars["high"][i], bars["low"][i], close,
+                                bars["volume"][i]))
+            strategy.execute()
+            position = getattr(strategy, 'position', 0)
+            if journal is not None and position != previous_position:
+                journal.record(starts[i], EVENT_SIGNAL, (position > 0) - (position < 0), close, position,
+                               self._strategy_id)
+
+            target = position * stake
+            next_tick = bars["next_tick"][i]
+            if target != holdings and next_tick >= 0:
+                self._fill(columns, next_tick, target - holdings)
+
+    def _fill(self, columns, tick, delta):
+        bid = columns["bid"][tick]
+        ask = columns["ask"][tick]
+        price = ask if delta > 0 else bid
+        value = delta * price
+        fee = abs(value) * self.commission
+        self._cash -= value + fee
+        self._holdings += delta
+        self._spread_cost += abs(delta) * (ask - bid) / 2.0
+        time = columns["time"][tick]
+        self._fills.append((time, delta, price, fee))
+        if self.journal is not None:
+            self.journal.record(time, EVENT_FILL, 1 if delta > 0 else -1, price, abs(delta), self._strategy_id)
+
+    def _results(self, ticks):
+        if self._bars:
+            times, equity, positions = (np.array(values) for values in zip(*self._bars))
+        else:
+            times, equity, positions = (np.array([], dtype="datetime64[ns]"), np.array([]), np.array([]))
+        index = pd.DatetimeIndex(times)
+        fills = pd.DataFrame(self._fills, columns=['time', 'size', 'price', 'commission'])
+
+        return {
+            # Son barda verilen emir gerçekleşmediği için son değer son barın kapanış değeridir
+            'final_value': float(equity[-1]) if len(equity) else float(self.cash),
+            'equity': pd.Series(equity, index=index, name='equity'),
+            'positions': pd.Series(positions, index=index, name='position'),
+            'trades': self._build_trades(fills),
+            'fills': fills,
+            'ticks': ticks,
+            'spread_cost': self._spread_cost,
+        }
+
+    def _build_trades(self, fills):
+        # Gerçekleşmeler arasında sabit ve sıfırdan farklı pozisyon taşınan her bölüm bir işlemdir
+        holdings = np.cumsum(fills['size'].to_numpy()) if len(fills) else np.array([])
+        held = np.flatnonzero(holdings != 0)
+        closed = held + 1 < len(fills)
+        exits = np.where(closed, held + 1, 0)
+        sizes = holdings[held]
+        entry_price = fills['price'].to_numpy()[held]
+        exit_price = np.where(closed, fills['price'].to_numpy()[exits], np.nan)
+        pnl = sizes * (exit_price - entry_price)
+        fees = np.abs(sizes) * (entry_price + exit_price) * self.commission
+        return pd.DataFrame({
+            'entry_time': fills['time'].to_numpy()[held],
+            'exit_time': pd.Series(fills['time'].to_numpy()[exits]).where(closed).to_numpy(),
+            'size': sizes,
+            'entry_price': entry_price,
+            'exit_price': exit_price,
+            'pnl': pnl,
+            'pnl_net': pnl - fees,
+        })
@@ -0,0 +1,300 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.logger import Logger
+from core.metrics import max_drawdown, sharpe_ratio
+from core.optimizer import (check_execution, evaluate_params, expand_grid, prepare_data, rank_rows, share_data,
+                            worker_data)
+from core.result_store import KIND_WALK_FORWARD, data_hash, run_key
+from data.shared_bars import SharedBarsRegistry
+
+# Her işçi sürecinde bir kez hazırlanan tüm veri ve ayarlar
+_worker_data = None
+_worker_settings = None
+
+
+def date_range_positions(times, start_date=None, end_date=None):
+    """
+    Sıralı zaman damgalarında [start_date, end_date] aralığının konumlarını döner (end_date günü dahil).
+
+    Args:
+        times (numpy.ndarray): Sıralı datetime64 zaman damgaları.
+        start_date (str, optional): Başlangıç tarihi.
+        end_date (str, optional): Bitiş tarihi.
+
+    Returns:
+        tuple: (başlangıç, bitiş) konumları; bitiş hariçtir.
+    """
+    lo = 0 if start_date is None else int(np.searchsorted(times, np.datetime64(pd.Timestamp(start_date)), 'left'))
+    hi = len(times)
+    if end_date is not None:
+        end = pd.Timestamp(end_date)
+        if end == end.normalize():
+            # Yalnızca tarih verilmişse o günün tamamı dahil edilir
+            end += pd.Timedelta(days=1)
+            hi = int(np.searchsorted(times, np.datetime64(end), 'left'))
+        else:
+            hi = int(np.searchsorted(times, np.datetime64(end), 'right'))
+    return lo, max(lo, hi)
+
+
+def walk_forward_windows(times, in_sample, out_of_sample, step=None, anchored=False):
+    """
+    Örneklem içi / örneklem dışı pencere konumlarını üretir.
+
+    Uzunluklar bar sayısı (int) veya süre ("180D", "4W" gibi pandas Timedelta metni) olabilir.
+    Kayan modda örneklem içi pencere her adımda ilerler; sabit başlangıçlı (anchored) modda
+    başlangıç sabit kalır ve pencere büyür.
+
+    Args:
+        times (numpy.ndarray): Sıralı datetime64 zaman damgaları.
+        in_sample (int or str): Örneklem içi pencere uzunluğu.
+        out_of_sample (int or str): Örneklem dışı pencere uzunluğu.
+        step (int or str, optional): Pencerelerin kayma miktarı; varsayılan out_of_sample.
+        anchored (bool): Örneklem içi pencerenin başlangıcı sabit kalsın.
+
+    Returns:
+        list: (örneklem içi başlangıç, örneklem dışı başlangıç, örneklem dışı bitiş) konumları.
+    """
+    step = out_of_sample if step is None else step
+    count = len(times)
+    windows = []
+    if isinstance(in_sample, str) or isinstance(out_of_sample, str) or isinstance(step, str):
+        if count == 0:
+            return windows
+        in_sample, out_of_sample, step = (pd.Timedelta(value).to_timedelta64() if isinstance(value, str)
+                                          else None for value in (in_sample, out_of_sample, step))
+        if None in (in_sample, out_of_sample, step):
+            raise ValueError("Süre ve bar sayısı pencere uzunlukları birlikte kullanılamaz.")
+        first = times[0]
+        k = 0
+        while True:
+            is_end = first + in_sample + k * step
+            is_start = first if anchored else is_end - in_sample
+            positions = np.searchsorted(times, [is_start, is_end, is_end + out_of_sample], 'left')
+            if positions[1] >= count:
+                break
+            # Örneklem dışı aralığı bar içermeyen pencereler (ör: hafta sonuna denk gelen gün) atlanır
+            if positions[1] > positions[0] and positions[2] > positions[1]:
+                windows.append(tuple(int(p) for p in positions))
+            k += 1
+        return windows
+
+    if min(in_sample, out_of_sample, step) < 1:
+        raise ValueError("Pencere uzunlukları ve adım pozitif olmalıdır.")
+    is_end = in_sample
+    while is_end < count:
+        is_start = 0 if anchored else is_end - in_sample
+        windows.append((is_start, is_end, min(is_end + out_of_sample, count)))
+        is_end += step
+    return windows
+
+
+def evaluate_out_of_sample(data, settings, params, oos_start, oos_end):
+    """
+    Parametreleri örneklem dışı pencerede değerlendirir. settings["warmup"] kadar önceki bar
+    yalnızca indikatörleri doldurmak için eklenir; bu barlardaki kâr/zarar sayılmaz.
+
+    Args:
+        data (pandas.DataFrame): prepare_data çıktısı.
+        settings (dict): Motor ayarları ("warmup" dahil).
+        params (dict): Strateji parametreleri.
+        oos_start (int): Örneklem dışı pencerenin başlangıç konumu.
+        oos_end (int): Örneklem dışı pencerenin bitiş konumu (hariç).
+
+    Returns:
+        tuple: (pencere büyüme çarpanı, vektörel motorda 1'den başlayan göreli sermaye eğrisi
+            aksi halde None, sharpe/max_drawdown/trade_count metrikleri)
+    """
+    if oos_end <= oos_start:
+        # Boş pencere: pozisyon açılmaz, sermaye değişmez
+        equity = None
+        if settings["engine"] == "vectorized":
+            equity = pd.Series(np.empty(0), index=data.index[oos_start:oos_start], name="equity")
+        return 1.0, equity, {"sharpe": np.nan, "max_drawdown": 0.0, "trade_count": 0}
+    warmup = min(settings.get("warmup", 0), oos_start)
+    metrics, results = evaluate_params(data.iloc[oos_start - warmup:oos_end], settings, params)
+    if results is None:
+        return metrics["final_value"] / settings["cash"], None, metrics
+    equity_all = results["equity"]
+    base = equity_all.iloc[warmup - 1] if warmup else settings["cash"]
+    equity = equity_all.iloc[warmup:] / base
+    trades = results["trades"]
+    return float(equity.iloc[-1]), equity, {
+        "sharpe": sharpe_ratio(equity),
+        "max_drawdown": max_drawdown(equity),
+        "trade_count": int((trades["exit_time"] >= equity.index[0]).sum()),
+    }
+
+
+def _init_worker(data, settings):
+    global _worker_data, _worker_settings
+    _worker_data = worker_data(data)
+    _worker_settings = settings
+
+
+def _run_window(window):
+    is_start, oos_start, oos_end = window
+    settings = _worker_settings
+    data = _worker_data
+
+    # Örneklem içi optimizasyon; dilimler ortak verinin kopyasız görünümleridir
+    in_sample = data.iloc[is_start:oos_start]
+    rows = [{"combination": i, **evaluate_params(in_sample, settings, params)[0]}
+            for i, params in enumerate(settings["combinations"])]
+    best = rank_rows(rows, settings["rank_by"]).iloc[0]
+    # Tablo satırı sayısal tipleri yükseltebileceği için parametreler özgün sözlükten alınır
+    params = settings["combinations"][int(best["combination"])]
+
+    growth, equity, oos_metrics = evaluate_out_of_sample(data, settings, params, oos_start, oos_end)
+
+    times = data.index if settings["engine"] == "vectorized" else pd.DatetimeIndex(data[settings["date_column"]])
+    return {
+        "is_start": times[is_start],
+        "is_end": times[oos_start - 1],
+        "oos_start": times[oos_start],
+        "oos_end": times[oos_end - 1],
+        **params,
+        "is_score": best[settings["rank_by"]],
+        "oos_return": (growth - 1.0) * 100.0,
+        "oos_sharpe": oos_metrics.get("sharpe"),
+        "oos_max_drawdown": oos_metrics.get("max_drawdown"),
+        "oos_trade_count": oos_metrics.get("trade_count"),
+    }, equity
+
+
+class WalkForward:
+    def __init__(self, strategy_class, data, date_column, price_column, cash=10000, commission=0.001,
+                 stake=1, engine="vectorized", max_workers=None, start_date=None, end_date=None, store=None,
+                 execution=None):
+        """
+        İleriye doğru (walk-forward) değerlendirme motoru. Veri örneklem içi / örneklem dışı
+        pencerelere bölünür; her örneklem içi pencerede parametreler optimize edilir, en iyi
+        parametreler sonraki örneklem dışı pencerede test edilir ve sonuçlar birleştirilir.
+
+        Veri bir kez yüklenir ve paylaşımlı belleğe alınır; işçi süreçler başlatılırken kopyasız
+        bağlanır, pencereler bu ortak verinin kopyasız dilimleridir ve paralel çalıştırılır.
+
+        Args:
+            strategy_class (class): Çalıştırılacak strateji sınıfı.
+            data (pandas.DataFrame): Tarih sırasına göre sıralı, tarih ve fiyat sütunlarını içeren veri.
+            date_column (str): Tarih sütunu.
+            price_column (str): Fiyat sütunu.
+            cash (float): Her pencerenin başlangıç sermayesi.
+            commission (float): Komisyon oranı.
+            stake (float): Pozisyon başına işlem miktarı.
+            engine (str): "vectorized" veya "backtrader".
+            max_workers (int, optional): İşçi sayısı; belirtilmezse çekirdek sayısı kullanılır.
+            start_date (str, optional): Değerlendirilecek aralığın başlangıcı.
+            end_date (str, optional): Değerlendirilecek aralığın bitişi (gün dahil).
+            store (ResultStore, optional): Sonuç deposu; verilirse aynı veri, kod, ızgara ve pencere
+                ayarlarıyla yapılmış bir değerlendirme yeniden hesaplanmadan döner.
+            execution (dict, optional): FillSimulator parametreleri (yalnızca vektörel motor).
+        """
+        check_execution(engine, execution)
+        self.logger = Logger(__name__)
+        self.store = store
+        lo, hi = date_range_positions(data[date_column].to_numpy(dtype="datetime64[ns]"), start_date, end_date)
+        self.data = data.iloc[lo:hi]
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.settings = {
+            "strategy_class": strategy_class,
+            "date_column": date_column,
+            "price_column": price_column,
+            "cash": cash,
+            "commission": commission,
+            "stake": stake,
+            "engine": engine,
+            "execution": execution,
+        }
+
+    def run(self, grid, in_sample, out_of_sample, step=None, anchored=False, warmup=0,
+            rank_by="final_value", constraint=None):
+        """
+        Tüm pencereleri çalıştırır ve örneklem dışı sonuçları birleştirir.
+
+        Args:
+            grid (dict): expand_grid formatında parametre ızgarası.
+            in_sample, out_of_sample, step, anchored: walk_forward_windows parametreleri.
+            warmup (int): Örneklem dışı pencereden önce indikatörleri doldurmak için eklenen bar
+                sayısı (yalnızca vektörel motor; bu barlardaki kâr/zarar sayılmaz).
+            rank_by (str): Örneklem içi sıralama metriği.
+            constraint (callable, optional): Kombinasyonu kabul edip etmeyeceğini dönen fonksiyon.
+
+        Returns:
+            dict: 'windows' (pencere bazında sonuç tablosu), 'equity' (vektörel motorda birleştirilmiş
+                örneklem dışı sermaye eğrisi), 'final_value' ve 'return' (yüzde) anahtarları.
+        """
+        if warmup and self.settings["engine"] != "vectorized":
+            raise ValueError("Isınma barları yalnızca vektörel motorla kullanılabilir.")
+        combinations = expand_grid(grid)
+        if constraint is not None:
+            combinations = [params for params in combinations if constraint(params)]
+        cash = self.settings["cash"]
+        times = self.data[self.settings["date_column"]].to_numpy(dtype="datetime64[ns]")
+        windows = walk_forward_windows(times, in_sample, out_of_sample, step, anchored)
+        if not combinations or not windows:
+            return {"windows": pd.DataFrame(), "equity": None, "final_value": float(cash), "return": 0.0}
+        if any(current[2] > following[1] for current, following in zip(windows, windows[1:])):
+            raise ValueError("Örneklem dışı pencereler çakışıyor; adım örneklem dışı uzunluktan küçük olamaz.")
+
+        settings = {**self.settings, "combinations": combinations, "rank_by": rank_by, "warmup": warmup}
+        if self.store is not None:
+            digest = data_hash(self.data)
+            key = run_key(digest, self.settings["strategy_class"], {"grid": combinations},
+                          {**settings, "windows": windows})
+            record = self.store.get(key)
+            if record is not None:
+                self.logger.info("İleriye doğru değerlendirme sonuç deposundan alındı.")
+                return self._from_record(record)
+
+        workers = min(self.max_workers, len(windows))
+        self.logger.info("%d pencere, pencere başına %d kombinasyon, %d işçi ile çalıştırılıyor.",
+                         len(windows), len(combinations), workers)
+        # Veri düzeni bir kez hazırlanıp paylaşımlı belleğe yüklenir; işçiler pencereleri bu
+        # verinin kopyasız dilimleri olarak alır
+        with SharedBarsRegistry() as registry, ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(share_data(registry, prepare_data(self.data, settings)), settings)) as executor:
+            outputs = list(executor.map(_run_window, windows))
+
+        rows = [row for row, _ in outputs]
+        growth = np.cumprod([1.0 + row["oos_return"] / 100.0 for row in rows])
+        equity = None
+        if self.settings["engine"] == "vectorized":
+            # Her pencerenin göreli eğrisi önceki pencerelerin birikimli getirisiyle ölçeklenir
+            scale = np.concatenate([[1.0], growth[:-1]])
+            equity = pd.concat([segment * factor * cash for (_, segment), factor in zip(outputs, scale)])
+            equity.name = "equity"
+        self.logger.info("İleriye doğru değerlendirme tamamlandı.")
+        results = {
+            "windows": pd.DataFrame(rows),
+            "equity": equity,
+            "final_value": float(cash * growth[-1]),
+            "return": float((growth[-1] - 1.0) * 100.0),
+        }
+        if self.store is not None:
+            frames = {"windows": results["windows"]}
+            if equity is not None:
+                frames["equity"] = equity
+            self.store.put(key, KIND_WALK_FORWARD, self.settings["strategy_class"], {"grid": combinations},
+                           {**settings, "windows": windows},
+                           {"final_value": results["final_value"], "return": results["return"]},
+                           frames, data_digest=digest)
+        return results
+
+    @staticmethod
+    def _from_record(record):
+        equity = record.get("equity")
+        if equity is not None:
+            # Eğri depoya indeksiyle birlikte yazılır; ilk sütun zaman indeksidir
+            equity = equity.set_index(equity.columns[0])["equity"].copy()
+        return {
+            "windows": record["windows"].copy(),
+            "equity": equity,
+            "final_value": record["metrics"]["final_value"],
+            "return": record["metrics"]["return"],
+        }
@@ -0,0 +1,231 @@
+import contextlib
+import json
+import os
+import sqlite3
+import time
+
+# İş durumları
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sweeps (
+    name TEXT PRIMARY KEY,
+    settings TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sweep TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    result TEXT,
+    error TEXT,
+    updated REAL NOT NULL,
+    UNIQUE (sweep, job_key)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (sweep, status);
+"""
+
+
+def _json(value):
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class WorkQueue:
+    def __init__(self, path, lease_seconds=300, max_attempts=3, clock=time.time):
+        """
+        SQLite üzerinde kalıcı iş kuyruğu. Koordinatör işleri (ör: sembol x parametre x pencere)
+        kuyruğa yazar; aynı veya farklı makinelerdeki işçiler işleri kiralayarak (lease) alır ve
+        sonuçları geri yazar.
+
+        - Kiralama tek bir yazma işleminde (BEGIN IMMEDIATE) yapılır; bir iş aynı anda yalnızca
+          bir işçiye verilir.
+        - Kira süresi dolan işler (ör: işçi süreci öldüğünde) başka bir işçiye yeniden verilir;
+          uzun işler heartbeat ile kiralarını uzatır.
+        - Hata veren veya kirası dolan işler max_attempts denemeye kadar yeniden kuyruğa girer,
+          sonra "failed" olarak işaretlenir (retry_failed ile yeniden denenebilir).
+
+        Birden fazla makineden erişimde dosya, kilitlemeyi doğru destekleyen ortak bir dosya
+        sisteminde olmalıdır; bu yüzden WAL yerine varsayılan günlük modu kullanılır.
+
+        Args:
+            path (str): Kuyruk veritabanı dosyası.
+            lease_seconds (float): Kira süresi (saniye).
+            max_attempts (int): Bir işin en fazla deneme sayısı.
+            clock (callable): Zaman kaynağı (saniye); testlerde değiştirilebilir.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.clock = clock
+        # İşlemler açıkça başlatılır; bekleyen kilitler için 30 saniye beklenir
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    def submit(self, sweep, settings, jobs):
+        """
+        Bir taramayı ve işlerini kuyruğa yazar. Aynı adla daha önce yazılmış işler tekrar
+        eklenmez; yarıda kalan bir tarama aynı adla yeniden gönderildiğinde kaldığı yerden sürer.
+
+        Args:
+            sweep (str): Tarama adı.
+            settings (dict): Tüm işler için ortak ayarlar (JSON olarak saklanır).
+            jobs (list): İş tanımları (JSON'a çevrilebilir sözlükler).
+
+        Returns:
+            int: Yeni eklenen iş sayısı.
+        """
+        now = self.clock()
+        with self._transaction() as connection:
+            connection.execute("INSERT OR IGNORE INTO sweeps VALUES (?, ?, ?)", (sweep, _json(settings), now))
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO jobs (sweep, job_key, payload, status, updated) VALUES (?, ?, ?, ?, ?)",
+                ((sweep, _json(job), json.dumps(job, default=str), STATUS_PENDING, now) for job in jobs))
+            return connection.total_changes - before
+
+    def settings(self, sweep):
+        """
+        Taramanın ortak ayarlarını döner; tarama yoksa None.
+        """
+        row = self._connection.execute("SELECT settings FROM sweeps WHERE name = ?", (sweep,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def lease(self, worker, sweep=None):
+        """
+        Sıradaki işi işçiye kiralar. Bekleyen işler ve kirası dolmuş çalışan işler adaydır;
+        deneme hakkı biten ve kirası dolan işler önce "failed" olarak işaretlenir.
+
+        Args:
+            worker (str): İşçi adı.
+            sweep (str, optional): Yalnızca bu taramanın işleri.
+
+        Returns:
+            dict: 'id', 'sweep', 'payload' ve 'attempts' anahtarlarıyla iş; iş yoksa None.
+        """
+        now = self.clock()
+        scope, values = ("AND sweep = ?", [sweep]) if sweep is not None else ("", [])
+        with self._transaction() as connection:
+            connection.execute(
+                f"UPDATE jobs SET status = ?, error = ?, updated = ? WHERE status = ? AND lease_until < ? "
+                f"AND attempts >= ? {scope}",
+                [STATUS_FAILED, "Kira süresi doldu.", now, STATUS_RUNNING, now, self.max_attempts] + values)
+            row = connection.execute(
+                f"SELECT id, sweep, payload, attempts FROM jobs WHERE (status = ? OR (status = ? AND lease_until < ?)) "
+                f"{scope} ORDER BY id LIMIT 1",
+                [STATUS_PENDING, STATUS_RUNNING, now] + values).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1, updated = ? "
+                "WHERE id = ?",
+                (STATUS_RUNNING, worker, now + self.lease_seconds, now, row[0]))
+        return {"id": row[0], "sweep": row[1], "payload": json.loads(row[2]), "attempts": row[3] + 1}
+
+    def _update_owned(self, job_id, worker, assignments, values):
+        # Yalnızca işi hâlâ kiralamış olan işçinin güncellemesi kabul edilir
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE jobs SET {assignments}, updated = ? WHERE id = ? AND worker = ? AND status = ?",
+                list(values) + [self.clock(), job_id, worker, STATUS_RUNNING])
+            return cursor.rowcount == 1
+
+    def heartbeat(self, job_id, worker):
+        """
+        İşin kirasını uzatır.
+
+        Returns:
+            bool: İş hâlâ bu işçideyse True.
+        """
+        return self._update_owned(job_id, worker, "lease_until = ?", [self.clock() + self.lease_seconds])
+
+    def complete(self, job_id, worker, result):
+        """
+        İşin sonucunu yazar. Kirası dolup başka işçiye verilmiş işlerin geç gelen sonucu yok sayılır.
+
+        Returns:
+            bool: Sonuç kabul edildiyse True.
+        """
+        return self._update_owned(job_id, worker, "status = ?, result = ?, error = NULL",
+                                  [STATUS_DONE, json.dumps(result, default=str)])
+
+    def fail(self, job_id, worker, error):
+        """
+        İşi başarısız olarak bildirir; deneme hakkı varsa iş yeniden kuyruğa girer.
+
+        Returns:
+            bool: Bildirim kabul edildiyse True.
+        """
+        return self._update_owned(
+            job_id, worker, "status = CASE WHEN attempts < ? THEN ? ELSE ? END, error = ?, lease_until = NULL",
+            [self.max_attempts, STATUS_PENDING, STATUS_FAILED, str(error)])
+
+    def retry_failed(self, sweep):
+        """
+        Taramadaki başarısız işleri deneme sayılarını sıfırlayarak yeniden kuyruğa alır.
+
+        Returns:
+            int: Yeniden kuyruğa alınan iş sayısı.
+        """
+        with self._transaction() as connection:
+            return connection.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, worker = NULL, lease_until = NULL, updated = ? "
+                "WHERE sweep = ? AND status = ?",
+                (STATUS_PENDING, self.clock(), sweep, STATUS_FAILED)).rowcount
+
+    def progress(self, sweep):
+        """
+        Taramanın ilerlemesini döner.
+
+        Returns:
+            dict: 'total', 'pending', 'running', 'done' ve 'failed' iş sayıları.
+        """
+        counts = dict(self._connection.execute(
+            "SELECT status, COUNT(*) FROM jobs WHERE sweep = ? GROUP BY status", (sweep,)).fetchall())
+        progress = {status: counts.get(status, 0)
+                    for status in (STATUS_PENDING, STATUS_RUNNING, STATUS_DONE, STATUS_FAILED)}
+        progress["total"] = sum(progress.values())
+        return progress
+
+    def results(self, sweep):
+        """
+        Tamamlanan işlerin tanımlarını ve sonuçlarını iş sırasıyla döner.
+
+        Returns:
+            list: (iş tanımı, sonuç) çiftleri.
+        """
+        rows = self._connection.execute(
+            "SELECT payload, result FROM jobs WHERE sweep = ? AND status = ? ORDER BY id", (sweep, STATUS_DONE))
+        return [(json.loads(payload), json.loads(result)) for payload, result in rows]
+
+    def failures(self, sweep):
+        """
+        Başarısız işlerin tanımlarını ve son hata mesajlarını döner.
+
+        Returns:
+            list: (iş tanımı, hata) çiftleri.
+        """
+        rows = self._connection.execute(
+            "SELECT payload, error FROM jobs WHERE sweep = ? AND status = ? ORDER BY id", (sweep, STATUS_FAILED))
+        return [(json.loads(payload), error) for payload, error in rows]
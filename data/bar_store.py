@@ -0,0 +1,412 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# fetch_data_main.py'nin CSV dosyalarını yazdığı varsayılan klasör
+DEFAULT_BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "historic_data")
+
+META_FILE = "meta.json"
+STORE_SUFFIX = ".bars"
+
+
+def _column_file(path, column, meta=None):
+    # Tam yazımlar sütunları sürüm numaralı dosyalara yazar; dosya adları meta içinde tutulur.
+    # Dosya adı kaydı olmayan (eski) depolarda sütun dosyası <sütun>.bin'dir.
+    files = meta.get("files", {}) if meta else {}
+    return os.path.join(path, files.get(column, f"{column}.bin"))
+
+
+def _storage_dtype(dtype):
+    # Tarih sütunları diskte int64 (epoch'tan bu yana nanosaniye) olarak tutulur
+    return np.dtype(np.int64) if dtype == "datetime64[ns]" else np.dtype(dtype)
+
+
+def _read_meta(path):
+    meta_path = os.path.join(path, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, "r") as f:
+        return json.load(f)
+
+
+def _write_meta(path, meta):
+    # Meta dosyası, yazımın tamamlandığını gösteren işlem noktasıdır; atomik olarak değiştirilir
+    tmp_path = os.path.join(path, META_FILE + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, os.path.join(path, META_FILE))
+
+
+def _to_columns(df):
+    columns = {}
+    dtypes = {}
+    for name in df.columns:
+        series = df[name]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            if getattr(series.dt, "tz", None) is not None:
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            columns[name] = series.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            dtypes[name] = "datetime64[ns]"
+        elif pd.api.types.is_numeric_dtype(series):
+            values = np.ascontiguousarray(series.to_numpy())
+            columns[name] = values
+            dtypes[name] = values.dtype.str
+        else:
+            raise ValueError(f"Sayısal olmayan sütun bar deposuna yazılamaz: {name}")
+    return columns, dtypes
+
+
+def write_bars(path, df, source_mtime=None):
+    """
+    DataFrame'i sütun başına bir ikili dosya olacak şekilde bar deposu klasörüne yazar.
+    Mevcut içerik tamamen değiştirilir.
+
+    Sütunlar yeni sürüm numaralı dosyalara yazılır ve meta dosyasının değiştirilmesi tek işlem
+    noktasıdır: yazım yarıda kalırsa depo eski haliyle okunmaya devam eder, okuyucular hiçbir
+    zaman eski ve yeni sütunların karışımını görmez. Eski sürümün dosyaları sonra silinir.
+
+    Args:
+        path (str): Bar deposu klasörü (ör: historic_data/EURUSD/M5.bars).
+        df (pandas.DataFrame): Tarih ve sayısal sütunlardan oluşan bar verisi.
+        source_mtime (int, optional): Kaynak CSV dosyasının değişiklik zamanı (ns).
+    """
+    columns, dtypes = _to_columns(df)
+    os.makedirs(path, exist_ok=True)
+    previous = _read_meta(path)
+    version = (previous or {}).get("version", 0) + 1
+    files = {name: f"{name}.{version}.bin" for name in columns}
+    for name, values in columns.items():
+        # Yeni dosyalar henüz meta tarafından gösterilmediği için doğrudan yazılabilir
+        values.tofile(os.path.join(path, files[name]))
+    _write_meta(path, {
+        "columns": dtypes,
+        "order": list(df.columns),
+        "rows": len(df),
+        "source_mtime": source_mtime,
+        "version": version,
+        "files": files,
+    })
+    _remove_stale_files(path, set(files.values()))
+
+
+def _remove_stale_files(path, current):
+    # Önceki sürümlerin ve yarıda kalmış yazımların sütun dosyaları silinir. Bellek eşlemeyle açık
+    # dosyalar POSIX'te okuyucular kapatana kadar erişilebilir kalır; silinemeyenler (Windows)
+    # sonraki tam yazımda tekrar denenir.
+    for name in os.listdir(path):
+        if name.endswith(".bin") and name not in current:
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+
+
+def append_bars(path, df):
+    """
+    Bar deposunun sonuna yeni barlar ekler. Depo yoksa oluşturur.
+    Sütunlar mevcut şemayla aynı olmalıdır. Yeni değerler sütun türüne kayıpsız dönüşemiyorsa
+    (ör: tamsayı sütuna ondalıklı değerler) sütun genişletilir ve depo baştan yazılır.
+
+    Args:
+        path (str): Bar deposu klasörü.
+        df (pandas.DataFrame): Eklenecek barlar.
+    """
+    meta = _read_meta(path)
+    if meta is None:
+        write_bars(path, df)
+        return
+    if len(df) == 0:
+        return
+
+    if set(df.columns) != set(meta["order"]):
+        raise ValueError(f"Eklenen sütunlar depo şemasıyla uyuşmuyor: {list(df.columns)}")
+    df = df[meta["order"]]
+    columns, dtypes = _to_columns(df)
+    widened = False
+    for name, dtype in meta["columns"].items():
+        if (dtype == "datetime64[ns]") != (dtypes[name] == "datetime64[ns]"):
+            raise ValueError(f"Eklenen sütunun türü depo şemasıyla uyuşmuyor: {name} ({dtypes[name]} != {dtype})")
+        storage = _storage_dtype(dtype)
+        if np.can_cast(columns[name].dtype, storage, casting="safe"):
+            columns[name] = columns[name].astype(storage, copy=False)
+        else:
+            # Ör: tamsayı sütuna ondalıklı/NaN değerler; yerinde dönüştürmek veriyi bozar
+            widened = True
+    if widened:
+        # Sütun türü genişletilerek depo tam yazım (sürümlü, atomik) yoluyla yeniden yazılır
+        combined = {}
+        for name, values in read_bar_arrays(path).items():
+            if meta["columns"][name] == "datetime64[ns]":
+                combined[name] = np.concatenate([values.view(np.int64), columns[name]]).view("datetime64[ns]")
+            else:
+                combined[name] = np.concatenate([values, columns[name]])
+        write_bars(path, pd.DataFrame(combined, copy=False), source_mtime=meta.get("source_mtime"))
+        return
+
+    rows = meta["rows"]
+    for name, values in columns.items():
+        column_path = _column_file(path, name, meta)
+        itemsize = values.dtype.itemsize
+        with open(column_path, "r+b") as f:
+            # Yarım kalmış bir önceki eklemeden kalan baytlar atılır
+            f.truncate(rows * itemsize)
+            f.seek(0, os.SEEK_END)
+            values.tofile(f)
+    meta["rows"] = rows + len(df)
+    _write_meta(path, meta)
+
+
+def truncate_bars(path, rows):
+    """
+    Bar deposunu ilk `rows` bara kısaltır. Dosyalardaki fazla baytlar bir sonraki
+    eklemede atılır.
+
+    Args:
+        path (str): Bar deposu klasörü.
+        rows (int): Korunacak bar sayısı.
+    """
+    meta = _read_meta(path)
+    if meta is None:
+        raise FileNotFoundError(f"Bar deposu bulunamadı: {path}")
+    meta["rows"] = min(meta["rows"], max(rows, 0))
+    _write_meta(path, meta)
+
+
+def bar_count(path):
+    """
+    Bar deposundaki bar sayısını döner; depo yoksa 0.
+    """
+    meta = _read_meta(path)
+    return 0 if meta is None else meta["rows"]
+
+
+def read_bar_arrays(path):
+    """
+    Bar deposundaki sütunları kopyalamadan, salt okunur bellek eşlemeli diziler olarak açar.
+
+    Args:
+        path (str): Bar deposu klasörü.
+
+    Returns:
+        dict: Sütun adı -> numpy.memmap (tarih sütunları datetime64[ns] görünümüdür).
+    """
+    meta = _read_meta(path)
+    if meta is None:
+        raise FileNotFoundError(f"Bar deposu bulunamadı: {path}")
+    rows = meta["rows"]
+    arrays = {}
+    for name in meta["order"]:
+        dtype = meta["columns"][name]
+        storage = _storage_dtype(dtype)
+        if rows == 0:
+            values = np.empty(0, dtype=storage)
+        else:
+            values = np.memmap(_column_file(path, name, meta), dtype=storage, mode="r", shape=(rows,))
+        if dtype == "datetime64[ns]":
+            values = values.view("datetime64[ns]")
+        arrays[name] = values
+    return arrays
+
+
+def read_bars(path):
+    """
+    Bar deposunu DataFrame olarak okur. Sütunlar bellek eşlemeli dosyalara bağlı kalır;
+    veri kopyalanmaz ve ayrıştırılmaz.
+
+    Args:
+        path (str): Bar deposu klasörü.
+
+    Returns:
+        pandas.DataFrame: Bar verisi.
+    """
+    arrays = read_bar_arrays(path)
+    # memmap alt sınıfı yerine aynı belleğe bakan düz ndarray görünümleri kullanılır
+    return pd.DataFrame({name: values.view(np.ndarray) for name, values in arrays.items()}, copy=False)
+
+
+def last_timestamp(path, date_column="time"):
+    """
+    Bar deposundaki son barın zaman damgasını döner.
+
+    Args:
+        path (str): Bar deposu klasörü.
+        date_column (str): Tarih sütunu.
+
+    Returns:
+        pandas.Timestamp: Son zaman damgası; depo yoksa veya boşsa None.
+    """
+    meta = _read_meta(path)
+    if meta is None or meta["rows"] == 0:
+        return None
+    return pd.Timestamp(read_bar_arrays(path)[date_column][-1])
+
+
+def iter_bar_chunks(path, chunk_size=65536):
+    """
+    Bar deposunu sabit boyutlu parçalar halinde okur. Her parça dosyadan ayrı okunur ve
+    işlendikten sonra serbest bırakılır; bellek kullanımı depo boyutundan bağımsızdır.
+
+    Args:
+        path (str): Bar deposu klasörü.
+        chunk_size (int): Parça başına bar sayısı.
+
+    Yields:
+        pandas.DataFrame: En fazla chunk_size bar içeren parça.
+    """
+    meta = _read_meta(path)
+    if meta is None:
+        raise FileNotFoundError(f"Bar deposu bulunamadı: {path}")
+    rows = meta["rows"]
+    for start in range(0, rows, chunk_size):
+        count = min(chunk_size, rows - start)
+        columns = {}
+        for name in meta["order"]:
+            dtype = meta["columns"][name]
+            storage = _storage_dtype(dtype)
+            values = np.fromfile(_column_file(path, name, meta), dtype=storage, count=count,
+                                 offset=start * storage.itemsize)
+            columns[name] = values.view("datetime64[ns]") if dtype == "datetime64[ns]" else values
+        yield pd.DataFrame(columns, copy=False)
+
+
+def convert_csv(csv_path, date_column="time", chunk_size=1_000_000):
+    """
+    CSV dosyasını parça parça okuyarak bar deposuna dönüştürür; dosyanın tamamı hiçbir
+    zaman belleğe alınmaz. Kaynak değişiklik zamanı yalnızca dönüşüm tamamlandığında yazılır,
+    böylece yarıda kalan bir dönüşüm sonraki kullanımda baştan yapılır.
+
+    Args:
+        csv_path (str): Kaynak CSV dosyası.
+        date_column (str): Tarih sütunu.
+        chunk_size (int): Parça başına satır sayısı.
+
+    Returns:
+        str: Bar deposu klasörü.
+    """
+    store_path = cache_path_for(csv_path)
+    source_mtime = os.stat(csv_path).st_mtime_ns
+    for i, chunk in enumerate(pd.read_csv(csv_path, parse_dates=[date_column], chunksize=chunk_size)):
+        if i == 0:
+            write_bars(store_path, chunk)
+        else:
+            append_bars(store_path, chunk)
+    meta = _read_meta(store_path)
+    meta["source_mtime"] = source_mtime
+    _write_meta(store_path, meta)
+    return store_path
+
+
+class BarStream:
+    def __init__(self, csv_path, date_column="time", chunk_size=65536):
+        """
+        Bir CSV kaynağının barlarını parça parça dolaşan, tekrar tekrar gezilebilen akış.
+        Bar deposu yoksa veya CSV değiştiyse CSV önce parça parça depoya dönüştürülür.
+        Uzun geçmişlerde (ör: yıllarca M1 verisi) bellek kullanımını sabit tutmak için
+        load_bars yerine kullanılır.
+
+        Args:
+            csv_path (str): Kaynak CSV dosyası (yalnızca bar deposu varsa dosya gerekmez).
+            date_column (str): Tarih sütunu.
+            chunk_size (int): Parça başına bar sayısı.
+        """
+        self.csv_path = csv_path
+        self.date_column = date_column
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        self._ensure_store()
+        return bar_count(cache_path_for(self.csv_path))
+
+    def _ensure_store(self):
+        if not os.path.exists(self.csv_path):
+            return
+        meta = _read_meta(cache_path_for(self.csv_path))
+        if meta is None or meta.get("source_mtime") != os.stat(self.csv_path).st_mtime_ns:
+            convert_csv(self.csv_path, self.date_column)
+
+    def __iter__(self):
+        self._ensure_store()
+        return iter_bar_chunks(cache_path_for(self.csv_path), self.chunk_size)
+
+
+def cache_path_for(csv_path):
+    """
+    Bir CSV dosyası için bar deposu klasörünün yolunu döner (ör: M5.csv -> M5.bars).
+    """
+    return os.path.splitext(csv_path)[0] + STORE_SUFFIX
+
+
+def load_bars(csv_path, date_column="time"):
+    """
+    Bar verisini yükler. Geçerli bir bar deposu varsa CSV ayrıştırılmadan bellek eşleme
+    ile okunur. Depo yoksa veya CSV dosyası depo yazıldıktan sonra değiştiyse, CSV bir kez
+    okunur ve depoya dönüştürülür.
+
+    Args:
+        csv_path (str): Kaynak CSV dosyası.
+        date_column (str): Tarih sütunu.
+
+    Returns:
+        pandas.DataFrame: Bar verisi.
+    """
+    store_path = cache_path_for(csv_path)
+    if not os.path.exists(csv_path):
+        # Sadece bar deposu olarak yazılmış veriler
+        return read_bars(store_path)
+
+    source_mtime = os.stat(csv_path).st_mtime_ns
+    meta = _read_meta(store_path)
+    if meta is not None and meta.get("source_mtime") == source_mtime:
+        return read_bars(store_path)
+
+    df = pd.read_csv(csv_path, parse_dates=[date_column])
+    try:
+        write_bars(store_path, df, source_mtime=source_mtime)
+    except (ValueError, OSError) as e:
+        print(f"Bar deposu oluşturulamadı, CSV verisi kullanılıyor: {e}")
+    return df
+
+
+class BarStore:
+    def __init__(self, base_path=None):
+        """
+        Sembol ve zaman dilimine göre anahtarlanmış ikili bar deposu.
+        Yerleşim CSV dosyalarıyla aynıdır: <base_path>/<sembol>/<zaman dilimi>.bars
+
+        Args:
+            base_path (str, optional): Kök klasör; varsayılan data/historic_data.
+        """
+        self.base_path = base_path or DEFAULT_BASE_PATH
+
+    def path(self, symbol, timeframe):
+        return os.path.join(self.base_path, symbol, f"{timeframe}{STORE_SUFFIX}")
+
+    def exists(self, symbol, timeframe):
+        return _read_meta(self.path(symbol, timeframe)) is not None
+
+    def write(self, symbol, timeframe, df):
+        write_bars(self.path(symbol, timeframe), df)
+
+    def append(self, symbol, timeframe, df):
+        append_bars(self.path(symbol, timeframe), df)
+
+    def truncate(self, symbol, timeframe, rows):
+        truncate_bars(self.path(symbol, timeframe), rows)
+
+    def count(self, symbol, timeframe):
+        return bar_count(self.path(symbol, timeframe))
+
+    def read(self, symbol, timeframe):
+        return read_bars(self.path(symbol, timeframe))
+
+    def read_arrays(self, symbol, timeframe):
+        return read_bar_arrays(self.path(symbol, timeframe))
+
+    def iter_chunks(self, symbol, timeframe, chunk_size=65536):
+        return iter_bar_chunks(self.path(symbol, timeframe), chunk_size)
+
+    def last_timestamp(self, symbol, timeframe, date_column="time"):
+        return last_timestamp(self.path(symbol, timeframe), date_column)
@@ -0,0 +1,36 @@
+import asyncio
+import json
+import os
+
+from connectors.async_binance_connector import AsyncBinanceConnector
+from data.data_source.binance.history_loader import OHLCVHistoryLoader
+
+
+async def fetch_history(config):
+    connector = AsyncBinanceConnector(config["exchange"], config.get("api_key", ""), config.get("secret", ""))
+    if not await connector.initialize():
+        await connector.close()
+        return []
+    try:
+        loader = OHLCVHistoryLoader(connector, windows=config.get("windows", 4), limit=config.get("limit", 1000))
+        return await loader.load_many(config["symbols"], config["timeframe"], config["since"], config.get("until"))
+    finally:
+        await connector.close()
+
+
+def main():
+    # Script konumuna göre config path belirle
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    config_path = os.path.join(script_dir, "config.json")
+
+    with open(config_path, "r") as f:
+        config = json.load(f)
+
+    reports = asyncio.run(fetch_history(config))
+    for report in reports:
+        print(f"✅ {report['symbol']} - {report['timeframe']}: "
+              f"{report['new_bars']} yeni mum, toplam {report['total_bars']}")
+
+
+if __name__ == "__main__":
+    main()
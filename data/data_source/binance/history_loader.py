@@ -0,0 +1,188 @@
+import asyncio
+import json
+import os
+import shutil
+
+import ccxt
+import pandas as pd
+
+from data.bar_store import BarStore, append_bars, bar_count, last_timestamp, read_bar_arrays, truncate_bars
+from data.data_source.pipeline import ohlcv_to_frame
+
+
+def symbol_folder(symbol):
+    """
+    ccxt sembolünü bar deposu klasör adına çevirir (ör: 'BTC/USDT' -> 'BTCUSDT').
+    """
+    return symbol.replace("/", "").replace(":", "_")
+
+
+def to_milliseconds(value):
+    """
+    Tarih metni, datetime veya milisaniye değerini epoch milisaniyesine çevirir.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.value // 1_000_000
+
+
+class OHLCVHistoryLoader:
+    def __init__(self, connector, store=None, windows=4, limit=1000, retries=3, merge_chunk=100_000):
+        """
+        Sayfalı toplu OHLCV geçmişi indiricisi. İstenen zaman aralığı pencerelere bölünür;
+        her pencere `since` ile sayfa sayfa ilerler ve pencereler hız sınırı içinde
+        eşzamanlı indirilir. Sayfalar geldikçe pencereye ait geçici bar deposuna yazılır,
+        bu yüzden bellek kullanımı geçmişin uzunluğuyla büyümez. Yarıda kalan indirme
+        aynı çağrıyla kaldığı yerden devam eder.
+
+        Args:
+            connector (AsyncBinanceConnector): Başlatılmış asenkron borsa bağlantısı.
+            store (BarStore, optional): Hedef bar deposu; varsayılan data/historic_data.
+            windows (int): Sembol başına eşzamanlı indirilen pencere sayısı.
+            limit (int): İstek başına mum sayısı.
+            retries (int): Başarısız sayfa isteği için yeniden deneme sayısı.
+            merge_chunk (int): Pencereler birleştirilirken bir seferde kopyalanan bar sayısı.
+        """
+        self.connector = connector
+        self.store = store or BarStore()
+        self.windows = windows
+        self.limit = limit
+        self.retries = retries
+        self.merge_chunk = merge_chunk
+
+    def _paths(self, symbol, timeframe):
+        target = self.store.path(symbol_folder(symbol), timeframe)
+        return target, target + ".download.json"
+
+    def _save_manifest(self, manifest_path, manifest):
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+
+    def _plan(self, manifest_path, start, end, step):
+        # Yarıda kalan indirmenin planı (pencereler ve birleştirme durumu) aynen kullanılır
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as f:
+                return json.load(f)
+
+        bars = max((end - start) // step, 1)
+        count = max(1, min(self.windows, bars // self.limit or 1))
+        size = -(-bars // count) * step
+        windows = [[start + i * size, min(start + (i + 1) * size, end)] for i in range(count)]
+        manifest = {"start": start, "end": end, "windows": windows, "merged": []}
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        self._save_manifest(manifest_path, manifest)
+        return manifest
+
+    async def _fetch_page(self, symbol, timeframe, since):
+        # Yalnızca geçici ağ hataları yeniden denenir; diğer borsa hataları (ör: geçersiz sembol) iletilir
+        for attempt in range(self.retries + 1):
+            try:
+                return await self.connector.fetch_ohlcv(symbol, timeframe, since=since, limit=self.limit)
+            except ccxt.NetworkError:
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(0.5 * (2 ** attempt))
+
+    async def _load_window(self, symbol, timeframe, part_path, start, end, step):
+        cursor = start
+        last = last_timestamp(part_path)
+        if last is not None:
+            cursor = to_milliseconds(last) + step
+
+        while cursor < end:
+            page = await self._fetch_page(symbol, timeframe, cursor)
+            if not page:
+                break
+            df = ohlcv_to_frame(page)
+            times = df["time"].astype("int64") // 1_000_000
+            df = df[(times >= cursor) & (times < end)]
+            if df.empty:
+                break
+            append_bars(part_path, df)
+            cursor = to_milliseconds(df["time"].iloc[-1]) + step
+
+    def _merge(self, target, part_paths, manifest_path, manifest):
+        # Pencereler sırayla, parça parça ana depoya eklenir. Birleştirme sırasında kesilen
+        # bir parça, yeniden başlatıldığında ana depo eski uzunluğuna kısaltılıp tekrar eklenir.
+        for index, part_path in enumerate(part_paths):
+            if index in manifest["merged"]:
+                continue
+            if manifest.get("merging") == index:
+                if bar_count(target) > manifest["merge_rows"]:
+                    truncate_bars(target, manifest["merge_rows"])
+            else:
+                manifest["merging"] = index
+                manifest["merge_rows"] = bar_count(target)
+                self._save_manifest(manifest_path, manifest)
+
+            if bar_count(part_path) > 0:
+                arrays = read_bar_arrays(part_path)
+                rows = len(next(iter(arrays.values())))
+                for offset in range(0, rows, self.merge_chunk):
+                    chunk = {name: values[offset:offset + self.merge_chunk] for name, values in arrays.items()}
+                    append_bars(target, pd.DataFrame(chunk))
+                del arrays
+
+            manifest["merged"].append(index)
+            manifest.pop("merging", None)
+            self._save_manifest(manifest_path, manifest)
+            shutil.rmtree(part_path, ignore_errors=True)
+
+    async def load(self, symbol, timeframe, since, until=None):
+        """
+        Bir sembolün OHLCV geçmişini bar deposuna indirir. Depoda veri varsa
+        son kaydedilen mumdan sonrası indirilir.
+
+        Args:
+            symbol (str): İşlem sembolü (örn: 'BTC/USDT').
+            timeframe (str): Mum aralığı (örn: '1m').
+            since: Başlangıç zamanı (tarih metni, datetime veya ms).
+            until (optional): Bitiş zamanı (hariç); varsayılan ve üst sınır, oluşmakta olan mumun başlangıcıdır.
+
+        Returns:
+            dict: symbol, timeframe, new_bars ve total_bars alanlarını içeren rapor.
+        """
+        step = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        target, manifest_path = self._paths(symbol, timeframe)
+        rows_before = bar_count(target)
+
+        start = to_milliseconds(since)
+        stored_last = last_timestamp(target)
+        if stored_last is not None:
+            start = max(start, to_milliseconds(stored_last) + step)
+        # Henüz kapanmamış mum indirilmez; depodaki son mum sonraki yüklemelerde yeniden çekilmediği için
+        # oluşmakta olan mum kaydedilirse eksik değerleriyle kalırdı
+        now = to_milliseconds(pd.Timestamp.now(tz="UTC")) // step * step
+        end = min(to_milliseconds(until), now) if until is not None else now
+
+        if start < end or os.path.exists(manifest_path):
+            manifest = self._plan(manifest_path, start, end, step)
+            windows = manifest["windows"]
+            part_paths = [f"{target}.part{i}" for i in range(len(windows))]
+            await asyncio.gather(*(
+                self._load_window(symbol, timeframe, part_paths[i], window_start, window_end, step)
+                for i, (window_start, window_end) in enumerate(windows)
+                if i not in manifest["merged"]
+            ))
+            self._merge(target, part_paths, manifest_path, manifest)
+            os.remove(manifest_path)
+
+        total = bar_count(target)
+        return {"symbol": symbol, "timeframe": timeframe, "new_bars": total - rows_before, "total_bars": total}
+
+    async def load_many(self, symbols, timeframe, since, until=None):
+        """
+        Birden fazla sembolü eşzamanlı indirir; toplam istek hızı bağlantının
+        hız sınırlayıcısıyla sınırlıdır.
+
+        Returns:
+            list: Her sembol için load raporu.
+        """
+        return await asyncio.gather(*(self.load(symbol, timeframe, since, until) for symbol in symbols))
@@ -1,14 +1,20 @@
 import os
 import json
+from datetime import datetime, timedelta, timezone
 
 import pandas as pd
-from data.data_source.mt5.mt5 import MT5Exchange
+from data.bar_store import BarStore, cache_path_for, convert_csv, write_bars
+from data.data_source.mt5.mt5 import MT5Exchange, TIMEFRAME_SECONDS
+from data.data_source.pipeline import FetchJob, FetchPipeline, MT5Source, print_pipeline_summary, rates_to_frame
+from data.resample import ResampleCache
+from data.tick_store import TickStore
 
 
 def save_rates_to_csv(symbol, timeframe, rates, base_path=None):
-    df = pd.DataFrame(rates)
-    df["time"] = pd.to_datetime(df["time"], unit="s")
+    return save_frame_to_csv(symbol, timeframe, rates_to_frame(rates), base_path)
 
+
+def save_frame_to_csv(symbol, timeframe, df, base_path=None):
     if base_path is None:
         # 'historical' klasörü fetch_data_main.py'nin bulunduğu yerin içinde olsun
         base_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../historic_data")
@@ -18,7 +24,247 @@ def save_rates_to_csv(symbol, timeframe, rates, base_path=None):
 
     filename = os.path.join(folder_path, f"{timeframe}.csv")
     df.to_csv(filename, index=False)
+
+    # Backtest yükleyicisinin CSV'yi yeniden ayrıştırmaması için ikili bar deposu da yazılır
+    write_bars(cache_path_for(filename), df, source_mtime=os.stat(filename).st_mtime_ns)
     print(f"✅ {symbol} - {timeframe} verisi kaydedildi → {filename}")
+    return filename
+
+
+def find_gaps(times, interval_seconds, skip_weekends=True):
+    """
+    Ardışık barlar arasında zaman diliminden uzun boşlukları bulur.
+
+    Args:
+        times (pandas.Series): Sıralı bar zaman damgaları.
+        interval_seconds (int): Zaman diliminin saniye cinsinden süresi.
+        skip_weekends (bool): Cuma'dan Pazar/Pazartesi'ye uzanan hafta sonu
+            kapanışlarını boşluk sayma.
+
+    Returns:
+        list: (başlangıç, bitiş, eksik bar sayısı) demetleri.
+    """
+    times = pd.Series(pd.to_datetime(times)).reset_index(drop=True)
+    if len(times) < 2:
+        return []
+    deltas = times.diff().dt.total_seconds()
+    positions = deltas[deltas > interval_seconds].index
+
+    gaps = []
+    for position in positions:
+        start, end = times[position - 1], times[position]
+        if (skip_weekends and start.weekday() == 4 and end.weekday() in (6, 0)
+                and end - start <= pd.Timedelta(days=3)):
+            continue
+        missing = int(deltas[position] // interval_seconds) - 1
+        gaps.append((start, end, missing))
+    return gaps
+
+
+def seed_store_from_csv(store, symbol, timeframe):
+    """
+    Depo yoksa ve aynı yerde daha önce indirilmiş bir CSV varsa depoyu CSV'den oluşturur.
+    Böylece senkronizasyon CSV'nin devamını çeker; depo CSV'nin değişiklik zamanını taşıdığı
+    için load_bars senkronize edilen barları eski CSV ile değiştirmez.
+
+    Returns:
+        bool: Depo CSV'den oluşturulduysa True.
+    """
+    csv_path = os.path.splitext(store.path(symbol, timeframe))[0] + ".csv"
+    if store.exists(symbol, timeframe) or not os.path.exists(csv_path):
+        return False
+    convert_csv(csv_path)
+    return True
+
+
+def fetch_new_rates(exchange, store, symbol, timeframe, bars):
+    """
+    Depoya eklenecek barları çeker: depo boşsa son `bars` bar, doluysa son kaydedilen bar dahil
+    sonrası aralık sorgusuyla.
+
+    Returns:
+        numpy.ndarray: MT5 bar dizisi (veya hata durumunda None).
+    """
+    seed_store_from_csv(store, symbol, timeframe)
+    last = store.last_timestamp(symbol, timeframe)
+    if last is None:
+        return exchange.get_historical_data(symbol, timeframe, bars)
+    date_from = datetime.fromtimestamp(last.timestamp(), tz=timezone.utc)
+    return exchange.get_historical_data_range(symbol, timeframe, date_from)
+
+
+def store_new_rates(store, symbol, timeframe, df):
+    """
+    fetch_new_rates ile çekilen barları depoya ekler. Son kaydedilen bar oluşum halindeyken
+    kaydedilmiş olabileceğinden dikiş noktasında yeniden çekilen sürümüyle değiştirilir.
+
+    Args:
+        store (BarStore): Bar deposu.
+        symbol (str): İşlem sembolü.
+        timeframe (str): Zaman dilimi adı (ör: "M5").
+        df (pandas.DataFrame): Çekilen barlar (boş olabilir).
+
+    Returns:
+        dict: symbol, timeframe, new_bars, total_bars ve gaps alanlarını içeren rapor.
+    """
+    last = store.last_timestamp(symbol, timeframe)
+    report = {"symbol": symbol, "timeframe": timeframe, "new_bars": 0,
+              "total_bars": store.count(symbol, timeframe), "gaps": []}
+    if df is None or len(df) == 0:
+        return report
+
+    if last is not None:
+        # Dikiş noktası: son kaydedilen bar yeniden geldiyse depodan çıkarılıp güncel haliyle eklenir
+        df = df[df["time"] >= last]
+        if len(df) and df["time"].iloc[0] == last:
+            store.truncate(symbol, timeframe, report["total_bars"] - 1)
+        report["new_bars"] = int((df["time"] > last).sum())
+        seam = pd.concat([pd.Series([last]), df["time"]], ignore_index=True)
+    else:
+        report["new_bars"] = len(df)
+        seam = df["time"]
+
+    store.append(symbol, timeframe, df.drop_duplicates("time", keep="last"))
+    report["total_bars"] = store.count(symbol, timeframe)
+    if timeframe in TIMEFRAME_SECONDS:
+        report["gaps"] = find_gaps(seam, TIMEFRAME_SECONDS[timeframe])
+    return report
+
+
+def sync_rates(exchange, store, symbol, timeframe, bars):
+    """
+    Bir sembol ve zaman dilimi için bar deposunu artımlı olarak günceller.
+    Depo boşsa son `bars` bar indirilir; doluysa yalnızca son kaydedilen bardan
+    sonraki barlar aralık sorgusuyla çekilip depoya eklenir. Son kaydedilen bar
+    oluşum halindeyken kaydedilmiş olabileceğinden dikiş noktasında yeniden
+    çekilen sürümüyle değiştirilir.
+
+    Args:
+        exchange (MT5Exchange): Bağlı MT5 bağlantısı.
+        store (BarStore): Bar deposu.
+        symbol (str): İşlem sembolü.
+        timeframe (str): Zaman dilimi adı (ör: "M5").
+        bars (int): Depo boşken indirilecek bar sayısı.
+
+    Returns:
+        dict: symbol, timeframe, new_bars, total_bars ve gaps alanlarını içeren rapor.
+    """
+    rates = fetch_new_rates(exchange, store, symbol, timeframe, bars)
+    df = rates_to_frame(rates) if rates is not None and len(rates) else None
+    return store_new_rates(store, symbol, timeframe, df)
+
+
+class MT5SyncSource(MT5Source):
+    def __init__(self, exchange, store, bars, max_concurrency=1):
+        """
+        Artımlı senkronizasyon için indirme kaynağı: her iş depodaki son bardan sonrasını
+        çeker (bkz. fetch_new_rates). Yeni bar olmaması hata sayılmaz.
+
+        Args:
+            exchange (MT5Exchange): Bağlı MT5 bağlantısı.
+            store (BarStore): Bar deposu.
+            bars (int): Depo boşken indirilecek bar sayısı.
+            max_concurrency (int): Aynı anda yapılabilecek en fazla istek.
+        """
+        super().__init__(exchange, bars, max_concurrency)
+        self.store = store
+        self.allow_empty = True
+
+    def fetch(self, symbol, timeframe):
+        return fetch_new_rates(self.exchange, self.store, symbol, timeframe, self.bars)
+
+
+def sync_all(exchange, store, symbols, timeframes, bars, max_concurrency=1, max_workers=4, retries=3):
+    """
+    Tüm sembol ve zaman dilimlerini indirme hattı (FetchPipeline) üzerinden artımlı olarak
+    senkronize eder; istekler kaynak başına eşzamanlılık sınırıyla ve yeniden denemeyle yapılır,
+    barlar tek yazıcı iş parçacığında depoya eklenir.
+
+    Returns:
+        tuple: (hat özeti, config sırasıyla senkronizasyon raporları)
+    """
+    reports = {}
+
+    def write(symbol, timeframe, df):
+        reports[(symbol, timeframe)] = store_new_rates(store, symbol, timeframe, df)
+
+    source = MT5SyncSource(exchange, store, bars, max_concurrency=max_concurrency)
+    jobs = [FetchJob(source, symbol, tf) for symbol in symbols for tf in timeframes]
+    summary = FetchPipeline(write, max_workers=max_workers, retries=retries).run(jobs)
+    return summary, [reports[(job.symbol, job.timeframe)] for job in jobs if (job.symbol, job.timeframe) in reports]
+
+
+def sync_ticks(exchange, tick_store, symbol, days, now=None):
+    """
+    Bir sembolün tick deposunu artımlı olarak günceller. Depo boşsa son `days` günün tickleri,
+    doluysa son kaydedilen tickten sonrası çekilir. Terminalden tek seferde çok büyük yanıt
+    almamak ve belleği sınırlı tutmak için istekler birer günlük aralıklara bölünür. Son kaydedilen
+    tickin milisaniyesi yeniden çekilir ve depodaki o milisaniyenin ticklerinin yerine geçer.
+
+    Args:
+        exchange (MT5Exchange): Bağlı MT5 bağlantısı.
+        tick_store (TickStore): Tick deposu.
+        symbol (str): İşlem sembolü.
+        days (int): Depo boşken indirilecek gün sayısı.
+        now (datetime, optional): Bitiş zamanı (UTC); varsayılan şimdiki zaman.
+
+    Returns:
+        int: Eklenen tick sayısı.
+    """
+    now = now or datetime.now(timezone.utc)
+    last = tick_store.last_time(symbol)
+    if last is None:
+        date_from = now - timedelta(days=days)
+    else:
+        # Son milisaniye yeniden çekilir; aynı milisaniyede sonradan gelen tickler de depoya girer
+        date_from = last.to_pydatetime().replace(tzinfo=timezone.utc)
+    digits = exchange.get_symbol_digits(symbol)
+
+    added = 0
+    while date_from < now:
+        date_to = min(date_from + timedelta(days=1), now)
+        ticks = exchange.get_ticks_range(symbol, date_from, date_to)
+        if ticks is not None and len(ticks):
+            added += tick_store.append(symbol, ticks, digits)
+        date_from = date_to
+    print(f"🔄 {symbol} tickleri senkronize edildi: {added} yeni tick, toplam {tick_store.count(symbol)}")
+    return added
+
+
+def print_sync_report(reports):
+    print("📋 Senkronizasyon raporu:")
+    for report in reports:
+        print(f"  {report['symbol']} - {report['timeframe']}: "
+              f"{report['new_bars']} yeni bar, toplam {report['total_bars']}")
+        for start, end, missing in report["gaps"]:
+            print(f"    ⚠️ Boşluk: {start} → {end} ({missing} eksik bar)")
+
+
+def derive_timeframes(store, symbols, timeframes):
+    """
+    Config'teki "derived_timeframes" listesindeki zaman dilimlerini indirilen en ince barlardan
+    türetir. Türetilmiş depolar yalnızca yeni barlar için güncellenir.
+
+    Args:
+        store (BarStore): Bar deposu.
+        symbols (list): Semboller.
+        timeframes (list): Türetilecek zaman dilimleri (ör: ["M15", "H4"]).
+    """
+    cache = ResampleCache(store)
+    for symbol in symbols:
+        for tf in timeframes:
+            bars = cache.refresh(symbol, tf)
+            print(f"🧮 {symbol} - {tf} türetildi: {bars} bar güncellendi")
+
+
+def sync_configured_ticks(exchange, config):
+    # Config'te "ticks.enabled" açıksa tüm semboller için tick deposu güncellenir
+    tick_config = config.get("ticks", {})
+    if not tick_config.get("enabled", False):
+        return
+    tick_store = TickStore(compress=tick_config.get("compress", True))
+    for symbol in config["symbols"]:
+        sync_ticks(exchange, tick_store, symbol, tick_config.get("days", 7))
 
 
 def main():
@@ -33,18 +279,26 @@ def main():
     exchange = MT5Exchange()
     exchange.connect()
 
-    # Her sembol ve zaman dilimi için verileri çek ve kaydet
-    for symbol in config["symbols"]:
-        for tf in config["timeframes"]:
-            print(f"🔄 Veri çekiliyor: {symbol} - {tf}")
-            rates = exchange.get_historical_data(symbol, tf, config["bars"])
-
-            if rates is None or len(rates) == 0:
-                print(f"❌ Veri alınamadı: {symbol} - {tf}")
-                continue
+    # Artımlı modda yalnızca son kaydedilen bardan sonraki veriler çekilip depoya eklenir
+    if config.get("incremental", False):
+        store = BarStore()
+        summary, reports = sync_all(exchange, store, config["symbols"], config["timeframes"], config["bars"],
+                                    max_concurrency=config.get("max_concurrency", 1),
+                                    max_workers=config.get("max_workers", 4), retries=config.get("retries", 3))
+        print_pipeline_summary(summary)
+        print_sync_report(reports)
+        derive_timeframes(store, config["symbols"], config.get("derived_timeframes", []))
+        sync_configured_ticks(exchange, config)
+        return
 
-            print(f"🔢 Toplam veri: {len(rates)}")
-            save_rates_to_csv(symbol, tf, rates)
+    # Her sembol ve zaman dilimi için verileri indirme hattı üzerinden çek ve kaydet
+    source = MT5Source(exchange, config["bars"], max_concurrency=config.get("max_concurrency", 1))
+    jobs = [FetchJob(source, symbol, tf) for symbol in config["symbols"] for tf in config["timeframes"]]
+    pipeline = FetchPipeline(save_frame_to_csv, max_workers=config.get("max_workers", 4),
+                             retries=config.get("retries", 3))
+    print_pipeline_summary(pipeline.run(jobs))
+    derive_timeframes(BarStore(), config["symbols"], config.get("derived_timeframes", []))
+    sync_configured_ticks(exchange, config)
 
     print("📁 Çalışma dizini:", os.getcwd())
 
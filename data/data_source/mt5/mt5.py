@@ -1,9 +1,21 @@
 import json
 import os
+from datetime import datetime, timezone
 import MetaTrader5 as mt5
 
 #from utils.config_loader import load_config
 
+# Zaman dilimlerinin saniye cinsinden süreleri (boşluk tespiti ve aralık sorguları için)
+TIMEFRAME_SECONDS = {
+    "M1": 60,
+    "M5": 5 * 60,
+    "M15": 15 * 60,
+    "M30": 30 * 60,
+    "H1": 60 * 60,
+    "H4": 4 * 60 * 60,
+    "D1": 24 * 60 * 60,
+}
+
 class MT5Exchange():
     def __init__(self):
         # Config dosyasının aynı klasörde olduğunu belirtiyoruz
@@ -30,17 +42,46 @@ class MT5Exchange():
         else:
             print(f"Bağlantı başarılı: {mt5.version()}")
 
+    def get_timeframe(self, timeframe):
+        # "M5", "H1" gibi isimleri mt5.TIMEFRAME_* sabitlerine çevirir
+        return getattr(mt5, f"TIMEFRAME_{timeframe}")
+
     def get_historical_data(self, symbol, timeframe, bars):
-        timeframes = {
-            "M1": mt5.TIMEFRAME_M1,
-            "M5": mt5.TIMEFRAME_M5,
-            "M15": mt5.TIMEFRAME_M15,
-            "H1": mt5.TIMEFRAME_H1,
-            "D1": mt5.TIMEFRAME_D1,
-        }
-        rates = mt5.copy_rates_from_pos(symbol, timeframes[timeframe], 0, bars)
+        rates = mt5.copy_rates_from_pos(symbol, self.get_timeframe(timeframe), 0, bars)
         return rates
 
+    def get_historical_data_range(self, symbol, timeframe, date_from, date_to=None):
+        """
+        Belirtilen zaman aralığındaki barları getirir (sınırlar dahil).
+
+        Args:
+            symbol (str): İşlem sembolü.
+            timeframe (str): Zaman dilimi adı (ör: "M5").
+            date_from (datetime): Başlangıç zamanı (UTC).
+            date_to (datetime, optional): Bitiş zamanı (UTC); varsayılan şimdiki zaman.
+        """
+        if date_to is None:
+            date_to = datetime.now(timezone.utc)
+        return mt5.copy_rates_range(symbol, self.get_timeframe(timeframe), date_from, date_to)
+
+    def get_ticks_range(self, symbol, date_from, date_to=None):
+        """
+        Belirtilen zaman aralığındaki tüm tickleri getirir (copy_ticks_range).
+
+        Args:
+            symbol (str): İşlem sembolü.
+            date_from (datetime): Başlangıç zamanı (UTC).
+            date_to (datetime, optional): Bitiş zamanı (UTC); varsayılan şimdiki zaman.
+        """
+        if date_to is None:
+            date_to = datetime.now(timezone.utc)
+        return mt5.copy_ticks_range(symbol, date_from, date_to, mt5.COPY_TICKS_ALL)
+
+    def get_symbol_digits(self, symbol):
+        # Fiyatların ondalık basamak sayısı (tick deposunda fiyatlar tamsayı puan olarak saklanır)
+        info = mt5.symbol_info(symbol)
+        return info.digits if info is not None else None
+
     def place_order(self, symbol, lot, order_type, price=None, sl=None, tp=None):
         order_types = {
             "buy": mt5.ORDER_TYPE_BUY,
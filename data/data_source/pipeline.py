@@ -0,0 +1,208 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+
+# Tek bir indirme işi: hangi kaynaktan hangi sembol/zaman dilimi çekilecek
+FetchJob = namedtuple('FetchJob', ['source', 'symbol', 'timeframe'])
+
+_STOP = object()
+
+
+def rates_to_frame(rates):
+    """
+    MT5 copy_rates_* çıktısını DataFrame'e çevirir.
+    """
+    df = pd.DataFrame(rates)
+    df["time"] = pd.to_datetime(df["time"], unit="s")
+    return df
+
+
+def ohlcv_to_frame(ohlcv):
+    """
+    ccxt fetch_ohlcv çıktısını ([ms, open, high, low, close, volume] listeleri) DataFrame'e çevirir.
+    """
+    df = pd.DataFrame(ohlcv, columns=["time", "open", "high", "low", "close", "volume"])
+    df["time"] = pd.to_datetime(df["time"], unit="ms")
+    return df
+
+
+class MT5Source:
+    def __init__(self, exchange, bars, max_concurrency=1):
+        """
+        MT5Exchange için indirme kaynağı. MetaTrader5 terminali tek bağlantı üzerinden
+        çalıştığı için varsayılan eşzamanlılık 1'dir.
+
+        Args:
+            exchange (MT5Exchange): Bağlı MT5 bağlantısı.
+            bars (int): Çekilecek bar sayısı.
+            max_concurrency (int): Aynı anda yapılabilecek en fazla istek.
+        """
+        self.name = "mt5"
+        self.exchange = exchange
+        self.bars = bars
+        self.max_concurrency = max_concurrency
+
+    def fetch(self, symbol, timeframe):
+        return self.exchange.get_historical_data(symbol, timeframe, self.bars)
+
+    def to_frame(self, raw):
+        return rates_to_frame(raw)
+
+
+class BinanceSource:
+    def __init__(self, connector, limit=1000, max_concurrency=4):
+        """
+        ccxt tabanlı BinanceConnector için OHLCV indirme kaynağı.
+
+        Args:
+            connector (BinanceConnector): Başlatılmış borsa bağlantısı.
+            limit (int): İstek başına çekilecek mum sayısı.
+            max_concurrency (int): Aynı anda yapılabilecek en fazla istek.
+        """
+        self.name = connector.exchange_name
+        self.connector = connector
+        self.limit = limit
+        self.max_concurrency = max_concurrency
+
+    def fetch(self, symbol, timeframe):
+        return self.connector.fetch_ohlcv(symbol, timeframe, limit=self.limit)
+
+    def to_frame(self, raw):
+        return ohlcv_to_frame(raw)
+
+
+class FetchPipeline:
+    def __init__(self, writer, max_workers=8, retries=3, backoff=0.5, queue_size=16):
+        """
+        Üç aşamalı indirme hattı:
+        1. Sınırlı sayıda işçiden oluşan havuz istekleri gönderir (kaynak başına eşzamanlılık sınırı,
+           üstel geri çekilmeli yeniden deneme).
+        2. Ayrı bir dönüştürme iş parçacığı ham sonuçları DataFrame'e çevirir.
+        3. Ayrı bir yazıcı iş parçacığı sonuçları tamamlandıkça kaydeder.
+
+        Args:
+            writer (callable): writer(symbol, timeframe, df) şeklinde kaydetme fonksiyonu.
+            max_workers (int): İndirme işçisi sayısı.
+            retries (int): Başarısız istek için en fazla yeniden deneme sayısı.
+            backoff (float): İlk yeniden deneme bekleme süresi (saniye); her denemede iki katına çıkar.
+            queue_size (int): Aşamalar arasındaki kuyrukların kapasitesi.
+        """
+        self.writer = writer
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.queue_size = queue_size
+
+    def _fetch(self, job, semaphore, stats):
+        for attempt in range(self.retries + 1):
+            error = None
+            with semaphore:
+                try:
+                    raw = job.source.fetch(job.symbol, job.timeframe)
+                except Exception as e:
+                    raw, error = None, e
+            # Boş sonuç, kaynak izin vermiyorsa (allow_empty) yeniden denenir
+            if raw is not None and (len(raw) > 0 or getattr(job.source, "allow_empty", False)):
+                return raw
+            if attempt < self.retries:
+                with stats["lock"]:
+                    stats["retries"] += 1
+                time.sleep(self.backoff * (2 ** attempt))
+        raise RuntimeError(f"Veri alınamadı: {error}" if error else "Veri alınamadı: boş sonuç")
+
+    def _convert(self, fetched, converted, stats):
+        while True:
+            item = fetched.get()
+            if item is _STOP:
+                converted.put(_STOP)
+                return
+            job, raw = item
+            try:
+                converted.put((job, job.source.to_frame(raw)))
+            except Exception as e:
+                self._fail(job, e, stats)
+
+    def _write(self, converted, stats):
+        while True:
+            item = converted.get()
+            if item is _STOP:
+                return
+            job, df = item
+            try:
+                self.writer(job.symbol, job.timeframe, df)
+            except Exception as e:
+                self._fail(job, e, stats)
+                continue
+            with stats["lock"]:
+                stats["succeeded"] += 1
+                stats["bars"] += len(df)
+
+    def _fail(self, job, error, stats):
+        print(f"❌ {job.source.name}: {job.symbol} - {job.timeframe}: {error}")
+        with stats["lock"]:
+            stats["failed"].append((job.source.name, job.symbol, job.timeframe, str(error)))
+
+    def run(self, jobs):
+        """
+        İşleri hattan geçirir ve tamamlanınca özet döner.
+
+        Args:
+            jobs (list): FetchJob listesi.
+
+        Returns:
+            dict: jobs, succeeded, failed, retries, bars, elapsed ve bars_per_second alanlarını
+                içeren özet.
+        """
+        stats = {"lock": threading.Lock(), "succeeded": 0, "failed": [], "retries": 0, "bars": 0}
+        semaphores = {}
+        for job in jobs:
+            if id(job.source) not in semaphores:
+                semaphores[id(job.source)] = threading.BoundedSemaphore(job.source.max_concurrency)
+
+        fetched = queue.Queue(maxsize=self.queue_size)
+        converted = queue.Queue(maxsize=self.queue_size)
+        converter = threading.Thread(target=self._convert, args=(fetched, converted, stats), daemon=True)
+        writer = threading.Thread(target=self._write, args=(converted, stats), daemon=True)
+        converter.start()
+        writer.start()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch, job, semaphores[id(job.source)], stats): job
+                for job in jobs
+            }
+            # Sonuçlar tamamlanma sırasıyla dönüştürme aşamasına aktarılır
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    fetched.put((job, future.result()))
+                except Exception as e:
+                    self._fail(job, e, stats)
+
+        fetched.put(_STOP)
+        converter.join()
+        writer.join()
+        elapsed = time.perf_counter() - started
+
+        return {
+            "jobs": len(jobs),
+            "succeeded": stats["succeeded"],
+            "failed": stats["failed"],
+            "retries": stats["retries"],
+            "bars": stats["bars"],
+            "elapsed": elapsed,
+            "bars_per_second": stats["bars"] / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+def print_pipeline_summary(summary):
+    print(f"📊 {summary['succeeded']}/{summary['jobs']} iş tamamlandı, "
+          f"{len(summary['failed'])} başarısız, {summary['retries']} yeniden deneme")
+    print(f"⏱️ {summary['bars']} bar {summary['elapsed']:.2f} sn içinde "
+          f"({summary['bars_per_second']:.0f} bar/sn)")
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from data.bar_store import BarStore, STORE_SUFFIX, _read_meta
+
+RESAMPLE_FILE = "resample.json"
+
+_UNIT_SECONDS = {"S": 1, "M": 60, "H": 60 * 60, "D": 24 * 60 * 60, "W": 7 * 24 * 60 * 60}
+# Haftalık barlar MT5'te olduğu gibi pazar günü başlar (1970-01-04 pazar)
+_WEEK_ORIGIN_SECONDS = 3 * 24 * 60 * 60
+
+
+def timeframe_seconds(timeframe):
+    """
+    Zaman dilimi adını saniyeye çevirir (ör: "M3" -> 180, "H4" -> 14400, "W1" -> 604800).
+
+    Args:
+        timeframe (str): S, M, H, D veya W ile başlayan ve bir sayıyla biten ad.
+
+    Returns:
+        int: Bar süresi (saniye).
+    """
+    match = re.fullmatch(r"([SMHDW])(\d+)", timeframe)
+    if match is None or int(match.group(2)) < 1:
+        raise ValueError(f"Desteklenmeyen zaman dilimi: {timeframe}")
+    return _UNIT_SECONDS[match.group(1)] * int(match.group(2))
+
+
+def _aggregation(column):
+    if column == "open":
+        return "first"
+    if column == "high":
+        return "max"
+    if column == "low":
+        return "min"
+    if "volume" in column:
+        return "sum"
+    # close, spread ve diğer sütunlar için son değer
+    return "last"
+
+
+def resample_bars(df, timeframe, date_column="time"):
+    """
+    Sıralı barları daha yüksek bir zaman dilimine toplar. Gruplar, zaman damgaları bar
+    süresine göre aşağı yuvarlanarak belirlenir ve tüm sütunlar tek geçişte reduceat ile
+    hesaplanır (open ilk, high en büyük, low en küçük, hacim toplam, diğerleri son değer).
+
+    Args:
+        df (pandas.DataFrame): Tarih sütunu ve sayısal sütunlardan oluşan, zamana göre sıralı barlar.
+        timeframe (str): Hedef zaman dilimi (ör: "M3", "H4").
+        date_column (str): Tarih sütunu.
+
+    Returns:
+        pandas.DataFrame: Zaman damgası her grubun başlangıcı olan, aynı sütunlara sahip barlar.
+    """
+    step = timeframe_seconds(timeframe) * 1_000_000_000
+    origin = _WEEK_ORIGIN_SECONDS * 1_000_000_000 if timeframe.startswith("W") else 0
+    times = df[date_column].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    if len(times) == 0:
+        return df.iloc[:0].copy()
+
+    buckets = (times - origin) // step * step + origin
+    starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+    ends = np.append(starts[1:], len(times)) - 1
+
+    columns = {date_column: buckets[starts].view("datetime64[ns]")}
+    for column in df.columns:
+        if column == date_column:
+            continue
+        values = df[column].to_numpy()
+        how = _aggregation(column)
+        if how == "first":
+            columns[column] = values[starts]
+        elif how == "last":
+            columns[column] = values[ends]
+        elif how == "max":
+            columns[column] = np.maximum.reduceat(values, starts)
+        elif how == "min":
+            columns[column] = np.minimum.reduceat(values, starts)
+        else:
+            columns[column] = np.add.reduceat(values, starts)
+    return pd.DataFrame(columns)
+
+
+def align_timeframe(base_times, base_timeframe, higher, higher_timeframe, date_column="time"):
+    """
+    Yüksek zaman dilimi barlarını taban barlara hizalar. Her taban bar, kapanışı itibarıyla
+    tamamlanmış son yüksek zaman dilimi barını görür; henüz kapanmamış bar kullanılmaz.
+
+    Args:
+        base_times (numpy.ndarray): Taban barların açılış zamanları (datetime64).
+        base_timeframe (str): Taban zaman dilimi.
+        higher (pandas.DataFrame): resample_bars çıktısı.
+        higher_timeframe (str): Yüksek zaman dilimi.
+        date_column (str): Tarih sütunu.
+
+    Returns:
+        pandas.DataFrame: Taban barlarla aynı uzunlukta, sütunları "<sütun>_<zaman dilimi>"
+            şeklinde adlandırılmış hizalanmış değerler (tamamlanmış bar yoksa NaN).
+    """
+    base_close = (np.asarray(base_times, dtype="datetime64[ns]")
+                  + np.timedelta64(timeframe_seconds(base_timeframe), "s"))
+    higher_close = (higher[date_column].to_numpy(dtype="datetime64[ns]")
+                    + np.timedelta64(timeframe_seconds(higher_timeframe), "s"))
+    last_complete = np.searchsorted(higher_close, base_close, side="right") - 1
+    available = last_complete >= 0
+    positions = np.maximum(last_complete, 0)
+
+    aligned = {}
+    for column in higher.columns:
+        if column == date_column:
+            continue
+        values = higher[column].to_numpy(dtype=np.float64)[positions] if len(higher) else \
+            np.full(len(positions), np.nan)
+        values[~available] = np.nan
+        aligned[f"{column}_{higher_timeframe}"] = values
+    return pd.DataFrame(aligned)
+
+
+def _row_digest(arrays, row):
+    # Bir taban barın tüm sütun değerlerinin özeti; satır yoksa None
+    if row < 0:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(arrays):
+        digest.update(name.encode())
+        digest.update(np.ascontiguousarray(arrays[name][row:row + 1]).tobytes())
+    return digest.hexdigest()
+
+
+class ResampleCache:
+    def __init__(self, store=None):
+        """
+        Yüksek zaman dilimlerini depodaki en ince barlardan türetir ve bar deposu olarak önbelleğe alır.
+        Türetilen depo, kaynağın hangi zaman dilimi ve kaç bar olduğunu ve son taban barın özetini
+        resample.json içinde tutar; kaynağa yeni bar eklendiğinde veya son taban bar güncellendiğinde
+        yalnızca son (eksik olabilecek) türetilmiş bar ve sonrası yeniden hesaplanır.
+
+        Args:
+            store (BarStore, optional): Bar deposu; varsayılan data/historic_data.
+        """
+        self.store = store or BarStore()
+
+    def _sidecar(self, symbol, timeframe):
+        path = os.path.join(self.store.path(symbol, timeframe), RESAMPLE_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _write_sidecar(self, symbol, timeframe, info):
+        path = os.path.join(self.store.path(symbol, timeframe), RESAMPLE_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(info, f)
+        os.replace(tmp_path, path)
+
+    def native_timeframes(self, symbol):
+        """
+        Sembol için doğrudan indirilmiş (türetilmemiş) zaman dilimlerini kısadan uzuna döner.
+        """
+        folder = os.path.join(self.store.base_path, symbol)
+        if not os.path.isdir(folder):
+            return []
+        timeframes = []
+        for name in os.listdir(folder):
+            timeframe = name[:-len(STORE_SUFFIX)]
+            if not name.endswith(STORE_SUFFIX) or _read_meta(os.path.join(folder, name)) is None:
+                continue
+            if self._sidecar(symbol, timeframe) is not None:
+                continue
+            try:
+                timeframes.append((timeframe_seconds(timeframe), timeframe))
+            except ValueError:
+                continue
+        return [timeframe for _, timeframe in sorted(timeframes)]
+
+    def base_timeframe(self, symbol, timeframe):
+        """
+        Hedef zaman dilimini türetmek için kullanılabilecek en ince doğrudan indirilmiş zaman dilimi.
+        """
+        target = timeframe_seconds(timeframe)
+        for base in self.native_timeframes(symbol):
+            seconds = timeframe_seconds(base)
+            if seconds < target and target % seconds == 0:
+                return base
+        raise FileNotFoundError(f"{symbol} için {timeframe} türetilebilecek taban veri bulunamadı.")
+
+    def get(self, symbol, timeframe, date_column="time"):
+        """
+        İstenen zaman dilimindeki barları döner. Doğrudan indirilmiş depo varsa o okunur;
+        yoksa taban barlardan türetilir, depoya yazılır ve sonraki çağrılarda yalnızca yeni
+        barlar işlenir.
+
+        Args:
+            symbol (str): Sembol klasörü.
+            timeframe (str): Zaman dilimi.
+            date_column (str): Tarih sütunu.
+
+        Returns:
+            pandas.DataFrame: Bar verisi.
+        """
+        if self.store.exists(symbol, timeframe) and self._sidecar(symbol, timeframe) is None:
+            return self.store.read(symbol, timeframe)
+        self.refresh(symbol, timeframe, date_column)
+        return self.store.read(symbol, timeframe)
+
+    def refresh(self, symbol, timeframe, date_column="time"):
+        """
+        Türetilmiş depoyu taban verinin güncel haline getirir.
+
+        Returns:
+            int: Yeniden hesaplanan (veya eklenen) bar sayısı.
+        """
+        info = self._sidecar(symbol, timeframe)
+        base = info["base"] if info else self.base_timeframe(symbol, timeframe)
+        base_arrays = self.store.read_arrays(symbol, base)
+        base_times = base_arrays[date_column]
+        base_rows = len(base_times)
+        first_time = int(base_times[0].view(np.int64)) if base_rows else None
+
+        if (info is not None and self.store.exists(symbol, timeframe)
+                and info["base_rows"] <= base_rows and info["first_time"] == first_time):
+            # Son taban bar oluşum halindeyken yazılıp sonradan yerinde güncellenmiş olabilir (satır sayısı
+            # değişmeden); değerleri değiştiyse son türetilmiş bar yeniden hesaplanır
+            unchanged = info.get("last_digest") == _row_digest(base_arrays, info["base_rows"] - 1)
+            if info["base_rows"] == base_rows and unchanged:
+                return 0
+            # Son türetilmiş bar eksik olabilir; o barın başladığı yerden itibaren yeniden hesaplanır
+            derived_rows = self.store.count(symbol, timeframe)
+            position = 0
+            if derived_rows:
+                last_start = self.store.read_arrays(symbol, timeframe)[date_column][derived_rows - 1]
+                position = int(np.searchsorted(base_times, last_start, side="left"))
+                self.store.truncate(symbol, timeframe, derived_rows - 1)
+            tail = pd.DataFrame({name: values[position:].view(np.ndarray) for name, values in base_arrays.items()})
+            resampled = resample_bars(tail, timeframe, date_column)
+            self.store.append(symbol, timeframe, resampled)
+        else:
+            frame = pd.DataFrame({name: values.view(np.ndarray) for name, values in base_arrays.items()},
+                                 copy=False)
+            resampled = resample_bars(frame, timeframe, date_column)
+            self.store.write(symbol, timeframe, resampled)
+
+        self._write_sidecar(symbol, timeframe, {"base": base, "base_rows": base_rows, "first_time": first_time,
+                                                "last_digest": _row_digest(base_arrays, base_rows - 1)})
+        return len(resampled)
+
+
+def timeframe_columns(columns, timeframes):
+    """
+    add_timeframes ile eklenen "<sütun>_<zaman dilimi>" sütunlarının adlarını döner.
+
+    Args:
+        columns (iterable): Tablonun sütun adları.
+        timeframes (list): Eklenen zaman dilimleri.
+
+    Returns:
+        list: Yüksek zaman dilimi sütunları (tablodaki sırayla).
+    """
+    suffixes = tuple(f"_{timeframe}" for timeframe in timeframes)
+    return [name for name in columns if str(name).endswith(suffixes)]
+
+
+def add_timeframes(df, csv_path, timeframes, date_column="time"):
+    """
+    Bir CSV'den yüklenmiş taban barlara yüksek zaman dilimlerini hizalanmış sütunlar olarak ekler.
+    Yol <kök>/<sembol>/<zaman dilimi>.csv düzeninde olmalıdır; yüksek zaman dilimleri ayrıca
+    indirilmez ve CSV'den okunmaz, aynı depodaki taban barlardan türetilir.
+
+    Args:
+        df (pandas.DataFrame): Taban barlar (load_bars çıktısı).
+        csv_path (str): Taban barların CSV yolu (ör: data/historic_data/EURUSD/M1.csv).
+        timeframes (list): Eklenecek zaman dilimleri (ör: ["M15", "H4"]).
+        date_column (str): Tarih sütunu.
+
+    Returns:
+        pandas.DataFrame: Taban barlar ve "<sütun>_<zaman dilimi>" sütunları.
+    """
+    folder = os.path.dirname(os.path.abspath(csv_path))
+    symbol = os.path.basename(folder)
+    base_timeframe = os.path.splitext(os.path.basename(csv_path))[0]
+    cache = ResampleCache(BarStore(os.path.dirname(folder)))
+    base_times = df[date_column].to_numpy(dtype="datetime64[ns]")
+
+    frames = [df.reset_index(drop=True)]
+    for timeframe in timeframes:
+        higher = cache.get(symbol, timeframe, date_column)
+        frames.append(align_timeframe(base_times, base_timeframe, higher, timeframe, date_column))
+    return pd.concat(frames, axis=1)
@@ -0,0 +1,221 @@
+import atexit
+import os
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from data.bar_store import _to_columns
+
+# Sütunlar blok içinde bu hizalamayla art arda yerleştirilir
+_ALIGNMENT = 64
+
+# Bu süreçte bağlanılan bloklar; görünümler yaşadığı sürece bloklar açık kalmalıdır
+_attached = {}
+_attached_lock = threading.Lock()
+
+
+class SharedBarsHandle:
+    def __init__(self, segment, rows, columns, index=None):
+        """
+        Paylaşımlı bellekteki bir bar tablosunun tanımı. Küçük ve serileştirilebilir bir nesnedir;
+        işçi süreçlere veri yerine bu tanım gönderilir ve işçiler blok adına göre bağlanır.
+
+        Args:
+            segment (str): Paylaşımlı bellek bloğunun adı.
+            rows (int): Satır sayısı.
+            columns (list): (sütun adı, dtype metni, bayt konumu) üçlüleri.
+            index (list, optional): Tabloya geri kurulacak indeks sütunları.
+        """
+        self.segment = segment
+        self.rows = rows
+        self.columns = columns
+        self.index = index
+
+    @property
+    def nbytes(self):
+        return sum(self.rows * np.dtype(dtype).itemsize for _, dtype, _ in self.columns)
+
+
+def can_share(df):
+    """
+    Tablonun paylaşımlı belleğe yazılabilir olup olmadığını döner (tüm sütunlar sayısal veya tarih).
+    """
+    frame = df if isinstance(df.index, pd.RangeIndex) else df.reset_index()
+    return all(pd.api.types.is_numeric_dtype(frame[name]) or pd.api.types.is_datetime64_any_dtype(frame[name])
+               for name in frame.columns)
+
+
+def share_frame(df):
+    """
+    Tabloyu tek bir paylaşımlı bellek bloğuna kopyalar. Sütunlar bar deposundaki gibi ham
+    dizilerdir (tarih sütunları int64 nanosaniye); RangeIndex dışındaki indeksler sütun
+    olarak yazılır ve bağlanırken geri kurulur.
+
+    Args:
+        df (pandas.DataFrame): Sayısal ve tarih sütunlarından oluşan tablo.
+
+    Returns:
+        tuple: (SharedBarsHandle, multiprocessing.shared_memory.SharedMemory)
+    """
+    index = None
+    if not isinstance(df.index, pd.RangeIndex):
+        index = [name if name is not None else "index" for name in df.index.names]
+        df = df.reset_index(names=index)
+    columns, dtypes = _to_columns(df)
+
+    layout, offset = [], 0
+    for name in df.columns:
+        layout.append((name, dtypes[name], offset))
+        size = columns[name].nbytes
+        offset += -(-size // _ALIGNMENT) * _ALIGNMENT
+    segment = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for name, _, start in layout:
+        values = columns[name]
+        np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf, offset=start)[:] = values
+    return SharedBarsHandle(segment.name, len(df), layout, index), segment
+
+
+def _segment(name):
+    with _attached_lock:
+        if name not in _attached:
+            _attached[name] = shared_memory.SharedMemory(name=name)
+        return _attached[name]
+
+
+def attach_frame(handle):
+    """
+    Paylaşımlı bellekteki tabloya bağlanır. Sütunlar blok üzerinde salt okunur NumPy
+    görünümleridir; veri kopyalanmaz ve serileştirilmez. Blok süreç boyunca açık tutulur.
+
+    Args:
+        handle (SharedBarsHandle): share_frame veya SharedBarsRegistry tanımı.
+
+    Returns:
+        pandas.DataFrame: Bar verisi.
+    """
+    buffer = _segment(handle.segment).buf
+    arrays = {}
+    for name, dtype, offset in handle.columns:
+        storage = np.int64 if dtype == "datetime64[ns]" else np.dtype(dtype)
+        values = np.ndarray((handle.rows,), dtype=storage, buffer=buffer, offset=offset)
+        values.flags.writeable = False
+        arrays[name] = values.view("datetime64[ns]") if dtype == "datetime64[ns]" else values
+    if not handle.index:
+        return pd.DataFrame(arrays, copy=False)
+    # set_index sütunları kopyalar; indeks doğrudan blok üzerindeki dizilerden kurulur
+    names = [None if name == "index" and handle.index == ["index"] else name for name in handle.index]
+    levels = [arrays.pop(name) for name in handle.index]
+    if len(levels) == 1:
+        index = pd.Index(levels[0], name=names[0], copy=False)
+    else:
+        index = pd.MultiIndex.from_arrays(levels, names=names)
+    return pd.DataFrame(arrays, index=index, copy=False)
+
+
+class SharedBarsRegistry:
+    def __init__(self):
+        """
+        Paylaşımlı bellekteki bar tablolarının sembol / zaman dilimi kaydı. Ana süreç her tabloyu
+        bir kez paylaşımlı belleğe yükler; işçi süreçler kaydın kopyasını (yalnızca tanımlar)
+        alır ve get ile tablolara kopyasız bağlanır.
+
+        Tablolar referans sayılıdır: aynı sembol / zaman dilimi tekrar yüklendiğinde sayaç artar,
+        release ile azalır ve sıfıra indiğinde blok silinir. close (veya with bloğunun sonu) ve
+        süreç çıkışı kalan tüm blokları siler; yalnızca kaydı oluşturan süreç blokları siler.
+        """
+        self._handles = {}
+        self._segments = {}
+        self._references = {}
+        self._owner = os.getpid()
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        # İşçilere yalnızca tanımlar gönderilir; bloklar ve sayaçlar ana süreçte kalır
+        return {"_handles": dict(self._handles), "_segments": {}, "_references": {}, "_owner": None}
+
+    def publish(self, symbol, timeframe, df):
+        """
+        Tabloyu paylaşımlı belleğe yükler; aynı sembol / zaman dilimi zaten yüklüyse yalnızca
+        referans sayacını artırır.
+
+        Args:
+            symbol (str): Sembol (veya varlık adı).
+            timeframe (str): Zaman dilimi.
+            df (pandas.DataFrame): Bar verisi.
+
+        Returns:
+            SharedBarsHandle: Tablonun tanımı.
+        """
+        key = (symbol, timeframe)
+        if key in self._handles:
+            self._references[key] += 1
+            return self._handles[key]
+        handle, segment = share_frame(df)
+        self._handles[key] = handle
+        self._segments[key] = segment
+        self._references[key] = 1
+        return handle
+
+    def lookup(self, symbol, timeframe):
+        """
+        Sembol / zaman dilimi tanımını döner.
+
+        Raises:
+            KeyError: Tablo kayıtlı değilse.
+        """
+        return self._handles[(symbol, timeframe)]
+
+    def get(self, symbol, timeframe):
+        """
+        Sembol / zaman dilimi tablosuna bağlanır (bkz. attach_frame).
+        """
+        return attach_frame(self.lookup(symbol, timeframe))
+
+    def keys(self):
+        return list(self._handles)
+
+    def release(self, symbol, timeframe):
+        """
+        Referans sayacını azaltır; sıfıra inen tablonun bloğunu siler.
+        """
+        key = (symbol, timeframe)
+        self._references[key] -= 1
+        if self._references[key] == 0:
+            del self._references[key]
+            del self._handles[key]
+            self._unlink(self._segments.pop(key))
+
+    def close(self):
+        """
+        Kayıttaki tüm blokları siler (yalnızca kaydı oluşturan süreçte).
+        """
+        if self._owner != os.getpid():
+            return
+        atexit.unregister(self.close)
+        for segment in self._segments.values():
+            self._unlink(segment)
+        self._segments.clear()
+        self._handles.clear()
+        self._references.clear()
+
+    @staticmethod
+    def _unlink(segment):
+        segment.unlink()
+        with _attached_lock:
+            attached = _attached.pop(segment.name, None)
+        for opened in (segment, attached):
+            if opened is None:
+                continue
+            try:
+                opened.close()
+            except BufferError:
+                # Ana süreçte hâlâ görünüm varsa eşleme görünümlerle birlikte kapanır; ad zaten silinmiştir
+                pass
@@ -0,0 +1,297 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data.bar_store import DEFAULT_BASE_PATH, read_bar_arrays, write_bars
+
+TICKS_FOLDER = "ticks"
+INDEX_FILE = "index.json"
+DAY_MS = 24 * 60 * 60 * 1000
+
+# Sıkıştırılmış parçalarda delta kodlanan tamsayı sütunları ve fiyat sütunları
+PRICE_COLUMNS = ("bid", "ask", "last")
+TICK_COLUMNS = ("time", "bid", "ask", "last", "volume", "flags")
+
+
+def _narrow(values):
+    # Delta değerleri çoğunlukla küçük olduğundan sığdıkları en dar tamsayı tipinde saklanır
+    if len(values) == 0:
+        return values.astype(np.int8)
+    low, high = values.min(), values.max()
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _decode(encoded, column):
+    # Delta kodlu sütunu çözer; ilk değeri ayrı saklanmamış eski parçalarda ilk fark değerin kendisidir
+    deltas = encoded[column]
+    if f"{column}_base" not in encoded:
+        return np.cumsum(deltas, dtype=np.int64)
+    values = np.empty(len(deltas) + 1, dtype=np.int64)
+    values[0] = encoded[f"{column}_base"][0]
+    np.cumsum(deltas, dtype=np.int64, out=values[1:])
+    values[1:] += values[0]
+    return values
+
+
+def _infer_digits(prices, max_digits=8):
+    # Tüm fiyatları tam sayıya çeviren en küçük ondalık basamak sayısı
+    prices = prices[prices != 0]
+    for digits in range(max_digits + 1):
+        scaled = prices * 10 ** digits
+        if np.all(np.abs(scaled - np.round(scaled)) < 1e-6):
+            return digits
+    return max_digits
+
+
+def ticks_to_columns(ticks):
+    """
+    MT5 copy_ticks_* çıktısını (yapılandırılmış dizi) veya DataFrame'i tick sütunlarına çevirir.
+    Milisaniye hassasiyeti için varsa "time_msc", gerçek hacim için varsa "volume_real" kullanılır.
+
+    Args:
+        ticks (numpy.ndarray or pandas.DataFrame): time/time_msc, bid, ask ve isteğe bağlı
+            last, volume/volume_real, flags alanları.
+
+    Returns:
+        dict: Sütun adı -> dizi; "time" epoch'tan bu yana milisaniyedir (int64).
+    """
+    names = ticks.dtype.names if isinstance(ticks, np.ndarray) else tuple(ticks.columns)
+    count = len(ticks)
+
+    def column(name):
+        values = ticks[name]
+        return values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+
+    if "time_msc" in names:
+        time = column("time_msc").astype(np.int64)
+    else:
+        time = column("time")
+        if time.dtype.kind == "M":
+            time = time.astype("datetime64[ms]").view(np.int64)
+        else:
+            # MT5 "time" alanı saniyedir
+            time = time.astype(np.int64) * 1000
+    volume_name = "volume_real" if "volume_real" in names else "volume"
+    return {
+        "time": time,
+        "bid": column("bid").astype(np.float64),
+        "ask": column("ask").astype(np.float64),
+        "last": column("last").astype(np.float64) if "last" in names else np.zeros(count),
+        "volume": column(volume_name).astype(np.float64) if volume_name in names else np.zeros(count),
+        "flags": column("flags").astype(np.int64) if "flags" in names else np.zeros(count, dtype=np.int64),
+    }
+
+
+class TickStore:
+    def __init__(self, base_path=None, compress=True):
+        """
+        Sembol başına günlük parçalara bölünmüş tick deposu. Yerleşim:
+        <base_path>/<sembol>/ticks/<YYYYMMDD>[.<sürüm>].npz (veya .bars) ve index.json.
+
+        Sıkıştırılmış modda fiyatlar tamsayı puanlara çevrilir, zaman ve fiyatlar delta kodlanır,
+        en dar tamsayı tipine indirilip zlib ile sıkıştırılır; okuma her seferinde tek bir günü
+        çözer. Sıkıştırmasız modda her gün bir bar deposudur ve kopyasız bellek eşleme ile açılır.
+        Her iki modda da geçmişin tamamı hiçbir zaman belleğe alınmaz.
+
+        Args:
+            base_path (str, optional): Kök klasör; varsayılan data/historic_data.
+            compress (bool): Yeni parçaların sıkıştırılarak yazılıp yazılmayacağı.
+        """
+        self.base_path = base_path or DEFAULT_BASE_PATH
+        self.compress = compress
+
+    def path(self, symbol):
+        return os.path.join(self.base_path, symbol, TICKS_FOLDER)
+
+    def _read_index(self, symbol):
+        path = os.path.join(self.path(symbol), INDEX_FILE)
+        if not os.path.exists(path):
+            return {"digits": None, "chunks": []}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _write_index(self, symbol, index):
+        path = os.path.join(self.path(symbol), INDEX_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+
+    def chunks(self, symbol):
+        """
+        Sembolün parça listesini döner (file, day, first, last, rows, version alanları; zamanlar ms).
+        """
+        return self._read_index(symbol)["chunks"]
+
+    def count(self, symbol):
+        return sum(chunk["rows"] for chunk in self.chunks(symbol))
+
+    def last_time(self, symbol):
+        """
+        Depodaki son tickin zamanını döner; depo boşsa None.
+        """
+        chunks = self.chunks(symbol)
+        if not chunks:
+            return None
+        return pd.Timestamp(chunks[-1]["last"], unit="ms")
+
+    def append(self, symbol, ticks, digits=None):
+        """
+        Yeni tickleri depoya ekler. Depodaki son tickten eski tickler atlanır. Aynı milisaniyede
+        birden fazla tick olabildiğinden son tickle aynı zamanlı tickler atlanmaz; gelen tickler
+        depodaki o milisaniyenin ticklerinin yerine geçer (son milisaniye yeniden çekilerek
+        tamamlanabilir). Son günün parçası yeni ticklerle birlikte yeniden yazılır.
+
+        Args:
+            symbol (str): Sembol.
+            ticks (numpy.ndarray or pandas.DataFrame): ticks_to_columns ile okunabilen tickler.
+            digits (int, optional): Fiyat ondalık basamak sayısı (MT5 symbol_info.digits);
+                belirtilmezse ilk eklemede veriden çıkarılır.
+
+        Returns:
+            int: Eklenen tick sayısı (yerine geçilen tickler hariç).
+        """
+        columns = ticks_to_columns(ticks)
+        index = self._read_index(symbol)
+        order = np.argsort(columns["time"], kind="stable")
+        columns = {name: values[order] for name, values in columns.items()}
+        last = index["chunks"][-1]["last"] if index["chunks"] else None
+        if last is not None:
+            keep = columns["time"] >= last
+            columns = {name: values[keep] for name, values in columns.items()}
+        added = len(columns["time"])
+        if added == 0:
+            return 0
+        # Gelen tickler son milisaniyeyi içeriyorsa depodaki o milisaniyenin tickleri değiştirilir
+        replace_last = last is not None and columns["time"][0] == last
+
+        if index["digits"] is None:
+            index["digits"] = digits if digits is not None else _infer_digits(
+                np.concatenate([columns[name] for name in PRICE_COLUMNS]))
+        os.makedirs(self.path(symbol), exist_ok=True)
+
+        days = columns["time"] // DAY_MS
+        bounds = np.flatnonzero(np.diff(days, prepend=days[0] - 1))
+        bounds = np.append(bounds, added)
+        replaced = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            day = int(days[start])
+            part = {name: values[start:end] for name, values in columns.items()}
+            version = 0
+            if index["chunks"] and index["chunks"][-1]["day"] == day:
+                # Aynı günün mevcut parçası yeni ticklerle birleştirilir
+                previous = index["chunks"].pop()
+                existing = self._read_chunk(symbol, previous, index["digits"])
+                existing["time"] = existing["time"].astype("datetime64[ms]").view(np.int64)
+                if replace_last:
+                    kept = existing["time"] < last
+                    added -= len(kept) - int(kept.sum())
+                    existing = {name: values[kept] for name, values in existing.items()}
+                part = {name: np.concatenate([existing[name], part[name]]) for name in TICK_COLUMNS}
+                version = previous.get("version", 0) + 1
+                replaced.append(previous)
+            index["chunks"].append(self._write_chunk(symbol, day, part, index["digits"], version))
+        # Birleştirilen parça yeni adla yazılır; index dosyası işlem noktasıdır, eski parça ancak
+        # sonra silinir. Yarıda kalan bir ekleme depoyu önceki haliyle bırakır.
+        self._write_index(symbol, index)
+        for previous in replaced:
+            self._remove_chunk(symbol, previous)
+        return added
+
+    def _write_chunk(self, symbol, day, columns, digits, version=0):
+        name = pd.Timestamp(day * DAY_MS, unit="ms").strftime("%Y%m%d")
+        if version:
+            name = f"{name}.{version}"
+        entry = {"day": day, "first": int(columns["time"][0]), "last": int(columns["time"][-1]),
+                 "rows": len(columns["time"]), "version": version}
+        if self.compress:
+            scale = 10 ** digits
+            # İlk değer ayrı saklanır; yalnızca farklar daraltılır (ilk değerin büyüklüğü tüm sütunu
+            # int64'te tutmaz)
+            encoded = {"time_base": columns["time"][:1].astype(np.int64),
+                       "time": _narrow(np.diff(columns["time"]))}
+            for column in PRICE_COLUMNS:
+                points = np.round(columns[column] * scale).astype(np.int64)
+                encoded[f"{column}_base"] = points[:1]
+                encoded[column] = _narrow(np.diff(points))
+            encoded["volume"] = columns["volume"]
+            encoded["flags"] = _narrow(columns["flags"])
+            entry["file"] = f"{name}.npz"
+            path = os.path.join(self.path(symbol), entry["file"])
+            with open(path + ".tmp", "wb") as f:
+                np.savez_compressed(f, **encoded)
+            os.replace(path + ".tmp", path)
+        else:
+            entry["file"] = f"{name}.bars"
+            frame = pd.DataFrame({name: values for name, values in columns.items()})
+            frame["time"] = frame["time"].to_numpy().astype("datetime64[ms]").astype("datetime64[ns]")
+            write_bars(os.path.join(self.path(symbol), entry["file"]), frame)
+        return entry
+
+    def _remove_chunk(self, symbol, entry):
+        path = os.path.join(self.path(symbol), entry["file"])
+        if os.path.isdir(path):
+            # Bellek eşlemeli okuyucular dosyaları açık tutabilir; klasör yerine yalnızca girdisi silinir
+            for name in os.listdir(path):
+                os.remove(os.path.join(path, name))
+            os.rmdir(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def _read_chunk(self, symbol, entry, digits):
+        path = os.path.join(self.path(symbol), entry["file"])
+        if entry["file"].endswith(".bars"):
+            arrays = read_bar_arrays(path)
+            return {name: arrays[name] for name in TICK_COLUMNS}
+        scale = 10.0 ** digits
+        with np.load(path) as encoded:
+            columns = {"time": _decode(encoded, "time").astype("datetime64[ms]").astype("datetime64[ns]")}
+            for column in PRICE_COLUMNS:
+                columns[column] = _decode(encoded, column) / scale
+            columns["volume"] = encoded["volume"]
+            columns["flags"] = encoded["flags"].astype(np.int64)
+        return columns
+
+    def iter_chunks(self, symbol, start=None, end=None):
+        """
+        Tickleri günlük parçalar halinde sırayla döner; aynı anda yalnızca bir parça bellekte tutulur.
+
+        Args:
+            symbol (str): Sembol.
+            start (str or pandas.Timestamp, optional): Başlangıç zamanı (dahil).
+            end (str or pandas.Timestamp, optional): Bitiş zamanı (hariç).
+
+        Yields:
+            dict: Sütun adı -> dizi ("time" datetime64[ns]; bid, ask, last, volume float64; flags int64).
+        """
+        index = self._read_index(symbol)
+        start_ms = None if start is None else pd.Timestamp(start).value // 1_000_000
+        end_ms = None if end is None else pd.Timestamp(end).value // 1_000_000
+        for entry in index["chunks"]:
+            if (start_ms is not None and entry["last"] < start_ms) or \
+                    (end_ms is not None and entry["first"] >= end_ms):
+                continue
+            columns = self._read_chunk(symbol, entry, index["digits"])
+            if start_ms is not None or end_ms is not None:
+                times = columns["time"]
+                lo = 0 if start_ms is None else np.searchsorted(times, np.datetime64(start_ms, "ms"), "left")
+                hi = len(times) if end_ms is None else np.searchsorted(times, np.datetime64(end_ms, "ms"), "left")
+                columns = {name: values[lo:hi] for name, values in columns.items()}
+            if len(columns["time"]):
+                yield columns
+
+    def read(self, symbol, start=None, end=None):
+        """
+        Belirtilen aralıktaki tickleri DataFrame olarak döner. Yalnızca küçük aralıklar için
+        kullanılmalıdır; geçmişin tamamı için iter_chunks tercih edilir.
+        """
+        frames = [pd.DataFrame(columns) for columns in self.iter_chunks(symbol, start, end)]
+        if not frames:
+            return pd.DataFrame({name: [] for name in TICK_COLUMNS})
+        return pd.concat(frames, ignore_index=True)
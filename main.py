@@ -5,8 +5,25 @@ import pandas as pd
 import backtrader as bt
 
 # Gerekli modüllerin içe aktarılması
-from connectors.backtester_connector import BacktesterConnector
+from connectors.backtester_connector import BacktesterConnector, create_data_feed, create_streaming_feed
+from connectors.vectorized_connector import VectorizedConnector
 from connectors.mt5_connector import MetaTrader5Connector
+from core.journal import TradeJournal
+from core.live_runner import LiveRunner, MT5BarSource, MT5OrderRouter
+from core.logger import configure_logging
+from core.distributed import DistributedSweep, QueueWorker
+from core.metrics import summarize_vectorized
+from core.monte_carlo import MonteCarlo
+from core.optimizer import ParameterSweep, check_execution
+from core.profiler import configure_profiler, get_profiler
+from core.result_store import KIND_BACKTEST, ResultStore, data_hash, run_key
+from core.tick_replay import TickReplay
+from core.portfolio import PortfolioBacktest, load_portfolio
+from core.walk_forward import WalkForward
+from core.work_queue import WorkQueue
+from data.bar_store import BarStream, load_bars
+from data.resample import add_timeframes, timeframe_columns
+from data.tick_store import TickStore
 from strategy.exp_moving_average import MovingAverageStrategy
 
 
@@ -27,83 +44,565 @@ def run_backtest():
     """
     Backtest modunu çalıştırır:
     - JSON formatındaki backtester konfigürasyonunu yükler.
-    - Config içindeki dosya yolunu kullanarak CSV dosyasını okur.
+    - Config içindeki dosya yolunu kullanarak CSV dosyasını okur (ikili bar deposu
+      güncelse CSV ayrıştırılmadan bellek eşleme ile okunur).
     - DataFrame'i bt.feeds.PandasData formatına çevirir.
     - Backtester connector aracılığıyla stratejiyi yürütür.
+    - Config'te "engine" değeri "vectorized" ise, strateji vektörel motorla çalıştırılır.
+    - Config'te "data.portfolio" listesi doluysa portföy modunda çalışılır.
+    - Config'teki "data.timeframes" listesindeki yüksek zaman dilimleri (ör: ["M15", "H4"])
+      ayrı CSV yüklenmeden taban barlardan türetilir ve "<sütun>_<zaman dilimi>" sütunları
+      olarak eklenir; her bar yalnızca kapanmış yüksek zaman dilimi barlarını görür.
+    - Config'teki "logging.profile" açıksa aşama süreleri ölçülür ve rapor kaydedilir.
+    - Config'te "backtester.journal_path" verilmişse sinyal ve emirler günlüğe yazılır.
+    - Config'te "engine" değeri "tick" ise, tick deposu yeniden oynatılır (run_tick_backtest).
+    - Config'te "backtester.streaming" açıksa veri belleğe alınmadan parça parça işlenir
+      (run_streaming_backtest).
+    - Config'te "backtester.execution.enabled" açıksa (yalnızca vektörel motor) spread, kayma,
+      gecikme ve kısmi dolum FillSimulator ile maliyetlere yansıtılır.
+    - Config'te "backtester.result_store" verilmişse koşu veri + strateji kodu + parametre
+      özetiyle sonuç deposunda aranır; aynı girdilerle yapılmış koşu yeniden hesaplanmaz
+      (günlük bu durumda yeniden yazılmaz).
+    - Config'teki "robustness.enabled" açıksa işlemler ve sermaye eğrisi üzerinde Monte Carlo /
+      bootstrap sağlamlık analizi yapılır (run_robustness).
     """
     backtest_config_path = os.path.join('config', 'backtester_config.json')
     config = load_config(backtest_config_path)
+    configure_logging(config.get("logging", {}))
+    profiler = configure_profiler(config.get("logging", {}))
+    journal_path = config["backtester"].get("journal_path")
+    journal = TradeJournal(journal_path) if journal_path else None
+    execution = execution_settings(config)
+    if execution is not None:
+        if config["data"].get("portfolio") or config["backtester"].get("streaming"):
+            raise ValueError("Gerçekleşme modeli portföy ve akışlı modlarda desteklenmiyor.")
+        if config["backtester"].get("engine") != "tick":
+            check_execution(config["backtester"].get("engine", "backtrader"), execution)
+
+    if config["data"].get("portfolio"):
+        run_portfolio_backtest(config, journal)
+        close_journal(journal)
+        profiler.write_report()
+        return
+
+    if config["backtester"].get("engine") == "tick":
+        run_tick_backtest(config, journal)
+        close_journal(journal)
+        profiler.write_report()
+        return
 
     # Config içindeki "file_path" değeri kullanılarak CSV dosyasını okuyoruz.
     data_file = config["data"]["file_path"]
     date_column = config["data"]["date_column"]
     price_column = config["data"]["price_column"]
 
-    df = pd.read_csv(data_file, parse_dates=[date_column])
+    if config["backtester"].get("streaming", False):
+        run_streaming_backtest(config, journal)
+        close_journal(journal)
+        profiler.write_report()
+        return
+
+    with profiler.stage("data_loading"):
+        df = load_bars(data_file, date_column)
+        if config["data"].get("timeframes"):
+            # Yüksek zaman dilimleri taban barlardan türetilip hizalanmış sütunlar olarak eklenir
+            df = add_timeframes(df, data_file, config["data"]["timeframes"], date_column)
+
+    backtester_config = config["backtester"]
+    strategy_params = config.get("strategy", {}).get("parameters", {})
+    engine = backtester_config.get("engine", "backtrader")
+
+    store = open_result_store(config)
+    if store is not None:
+        digest = data_hash(df)
+        settings = {
+            "engine": engine,
+            "date_column": date_column,
+            "price_column": price_column,
+            "cash": backtester_config["initial_capital"],
+            "commission": backtester_config["commission"],
+            "stake": backtester_config.get("stake", 1),
+            "execution": execution,
+        }
+        key = run_key(digest, MovingAverageStrategy, strategy_params, settings)
+        record = store.get(key)
+        if record is not None:
+            print("Backtest sonuçları (sonuç deposundan):", record["metrics"])
+            equity = record["equity"].set_index(record["equity"].columns[0])["equity"] if "equity" in record else None
+            run_robustness(config, equity=equity, trades=record.get("trades"))
+            # Günlük kapatılmaz; aynı girdilerle yazılmış önceki günlük olduğu gibi kalır
+            store.close()
+            profiler.write_report()
+            return
+
+    if engine == "vectorized":
+        backtester = VectorizedConnector(
+            MovingAverageStrategy,
+            df.set_index(date_column),
+            cash=backtester_config["initial_capital"],
+            commission=backtester_config["commission"],
+            stake=backtester_config.get("stake", 1),
+            price_column=price_column,
+            strategy_params=strategy_params,
+            journal=journal,
+            execution=execution
+        )
+        results = backtester.run()
+        metrics = summarize_vectorized(results)
+        print("Backtest sonuçları:", metrics)
+        run_robustness(config, equity=results["equity"], trades=results["trades"])
+        if store is not None:
+            store.put(key, KIND_BACKTEST, MovingAverageStrategy, strategy_params, settings, metrics,
+                      {"equity": results["equity"], "positions": results["positions"],
+                       "trades": results["trades"]}, data_digest=digest)
+            store.close()
+        close_journal(journal)
+        profiler.write_report()
+        return
 
     # DataFrame'i backtrader'ın veri feed'ine çeviriyoruz.
     # Eğer CSV sadece tarih ve fiyat bilgisi içeriyorsa,
     # open, high, low değerlerini price_column olarak ayarlayabiliriz.
-    data_feed = bt.feeds.PandasData(
-        dataname=df,
-        datetime=date_column,
-        open=price_column,
-        high=price_column,
-        low=price_column,
-        close=price_column,
-        volume=-1,
-        openinterest=-1
-    )
+    # Yüksek zaman dilimi sütunları ayrı çizgiler olarak eklenir ve stratejinin barlarında görünür.
+    data_feed = create_data_feed(df, date_column, price_column,
+                                 timeframe_columns(df.columns, config["data"].get("timeframes") or []))
 
     backtester = BacktesterConnector(
         MovingAverageStrategy,
         data_feed,
-        cash=config["backtester"]["initial_capital"],
-        commission=config["backtester"]["commission"]
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        strategy_params=strategy_params,
+        journal=journal
     )
 
     results = backtester.run()
-    print("Backtest sonuçları:", results)
+    metrics = backtester.summarize(results)
+    print("Backtest sonuçları:", metrics)
+    trades = backtester.trades(results)
+    run_robustness(config, trades=trades)
+    if store is not None:
+        store.put(key, KIND_BACKTEST, MovingAverageStrategy, strategy_params, settings, metrics,
+                  {"trades": trades}, data_digest=digest)
+        store.close()
+    close_journal(journal)
+    profiler.write_report()
 
-def run_metatrader5():
+
+def execution_settings(config):
     """
-    MetaTrader5 modunu çalıştırır:
-    - MetaTrader5 konfigürasyonunu yükler.
-    - MetaTrader5 connector aracılığıyla bağlantı kurar.
-    - Örnek olarak, belirli bir sembol için geçmiş verileri getirir.
+    Config'teki "backtester.execution" bölümünden FillSimulator parametrelerini döner;
+    bölüm yoksa veya "enabled" kapalıysa None.
     """
-    mt5_config_path = os.path.join('config', 'metatrader5_config.json')
-    config = load_config(mt5_config_path)
+    execution = dict(config.get("backtester", {}).get("execution") or {})
+    if not execution.pop("enabled", False):
+        return None
+    return execution
 
-    # Config üzerinden gerekli bilgiler alınır: login, password, server
-    login = config.get('login')
-    password = config.get('password')
-    server = config.get('server')
 
-    mt5_connector = MetaTrader5Connector(login, password, server)
-    if not mt5_connector.initialize():
-        print("MetaTrader5 bağlantısı kurulamadı.")
+def run_robustness(config, equity=None, trades=None):
+    """
+    Config'teki "robustness" bölümü açıksa backtest sonuçları üzerinde Monte Carlo analizi
+    yapar ve yöntem bazında getiri, düşüş ve iflas riski dağılımlarını yazdırır.
+    """
+    robustness = config.get("robustness") or {}
+    if not robustness.get("enabled", False):
+        return None
+    if (trades is None or len(trades) == 0) and (equity is None or len(equity) < 2):
+        print("Sağlamlık analizi için işlem veya sermaye eğrisi bulunamadı.")
+        return None
+    monte_carlo = MonteCarlo(
+        equity=equity,
+        trades=trades,
+        cash=config["backtester"]["initial_capital"],
+        ruin_level=robustness.get("ruin_level", 0.5),
+        frequency=robustness.get("frequency", "D"),
+        seed=robustness.get("seed"),
+        max_memory_mb=robustness.get("max_memory_mb", 256)
+    )
+    table = monte_carlo.run(robustness.get("simulations", 10000), robustness.get("block_size", 20),
+                            robustness.get("length"))
+    print("Monte Carlo sağlamlık analizi:")
+    print(table.to_string())
+    return table
+
+
+def open_result_store(config):
+    """
+    Config'teki "backtester.result_store" yolundaki sonuç deposunu açar; belirtilmemişse None.
+    """
+    path = config.get("backtester", {}).get("result_store")
+    return ResultStore(path) if path else None
+
+
+def close_journal(journal):
+    """
+    Sinyal/emir günlüğünü diske aktarır ve özetini yazdırır.
+    """
+    if journal is None:
         return
+    journal.close()
+    print(f"{len(journal)} sinyal/emir olayı kaydedildi → {journal.path}")
+
+
+def run_portfolio_backtest(config, journal=None):
+    """
+    Portföy modunu çalıştırır:
+    - Config'teki tüm sembol/zaman dilimi verilerini bir kez yükler ("backtester.streaming"
+      açıksa yüklemek yerine parça parça okur).
+    - Tüm varlıkları tek bir Cerebro içinde veya vektörel motorla çalıştırır.
+    - Varlık bazında ve toplam sonuçları yazdırır.
+    """
+    date_column = config["data"]["date_column"]
+    price_column = config["data"]["price_column"]
+    backtester_config = config["backtester"]
+    # Akışlı modda veriler yüklenmez, varlık başına parça parça okunur
+    chunk_size = backtester_config.get("chunk_size", 65536) if backtester_config.get("streaming") else None
+    with get_profiler().stage("data_loading"):
+        frames = load_portfolio(config["data"]["portfolio"], date_column,
+                                config["data"].get("base_path", "data/historic_data"), chunk_size)
+
+    portfolio = PortfolioBacktest(
+        MovingAverageStrategy,
+        frames,
+        date_column,
+        price_column,
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        engine=backtester_config.get("engine", "backtrader"),
+        strategy_params=config.get("strategy", {}).get("parameters", {}),
+        journal=journal
+    )
+    results = portfolio.run()
+    print("Varlık bazında sonuçlar:")
+    print(results['assets'].to_string())
+    print('Portföy Final Value: %.2f' % results['final_value'])
+
+
+def run_streaming_backtest(config, journal=None):
+    """
+    Akışlı backtest modunu çalıştırır:
+    - CSV yerine bar deposu "backtester.chunk_size" boyutunda parçalar halinde okunur
+      (depo yoksa CSV parça parça dönüştürülür).
+    - Cerebro bellek tasarrufu modunda (exactbars) çalışır; bellek kullanımı geçmişin
+      uzunluğundan bağımsızdır.
+    - Vektörel motor serinin tamamına ihtiyaç duyduğu için akışlı modda kullanılamaz.
+    - Yüksek zaman dilimi sütunları (data.timeframes) akışlı modda eklenemez; verilmişse hata verilir.
+    """
+    backtester_config = config["backtester"]
+    if backtester_config.get("engine", "backtrader") != "backtrader":
+        raise ValueError("Akışlı mod yalnızca backtrader motoruyla kullanılabilir.")
+    if config["data"].get("timeframes"):
+        raise ValueError("Akışlı mod yüksek zaman dilimi sütunlarını (data.timeframes) desteklemiyor.")
+    date_column = config["data"]["date_column"]
+    stream = BarStream(config["data"]["file_path"], date_column, backtester_config.get("chunk_size", 65536))
+    data_feed = create_streaming_feed(stream, date_column, config["data"]["price_column"])
+
+    backtester = BacktesterConnector(
+        MovingAverageStrategy,
+        data_feed,
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        strategy_params=config.get("strategy", {}).get("parameters", {}),
+        journal=journal,
+        exactbars=True
+    )
+    results = backtester.run()
+    print("Backtest sonuçları:", backtester.summarize(results))
+
+
+def run_tick_backtest(config, journal=None):
+    """
+    Tick replay modunu çalıştırır:
+    - Sembol ve bar zaman dilimi "data.file_path" içinden alınır (ör: EURUSD/M5.csv -> EURUSD, M5).
+    - Tickler "data.base_path" altındaki tick deposundan günlük parçalar halinde okunur.
+    - Barlar ticklerden anlık oluşturulur, emirler ask/bid fiyatlarından gerçekleşir.
+    """
+    file_path = config["data"]["file_path"]
+    symbol = os.path.basename(os.path.dirname(file_path))
+    timeframe = os.path.splitext(os.path.basename(file_path))[0]
+    backtester_config = config["backtester"]
+    end_date = backtester_config.get("end_date")
+    if end_date is not None and pd.Timestamp(end_date) == pd.Timestamp(end_date).normalize():
+        # Yalnızca tarih verilmişse o günün tamamı dahil edilir
+        end_date = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+
+    replay = TickReplay(
+        MovingAverageStrategy,
+        TickStore(config["data"].get("base_path", "data/historic_data")),
+        symbol,
+        timeframe,
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        strategy_params=config.get("strategy", {}).get("parameters", {}),
+        start=backtester_config.get("start_date"),
+        end=end_date,
+        journal=journal
+    )
+    results = replay.run()
+    print("Backtest sonuçları:", summarize_vectorized(results))
+    print("İşlenen tick: %d, ödenen spread: %.5f" % (results['ticks'], results['spread_cost']))
+    run_robustness(config, equity=results['equity'], trades=results['trades'])
+
+
+def valid_windows(params):
+    """
+    Kısa pencerenin uzun pencereden küçük olmadığı kombinasyonları eler; optimizasyon,
+    walk-forward ve dağıtık taramalarda ortak kısıttır.
+    """
+    return params.get("short_window", 0) < params.get("long_window", float("inf"))
+
 
-    # Örnek veri çekimi: Sembol, timeframe ve bar sayısı config üzerinden veya default değerlerle belirlenir.
-    symbol = config.get('symbol', 'EURUSD')
+def run_optimization():
+    """
+    Parametre taraması modunu çalıştırır:
+    - Backtester konfigürasyonundaki "optimization" bölümünden parametre ızgarasını okur.
+    - CSV dosyasını bir kez okur ve işçi süreçlerle paylaşır.
+    - Tüm kombinasyonları paralel çalıştırıp sıralı sonuç tablosunu yazdırır ve kaydeder.
+    - "backtester.result_store" verilmişse daha önce hesaplanmış kombinasyonlar depodan alınır.
+    """
+    backtest_config_path = os.path.join('config', 'backtester_config.json')
+    config = load_config(backtest_config_path)
+    configure_logging(config.get("logging", {}))
+
+    date_column = config["data"]["date_column"]
+    price_column = config["data"]["price_column"]
+    df = load_bars(config["data"]["file_path"], date_column)
+
+    backtester_config = config["backtester"]
+    optimization_config = config.get("optimization", {})
+    grid = optimization_config.get("parameters", config.get("strategy", {}).get("parameters", {}))
 
-    # MetaTrader5 modülünden timeframe sabiti kullanabilmek için ek içe aktarma yapıyoruz
-    import MetaTrader5 as mt5
-    timeframe = config.get('timeframe', mt5.TIMEFRAME_H1)
-    data = mt5_connector.get_data(symbol, timeframe, n_bars=100)
+    sweep = ParameterSweep(
+        MovingAverageStrategy,
+        df,
+        date_column,
+        price_column,
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        engine=optimization_config.get("engine", backtester_config.get("engine", "backtrader")),
+        max_workers=optimization_config.get("max_workers"),
+        store=open_result_store(config),
+        execution=execution_settings(config)
+    )
+
+    table = sweep.run(grid, rank_by=optimization_config.get("rank_by", "final_value"),
+                      constraint=valid_windows)
+    print("Optimizasyon sonuçları:")
+    print(table.to_string())
+
+    output_file = optimization_config.get("output_file")
+    if output_file:
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        table.to_csv(output_file, index=False)
+        print(f"Sonuçlar kaydedildi → {output_file}")
+
+def run_walk_forward():
+    """
+    İleriye doğru (walk-forward) değerlendirme modunu çalıştırır:
+    - Veriyi bir kez yükler ve "backtester" bölümündeki start_date/end_date aralığına kısaltır.
+    - "walk_forward" bölümündeki pencere ayarlarıyla örneklem içi optimizasyon ve örneklem dışı
+      testleri paralel çalıştırır (parametre ızgarası "optimization" bölümünden alınır).
+    - Pencere bazında sonuçları ve birleştirilmiş örneklem dışı getiriyi yazdırır ve kaydeder.
+    - "backtester.result_store" verilmişse aynı ayarlarla yapılmış değerlendirme depodan alınır.
+    """
+    backtest_config_path = os.path.join('config', 'backtester_config.json')
+    config = load_config(backtest_config_path)
+    configure_logging(config.get("logging", {}))
+
+    date_column = config["data"]["date_column"]
+    price_column = config["data"]["price_column"]
+    df = load_bars(config["data"]["file_path"], date_column)
+
+    backtester_config = config["backtester"]
+    optimization_config = config.get("optimization", {})
+    wf_config = config.get("walk_forward", {})
+    grid = optimization_config.get("parameters", config.get("strategy", {}).get("parameters", {}))
+
+    walk_forward = WalkForward(
+        MovingAverageStrategy,
+        df,
+        date_column,
+        price_column,
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        engine=wf_config.get("engine", "vectorized"),
+        max_workers=wf_config.get("max_workers"),
+        start_date=backtester_config.get("start_date"),
+        end_date=backtester_config.get("end_date"),
+        store=open_result_store(config),
+        execution=execution_settings(config)
+    )
+
+    results = walk_forward.run(
+        grid,
+        wf_config.get("in_sample", "90D"),
+        wf_config.get("out_of_sample", "30D"),
+        step=wf_config.get("step"),
+        anchored=wf_config.get("anchored", False),
+        warmup=wf_config.get("warmup", 0),
+        rank_by=wf_config.get("rank_by", optimization_config.get("rank_by", "final_value")),
+        constraint=valid_windows
+    )
+    print("Pencere bazında sonuçlar:")
+    print(results['windows'].to_string())
+    print('Örneklem dışı birleşik getiri: %.2f%% (Final Value: %.2f)' % (results['return'], results['final_value']))
+
+    output_file = wf_config.get("output_file")
+    if output_file and len(results['windows']):
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        results['windows'].to_csv(output_file, index=False)
+        print(f"Sonuçlar kaydedildi → {output_file}")
+
+
+def distributed_symbols(config):
+    """
+    Dağıtık tarama sembollerini ve zaman dilimini döner; "distributed.symbols" boşsa sembol ve
+    zaman dilimi "data.file_path" içinden alınır (ör: EURUSD/M5.csv -> ["EURUSD"], M5).
+    """
+    file_path = config["data"]["file_path"]
+    distributed_config = config.get("distributed", {})
+    symbols = distributed_config.get("symbols") or [os.path.basename(os.path.dirname(file_path))]
+    timeframe = distributed_config.get("timeframe") or os.path.splitext(os.path.basename(file_path))[0]
+    return symbols, timeframe
 
-    if data is not None:
-        print("Veri çekildi:")
-        print(data.head())
+
+def run_coordinator():
+    """
+    Dağıtık tarama koordinatörünü çalıştırır:
+    - "distributed" bölümündeki semboller x "optimization" ızgarası (x "walk_forward"
+      pencereleri, "distributed.walk_forward" açıksa) işlerini kalıcı kuyruğa yazar.
+    - Aynı ayarlarla yeniden çalıştırıldığında yeni iş eklenmez; tamamlanmış işler korunur ve
+      başarısız işler yeniden kuyruğa alınır.
+    - İşçiler (python main.py worker) herhangi bir makinede kuyruğa bağlanıp işleri çalıştırır;
+      koordinatör ilerlemeyi raporlar ve bitince sonuçları yazdırıp kaydeder.
+    """
+    backtest_config_path = os.path.join('config', 'backtester_config.json')
+    config = load_config(backtest_config_path)
+    configure_logging(config.get("logging", {}))
+
+    backtester_config = config["backtester"]
+    optimization_config = config.get("optimization", {})
+    distributed_config = config.get("distributed", {})
+    wf_config = config.get("walk_forward", {})
+    grid = optimization_config.get("parameters", config.get("strategy", {}).get("parameters", {}))
+    symbols, timeframe = distributed_symbols(config)
+
+    queue = WorkQueue(distributed_config.get("queue_path", "results/work_queue.sqlite"),
+                      lease_seconds=distributed_config.get("lease_seconds", 300),
+                      max_attempts=distributed_config.get("max_attempts", 3))
+    coordinator = DistributedSweep(
+        queue,
+        MovingAverageStrategy,
+        symbols,
+        timeframe,
+        config["data"]["date_column"],
+        config["data"]["price_column"],
+        cash=backtester_config["initial_capital"],
+        commission=backtester_config["commission"],
+        stake=backtester_config.get("stake", 1),
+        engine=distributed_config.get("engine", "vectorized"),
+        base_path=config["data"].get("base_path", "data/historic_data"),
+        start_date=backtester_config.get("start_date"),
+        end_date=backtester_config.get("end_date"),
+        execution=execution_settings(config)
+    )
+
+    if distributed_config.get("walk_forward", False):
+        sweep = coordinator.submit(grid, valid_windows, wf_config.get("in_sample", "90D"),
+                                   wf_config.get("out_of_sample", "30D"), wf_config.get("step"),
+                                   wf_config.get("anchored", False), wf_config.get("warmup", 0))
+        rank_by = wf_config.get("rank_by", optimization_config.get("rank_by", "final_value"))
     else:
-        print("Veri çekilemedi.")
+        sweep = coordinator.submit(grid, valid_windows)
+        rank_by = optimization_config.get("rank_by", "final_value")
+    retried = queue.retry_failed(sweep)
+    if retried:
+        print(f"{retried} başarısız iş yeniden kuyruğa alındı.")
+    print(f"Tarama {sweep} kuyrukta; işçileri 'python main.py worker' ile başlatın.")
+
+    progress = coordinator.wait(sweep, poll_interval=distributed_config.get("poll_interval", 5))
+    for job, error in queue.failures(sweep):
+        print(f"Başarısız iş {job['symbol']} {job['params']}: {error}")
+    table = coordinator.collect(sweep, rank_by)
+    print(f"Dağıtık tarama sonuçları ({progress['done']}/{progress['total']} iş):")
+    print(table.to_string())
+    if distributed_config.get("walk_forward", False) and len(table):
+        growth = (1 + table["oos_return"] / 100).groupby(table["symbol"]).prod()
+        for symbol, value in growth.items():
+            print('%s örneklem dışı birleşik getiri: %.2f%%' % (symbol, (value - 1) * 100))
+
+    output_file = distributed_config.get("output_file")
+    if output_file and len(table):
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        table.to_csv(output_file, index=False)
+        print(f"Sonuçlar kaydedildi → {output_file}")
+    queue.close()
+
+
+def run_worker():
+    """
+    Dağıtık tarama işçisini çalıştırır: "distributed.queue_path" kuyruğundan iş kiralar, veriyi
+    ortak bar deposundan yükler ve sonuçları kuyruğa yazar. Kuyruk "distributed.idle_timeout"
+    saniye boş kalınca durur (null ise beklemeye devam eder).
+    """
+    backtest_config_path = os.path.join('config', 'backtester_config.json')
+    config = load_config(backtest_config_path)
+    configure_logging(config.get("logging", {}))
+    distributed_config = config.get("distributed", {})
+
+    worker = QueueWorker(
+        distributed_config.get("queue_path", "results/work_queue.sqlite"),
+        base_path=distributed_config.get("worker_base_path"),
+        lease_seconds=distributed_config.get("lease_seconds", 300),
+        max_attempts=distributed_config.get("max_attempts", 3),
+        poll_interval=distributed_config.get("worker_poll_interval", 1.0)
+    )
+    completed = worker.run(idle_timeout=distributed_config.get("idle_timeout", 60))
+    print(f"İşçi {worker.name}: {completed} iş tamamlandı.")
 
-    # Canlı emir gönderimi örneği (gerçek emir göndermeden önce test edilmelidir):
-    # order_result = mt5_connector.send_order(symbol, mt5.ORDER_TYPE_BUY, volume=0.1, price=data['close'].iloc[-1])
-    # print("Emir sonucu:", order_result)
 
-    mt5_connector.shutdown()
+def run_metatrader5():
+    """
+    MetaTrader5 canlı modunu çalıştırır:
+    - MetaTrader5 konfigürasyonunu yükler ve terminal oturumunu açar.
+    - Stratejiyi son kapanmış barlarla ısıtır.
+    - Oturumu açık tutarak yeni kapanan barları stratejiye artımlı olarak iletir; pozisyon
+      değiştiğinde emirler ayrı bir iş parçacığında gönderilir.
+    - Durunca bar->emir gecikme istatistiklerini yazdırır.
+    """
+    mt5_config_path = os.path.join('config', 'mt5_config.json')
+    config = load_config(mt5_config_path)
+    exchange_config = config.get('exchange', {})
+    trading_config = config.get('trading', {})
+    live_config = config.get('live', {})
+    strategy_config = config.get('strategy', {})
+
+    mt5_connector = MetaTrader5Connector(int(exchange_config.get('login', 0)), exchange_config.get('password'),
+                                         exchange_config.get('server'))
+    if not mt5_connector.initialize():
+        print("MetaTrader5 bağlantısı kurulamadı.")
+        return
+
+    symbol = trading_config.get('symbol', 'EURUSD')
+    source = MT5BarSource(mt5_connector, symbol, live_config.get('timeframe', 'M1'))
+    router = MT5OrderRouter(mt5_connector, symbol, volume=trading_config.get('volume', 0.1),
+                            slippage=trading_config.get('slippage', 20),
+                            magic=trading_config.get('magic_number', 0))
+    runner = LiveRunner(MovingAverageStrategy, source, router,
+                        strategy_params=strategy_config.get('parameters', {}),
+                        warmup=live_config.get('warmup', 200),
+                        poll_interval=live_config.get('poll_interval', 0.05))
+    try:
+        runner.run(duration=live_config.get('duration'))
+    finally:
+        mt5_connector.shutdown()
 
 
 def main():
@@ -111,7 +610,11 @@ def main():
     Uygulamanın giriş noktası.
     Komut satırı argümanına göre mod seçimi yapılır:
       - 'backtest': Tarihsel veri üzerinde backtesting yapılır.
-      - 'mt5' veya 'metatrader5': MetaTrader5 üzerinden canlı veri ve işlem gerçekleştirilir.
+      - 'optimize': Parametre ızgarası üzerinde paralel backtest taraması yapılır.
+      - 'walkforward' veya 'wf': Kayan/sabit başlangıçlı pencerelerle ileriye doğru değerlendirme yapılır.
+      - 'coordinator': Dağıtık tarama işlerini kuyruğa yazar ve sonuçları toplar.
+      - 'worker': Dağıtık tarama kuyruğundaki işleri çalıştırır (birden çok makinede çalıştırılabilir).
+      - 'mt5' veya 'metatrader5': MetaTrader5 oturumu açık tutularak canlı barlarla işlem yapılır.
     """
     mode = 'backtest'
     if len(sys.argv) > 1:
@@ -120,11 +623,23 @@ def main():
     if mode == 'backtest':
         print("Backtest modu seçildi.")
         run_backtest()
+    elif mode in ['optimize', 'sweep']:
+        print("Optimizasyon modu seçildi.")
+        run_optimization()
+    elif mode in ['walkforward', 'wf']:
+        print("İleriye doğru değerlendirme modu seçildi.")
+        run_walk_forward()
+    elif mode == 'coordinator':
+        print("Dağıtık tarama koordinatör modu seçildi.")
+        run_coordinator()
+    elif mode == 'worker':
+        print("Dağıtık tarama işçi modu seçildi.")
+        run_worker()
     elif mode in ['mt5', 'metatrader5']:
         print("MetaTrader5 modu seçildi.")
         run_metatrader5()
     else:
-        print("Geçersiz mod. Lütfen 'backtest' veya 'mt5' (MetaTrader5) modunu seçiniz.")
+        print("Geçersiz mod. Lütfen 'backtest', 'optimize', 'walkforward', 'coordinator', 'worker' veya 'mt5' (MetaTrader5) modunu seçiniz.")
 
 
 if __name__ == '__main__':
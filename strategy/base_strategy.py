@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
+from collections import namedtuple
 import backtrader as bt
+from strategy.kernels import run_kernel
+
+
+# Artımlı modda stratejiye tek tek iletilen bar yapısı
+Bar = namedtuple('Bar', ['datetime', 'open', 'high', 'low', 'close', 'volume'])
 
 
 class BaseStrategy(ABC):
-    def __init__(self, data):
+    def __init__(self, data, **params):
         self.data = data
+        # Strateji parametreleri (ör: short_window, long_window); initialize içinde okunur
+        self.params = params
         self.initialize()
 
     @abstractmethod
@@ -30,3 +38,95 @@ class BaseStrategy(ABC):
         Stratejinin ana yürütme mantığını tanımlar.
         """
         pass
+
+    def on_bar(self, bar):
+        """
+        Artımlı modda tek bir yeni barı işler ve stratejinin iç durumunu günceller.
+        Bu metodu uygulayan stratejiler, geçmiş veriyi yeniden işlemeden bar başına
+        sabit maliyetle çalıştırılabilir.
+
+        Args:
+            bar: 'close' gibi alanlara öznitelik olarak erişilebilen bar (ör: Bar veya
+                DataFrame.itertuples() satırı).
+        """
+        raise NotImplementedError(f"{type(self).__name__} artımlı modu desteklemiyor.")
+
+    def supports_incremental(self):
+        """
+        Stratejinin on_bar metodunu uygulayıp uygulamadığını döner.
+        """
+        return type(self).on_bar is not BaseStrategy.on_bar
+
+    def generate_positions(self, data):
+        """
+        Vektörel modda tüm seri için her bar sonundaki hedef pozisyonu (1 = alım,
+        -1 = satış, 0 = pozisyon yok) tek seferde, bar döngüsü olmadan hesaplar.
+        Varsayılan olarak strateji derlenmiş bir çekirdek tanımlıyorsa (position_kernel)
+        çekirdek çalıştırılır.
+
+        Args:
+            data (pandas.DataFrame): Fiyat verilerini içeren DataFrame.
+
+        Returns:
+            numpy.ndarray: Her bar için hedef pozisyon.
+        """
+        if self.supports_kernel():
+            return self.run_kernel(data)
+        raise NotImplementedError(f"{type(self).__name__} vektörel modu desteklemiyor.")
+
+    def supports_vectorized(self):
+        """
+        Stratejinin generate_positions metodunu veya derlenmiş çekirdeği uygulayıp uygulamadığını döner.
+        """
+        return type(self).generate_positions is not BaseStrategy.generate_positions or self.supports_kernel()
+
+    def position_kernel(self):
+        """
+        Stratejinin bar başına mantığını tüm seri üzerinde tek çağrıda çalıştıran derlenmiş
+        çekirdeği döner (bkz. strategy.kernels.compile_kernel); tanımlanmamışsa None.
+        Durdurma ve iz süren stop gibi yola bağımlı kurallar maskelerle vektörleştirilemez;
+        bu kurallar çekirdek içinde derlenmiş döngü hızında çalışır.
+
+        Returns:
+            callable: kernel(inputs, params, out) imzalı çekirdek veya None.
+        """
+        return None
+
+    def kernel_inputs(self, data):
+        """
+        Çekirdeğe verilecek girdi dizilerini (ör: kapanış ve indikatörler) döner.
+
+        Args:
+            data (pandas.DataFrame): Fiyat verilerini içeren DataFrame.
+
+        Returns:
+            numpy.ndarray: (girdi sayısı x bar sayısı) boyutlu dizi.
+        """
+        raise NotImplementedError(f"{type(self).__name__} çekirdek girdilerini tanımlamıyor.")
+
+    def kernel_params(self):
+        """
+        Çekirdeğe verilecek sayısal parametreleri döner.
+
+        Returns:
+            list: Parametre değerleri.
+        """
+        return []
+
+    def supports_kernel(self):
+        """
+        Stratejinin derlenmiş çekirdek tanımlayıp tanımlamadığını döner.
+        """
+        return self.position_kernel() is not None
+
+    def run_kernel(self, data):
+        """
+        Çekirdeği tüm seri üzerinde tek çağrıda çalıştırır.
+
+        Args:
+            data (pandas.DataFrame): Fiyat verilerini içeren DataFrame.
+
+        Returns:
+            numpy.ndarray: Her bar için hedef pozisyon.
+        """
+        return run_kernel(self.position_kernel(), self.kernel_inputs(data), self.kernel_params())
@@ -1,15 +1,67 @@
+import numpy as np
 import pandas as pd
 from strategy.base_strategy import BaseStrategy
-import backtrader as bt
+from strategy import indicators
+from strategy.indicators import ExponentialMovingAverage, RollingMean
+from strategy.kernels import compile_kernel
 
-class MovingAverageStrategy(bt.Strategy):
+
+def _crossover_kernel(inputs, params, out):
+    # Girdiler: kapanış, kısa MA, uzun MA; parametreler: uzun pencere, iz süren stop oranı.
+    # execute metodunun bar bar ürettiği pozisyonlarla aynı sonucu verir.
+    close = inputs[0]
+    short_ma = inputs[1]
+    long_ma = inputs[2]
+    first = max(int(params[0]) - 1, 1)
+    trailing_stop = params[1]
+    position = 0.0
+    extreme = 0.0
+    for i in range(out.shape[0]):
+        if i >= first:
+            if short_ma[i - 1] < long_ma[i - 1] and short_ma[i] > long_ma[i]:
+                position = 1.0
+                extreme = close[i]
+            elif short_ma[i - 1] > long_ma[i - 1] and short_ma[i] < long_ma[i]:
+                position = -1.0
+                extreme = close[i]
+            elif trailing_stop > 0.0 and position > 0.0:
+                extreme = max(extreme, close[i])
+                if close[i] <= extreme * (1.0 - trailing_stop):
+                    position = 0.0
+            elif trailing_stop > 0.0 and position < 0.0:
+                extreme = min(extreme, close[i])
+                if close[i] >= extreme * (1.0 + trailing_stop):
+                    position = 0.0
+        out[i] = position
+
+
+_CROSSOVER_KERNEL = compile_kernel(_crossover_kernel)
+
+
+class MovingAverageStrategy(BaseStrategy):
     def initialize(self):
         """
         Hareketli ortalama stratejisinin başlangıç ayarlarını yapar.
         """
-        self.short_window = 40  # Kısa dönem için pencere boyutu
-        self.long_window = 100  # Uzun dönem için pencere boyutu
+        self.short_window = self.params.get('short_window', 40)  # Kısa dönem için pencere boyutu
+        self.long_window = self.params.get('long_window', 100)  # Uzun dönem için pencere boyutu
+        self.ma_type = self.params.get('ma_type', 'sma')  # Ortalama türü: "sma" veya "ema"
+        if self.ma_type not in ('sma', 'ema'):
+            raise ValueError(f"Desteklenmeyen ortalama türü: {self.ma_type}")
+        # İz süren stop: pozisyon, girişten beri görülen en iyi kapanıştan bu oranda geri
+        # çekildiğinde kapatılır ve bir sonraki crossover'a kadar pozisyon açılmaz
+        self.trailing_stop = self.params.get('trailing_stop') or 0.0
+        if not 0 <= self.trailing_stop < 1:
+            raise ValueError("trailing_stop 0 ile 1 arasında olmalıdır.")
         self.position = 0  # Mevcut pozisyon: 0 = pozisyon yok, 1 = alım, -1 = satış
+        self._extreme = 0.0  # Girişten beri pozisyon yönündeki en iyi kapanış
+
+        # Artımlı mod için bar başına O(1) güncellenen durum
+        streaming = RollingMean if self.ma_type == 'sma' else ExponentialMovingAverage
+        self._short_ma = streaming(self.short_window)
+        self._long_ma = streaming(self.long_window)
+        self._bar_count = 0
+        self._ma_state = None  # (önceki kısa MA, önceki uzun MA, kısa MA, uzun MA)
         print("Hareketli Ortalama Stratejisi başlatıldı.")
 
     def on_data(self, new_data):
@@ -18,31 +70,135 @@ class MovingAverageStrategy(bt.Strategy):
         Args:
             new_data (pandas.DataFrame): 'close' sütununu içeren fiyat verileri.
         """
+        self._ma_state = None
         self.data = new_data.copy()
         if len(self.data) >= self.long_window:
-            self.data['short_ma'] = self.data['close'].rolling(window=self.short_window).mean()
-            self.data['long_ma'] = self.data['close'].rolling(window=self.long_window).mean()
+            # Her adımda farklı uzunlukta dilim geldiği için önbellek kullanılmaz
+            self.data['short_ma'] = self._moving_average(self.data['close'], self.short_window, cached=False)
+            self.data['long_ma'] = self._moving_average(self.data['close'], self.long_window, cached=False)
+
+    def _moving_average(self, close, window, cached=True):
+        if self.ma_type == 'ema':
+            return indicators.ema(close, window, cached=cached)
+        return indicators.sma(close, window, cached=cached)
+
+    def on_bar(self, bar):
+        """
+        Tek bir yeni barı işler; hareketli ortalamaları halka tamponlar üzerinden
+        geçmişi yeniden hesaplamadan günceller.
+
+        Args:
+            bar: 'close' alanına sahip bar.
+        """
+        previous_short = self._short_ma.value
+        previous_long = self._long_ma.value
+        self._bar_count += 1
+        self._last_close = bar.close
+        self._ma_state = (
+            previous_short,
+            previous_long,
+            self._short_ma.update(bar.close),
+            self._long_ma.update(bar.close),
+        )
 
     def execute(self):
         """
         Hareketli ortalama crossover sinyallerine göre alım veya satış sinyali üretir.
 
         Returns:
-            str: Alım, satış sinyali veya veri yetersiz mesajı.
+            str: Alım, satış, stop sinyali veya veri yetersiz mesajı.
         """
-        if len(self.data) < self.long_window:
-            return "Yeterli veri yok."
+        if self._ma_state is not None:
+            # Artımlı mod: on_bar ile güncellenen durum kullanılır
+            if self._bar_count < self.long_window:
+                return "Yeterli veri yok."
+            previous_short, previous_long, latest_short, latest_long = self._ma_state
+            close = self._last_close
+        else:
+            if len(self.data) < self.long_window:
+                return "Yeterli veri yok."
 
-        latest = self.data.iloc[-1]
-        previous = self.data.iloc[-2]
+            latest = self.data.iloc[-1]
+            previous = self.data.iloc[-2]
+            previous_short, previous_long = previous['short_ma'], previous['long_ma']
+            latest_short, latest_long = latest['short_ma'], latest['long_ma']
+            close = latest['close']
 
         # Kısa MA'nın uzun MA'nın altından uzun MA'nın üstüne geçmesi alım sinyali üretir
-        if previous['short_ma'] < previous['long_ma'] and latest['short_ma'] > latest['long_ma']:
+        if previous_short < previous_long and latest_short > latest_long:
             self.position = 1
+            self._extreme = close
             return "Alım sinyali"
         # Kısa MA'nın uzun MA'nın üstünden uzun MA'nın altına geçmesi satış sinyali üretir
-        elif previous['short_ma'] > previous['long_ma'] and latest['short_ma'] < latest['long_ma']:
+        elif previous_short > previous_long and latest_short < latest_long:
             self.position = -1
+            self._extreme = close
             return "Satış sinyali"
-        else:
-            return "Pozisyon değişmedi."
+        elif self.trailing_stop and self.position != 0:
+            if self.position > 0:
+                self._extreme = max(self._extreme, close)
+                stopped = close <= self._extreme * (1 - self.trailing_stop)
+            else:
+                self._extreme = min(self._extreme, close)
+                stopped = close >= self._extreme * (1 + self.trailing_stop)
+            if stopped:
+                self.position = 0
+                return "Stop sinyali"
+        return "Pozisyon değişmedi."
+
+    def generate_positions(self, data):
+        """
+        Crossover maskelerini tüm seri için hesaplar ve her bar sonundaki pozisyonu döner.
+        Sonuçlar, execute metodunun bar bar ürettiği pozisyonlarla aynıdır. Hareketli ortalamalar
+        paylaşılan indikatör önbelleğinden alınır; aynı veri üzerindeki tarama koşuları aynı
+        pencereyi tekrar hesaplamaz.
+
+        Args:
+            data (pandas.DataFrame): 'close' sütununu içeren fiyat verileri.
+
+        İz süren stop yola bağımlı olduğu için maskelerle hesaplanamaz; trailing_stop verilmişse
+        pozisyonlar derlenmiş çekirdekle (position_kernel) tek çağrıda hesaplanır.
+
+        Returns:
+            numpy.ndarray: Her bar için pozisyon (1, -1 veya 0).
+        """
+        if self.trailing_stop:
+            return self.run_kernel(data).astype(np.int8)
+        close = data['close']
+        short_ma = self._moving_average(close, self.short_window)
+        long_ma = self._moving_average(close, self.long_window)
+        previous_short = np.roll(short_ma, 1)
+        previous_long = np.roll(long_ma, 1)
+        previous_short[0] = previous_long[0] = np.nan
+
+        with np.errstate(invalid='ignore'):
+            buy = (previous_short < previous_long) & (short_ma > long_ma)
+            sell = (previous_short > previous_long) & (short_ma < long_ma)
+        # execute, uzun pencere dolmadan sinyal üretmez (EMA değerleri ilk bardan itibaren tanımlıdır)
+        buy[:self.long_window - 1] = sell[:self.long_window - 1] = False
+
+        signals = np.where(buy, 1.0, np.where(sell, -1.0, np.nan))
+        return pd.Series(signals).ffill().fillna(0).to_numpy(dtype=np.int8)
+
+    def position_kernel(self):
+        """
+        Crossover ve iz süren stop kurallarını uygulayan derlenmiş çekirdeği döner.
+        """
+        return _CROSSOVER_KERNEL
+
+    def kernel_inputs(self, data):
+        """
+        Çekirdek girdilerini döner: kapanış, kısa MA ve uzun MA.
+        """
+        close = data['close']
+        return np.vstack([
+            close.to_numpy(dtype=np.float64),
+            self._moving_average(close, self.short_window),
+            self._moving_average(close, self.long_window),
+        ])
+
+    def kernel_params(self):
+        """
+        Çekirdek parametrelerini döner: uzun pencere ve iz süren stop oranı.
+        """
+        return [self.long_window, self.trailing_stop]
@@ -0,0 +1,470 @@
+import math
+from collections import OrderedDict, deque
+
+import numpy as np
+import pandas as pd
+
+
+class RollingMean:
+    def __init__(self, window):
+        """
+        Sabit pencereli basit hareketli ortalamayı her yeni değerde O(1) maliyetle günceller.
+        Son `window` değer bir halka tamponda tutulur; toplam, pandas'ın rolling().mean()
+        sonucuyla uyumlu kalması için telafili (Neumaier) toplama ile izlenir.
+
+        Args:
+            window (int): Pencere boyutu.
+        """
+        if window < 1:
+            raise ValueError("Pencere boyutu en az 1 olmalıdır.")
+        self.window = window
+        self._buffer = [0.0] * window
+        self._index = 0
+        self._count = 0
+        self._nan_count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self.value = math.nan
+
+    def _add(self, value):
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def update(self, value):
+        """
+        Pencereye yeni bir değer ekler, pencere doluysa en eski değeri çıkarır.
+
+        Args:
+            value (float): Yeni gözlem.
+
+        Returns:
+            float: Güncel ortalama; pencere dolmadıysa veya pencerede NaN varsa NaN.
+        """
+        value = float(value)
+        if self._count == self.window:
+            oldest = self._buffer[self._index]
+            if math.isnan(oldest):
+                self._nan_count -= 1
+            else:
+                self._add(-oldest)
+        else:
+            self._count += 1
+
+        self._buffer[self._index] = value
+        if math.isnan(value):
+            self._nan_count += 1
+        else:
+            self._add(value)
+        self._index = (self._index + 1) % self.window
+
+        if self._count == self.window and self._nan_count == 0:
+            self.value = (self._sum + self._compensation) / self.window
+        else:
+            self.value = math.nan
+        return self.value
+
+
+class ExponentialMovingAverage:
+    def __init__(self, span):
+        """
+        Üssel hareketli ortalamayı tek bir akümülatörle günceller.
+        NaN içermeyen serilerde sonuçlar pandas'ın ewm(span=span, adjust=False).mean()
+        çıktısıyla aynıdır; NaN değerler atlanır.
+
+        Args:
+            span (int): EMA periyodu.
+        """
+        if span < 1:
+            raise ValueError("EMA periyodu en az 1 olmalıdır.")
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = math.nan
+
+    def update(self, value):
+        """
+        Akümülatöre yeni bir değer ekler.
+
+        Args:
+            value (float): Yeni gözlem.
+
+        Returns:
+            float: Güncel EMA değeri.
+        """
+        value = float(value)
+        if math.isnan(value):
+            return self.value
+        if math.isnan(self.value):
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class WeightedMovingAverage:
+    def __init__(self, window):
+        """
+        Doğrusal ağırlıklı hareketli ortalama (en yeni değerin ağırlığı `window`, en eskinin 1).
+        Ağırlıklı toplam ve pencere toplamı her yeni değerde O(1) güncellenir; pencereye NaN
+        girdiğinde NaN çıkana kadar sonuç NaN olur ve toplamlar tampondan yeniden hesaplanır.
+
+        Args:
+            window (int): Pencere boyutu.
+        """
+        if window < 1:
+            raise ValueError("Pencere boyutu en az 1 olmalıdır.")
+        self.window = window
+        self._divisor = window * (window + 1) / 2.0
+        self._buffer = deque(maxlen=window)
+        self._numerator = 0.0
+        self._total = 0.0
+        self._nan_count = 0
+        self._stale = False
+        self.value = math.nan
+
+    def update(self, value):
+        value = float(value)
+        full = len(self._buffer) == self.window
+        oldest = self._buffer[0] if full else 0.0
+        self._buffer.append(value)
+        if full and math.isnan(oldest):
+            self._nan_count -= 1
+        if math.isnan(value):
+            self._nan_count += 1
+
+        if self._nan_count:
+            self._stale = True
+        elif self._stale:
+            self._numerator = sum((i + 1) * v for i, v in enumerate(self._buffer))
+            self._total = sum(self._buffer)
+            self._stale = False
+        elif full:
+            # Tüm ağırlıklar bir azalır (en eski değer düşer), yeni değer en yüksek ağırlığı alır
+            self._numerator += self.window * value - self._total
+            self._total += value - oldest
+        else:
+            self._numerator += len(self._buffer) * value
+            self._total += value
+
+        if len(self._buffer) == self.window and not self._nan_count:
+            self.value = self._numerator / self._divisor
+        else:
+            self.value = math.nan
+        return self.value
+
+
+class RollingStd:
+    def __init__(self, window, ddof=1):
+        """
+        Sabit pencereli standart sapmayı Welford ekleme/çıkarma adımlarıyla O(1) günceller.
+        Sonuçlar pandas'ın rolling(window).std(ddof=ddof) çıktısıyla uyumludur.
+
+        Args:
+            window (int): Pencere boyutu.
+            ddof (int): Serbestlik derecesi düzeltmesi (pandas varsayılanı 1).
+        """
+        if window <= ddof:
+            raise ValueError("Pencere boyutu ddof değerinden büyük olmalıdır.")
+        self.window = window
+        self.ddof = ddof
+        self._buffer = deque(maxlen=window)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._nan_count = 0
+        self.value = math.nan
+
+    def _add(self, value):
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, value):
+        self._count -= 1
+        if self._count == 0:
+            self._mean = self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def update(self, value):
+        value = float(value)
+        if len(self._buffer) == self.window:
+            oldest = self._buffer[0]
+            if math.isnan(oldest):
+                self._nan_count -= 1
+            else:
+                self._remove(oldest)
+        self._buffer.append(value)
+        if math.isnan(value):
+            self._nan_count += 1
+        else:
+            self._add(value)
+
+        if self._count == self.window:
+            self.value = math.sqrt(max(self._m2, 0.0) / (self.window - self.ddof))
+        else:
+            self.value = math.nan
+        return self.value
+
+
+class BollingerBands:
+    def __init__(self, window=20, num_std=2.0, ddof=0):
+        """
+        Bollinger bantları: hareketli ortalama ve ± num_std standart sapma.
+
+        Args:
+            window (int): Pencere boyutu.
+            num_std (float): Bant genişliği (standart sapma katı).
+            ddof (int): Standart sapma için serbestlik derecesi düzeltmesi.
+        """
+        self.num_std = num_std
+        self._mean = RollingMean(window)
+        self._std = RollingStd(window, ddof)
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, value):
+        """
+        Returns:
+            tuple: (orta, üst, alt) bant değerleri.
+        """
+        middle = self._mean.update(value)
+        width = self.num_std * self._std.update(value)
+        self.value = (middle, middle + width, middle - width)
+        return self.value
+
+
+class _WilderAverage:
+    # alpha = 1 / period olan üssel ortalama; period gözlemden önce değer üretmez
+    def __init__(self, period):
+        self.alpha = 1.0 / period
+        self.period = period
+        self.count = 0
+        self.value = math.nan
+
+    def update(self, value):
+        if self.count == 0:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        self.count += 1
+        return self.value
+
+    @property
+    def ready(self):
+        return self.count >= self.period
+
+
+class RelativeStrengthIndex:
+    def __init__(self, period=14):
+        """
+        Wilder yumuşatmalı RSI. NaN içermeyen serilerde sonuçlar rsi() fonksiyonuyla aynıdır;
+        NaN kapanışlar atlanır.
+
+        Args:
+            period (int): RSI periyodu.
+        """
+        if period < 1:
+            raise ValueError("RSI periyodu en az 1 olmalıdır.")
+        self.period = period
+        self._gain = _WilderAverage(period)
+        self._loss = _WilderAverage(period)
+        self._previous = math.nan
+        self.value = math.nan
+
+    def update(self, close):
+        close = float(close)
+        if math.isnan(close):
+            return self.value
+        if math.isnan(self._previous):
+            self._previous = close
+            return self.value
+        delta = close - self._previous
+        self._previous = close
+        gain = self._gain.update(max(delta, 0.0))
+        loss = self._loss.update(max(-delta, 0.0))
+        if not self._gain.ready:
+            self.value = math.nan
+        elif loss == 0.0:
+            self.value = 100.0 if gain > 0.0 else math.nan
+        else:
+            self.value = 100.0 - 100.0 / (1.0 + gain / loss)
+        return self.value
+
+
+class AverageTrueRange:
+    def __init__(self, period=14):
+        """
+        Wilder yumuşatmalı ortalama gerçek aralık (ATR). İlk barın gerçek aralığı high - low'dur.
+
+        Args:
+            period (int): ATR periyodu.
+        """
+        if period < 1:
+            raise ValueError("ATR periyodu en az 1 olmalıdır.")
+        self.period = period
+        self._average = _WilderAverage(period)
+        self._previous_close = math.nan
+        self.value = math.nan
+
+    def update(self, high, low, close):
+        high, low, close = float(high), float(low), float(close)
+        true_range = high - low
+        if not math.isnan(self._previous_close):
+            true_range = max(true_range, abs(high - self._previous_close), abs(low - self._previous_close))
+        self._previous_close = close
+        average = self._average.update(true_range)
+        self.value = average if self._average.ready else math.nan
+        return self.value
+
+
+# --- Vektörel (tüm seri) hesaplamalar ---
+
+class IndicatorCache:
+    def __init__(self, maxsize=128):
+        """
+        Vektörel indikatör sonuçlarını (seri, indikatör, parametreler) anahtarıyla saklayan LRU önbellek.
+        Seri kimliği, dizinin bellek adresi, şekli, adımları ve tipidir; kaynak dizi önbellekte
+        tutulduğu sürece adres yeniden kullanılamaz. Seriler yerinde değiştirilmemelidir.
+
+        Args:
+            maxsize (int): Saklanacak en fazla sonuç sayısı.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _series_key(values):
+        interface = values.__array_interface__
+        return interface['data'][0], values.shape, interface['strides'], values.dtype.str
+
+    def get(self, name, sources, params, compute):
+        key = (name, tuple(self._series_key(source) for source in sources), params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = compute(*sources)
+        for array in (result if isinstance(result, tuple) else (result,)):
+            array.flags.writeable = False
+        self._entries[key] = (sources, result)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+cache = IndicatorCache()
+
+
+def _as_array(values):
+    return np.asarray(values.to_numpy() if isinstance(values, pd.Series) else values, dtype=np.float64)
+
+
+def _indicator(name, params, compute, *series, cached=True):
+    sources = tuple(_as_array(values) for values in series)
+    if not cached:
+        return compute(*sources)
+    return cache.get(name, sources, params, compute)
+
+
+def _wilder(values, period):
+    return pd.Series(values).ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean().to_numpy()
+
+
+def sma(values, window, cached=True):
+    """
+    Basit hareketli ortalama (RollingMean ile aynı sonuç).
+
+    Args:
+        values (pandas.Series or numpy.ndarray): Fiyat serisi.
+        window (int): Pencere boyutu.
+        cached (bool): Sonuç paylaşılan önbellekten alınsın/önbelleğe yazılsın.
+
+    Returns:
+        numpy.ndarray: İlk window - 1 değeri NaN olan seri (önbellekten geliyorsa salt okunur).
+    """
+    return _indicator('sma', (window,), lambda x: pd.Series(x).rolling(window).mean().to_numpy(),
+                      values, cached=cached)
+
+
+def ema(values, span, cached=True):
+    """
+    Üssel hareketli ortalama (ExponentialMovingAverage ile aynı sonuç; NaN değerler atlanır).
+    """
+    return _indicator('ema', (span,),
+                      lambda x: pd.Series(x).ewm(span=span, adjust=False, ignore_na=True).mean().to_numpy(),
+                      values, cached=cached)
+
+
+def wma(values, window, cached=True):
+    """
+    Doğrusal ağırlıklı hareketli ortalama (WeightedMovingAverage ile aynı sonuç).
+    """
+    def compute(x):
+        weights = np.arange(window, 0, -1, dtype=np.float64)
+        result = np.full(len(x), np.nan)
+        if len(x) >= window:
+            result[window - 1:] = np.convolve(x, weights, mode='valid') / weights.sum()
+        return result
+    return _indicator('wma', (window,), compute, values, cached=cached)
+
+
+def rolling_std(values, window, ddof=1, cached=True):
+    """
+    Sabit pencereli standart sapma (RollingStd ile aynı sonuç).
+    """
+    return _indicator('rolling_std', (window, ddof),
+                      lambda x: pd.Series(x).rolling(window).std(ddof=ddof).to_numpy(), values, cached=cached)
+
+
+def bollinger(values, window=20, num_std=2.0, ddof=0, cached=True):
+    """
+    Bollinger bantları (BollingerBands ile aynı sonuç).
+
+    Returns:
+        tuple: (orta, üst, alt) bant dizileri.
+    """
+    def compute(x):
+        middle = sma(x, window, cached=cached)
+        width = num_std * rolling_std(x, window, ddof, cached=cached)
+        return middle, middle + width, middle - width
+    return _indicator('bollinger', (window, num_std, ddof), compute, values, cached=cached)
+
+
+def rsi(values, period=14, cached=True):
+    """
+    Wilder yumuşatmalı RSI (RelativeStrengthIndex ile aynı sonuç).
+    """
+    def compute(x):
+        delta = np.diff(x, prepend=np.nan)
+        gain = _wilder(np.where(np.isnan(delta), np.nan, np.maximum(delta, 0.0)), period)
+        loss = _wilder(np.where(np.isnan(delta), np.nan, np.maximum(-delta, 0.0)), period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 100.0 - 100.0 / (1.0 + gain / loss)
+    return _indicator('rsi', (period,), compute, values, cached=cached)
+
+
+def atr(high, low, close, period=14, cached=True):
+    """
+    Wilder yumuşatmalı ortalama gerçek aralık (AverageTrueRange ile aynı sonuç).
+    """
+    def compute(h, l, c):
+        previous_close = np.roll(c, 1)
+        previous_close[:1] = np.nan
+        true_range = np.fmax(h - l, np.fmax(np.abs(h - previous_close), np.abs(l - previous_close)))
+        return _wilder(true_range, period)
+    return _indicator('atr', (period,), compute, high, low, close, cached=cached)
@@ -0,0 +1,55 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba kurulu değilse çekirdekler saf Python olarak çalışır
+    numba = None
+
+# Çekirdeklerin JIT ile derlenip derlenmediği (NUMBA_DISABLE_JIT=1 ile derleme kapatılabilir)
+JIT_AVAILABLE = numba is not None
+
+
+def compile_kernel(function):
+    """
+    Bar döngüsü çekirdeğini Numba ile derler; Numba yoksa fonksiyonu olduğu gibi döner.
+    Derleme ilk çağrıda yapılır ve sonuç __pycache__ altında önbelleğe alınır.
+
+    Çekirdekler şu imzayı uygular ve yalnızca NumPy dizileri ile skalerler kullanır:
+
+        kernel(inputs, params, out)
+
+    - inputs (numpy.ndarray): (girdi sayısı x bar sayısı) boyutlu float64 dizi (ör: kapanış,
+      indikatörler).
+    - params (numpy.ndarray): Parametrelerin float64 dizisi.
+    - out (numpy.ndarray): Her bar sonundaki hedef pozisyonun yazılacağı float64 dizi.
+
+    Args:
+        function (callable): Çekirdek fonksiyonu.
+
+    Returns:
+        callable: Derlenmiş (veya saf Python) çekirdek.
+    """
+    if numba is None:
+        return function
+    return numba.njit(cache=True, nogil=True)(function)
+
+
+def run_kernel(kernel, inputs, params):
+    """
+    Çekirdeği tüm seri üzerinde tek çağrıda çalıştırır.
+
+    Args:
+        kernel (callable): compile_kernel çıktısı.
+        inputs (numpy.ndarray or sequence): Girdi dizileri; tek boyutlu dizi tek girdi sayılır.
+        params (sequence): Sayısal parametreler.
+
+    Returns:
+        numpy.ndarray: Her bar için hedef pozisyon.
+    """
+    inputs = np.ascontiguousarray(inputs, dtype=np.float64)
+    if inputs.ndim == 1:
+        inputs = inputs[np.newaxis, :]
+    params = np.ascontiguousarray(params, dtype=np.float64)
+    out = np.zeros(inputs.shape[1], dtype=np.float64)
+    kernel(inputs, params, out)
+    return out
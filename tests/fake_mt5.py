@@ -0,0 +1,160 @@
+import types
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+# MetaTrader5.copy_rates_* fonksiyonlarının döndürdüğü yapılandırılmış dizi tipi
+RATES_DTYPE = np.dtype([
+    ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+    ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8'),
+])
+
+
+def make_rates(start, count, interval_seconds, seed=0):
+    """
+    Test için sentetik bar dizisi üretir.
+
+    Args:
+        start (datetime): İlk barın zamanı (UTC).
+        count (int): Bar sayısı.
+        interval_seconds (int): Barlar arası süre.
+        seed (int): Rastgele sayı üreteci tohumu.
+    """
+    rng = np.random.default_rng(seed)
+    rates = np.zeros(count, dtype=RATES_DTYPE)
+    start_ts = int(start.replace(tzinfo=timezone.utc).timestamp())
+    rates['time'] = start_ts + np.arange(count, dtype=np.int64) * interval_seconds
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, count))
+    rates['open'] = close
+    rates['high'] = close + 0.0002
+    rates['low'] = close - 0.0002
+    rates['close'] = close
+    rates['tick_volume'] = rng.integers(1, 100, count)
+    rates['spread'] = rng.integers(0, 20, count)
+    return rates
+
+
+# MetaTrader5.copy_ticks_* fonksiyonlarının döndürdüğü yapılandırılmış dizi tipi
+TICKS_DTYPE = np.dtype([
+    ('time', '<i8'), ('bid', '<f8'), ('ask', '<f8'), ('last', '<f8'), ('volume', '<u8'),
+    ('time_msc', '<i8'), ('flags', '<u4'), ('volume_real', '<f8'),
+])
+
+
+def make_ticks(start, count, mean_interval_ms=250, seed=0, digits=5):
+    """
+    Test için sentetik tick dizisi üretir (rastgele aralıklı, bid/ask ve değişken spread).
+
+    Args:
+        start (datetime): İlk tickin zamanı (UTC).
+        count (int): Tick sayısı.
+        mean_interval_ms (int): Tickler arası ortalama süre (ms).
+        seed (int): Rastgele sayı üreteci tohumu.
+        digits (int): Fiyat ondalık basamak sayısı.
+    """
+    rng = np.random.default_rng(seed)
+    ticks = np.zeros(count, dtype=TICKS_DTYPE)
+    start_ms = int(start.replace(tzinfo=timezone.utc).timestamp() * 1000)
+    ticks['time_msc'] = start_ms + np.cumsum(rng.integers(1, 2 * mean_interval_ms, count))
+    ticks['time'] = ticks['time_msc'] // 1000
+    point = 10.0 ** -digits
+    bid_points = np.round(1.1 / point) + np.cumsum(rng.integers(-2, 3, count))
+    ticks['bid'] = np.round(bid_points * point, digits)
+    ticks['ask'] = np.round((bid_points + rng.integers(1, 20, count)) * point, digits)
+    ticks['flags'] = 6
+    return ticks
+
+
+def _to_timestamp(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return int(value)
+
+
+class FakeMetaTrader5(types.ModuleType):
+    """
+    MetaTrader5 modülünün çevrimdışı testler için bellekte çalışan yerine geçeni.
+    Barlar `rates[(symbol, timeframe)]` altında tutulur ve çağrılar `calls` listesine yazılır.
+    """
+    TIMEFRAME_M1 = 1
+    TIMEFRAME_M5 = 5
+    TIMEFRAME_M15 = 15
+    TIMEFRAME_M30 = 30
+    TIMEFRAME_H1 = 16385
+    TIMEFRAME_H4 = 16388
+    TIMEFRAME_D1 = 16408
+    COPY_TICKS_ALL = -1
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    TRADE_ACTION_DEAL = 1
+    ORDER_TIME_GTC = 0
+    ORDER_FILLING_IOC = 1
+    TRADE_RETCODE_DONE = 10009
+
+    def __init__(self):
+        super().__init__('MetaTrader5')
+        self.rates = {}
+        self.ticks = {}
+        self.calls = []
+        # symbol_info_tick'in döndüğü son tick: sembol -> (time_msc, bid, ask)
+        self.last_tick = {}
+
+    def initialize(self, *args, **kwargs):
+        self.calls.append(('initialize', kwargs))
+        return True
+
+    def shutdown(self):
+        self.calls.append(('shutdown',))
+
+    def version(self):
+        return (500, 4874, 'fake')
+
+    def last_error(self):
+        return (1, 'Success')
+
+    def copy_rates_from_pos(self, symbol, timeframe, start_pos, count):
+        self.calls.append(('copy_rates_from_pos', symbol, timeframe, start_pos, count))
+        rates = self.rates.get((symbol, timeframe))
+        if rates is None:
+            return None
+        end = len(rates) - start_pos
+        return rates[max(end - count, 0):end].copy()
+
+    def copy_rates_range(self, symbol, timeframe, date_from, date_to):
+        self.calls.append(('copy_rates_range', symbol, timeframe, date_from, date_to))
+        rates = self.rates.get((symbol, timeframe))
+        if rates is None:
+            return None
+        mask = (rates['time'] >= _to_timestamp(date_from)) & (rates['time'] <= _to_timestamp(date_to))
+        return rates[mask].copy()
+
+    def copy_ticks_range(self, symbol, date_from, date_to, flags):
+        self.calls.append(('copy_ticks_range', symbol, date_from, date_to, flags))
+        ticks = self.ticks.get(symbol)
+        if ticks is None:
+            return None
+        from_ms = int(date_from.replace(tzinfo=date_from.tzinfo or timezone.utc).timestamp() * 1000)
+        to_ms = int(date_to.replace(tzinfo=date_to.tzinfo or timezone.utc).timestamp() * 1000)
+        mask = (ticks['time_msc'] >= from_ms) & (ticks['time_msc'] <= to_ms)
+        return ticks[mask].copy()
+
+    def symbol_info(self, symbol):
+        return types.SimpleNamespace(name=symbol, digits=5, visible=True)
+
+    def symbol_select(self, symbol, enable):
+        return True
+
+    def symbol_info_tick(self, symbol):
+        self.calls.append(('symbol_info_tick', symbol))
+        if symbol not in self.last_tick:
+            return None
+        time_msc, bid, ask = self.last_tick[symbol]
+        return types.SimpleNamespace(time=time_msc // 1000, time_msc=time_msc, bid=bid, ask=ask)
+
+    def order_send(self, request):
+        self.calls.append(('order_send', request))
+        return types.SimpleNamespace(retcode=self.TRADE_RETCODE_DONE, price=request['price'],
+                                     volume=request['volume'], order=len(self.calls))
@@ -0,0 +1,118 @@
+import asyncio
+import time
+import unittest
+import ccxt
+from connectors.async_binance_connector import AsyncBinanceConnector
+from core.rate_limiter import AsyncTokenBucket
+
+
+class FakeAsyncExchange:
+    """
+    ccxt.async_support borsalarının yerel yerine geçeni. Her çağrı gecikmeli yanıtlanır
+    ve eşzamanlı istek sayısı ölçülür.
+    """
+    rateLimit = 10
+
+    def __init__(self, has_fetch_tickers=True, delay=0.01):
+        self.has = {'fetchTickers': has_fetch_tickers}
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.closed = False
+
+    async def _request(self, name, result):
+        self.calls.append(name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return result
+
+    async def load_markets(self):
+        return await self._request('load_markets', {})
+
+    async def fetch_ticker(self, symbol):
+        return await self._request('fetch_ticker', {'symbol': symbol, 'last': 1.0})
+
+    async def fetch_tickers(self, symbols):
+        return await self._request('fetch_tickers', {s: {'symbol': s, 'last': 1.0} for s in symbols})
+
+    async def fetch_order(self, order_id, symbol):
+        if order_id == 'missing':
+            raise ccxt.OrderNotFound(order_id)
+        return await self._request('fetch_order', {'id': order_id, 'symbol': symbol, 'status': 'closed'})
+
+    async def fetch_balance(self):
+        raise ccxt.AuthenticationError("geçersiz anahtar")
+
+    async def close(self):
+        self.closed = True
+
+
+class TestAsyncBinanceConnector(unittest.TestCase):
+    def make_connector(self, exchange, rate_limiter=None):
+        connector = AsyncBinanceConnector('binance', 'key', 'secret', rate_limiter=rate_limiter)
+        connector.exchange = exchange
+        return connector
+
+    def test_batch_tickers_use_single_request(self):
+        async def scenario():
+            exchange = FakeAsyncExchange()
+            async with self.make_connector(exchange) as connector:
+                symbols = [f"COIN{i}/USDT" for i in range(60)]
+                tickers = await connector.fetch_tickers(symbols)
+            return exchange, tickers
+
+        exchange, tickers = asyncio.run(scenario())
+        self.assertEqual(len(tickers), 60)
+        self.assertEqual(exchange.calls, ['load_markets', 'fetch_tickers'])
+        self.assertTrue(exchange.closed, "HTTP oturumu kapatılmadı!")
+
+    def test_fallback_tickers_run_concurrently_within_rate_limit(self):
+        # Toplu uç nokta yoksa istekler eşzamanlı gider ama token hızını aşmaz.
+        async def scenario():
+            exchange = FakeAsyncExchange(has_fetch_tickers=False, delay=0.05)
+            bucket = AsyncTokenBucket(rate=200, capacity=10)
+            connector = self.make_connector(exchange, bucket)
+            await connector.initialize()
+            started = time.monotonic()
+            tickers = await connector.fetch_tickers([f"COIN{i}/USDT" for i in range(50)])
+            return exchange, tickers, time.monotonic() - started
+
+        exchange, tickers, elapsed = asyncio.run(scenario())
+        self.assertEqual(sum(ticker is not None for ticker in tickers.values()), 50)
+        self.assertGreater(exchange.peak, 1, "İstekler eşzamanlı gönderilmedi!")
+        # Kapasite (10) sonrası kalan 41 token saniyede 200 hızla gelir: en az ~0.2 sn
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 1.0)
+
+    def test_order_status_polling(self):
+        async def scenario():
+            connector = self.make_connector(FakeAsyncExchange())
+            await connector.initialize()
+            return await connector.fetch_orders([('1', 'BTC/USDT'), ('missing', 'ETH/USDT')])
+
+        statuses = asyncio.run(scenario())
+        self.assertEqual(statuses['1']['status'], 'closed')
+        self.assertIsNone(statuses['missing'])
+
+    def test_exchange_errors_propagate(self):
+        # Borsa hataları yutulmamalı, türüyle birlikte çağırana iletilmelidir.
+        async def scenario():
+            connector = self.make_connector(FakeAsyncExchange())
+            await connector.initialize()
+            return await connector.fetch_balance()
+
+        with self.assertRaises(ccxt.AuthenticationError):
+            asyncio.run(scenario())
+
+    def test_cost_above_capacity_is_rejected(self):
+        # Kapasiteyi aşan ağırlık sonsuza dek beklemek yerine hata vermelidir.
+        bucket = AsyncTokenBucket(rate=10, capacity=5)
+        with self.assertRaises(ValueError):
+            asyncio.run(asyncio.wait_for(bucket.acquire(6), timeout=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+import pandas as pd
+import numpy as np
+from data.bar_store import BarStore, cache_path_for, convert_csv, load_bars, read_bar_arrays
+
+
+class TestBarStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        np.random.seed(5)
+        # MT5 copy_rates çıktısıyla aynı sütunlara sahip örnek barlar
+        self.bars = pd.DataFrame({
+            'time': pd.date_range(start='2023-01-01', periods=500, freq='5min'),
+            'open': np.random.rand(500),
+            'high': np.random.rand(500),
+            'low': np.random.rand(500),
+            'close': np.random.rand(500),
+            'tick_volume': np.random.randint(1, 100, 500),
+            'spread': np.random.randint(0, 20, 500),
+            'real_volume': np.zeros(500, dtype=np.int64),
+        })
+        self.csv_path = os.path.join(self.tmp_dir, 'EURUSD', 'M5.csv')
+        os.makedirs(os.path.dirname(self.csv_path))
+        self.bars.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_csv_converted_on_first_use(self):
+        # İlk yüklemede CSV okunup depoya dönüştürülmeli, sonraki yükleme depodan yapılmalıdır.
+        first = load_bars(self.csv_path, 'time')
+        self.assertTrue(os.path.isdir(cache_path_for(self.csv_path)), "Bar deposu oluşturulmadı!")
+
+        second = load_bars(self.csv_path, 'time')
+        pd.testing.assert_frame_equal(first, second)
+        self.assertIsInstance(read_bar_arrays(cache_path_for(self.csv_path))['close'], np.memmap)
+
+    def test_stale_cache_rebuilt_when_csv_changes(self):
+        load_bars(self.csv_path, 'time')
+        changed = self.bars.iloc[:100]
+        time.sleep(0.01)
+        changed.to_csv(self.csv_path, index=False)
+        reloaded = load_bars(self.csv_path, 'time')
+        self.assertEqual(len(reloaded), 100, "CSV değiştiği halde eski depo kullanıldı!")
+
+    def test_store_append(self):
+        store = BarStore(self.tmp_dir)
+        store.write('GBPUSD', 'M5', self.bars.iloc[:300])
+        store.append('GBPUSD', 'M5', self.bars.iloc[300:])
+        pd.testing.assert_frame_equal(store.read('GBPUSD', 'M5'), self.bars)
+        self.assertEqual(store.last_timestamp('GBPUSD', 'M5'), self.bars['time'].iloc[-1])
+
+    def test_interrupted_rewrite_keeps_previous_version(self):
+        # Tam yazım yarıda kalırsa depo eski haliyle okunmalı; tamamlanınca eski dosyalar silinmelidir.
+        store = BarStore(self.tmp_dir)
+        store.write('GBPUSD', 'M5', self.bars)
+        reader = store.read('GBPUSD', 'M5')
+        changed = self.bars.assign(close=self.bars['close'] + 1.0)
+        with mock.patch('data.bar_store._write_meta', side_effect=OSError("disk dolu")):
+            with self.assertRaises(OSError):
+                store.write('GBPUSD', 'M5', changed.iloc[:100])
+        pd.testing.assert_frame_equal(store.read('GBPUSD', 'M5'), self.bars)
+
+        store.write('GBPUSD', 'M5', changed)
+        pd.testing.assert_frame_equal(store.read('GBPUSD', 'M5'), changed)
+        # Önceden açılmış okuyucu eski içeriği görmeye devam eder
+        pd.testing.assert_frame_equal(reader, self.bars)
+        files = [name for name in os.listdir(store.path('GBPUSD', 'M5')) if name.endswith('.bin')]
+        self.assertEqual(len(files), len(self.bars.columns))
+
+        store.append('GBPUSD', 'M5', changed.iloc[:10].assign(time=changed['time'].iloc[-1] + pd.Timedelta('5min')))
+        self.assertEqual(store.count('GBPUSD', 'M5'), len(self.bars) + 10)
+
+    def test_append_widens_column_instead_of_lossy_cast(self):
+        # Tamsayı sütuna eklenen ondalıklı/NaN değerler kesilmemeli; sütun genişletilmelidir.
+        store = BarStore(self.tmp_dir)
+        store.write('GBPUSD', 'M5', self.bars.iloc[:498])
+        tail = self.bars.iloc[498:].astype({'tick_volume': np.float64})
+        tail['tick_volume'] = [2.7, np.nan]
+        store.append('GBPUSD', 'M5', tail)
+        result = store.read('GBPUSD', 'M5')
+        self.assertEqual(result['tick_volume'].dtype, np.float64)
+        self.assertEqual(result['tick_volume'].iloc[-2], 2.7)
+        self.assertTrue(np.isnan(result['tick_volume'].iloc[-1]))
+        pd.testing.assert_frame_equal(result.iloc[:498], self.bars.iloc[:498], check_dtype=False)
+
+        # CSV parçalarında tür farklı çıkarılsa da (int -> float) değerler korunmalıdır
+        self.bars['real_volume'] = self.bars['real_volume'].astype(object)
+        self.bars.loc[450, 'real_volume'] = 0.5
+        self.bars.to_csv(self.csv_path, index=False)
+        store_path = convert_csv(self.csv_path, chunk_size=200)
+        self.assertEqual(read_bar_arrays(store_path)['real_volume'][450], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import time
+import unittest
+from unittest import mock
+from benchmarks.run_benchmarks import compare_to_baseline, make_ohlcv, run_suite
+
+
+def _crash(df, tmp_dir):
+    os._exit(3)
+
+
+def _hang(df, tmp_dir):
+    time.sleep(60)
+
+
+def result(component, bars, bars_per_second, peak_rss_mb):
+    return {'component': component, 'bars': bars, 'bars_per_second': bars_per_second, 'peak_rss_mb': peak_rss_mb}
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_make_ohlcv_is_consistent(self):
+        df = make_ohlcv(1000)
+        self.assertEqual(len(df), 1000)
+        self.assertTrue((df['high'] >= df[['open', 'close']].max(axis=1)).all())
+        self.assertTrue((df['low'] <= df[['open', 'close']].min(axis=1)).all())
+
+    def test_compare_to_baseline_flags_regressions(self):
+        baseline = [result('csv_load', 10000, 1000.0, 100.0), result('executor_full', 10000, 500.0, 80.0)]
+        current = [result('csv_load', 10000, 700.0, 100.0),     # %30 yavaşlama
+                   result('executor_full', 10000, 480.0, 130.0),  # bellek artışı
+                   result('bar_store_load', 10000, 1.0, 1.0)]     # temelde yok, atlanır
+        regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn('csv_load', regressions[0])
+        self.assertIn('RSS', regressions[1])
+        self.assertEqual(compare_to_baseline(baseline, baseline), [])
+
+    def test_run_suite_small(self):
+        results = run_suite([2000], ['strategy_vectorized', 'bar_store_load'], allocations=True)
+        self.assertEqual([r['component'] for r in results], ['strategy_vectorized', 'bar_store_load'])
+        for r in results:
+            self.assertGreater(r['bars_per_second'], 0)
+            self.assertGreater(r['peak_rss_mb'], 0)
+            self.assertIsNotNone(r['alloc_peak_mb'])
+
+    def test_crashed_measurement_is_reported(self):
+        # Sonuç vermeden ölen ölçüm süreci askıda bırakmamalı, başarısız ölçüm olarak raporlanmalıdır.
+        components = {'crash': (_crash, None), 'hang': (_hang, None)}
+        with mock.patch.dict('benchmarks.run_benchmarks.COMPONENTS', components):
+            results = run_suite([100], ['crash', 'hang'], allocations=False, timeout=2)
+        self.assertEqual([r['component'] for r in results], ['crash', 'hang'])
+        self.assertIn('3', results[0]['error'])
+        self.assertIn('süre', results[1]['error'])
+        regressions = compare_to_baseline(results, [result('crash', 100, 1.0, 1.0)])
+        self.assertEqual(len(regressions), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
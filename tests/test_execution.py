@@ -0,0 +1,127 @@
+import unittest
+import numpy as np
+import pandas as pd
+from connectors.vectorized_connector import VectorizedConnector
+from core.execution import FillSimulator, fill_partially
+from core.optimizer import ParameterSweep
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+def reference_partial(desired, capacity):
+    # Bar bar çalışan başvuru uygulaması
+    holdings = np.zeros(len(desired))
+    current = 0.0
+    for i in range(len(desired)):
+        need = desired[i] - current
+        current += np.sign(need) * min(abs(need), capacity[i])
+        holdings[i] = current
+    return holdings
+
+
+class TestExecution(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(21)
+        periods = 3000
+        dates = pd.date_range(start='2023-01-01', periods=periods, freq='5min')
+        close = 1.1 + 0.01 * np.sin(np.linspace(0, 30, periods)) + np.random.normal(0, 0.0003, periods)
+        self.data = pd.DataFrame({
+            'close': close,
+            'spread': np.random.randint(5, 25, periods),
+            'tick_volume': np.random.randint(50, 500, periods),
+        }, index=dates)
+        self.params = {'short_window': 20, 'long_window': 60}
+
+    def run_connector(self, execution=None, stake=1000):
+        return VectorizedConnector(MovingAverageStrategy, self.data, cash=10000, commission=0.0, stake=stake,
+                                   strategy_params=self.params, execution=execution).run()
+
+    def test_zero_cost_model_matches_default_simulation(self):
+        # Maliyetsiz model mevcut vektörel sonuçları birebir vermelidir.
+        base = self.run_connector()
+        free = self.run_connector({'spread_column': 'none'})
+        np.testing.assert_array_equal(free['equity'].to_numpy(), base['equity'].to_numpy())
+        self.assertEqual(free['execution_cost'], 0.0)
+
+    def test_spread_and_slippage_prices(self):
+        # Alımlar bid + spread + kayma, satışlar bid - kayma fiyatından gerçekleşmelidir.
+        execution = {'point': 0.00001, 'slippage': 2}
+        base = self.run_connector()
+        costly = self.run_connector(execution)
+        delta = np.diff(costly['positions'].to_numpy(), prepend=0.0)
+        close = self.data['close'].to_numpy()
+        spread = self.data['spread'].to_numpy()
+        expected_cost = np.sum(np.abs(delta) * np.where(delta > 0, spread + 2, 2) * 0.00001)
+        self.assertAlmostEqual(costly['execution_cost'], expected_cost, places=9)
+        self.assertAlmostEqual(base['final_value'] - costly['final_value'], expected_cost, places=6)
+
+        trades = costly['trades']
+        long_trade = trades[trades['size'] > 0].iloc[0]
+        i = self.data.index.get_loc(long_trade['entry_time'])
+        self.assertAlmostEqual(long_trade['entry_price'], close[i] + (spread[i] + 2) * 0.00001, places=12)
+        short_trade = trades[trades['size'] < 0].iloc[0]
+        i = self.data.index.get_loc(short_trade['entry_time'])
+        self.assertAlmostEqual(short_trade['entry_price'], close[i] - 2 * 0.00001, places=12)
+
+    def test_volume_impact_is_capped_by_deviation(self):
+        simulator = FillSimulator(point=0.0001, spread_column='none', slippage=1, impact=10, deviation=4)
+        data = pd.DataFrame({'tick_volume': [100, 100, 100]})
+        prices, costs = simulator.fill_prices(np.array([10.0, -20.0, 100.0]), np.ones(3), data)
+        # 10 / 100 hacim -> 1 + 1 puan, 20 / 100 -> 1 + 2 puan, 100 / 100 -> 11 puan sınırla 4
+        np.testing.assert_allclose(prices, [1.0002, 0.9997, 1.0004])
+        np.testing.assert_allclose(costs, [10 * 0.0002, 20 * 0.0003, 100 * 0.0004])
+
+    def test_latency_delays_fills(self):
+        base = self.run_connector()
+        delayed = self.run_connector({'spread_column': 'none', 'latency_bars': 3})
+        np.testing.assert_array_equal(delayed['positions'].to_numpy()[3:], base['positions'].to_numpy()[:-3])
+
+    def test_partial_fills_match_bar_by_bar_reference(self):
+        rng = np.random.default_rng(4)
+        desired = np.repeat(rng.choice([-3.0, 0.0, 2.0, 5.0], 60), rng.integers(1, 8, 60))
+        capacity = rng.uniform(0.2, 2.0, len(desired))
+        np.testing.assert_allclose(fill_partially(desired, capacity), reference_partial(desired, capacity))
+
+        # Bağlantı üzerinden: pozisyon hiçbir barda hacim sınırından fazla değişmemelidir
+        results = self.run_connector({'spread_column': 'none', 'max_participation': 0.5})
+        delta = np.abs(np.diff(results['positions'].to_numpy(), prepend=0.0))
+        self.assertTrue(np.all(delta <= self.data['tick_volume'].to_numpy() * 0.5 + 1e-9))
+        self.assertGreater(np.count_nonzero(delta), np.count_nonzero(
+            np.diff(self.run_connector()['positions'].to_numpy(), prepend=0.0)))
+
+    def test_partial_fill_trades_match_equity(self):
+        # Kısmi dolumlarda işlemler gidiş-dönüş olarak oluşmalı; kapanan işlemlerin net kârı sermaye değişimine eşit olmalıdır.
+        rng = np.random.default_rng(8)
+        targets = np.repeat(rng.choice([-3000.0, 0.0, 2000.0], 40), rng.integers(20, 60, 40))[:len(self.data) - 100]
+        targets = np.concatenate([targets, np.zeros(len(self.data) - len(targets))])
+        connector = VectorizedConnector(MovingAverageStrategy, self.data, cash=10000, commission=0.001,
+                                        execution={'point': 0.00001, 'max_participation': 0.5})
+        results = connector.simulate(targets)
+        trades = results['trades']
+        self.assertEqual(results['positions'].iloc[-1], 0.0)
+        self.assertTrue(trades['exit_time'].notna().all())
+        self.assertAlmostEqual(trades['pnl_net'].sum(), results['final_value'] - 10000, places=6)
+
+        # Her işlem sıfırdan açılır ve sıfıra döner (veya yön değiştirir)
+        signs = np.sign(targets)
+        expected = np.count_nonzero((signs != 0) & (signs != np.concatenate(([0.0], signs[:-1]))))
+        self.assertLessEqual(len(trades), expected)
+        self.assertTrue(np.all(np.sign(trades['size']) != 0))
+
+    def test_sweep_applies_execution_and_rejects_backtrader(self):
+        frame = self.data.reset_index(names='time')
+        grid = {'short_window': [10, 20], 'long_window': [60]}
+        plain = ParameterSweep(MovingAverageStrategy, frame, 'time', 'close', stake=1000,
+                               engine='vectorized', max_workers=1).run(grid)
+        costly = ParameterSweep(MovingAverageStrategy, frame, 'time', 'close', stake=1000,
+                                engine='vectorized', max_workers=1,
+                                execution={'point': 0.00001, 'slippage': 2}).run(grid)
+        merged = plain.merge(costly, on=['short_window', 'long_window'], suffixes=('', '_costly'))
+        self.assertTrue((merged['final_value_costly'] < merged['final_value']).all())
+
+        with self.assertRaises(ValueError):
+            ParameterSweep(MovingAverageStrategy, frame, 'time', 'close', engine='backtrader',
+                           execution={'slippage': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import pandas as pd
+import numpy as np
+from core.executer import Executor
+from strategy.exp_moving_average import MovingAverageStrategy
+from strategy.indicators import RollingMean, ExponentialMovingAverage
+
+
+class TestIncrementalExecutor(unittest.TestCase):
+    def setUp(self):
+        # Birden fazla crossover üretecek dalgalı bir fiyat serisi oluşturuyoruz
+        dates = pd.date_range(start='2023-01-01', periods=400, freq='h')
+        np.random.seed(7)
+        prices = 100 + 5 * np.sin(np.linspace(0, 12, 400)) + np.random.normal(0, 0.5, 400)
+        self.data = pd.DataFrame({'close': prices}, index=dates)
+
+    def test_incremental_matches_full_recomputation(self):
+        # Artımlı mod, her adımda tam yeniden hesaplama ile aynı sinyalleri üretmelidir.
+        full = Executor(MovingAverageStrategy, self.data, incremental=False).run()
+        incremental = Executor(MovingAverageStrategy, self.data).run()
+        self.assertEqual(len(full), len(self.data))
+        self.assertEqual(full, incremental, "Artımlı sinyaller tam hesaplamayla uyuşmuyor!")
+        self.assertIn("Alım sinyali", incremental)
+        self.assertIn("Satış sinyali", incremental)
+
+    def test_rolling_mean_matches_pandas(self):
+        values = self.data['close'].to_numpy()
+        rolling = RollingMean(40)
+        streamed = [rolling.update(value) for value in values]
+        expected = self.data['close'].rolling(window=40).mean().to_numpy()
+        np.testing.assert_allclose(streamed, expected, rtol=1e-12)
+
+    def test_ema_matches_pandas(self):
+        ema = ExponentialMovingAverage(14)
+        streamed = [ema.update(value) for value in self.data['close']]
+        expected = self.data['close'].ewm(span=14, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(streamed, expected, rtol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import threading
+import time
+import unittest
+from datetime import datetime
+from data.data_source.pipeline import BinanceSource, FetchJob, FetchPipeline, MT5Source
+from tests.fake_mt5 import make_rates
+
+
+class FakeExchange:
+    """
+    İstekleri gecikmeli yanıtlayan ve eşzamanlı istek sayısını ölçen sahte MT5 bağlantısı.
+    İlk `failures` istek hata verir.
+    """
+    def __init__(self, delay=0.02, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_historical_data(self, symbol, timeframe, bars):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            fail = self.failures > 0
+            self.failures -= 1
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if fail:
+            raise ConnectionError("bağlantı koptu")
+        return make_rates(datetime(2024, 1, 1), bars, 300)
+
+
+class FakeBinanceConnector:
+    exchange_name = 'binance'
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        return [[1704067200000 + i * 60000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(limit)]
+
+
+class TestFetchPipeline(unittest.TestCase):
+    def setUp(self):
+        self.written = []
+        self.lock = threading.Lock()
+
+    def writer(self, symbol, timeframe, df):
+        with self.lock:
+            self.written.append((symbol, timeframe, len(df)))
+
+    def test_concurrency_limit_per_source(self):
+        # Kaynak başına eşzamanlılık sınırı, işçi sayısından bağımsız olarak uygulanmalıdır.
+        exchange = FakeExchange()
+        source = MT5Source(exchange, bars=100, max_concurrency=2)
+        jobs = [FetchJob(source, f"SYM{i}", 'M5') for i in range(10)]
+        summary = FetchPipeline(self.writer, max_workers=8).run(jobs)
+
+        self.assertEqual(summary['succeeded'], 10)
+        self.assertEqual(summary['bars'], 1000)
+        self.assertLessEqual(exchange.peak, 2, "Eşzamanlılık sınırı aşıldı!")
+        self.assertEqual(len(self.written), 10)
+
+    def test_retry_with_backoff(self):
+        exchange = FakeExchange(delay=0, failures=2)
+        source = MT5Source(exchange, bars=10)
+        summary = FetchPipeline(self.writer, retries=3, backoff=0.001).run([FetchJob(source, 'EURUSD', 'M5')])
+        self.assertEqual(summary['succeeded'], 1)
+        self.assertEqual(summary['retries'], 2)
+
+        exchange = FakeExchange(delay=0, failures=5)
+        source = MT5Source(exchange, bars=10)
+        summary = FetchPipeline(self.writer, retries=1, backoff=0.001).run([FetchJob(source, 'EURUSD', 'M5')])
+        self.assertEqual(summary['succeeded'], 0)
+        self.assertEqual(len(summary['failed']), 1)
+
+    def test_binance_ohlcv_source(self):
+        source = BinanceSource(FakeBinanceConnector(), limit=500)
+        summary = FetchPipeline(self.writer).run([FetchJob(source, 'BTC/USDT', '1m'),
+                                                  FetchJob(source, 'ETH/USDT', '1m')])
+        self.assertEqual(summary['succeeded'], 2)
+        self.assertEqual(sorted(self.written), [('BTC/USDT', '1m', 500), ('ETH/USDT', '1m', 500)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+import numpy as np
+from data.bar_store import BarStore, load_bars
+from data.data_source.pipeline import rates_to_frame
+from tests.fake_mt5 import FakeMetaTrader5, make_rates
+
+# MetaTrader5 yalnızca Windows'ta kurulabildiği için modüller sahte terminal ile içe aktarılır
+with mock.patch.dict(sys.modules, {'MetaTrader5': FakeMetaTrader5()}):
+    from data.data_source.mt5 import mt5 as mt5_module
+    from data.data_source.mt5 import fetch_data_main
+
+
+class TestIncrementalSync(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeMetaTrader5()
+        patcher = mock.patch.object(mt5_module, 'mt5', self.fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.store = BarStore(self.tmp_dir)
+        self.exchange = mt5_module.MT5Exchange()
+        self.exchange.connect()
+
+        # Pazartesi başlayan 2000 adet M5 bar
+        self.history = make_rates(datetime(2024, 1, 1), 2000, 300)
+
+    def test_first_sync_downloads_and_later_syncs_append(self):
+        # İlk senkronizasyon tam indirme yapar, sonrakiler yalnızca yeni barları aralık sorgusuyla çeker.
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = self.history[:1500].copy()
+        report = fetch_data_main.sync_rates(self.exchange, self.store, 'EURUSD', 'M5', 5000)
+        self.assertEqual(report['new_bars'], 1500)
+
+        # Son kaydedilen bar oluşum halindeydi; terminalde kapanış fiyatı değişmiş olarak geri gelir
+        updated = self.history.copy()
+        updated['close'][1499] += 0.01
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = updated
+        self.fake.calls.clear()
+
+        report = fetch_data_main.sync_rates(self.exchange, self.store, 'EURUSD', 'M5', 5000)
+        self.assertEqual(report['new_bars'], 500)
+        self.assertEqual(report['total_bars'], 2000)
+        self.assertEqual([call[0] for call in self.fake.calls], ['copy_rates_range'])
+
+        stored = self.store.read('EURUSD', 'M5')
+        self.assertTrue(stored['time'].is_unique, "Dikiş noktasında tekrar eden bar var!")
+        np.testing.assert_allclose(stored['close'].to_numpy(), updated['close'])
+
+    def test_sync_without_new_bars(self):
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = self.history
+        fetch_data_main.sync_rates(self.exchange, self.store, 'EURUSD', 'M5', 5000)
+        report = fetch_data_main.sync_rates(self.exchange, self.store, 'EURUSD', 'M5', 5000)
+        self.assertEqual(report['new_bars'], 0)
+        self.assertEqual(self.store.count('EURUSD', 'M5'), 2000)
+
+    def test_sync_all_runs_through_pipeline(self):
+        # Artımlı senkronizasyon indirme hattından geçmeli; yeni barı olmayan iş hata sayılmamalıdır.
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = self.history[:1500].copy()
+        self.fake.rates[('GBPUSD', self.fake.TIMEFRAME_M5)] = self.history.copy()
+        summary, reports = fetch_data_main.sync_all(self.exchange, self.store, ['EURUSD', 'GBPUSD'], ['M5'], 5000,
+                                                    max_workers=2, retries=0)
+        self.assertEqual(summary['succeeded'], 2)
+        self.assertEqual([(r['symbol'], r['new_bars']) for r in reports], [('EURUSD', 1500), ('GBPUSD', 2000)])
+
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = self.history.copy()
+        self.fake.calls.clear()
+        summary, reports = fetch_data_main.sync_all(self.exchange, self.store, ['EURUSD', 'GBPUSD'], ['M5'], 5000,
+                                                    max_workers=2, retries=0)
+        self.assertEqual((summary['succeeded'], summary['failed']), (2, []))
+        self.assertEqual([r['new_bars'] for r in reports], [500, 0])
+        self.assertEqual({call[0] for call in self.fake.calls}, {'copy_rates_range'})
+        self.assertEqual(self.store.count('EURUSD', 'M5'), 2000)
+        self.assertTrue(self.store.read('EURUSD', 'M5')['time'].is_unique)
+
+    def test_existing_csv_seeds_store(self):
+        # CSV olup depo yokken senkronizasyon CSV'nin devamını çekmeli; load_bars eski CSV'ye dönmemelidir.
+        csv_path = os.path.join(self.tmp_dir, 'EURUSD', 'M5.csv')
+        os.makedirs(os.path.dirname(csv_path))
+        rates_to_frame(self.history[:1500]).to_csv(csv_path, index=False)
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = self.history.copy()
+
+        report = fetch_data_main.sync_rates(self.exchange, self.store, 'EURUSD', 'M5', 100)
+        self.assertEqual((report['new_bars'], report['total_bars']), (500, 2000))
+        loaded = load_bars(csv_path)
+        self.assertEqual(len(loaded), 2000)
+        self.assertTrue(loaded['time'].is_unique)
+
+    def test_gap_detection(self):
+        # Hafta içi eksik barlar raporlanmalı, hafta sonu kapanışı raporlanmamalıdır.
+        weekday_gap = np.delete(self.history, np.arange(100, 110))
+        self.fake.rates[('EURUSD', self.fake.TIMEFRAME_M5)] = weekday_gap
+        report = fetch_data_main.sync_rates(self.exchange, self.store, 'EURUSD', 'M5', 5000)
+        self.assertEqual(len(report['gaps']), 1)
+        self.assertEqual(report['gaps'][0][2], 10)
+
+        friday_close = datetime(2024, 1, 5, 21, 55)
+        monday_open = datetime(2024, 1, 7, 22, 0)
+        self.assertEqual(fetch_data_main.find_gaps([friday_close, monday_open], 300), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
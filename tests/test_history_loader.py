@@ -0,0 +1,90 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from data.bar_store import BarStore
+from data.data_source.binance.history_loader import OHLCVHistoryLoader, to_milliseconds
+
+START = to_milliseconds('2024-01-01')
+STEP = 60_000
+
+
+class FakeOHLCVConnector:
+    """
+    Her dakika için deterministik mum üreten sahte asenkron bağlantı.
+    `fail_after` istekten sonra bağlantı kesilmiş gibi hata fırlatır.
+    """
+    def __init__(self, last_candle, fail_after=None):
+        self.last_candle = last_candle
+        self.fail_after = fail_after
+        self.calls = 0
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise ConnectionError("bağlantı koptu")
+        await asyncio.sleep(0)
+        first = -(-since // STEP) * STEP
+        times = [t for t in range(first, first + limit * STEP, STEP) if t <= self.last_candle]
+        return [[t, t / STEP, t / STEP + 1, t / STEP - 1, t / STEP, 1.0] for t in times]
+
+
+class TestOHLCVHistoryLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.store = BarStore(self.tmp_dir)
+        self.until = START + 10_000 * STEP
+
+    def assert_complete(self, expected_bars):
+        stored = self.store.read('BTCUSDT', '1m')
+        minutes = (stored['time'].astype('int64') // 1_000_000 - START) // STEP
+        np.testing.assert_array_equal(minutes.to_numpy(), np.arange(expected_bars))
+
+    def test_paginated_concurrent_windows(self):
+        # 10.000 mum, 4 pencerede 500'lük sayfalarla indirilip sıralı tek depoya birleştirilmelidir.
+        connector = FakeOHLCVConnector(self.until)
+        loader = OHLCVHistoryLoader(connector, self.store, windows=4, limit=500)
+        report = asyncio.run(loader.load('BTC/USDT', '1m', START, self.until))
+
+        self.assertEqual(report['new_bars'], 10_000)
+        self.assert_complete(10_000)
+        self.assertFalse(any(name.endswith(('.json', '.part0')) for name in os.listdir(os.path.join(self.tmp_dir, 'BTCUSDT'))))
+
+    def test_resume_after_interruption(self):
+        loader = OHLCVHistoryLoader(FakeOHLCVConnector(self.until, fail_after=9), self.store,
+                                    windows=4, limit=500, retries=0)
+        with self.assertRaises(ConnectionError):
+            asyncio.run(loader.load('BTC/USDT', '1m', START, self.until))
+
+        # Yeniden başlatılan indirme yalnızca eksik sayfaları çekmelidir
+        connector = FakeOHLCVConnector(self.until)
+        loader = OHLCVHistoryLoader(connector, self.store, windows=4, limit=500)
+        asyncio.run(loader.load('BTC/USDT', '1m', START, self.until))
+        self.assert_complete(10_000)
+        self.assertLessEqual(connector.calls, 20 - 9 + 4)
+
+    def test_incremental_load_appends_new_candles(self):
+        loader = OHLCVHistoryLoader(FakeOHLCVConnector(self.until), self.store, windows=2, limit=1000)
+        asyncio.run(loader.load('BTC/USDT', '1m', START, START + 4_000 * STEP))
+        report = asyncio.run(loader.load('BTC/USDT', '1m', START, self.until))
+        self.assertEqual(report['new_bars'], 6_000)
+        self.assert_complete(10_000)
+
+    def test_forming_candle_is_not_stored(self):
+        # Oluşmakta olan mum depoya yazılmamalıdır; aksi halde sonraki yüklemeler onu hiç güncellemez.
+        now = to_milliseconds(pd.Timestamp.now(tz='UTC')) // STEP * STEP
+        loader = OHLCVHistoryLoader(FakeOHLCVConnector(now + STEP), self.store, windows=1, limit=50)
+        asyncio.run(loader.load('BTC/USDT', '1m', now - 100 * STEP))
+        finished = to_milliseconds(pd.Timestamp.now(tz='UTC')) // STEP * STEP
+        stored = self.store.read('BTCUSDT', '1m')['time'].astype('int64') // 1_000_000
+        self.assertGreaterEqual(len(stored), 100)
+        self.assertLess(stored.iloc[-1], finished)
+        self.assertTrue(stored.is_monotonic_increasing and stored.is_unique)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+import pandas as pd
+from core.executer import Executor
+from strategy import indicators
+from strategy.exp_moving_average import MovingAverageStrategy
+from strategy.indicators import (AverageTrueRange, BollingerBands, ExponentialMovingAverage,
+                                 RelativeStrengthIndex, RollingMean, RollingStd, WeightedMovingAverage)
+
+
+class TestIndicators(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(11)
+        close = 100 + np.cumsum(np.random.normal(0, 0.5, 600))
+        spread = np.abs(np.random.normal(0, 0.3, 600))
+        self.close = pd.Series(close)
+        self.high = self.close + spread
+        self.low = self.close - spread
+        indicators.cache.clear()
+
+    def stream(self, indicator, *series):
+        return np.array([indicator.update(*values) for values in zip(*series)])
+
+    def test_streaming_matches_vectorized(self):
+        cases = [
+            (RollingMean(20), indicators.sma(self.close, 20)),
+            (ExponentialMovingAverage(20), indicators.ema(self.close, 20)),
+            (WeightedMovingAverage(20), indicators.wma(self.close, 20)),
+            (RollingStd(20), indicators.rolling_std(self.close, 20)),
+            (RelativeStrengthIndex(14), indicators.rsi(self.close, 14)),
+        ]
+        for indicator, expected in cases:
+            with self.subTest(indicator=type(indicator).__name__):
+                np.testing.assert_allclose(self.stream(indicator, self.close), expected, rtol=1e-9)
+
+        np.testing.assert_allclose(self.stream(AverageTrueRange(14), self.high, self.low, self.close),
+                                   indicators.atr(self.high, self.low, self.close, 14), rtol=1e-9)
+        bands = BollingerBands(20, num_std=2.0)
+        streamed = np.array([bands.update(v) for v in self.close])
+        np.testing.assert_allclose(streamed.T, indicators.bollinger(self.close, 20, 2.0), rtol=1e-9)
+
+    def test_vectorized_matches_pandas(self):
+        np.testing.assert_allclose(indicators.rolling_std(self.close, 30),
+                                   self.close.rolling(30).std().to_numpy(), rtol=1e-12)
+        weights = np.arange(1, 11)
+        expected = self.close.rolling(10).apply(lambda w: np.dot(w, weights) / weights.sum(), raw=True)
+        np.testing.assert_allclose(indicators.wma(self.close, 10), expected.to_numpy(), rtol=1e-12)
+        values = indicators.rsi(self.close, 14)
+        self.assertTrue(np.isnan(values[:14]).all())
+        self.assertTrue(((values[14:] >= 0) & (values[14:] <= 100)).all())
+
+    def test_nan_values_in_window(self):
+        values = self.close.copy()
+        values[100] = np.nan
+        for indicator, expected in ((WeightedMovingAverage(10), indicators.wma(values, 10)),
+                                    (RollingStd(10), indicators.rolling_std(values, 10))):
+            with self.subTest(indicator=type(indicator).__name__):
+                np.testing.assert_allclose(self.stream(indicator, values), expected, rtol=1e-9)
+
+    def test_results_are_memoized(self):
+        first = indicators.sma(self.close, 20)
+        second = indicators.sma(self.close, 20)
+        self.assertIs(first, second)
+        self.assertFalse(first.flags.writeable)
+        self.assertIsNot(indicators.sma(self.close, 21), first)
+        self.assertIsNot(indicators.sma(self.close.copy(), 20), first)
+        self.assertEqual((indicators.cache.hits, indicators.cache.misses), (1, 3))
+
+    def test_ema_strategy_modes_agree(self):
+        # EMA türünde artımlı, tam hesaplamalı ve vektörel modlar aynı pozisyonları üretmelidir.
+        data = pd.DataFrame({'close': self.close.to_numpy()[:300]},
+                            index=pd.date_range('2024-01-01', periods=300, freq='h'))
+        params = {'short_window': 10, 'long_window': 30, 'ma_type': 'ema'}
+        incremental = Executor(MovingAverageStrategy, data, strategy_params=params).run()
+        full = Executor(MovingAverageStrategy, data, incremental=False, strategy_params=params).run()
+        self.assertEqual(incremental, full)
+
+        vectorized = MovingAverageStrategy(data, **params).generate_positions(data)
+        streamed = MovingAverageStrategy(data, **params)
+        expected = []
+        for bar in data.itertuples():
+            streamed.on_bar(bar)
+            streamed.execute()
+            expected.append(streamed.position)
+        np.testing.assert_array_equal(vectorized, expected)
+        self.assertIn("Alım sinyali", incremental)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from connectors.backtester_connector import BacktesterConnector, create_data_feed
+from connectors.vectorized_connector import VectorizedConnector
+from core.executer import Executor
+from core.journal import EVENT_FILL, EVENT_SIGNAL, SIDE_BUY, TradeJournal, read_journal
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestTradeJournal(unittest.TestCase):
+    def setUp(self):
+        dates = pd.date_range(start='2023-01-01', periods=1500, freq='5min')
+        np.random.seed(3)
+        prices = 100 + 5 * np.sin(np.linspace(0, 30, 1500)) + np.random.normal(0, 0.3, 1500)
+        self.data = pd.DataFrame({'close': prices}, index=dates)
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def test_engines_record_same_events(self):
+        # Vektörel motor ve Cerebro aynı sinyal ve gerçekleşme olaylarını üretmelidir.
+        vectorized = TradeJournal()
+        VectorizedConnector(MovingAverageStrategy, self.data, stake=10, journal=vectorized).run()
+
+        backtrader = TradeJournal()
+        frame = self.data.reset_index(names='time')
+        BacktesterConnector(MovingAverageStrategy, create_data_feed(frame, 'time', 'close'),
+                            stake=10, journal=backtrader).run()
+
+        expected = vectorized.to_frame()
+        actual = backtrader.to_frame()
+        self.assertGreater((expected['kind'] == EVENT_FILL).sum(), 2)
+        pd.testing.assert_frame_equal(actual.drop(columns='strategy_id'), expected.drop(columns='strategy_id'))
+
+    def test_executor_signals_match_positions(self):
+        journal = TradeJournal()
+        Executor(MovingAverageStrategy, self.data, journal=journal).run()
+        events = journal.to_frame()
+        self.assertTrue((events['kind'] == EVENT_SIGNAL).all())
+        self.assertEqual(events['side'].iloc[0] * events['side'].iloc[1], -1)
+        self.assertEqual(list(journal.strategies), ['MovingAverageStrategy'])
+
+    def test_chunked_flush_round_trip(self):
+        path = os.path.join(self.tmp_dir, 'journal.bars')
+        journal = TradeJournal(path, chunk_size=1000)
+        sid = journal.strategy_id('EURUSD_M5')
+        times = pd.date_range('2024-01-01', periods=2500, freq='s')
+        journal.record_many(times[:2000], EVENT_FILL, np.ones(2000), np.arange(2000.0), np.ones(2000), sid)
+        for t in times[2000:]:
+            journal.record(t, EVENT_SIGNAL, SIDE_BUY, 1.5, 2.0, sid)
+        journal.close()
+        self.assertEqual(len(journal), 2500)
+
+        events, strategies = read_journal(path)
+        self.assertEqual(strategies, {'EURUSD_M5': 0})
+        self.assertEqual(len(events), 2500)
+        np.testing.assert_array_equal(events['time'].to_numpy(), times.to_numpy())
+        self.assertEqual(events['kind'].dtype, np.int8)
+        self.assertEqual(events['price'].iloc[1999], 1999.0)
+
+        # Aynı yola yeni günlük açıldığında eski içerik değiştirilir
+        rerun = TradeJournal(path)
+        rerun.record(times[0], EVENT_SIGNAL, SIDE_BUY, 1.0, 1.0)
+        rerun.close()
+        self.assertEqual(len(read_journal(path)[0]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import numpy as np
+import pandas as pd
+from connectors.vectorized_connector import VectorizedConnector
+from strategy.base_strategy import Bar, BaseStrategy
+from strategy.exp_moving_average import MovingAverageStrategy, _crossover_kernel
+from strategy.kernels import compile_kernel, run_kernel
+
+
+def _threshold_kernel(inputs, params, out):
+    # Kapanış eşiğin üstündeyse alım, altındaysa pozisyon yok
+    close = inputs[0]
+    for i in range(out.shape[0]):
+        out[i] = 1.0 if close[i] > params[0] else 0.0
+
+
+_THRESHOLD_KERNEL = compile_kernel(_threshold_kernel)
+
+
+class ThresholdStrategy(BaseStrategy):
+    # Yalnızca çekirdek tanımlayan strateji
+    def initialize(self):
+        self.threshold = self.params.get('threshold', 100)
+
+    def on_data(self, new_data):
+        pass
+
+    def execute(self):
+        pass
+
+    def position_kernel(self):
+        return _THRESHOLD_KERNEL
+
+    def kernel_inputs(self, data):
+        return data['close'].to_numpy()
+
+    def kernel_params(self):
+        return [self.threshold]
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(23)
+        periods = 4000
+        dates = pd.date_range(start='2023-01-01', periods=periods, freq='h')
+        prices = 100 + 5 * np.sin(np.linspace(0, 50, periods)) + np.cumsum(np.random.normal(0, 0.2, periods))
+        self.data = pd.DataFrame({'close': prices}, index=dates)
+
+    def incremental_positions(self, params):
+        strategy = MovingAverageStrategy(None, **params)
+        positions = []
+        for time, close in zip(self.data.index, self.data['close']):
+            strategy.on_bar(Bar(time, close, close, close, close, 0))
+            strategy.execute()
+            positions.append(strategy.position)
+        return np.array(positions)
+
+    def test_kernel_matches_vectorized_crossover(self):
+        # Stop kapalıyken çekirdek, maskelerle hesaplanan pozisyonlarla aynı olmalıdır.
+        for ma_type in ('sma', 'ema'):
+            strategy = MovingAverageStrategy(self.data, short_window=15, long_window=60, ma_type=ma_type)
+            np.testing.assert_array_equal(strategy.run_kernel(self.data), strategy.generate_positions(self.data))
+
+    def test_trailing_stop_matches_bar_by_bar_execution(self):
+        # Yola bağımlı stop çekirdekte de bar bar execute ile aynı pozisyonları üretmelidir.
+        params = {'short_window': 15, 'long_window': 60, 'trailing_stop': 0.01}
+        strategy = MovingAverageStrategy(self.data, **params)
+        positions = strategy.generate_positions(self.data)
+        np.testing.assert_array_equal(positions, self.incremental_positions(params))
+
+        plain = MovingAverageStrategy(self.data, short_window=15, long_window=60).generate_positions(self.data)
+        self.assertGreater(np.count_nonzero(plain), np.count_nonzero(positions))
+
+    def test_pure_python_fallback_gives_same_result(self):
+        strategy = MovingAverageStrategy(self.data, short_window=15, long_window=60, trailing_stop=0.02)
+        inputs, params = strategy.kernel_inputs(self.data), strategy.kernel_params()
+        np.testing.assert_array_equal(run_kernel(_crossover_kernel, inputs, params),
+                                      run_kernel(strategy.position_kernel(), inputs, params))
+
+    def test_kernel_only_strategy_runs_vectorized(self):
+        strategy = ThresholdStrategy(self.data, threshold=100)
+        self.assertTrue(strategy.supports_vectorized())
+        results = VectorizedConnector(ThresholdStrategy, self.data, stake=1,
+                                      strategy_params={'threshold': 100}).run()
+        expected = (self.data['close'].to_numpy() > 100).astype(float)
+        np.testing.assert_array_equal(results['positions'].to_numpy()[1:], expected[:-1])
+
+    def test_invalid_trailing_stop(self):
+        with self.assertRaises(ValueError):
+            MovingAverageStrategy(self.data, trailing_stop=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
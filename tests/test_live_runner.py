@@ -0,0 +1,170 @@
+import sys
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+import pandas as pd
+from connectors.binance_connector import BinanceConnector
+from core.live_runner import BinanceBarSource, BinanceOrderRouter, LiveRunner
+from strategy.base_strategy import Bar
+from strategy.exp_moving_average import MovingAverageStrategy
+from tests.fake_mt5 import FakeMetaTrader5, make_rates
+
+# MetaTrader5 yalnızca Windows'ta kurulabildiği için modüller sahte terminal ile içe aktarılır
+with mock.patch.dict(sys.modules, {'MetaTrader5': FakeMetaTrader5()}):
+    from connectors import mt5_connector
+    from core.live_runner import MT5BarSource, MT5OrderRouter
+
+PARAMS = {'short_window': 5, 'long_window': 20}
+
+
+def expected_targets(bars, warmup):
+    # Aynı barlar üzerinde çevrimdışı artımlı çalıştırma; ısınma sonrası pozisyon değişimleri
+    strategy = MovingAverageStrategy(None, **PARAMS)
+    targets = []
+    for i, bar in enumerate(bars):
+        previous = strategy.position
+        strategy.on_bar(bar)
+        strategy.execute()
+        if i >= warmup and strategy.position != previous:
+            targets.append(strategy.position)
+    return targets
+
+
+def deltas(targets):
+    holdings, result = 0, []
+    for target in targets:
+        result.append(target - holdings)
+        holdings = target
+    return result
+
+
+class FakeExchange:
+    """
+    ccxt borsa nesnesinin çevrimdışı yerine geçeni; mumlar `candles` listesinden döner.
+    """
+    def __init__(self, candles):
+        self.candles = candles
+        self.orders = []
+        self.ohlcv_calls = []
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.ohlcv_calls.append((since, limit))
+        rows = [row for row in self.candles if since is None or row[0] >= since]
+        return rows[-limit:] if limit else rows
+
+    def create_market_order(self, symbol, side, amount):
+        self.orders.append((side, amount))
+        return {'id': str(len(self.orders)), 'average': self.candles[-1][4]}
+
+
+class TestLiveRunner(unittest.TestCase):
+    def setUp(self):
+        self.rates = make_rates(datetime(2024, 1, 1), 400, 60, seed=5)
+        self.bars = [Bar(pd.Timestamp(row['time'], unit='s'), row['open'], row['high'], row['low'],
+                         row['close'], row['tick_volume']) for row in self.rates]
+
+    def test_mt5_runner_processes_only_new_bars(self):
+        # Her yeni bar bir kez işlenmeli, geçmiş yeniden çekilmemeli ve emirler çevrimdışı
+        # artımlı çalıştırmayla aynı pozisyon değişimlerini izlemelidir.
+        fake = FakeMetaTrader5()
+        key = ('EURUSD', fake.TIMEFRAME_M1)
+        with mock.patch.object(mt5_connector, 'mt5', fake):
+            connector = mt5_connector.MetaTrader5Connector(1, 'x', 'demo')
+            source = MT5BarSource(connector, 'EURUSD', 'M1', mt5_module=fake)
+            router = MT5OrderRouter(connector, 'EURUSD', volume=0.1, mt5_module=fake)
+            runner = LiveRunner(MovingAverageStrategy, source, router, strategy_params=PARAMS, warmup=100)
+
+            # Son bar oluşum halindedir
+            fake.rates[key] = self.rates[:101].copy()
+            fake.last_tick['EURUSD'] = (int(self.rates['time'][100]) * 1000 + 500, 1.1, 1.1002)
+            runner.start()
+            self.assertEqual(runner.step(), 0)
+
+            for i in range(101, len(self.rates)):
+                fake.rates[key] = self.rates[:i + 1].copy()
+                fake.last_tick['EURUSD'] = (int(self.rates['time'][i]) * 1000 + 100, 1.1, 1.1002)
+                self.assertEqual(runner.step(), 1)
+                self.assertEqual(runner.step(), 0)
+            runner.wait_orders()
+            runner.stop()
+
+        self.assertEqual(runner.bars, len(self.rates) - 101)
+        rate_calls = [call for call in fake.calls if call[0] == 'copy_rates_from_pos']
+        self.assertTrue(all(call[4] <= 2 for call in rate_calls[1:]), "Geçmiş yeniden çekildi!")
+
+        expected = deltas(expected_targets(self.bars[:-1], 100))
+        self.assertGreater(len(expected), 2)
+        orders = [call[1] for call in fake.calls if call[0] == 'order_send']
+        sent = [order['volume'] / 0.1 * (1 if order['type'] == fake.ORDER_TYPE_BUY else -1) for order in orders]
+        self.assertEqual([round(value) for value in sent], expected)
+        self.assertEqual([order['price'] for order in orders],
+                         [1.1002 if value > 0 else 1.1 for value in expected])
+
+        report = runner.latency_report()
+        self.assertEqual(report['orders'], len(expected))
+        self.assertGreater(report['order_p99_us'], 0)
+        self.assertGreaterEqual(report['order_p99_us'], report['order_p50_us'])
+
+    def test_binance_runner_uses_since_and_skips_forming_candle(self):
+        # Sorgular son okunan mumdan sonrasını istemeli; oluşum halindeki son mum işlenmemelidir.
+        candles = [[int(bar.datetime.value // 1_000_000), bar.open, bar.high, bar.low, bar.close, bar.volume]
+                   for bar in self.bars]
+        exchange = FakeExchange(candles[:51])
+        connector = BinanceConnector('binance', 'key', 'secret')
+        connector.exchange = exchange
+        runner = LiveRunner(MovingAverageStrategy, BinanceBarSource(connector, 'BTC/USDT'),
+                            BinanceOrderRouter(connector, 'BTC/USDT', amount=0.5),
+                            strategy_params=PARAMS, warmup=50)
+        runner.start()
+        for i in range(52, len(candles) + 1):
+            exchange.candles = candles[:i]
+            self.assertEqual(runner.step(), 1)
+        runner.stop()
+
+        self.assertEqual(runner.bars, len(candles) - 51)
+        self.assertEqual(exchange.ohlcv_calls[1], (candles[49][0] + 1, None))
+        expected = deltas(expected_targets(self.bars[:-1], 50))
+        self.assertEqual([(1 if side == 'buy' else -1) * amount / 0.5 for side, amount in exchange.orders],
+                         expected)
+        self.assertEqual(runner.holdings, sum(expected))
+
+    def test_orders_do_not_block_the_data_loop(self):
+        # Emir gönderimi sürerken yeni barlar işlenmeye devam etmelidir.
+        release = threading.Event()
+
+        class SlowRouter:
+            def __init__(self):
+                self.sent = []
+
+            def send(self, delta):
+                release.wait(5)
+                self.sent.append(delta)
+                return 1.0, None
+
+        class ListSource:
+            def __init__(self, bars):
+                self.bars = bars
+
+            def history(self, count):
+                return self.bars[:count]
+
+            def poll(self):
+                return [self.bars.pop(count)] if len(self.bars) > count else []
+
+        count = 50
+        router = SlowRouter()
+        runner = LiveRunner(MovingAverageStrategy, ListSource(list(self.bars)), router,
+                            strategy_params=PARAMS, warmup=count)
+        runner.start()
+        processed = sum(runner.step() for _ in range(len(self.bars)))
+        self.assertEqual(processed, len(self.bars) - count)
+        self.assertEqual(router.sent, [])
+        release.set()
+        runner.wait_orders()
+        runner.stop()
+        self.assertEqual(router.sent, deltas(expected_targets(self.bars, count)))
+
+
+if __name__ == '__main__':
+    unittest.main()
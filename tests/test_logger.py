@@ -0,0 +1,75 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from core.executer import Executor
+from core.logger import Logger, SignalLog, configure_logging, flush_logging
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class CountingStr:
+    # Biçimlendirildiğinde sayaç artıran mesaj argümanı
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "değer"
+
+
+class TestLogger(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.addCleanup(configure_logging, {})
+        self.log_file = os.path.join(self.tmp_dir, 'logs', 'backtest.log')
+
+    def read_log(self):
+        self.assertTrue(flush_logging())
+        with open(self.log_file, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def test_messages_batched_to_log_file(self):
+        configure_logging({'level': 'INFO', 'log_file': self.log_file, 'console': False, 'batch_size': 16})
+        logger = Logger('tests.batched')
+        for i in range(100):
+            logger.info("satır %d", i)
+        lines = self.read_log()
+        self.assertEqual(len(lines), 100)
+        self.assertTrue(lines[-1].endswith("INFO - satır 99"))
+
+    def test_disabled_level_is_not_formatted(self):
+        configure_logging({'level': 'WARNING', 'log_file': self.log_file, 'console': False})
+        logger = Logger('tests.lazy')
+        value = CountingStr()
+        logger.info("gizli %s", value)
+        logger.error("görünür %s", value)
+        self.assertEqual(self.read_log()[-1].split(' - ', 1)[1], "ERROR - görünür değer")
+        self.assertEqual(value.calls, 1)
+
+    def test_executor_signals_are_summarized(self):
+        configure_logging({'level': 'INFO', 'log_file': self.log_file, 'console': False})
+        dates = pd.date_range(start='2023-01-01', periods=250, freq='h')
+        data = pd.DataFrame({'close': 100 + np.sin(np.linspace(0, 8, 250))}, index=dates)
+        Executor(MovingAverageStrategy, data, log_every=100).run()
+        summaries = [line for line in self.read_log() if 'sinyal özeti' in line]
+        self.assertEqual(len(summaries), 3)
+        self.assertIn("Adım 200-249", summaries[-1])
+        self.assertFalse(any('Üretilen sinyal' in line for line in self.read_log()))
+
+    def test_debug_level_logs_every_bar(self):
+        configure_logging({'level': 'DEBUG', 'log_file': self.log_file, 'console': False})
+        signal_log = SignalLog(Logger('tests.signals'), every=0)
+        for i in range(5):
+            signal_log.record(i, "Pozisyon değişmedi.")
+        signal_log.close()
+        lines = self.read_log()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(all(logging.getLevelName(logging.DEBUG) in line for line in lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
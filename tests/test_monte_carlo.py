@@ -0,0 +1,74 @@
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from connectors.vectorized_connector import VectorizedConnector
+from core.monte_carlo import MonteCarlo, summarize_simulations
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(22)
+        self.pnl = rng.normal(5, 100, 800)
+        dates = pd.date_range(start='2020-01-01', periods=1500, freq='D')
+        self.equity = pd.Series(10000 * np.cumprod(1 + rng.normal(0.0003, 0.01, 1500)), index=dates)
+
+    def test_shuffle_preserves_total_return(self):
+        # Karıştırma işlem sırasını değiştirir, toplamı değiştirmez; düşüşler ise sıraya bağlıdır.
+        results = MonteCarlo(trades=self.pnl, cash=10000, seed=1).shuffle_trades(500)
+        expected = self.pnl.sum() / 10000 * 100
+        np.testing.assert_allclose(results['returns'], expected)
+        self.assertGreater(results['max_drawdown'].std(), 0)
+        self.assertTrue(np.all(results['max_drawdown'] >= 0))
+
+    def test_chunking_keeps_shapes_and_distribution(self):
+        # Bellek sınırına göre parçalara bölmek simülasyon sayısını ve dağılımı değiştirmemelidir.
+        whole = MonteCarlo(trades=self.pnl, seed=3).bootstrap_trades(300)
+        chunked = MonteCarlo(trades=self.pnl, seed=3, max_memory_mb=0.5).bootstrap_trades(300)
+        self.assertEqual(len(chunked['returns']), 300)
+        # Parçalar farklı rastgele çekimler kullanır; dağılımlar yakın olmalıdır
+        self.assertAlmostEqual(whole['summary']['return_p50'], chunked['summary']['return_p50'], delta=5)
+
+        block = MonteCarlo(equity=self.equity, seed=3, max_memory_mb=0.1).block_bootstrap(200, block_size=30)
+        self.assertEqual(block['returns'].shape, (200,))
+        starts = MonteCarlo(equity=self.equity, seed=3).random_starts(200, length=250)
+        self.assertEqual(starts['max_drawdown'].shape, (200,))
+
+    def test_risk_of_ruin_and_summary(self):
+        # Başlangıçta arka arkaya kayıplar sermayeyi yarıya düşürür; sıralama ne olursa olsun son
+        # sermaye aynıdır ama iflas yalnızca kayıplar birikince gerçekleşir.
+        trades = np.array([-3000.0, -3000.0, 7000.0])
+        results = MonteCarlo(trades=trades, cash=10000, ruin_level=0.5, seed=0).shuffle_trades(2000)
+        # Kayıpların ikisi de kazançtan önce gelirse (1/3 olasılık) sermaye 4000'e iner
+        self.assertAlmostEqual(results['summary']['risk_of_ruin'], 1 / 3, delta=0.04)
+
+        summary = summarize_simulations(np.array([-1.0, 1.0, 3.0]), np.array([1.0, 2.0, 3.0]),
+                                        np.array([True, False, False]))
+        self.assertEqual(summary['simulations'], 3)
+        self.assertAlmostEqual(summary['prob_loss'], 1 / 3)
+        self.assertAlmostEqual(summary['drawdown_p50'], 2.0)
+
+    def test_run_on_backtest_results(self):
+        np.random.seed(7)
+        periods = 5000
+        dates = pd.date_range(start='2023-01-01', periods=periods, freq='h')
+        prices = 100 + 5 * np.sin(np.linspace(0, 60, periods)) + np.random.normal(0, 0.3, periods)
+        results = VectorizedConnector(MovingAverageStrategy, pd.DataFrame({'close': prices}, index=dates),
+                                      cash=10000, stake=10,
+                                      strategy_params={'short_window': 10, 'long_window': 50}).run()
+        table = MonteCarlo(equity=results['equity'], trades=results['trades'], seed=5).run(1000)
+        self.assertEqual(list(table.index), ['trade_shuffle', 'trade_bootstrap', 'block_bootstrap', 'random_start'])
+        self.assertTrue((table['simulations'] == 1000).all())
+
+        with self.assertRaises(ValueError):
+            MonteCarlo(trades=results['trades']).block_bootstrap(10)
+
+    def test_ten_thousand_simulations_are_fast(self):
+        started = time.perf_counter()
+        MonteCarlo(trades=np.tile(self.pnl, 3), equity=self.equity, seed=2).run(10000)
+        self.assertLess(time.perf_counter() - started, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import pandas as pd
+import numpy as np
+from core.optimizer import ParameterSweep, expand_grid
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestParameterSweep(unittest.TestCase):
+    def setUp(self):
+        dates = pd.date_range(start='2023-01-01', periods=2000, freq='h')
+        np.random.seed(11)
+        prices = 100 + 5 * np.sin(np.linspace(0, 40, 2000)) + np.random.normal(0, 0.3, 2000)
+        self.data = pd.DataFrame({'time': dates, 'close': prices})
+
+    def test_expand_grid(self):
+        # Aralıklar (stop dahil), listeler ve tekil değerler birlikte açılabilmelidir.
+        combinations = expand_grid({
+            'short_window': {'start': 10, 'stop': 30, 'step': 10},
+            'long_window': [100, 200],
+            'stake': 5,
+        })
+        self.assertEqual(len(combinations), 6)
+        self.assertIn({'short_window': 30, 'long_window': 200, 'stake': 5}, combinations)
+
+    def test_sweep_returns_ranked_table(self):
+        sweep = ParameterSweep(MovingAverageStrategy, self.data, 'time', 'close',
+                               cash=10000, commission=0.001, stake=10, max_workers=2)
+        grid = {'short_window': [10, 20, 150], 'long_window': [50, 100]}
+        table = sweep.run(grid, rank_by='final_value',
+                          constraint=lambda params: params['short_window'] < params['long_window'])
+
+        self.assertEqual(len(table), 4, "Geçersiz kombinasyonlar elenmedi!")
+        for column in ['short_window', 'long_window', 'final_value', 'sharpe', 'max_drawdown', 'trade_count']:
+            self.assertIn(column, table.columns)
+        self.assertTrue(table['final_value'].is_monotonic_decreasing, "Tablo sıralı değil!")
+
+    def test_vectorized_engine_matches_backtrader(self):
+        grid = {'short_window': [20], 'long_window': [100]}
+        common = dict(cash=10000, commission=0.001, stake=10, max_workers=1)
+        backtrader_row = ParameterSweep(MovingAverageStrategy, self.data, 'time', 'close', **common).run(grid)
+        vectorized_row = ParameterSweep(MovingAverageStrategy, self.data, 'time', 'close',
+                                        engine='vectorized', **common).run(grid)
+        self.assertAlmostEqual(backtrader_row['final_value'][0], vectorized_row['final_value'][0], places=6)
+        self.assertEqual(backtrader_row['trade_count'][0], vectorized_row['trade_count'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import pandas as pd
+import numpy as np
+from core.portfolio import PortfolioBacktest, align_to_index
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+def make_frame(start, periods, seed):
+    np.random.seed(seed)
+    dates = pd.date_range(start=start, periods=periods, freq='h')
+    prices = 100 + 5 * np.sin(np.linspace(0, 25, periods) + seed) + np.random.normal(0, 0.3, periods)
+    return pd.DataFrame({'time': dates, 'close': prices})
+
+
+class TestPortfolioBacktest(unittest.TestCase):
+    def setUp(self):
+        # Farklı zamanlarda başlayan ve farklı uzunluktaki üç varlık
+        self.frames = {
+            'EURUSD_H1': make_frame('2023-01-01', 1500, 1),
+            'GBPUSD_H1': make_frame('2023-01-10', 1200, 2),
+            'USDJPY_H1': make_frame('2023-01-05', 1000, 3).iloc[::2].reset_index(drop=True),
+        }
+
+    def run_engine(self, engine):
+        return PortfolioBacktest(MovingAverageStrategy, self.frames, 'time', 'close', cash=100000,
+                                 commission=0.001, stake=10, engine=engine).run()
+
+    def test_vectorized_matches_single_cerebro(self):
+        # Vektörel portföy sonucu, tüm varlıkların tek Cerebro'da çalıştırılmasıyla aynı olmalıdır.
+        vectorized = self.run_engine('vectorized')
+        backtrader = self.run_engine('backtrader')
+
+        self.assertAlmostEqual(vectorized['final_value'], backtrader['final_value'], places=6)
+        pd.testing.assert_series_equal(vectorized['assets']['trade_count'], backtrader['assets']['trade_count'])
+        self.assertAlmostEqual(vectorized['assets']['pnl'].sum(), vectorized['final_value'] - 100000, places=6)
+
+    def test_shared_index_alignment(self):
+        vectorized = self.run_engine('vectorized')
+        expected_index = pd.DatetimeIndex(sorted(set().union(*(f['time'] for f in self.frames.values()))))
+        pd.testing.assert_index_equal(vectorized['equity'].index, expected_index, check_names=False)
+
+    def test_align_to_index(self):
+        index = pd.date_range('2024-01-01', periods=6, freq='h').to_numpy()
+        aligned = align_to_index(index, index[[1, 3]], np.array([10.0, 20.0]), fill_before=0.0)
+        np.testing.assert_array_equal(aligned, [0.0, 10.0, 10.0, 20.0, 20.0, 20.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
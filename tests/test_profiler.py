@@ -0,0 +1,63 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from connectors.backtester_connector import BacktesterConnector, create_data_feed
+from core.executer import Executor
+from core.profiler import Profiler, configure_profiler, get_profiler
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        dates = pd.date_range(start='2023-01-01', periods=300, freq='h')
+        np.random.seed(3)
+        prices = 100 + 5 * np.sin(np.linspace(0, 10, 300)) + np.random.normal(0, 0.5, 300)
+        self.data = pd.DataFrame({'close': prices}, index=dates)
+        self.addCleanup(configure_profiler, {})
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = configure_profiler({})
+        Executor(MovingAverageStrategy, self.data).run()
+        self.assertEqual(profiler.report(), {'stages': {}, 'counters': {}})
+        self.assertIsNone(profiler.write_report())
+
+    def test_executor_stages_and_counters(self):
+        profiler = configure_profiler({'profile': True})
+        Executor(MovingAverageStrategy, self.data).run()
+        report = profiler.report()
+        self.assertEqual(report['counters']['bars'], 300)
+        for stage in ('indicators', 'signals'):
+            stats = report['stages'][stage]
+            self.assertEqual(stats['calls'], 300)
+            self.assertLessEqual(stats['p50_us'], stats['p99_us'])
+            self.assertLessEqual(stats['p99_us'], stats['max_us'])
+
+    def test_backtrader_report_written(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, 'profile.json')
+        profiler = configure_profiler({'profile': True, 'profile_report': path})
+
+        df = self.data.rename_axis('time').reset_index()
+        connector = BacktesterConnector(MovingAverageStrategy, create_data_feed(df, 'time', 'close'))
+        connector.summarize(connector.run())
+        self.assertEqual(profiler.write_report(), path)
+
+        with open(path) as f:
+            report = json.load(f)
+        for stage in ('feed_conversion', 'indicators', 'signals', 'orders', 'broker', 'backtest', 'aggregation'):
+            self.assertIn(stage, report['stages'])
+        self.assertEqual(report['counters']['bars'], 300)
+        self.assertGreater(report['counters']['commission'], 0)
+
+    def test_shared_instance(self):
+        self.assertIs(get_profiler(), configure_profiler({'profile': True}))
+        self.assertFalse(Profiler().enabled)
+
+
+if __name__ == '__main__':
+    unittest.main()
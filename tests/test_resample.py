@@ -0,0 +1,146 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+import numpy as np
+from data.bar_store import BarStore
+from connectors.backtester_connector import BacktesterConnector, create_data_feed
+from data.resample import (ResampleCache, add_timeframes, align_timeframe, resample_bars, timeframe_columns,
+                           timeframe_seconds)
+from strategy.base_strategy import BaseStrategy
+
+
+class TestResample(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        np.random.seed(11)
+        # Hafta sonu boşluğu olan M1 barları
+        times = pd.date_range(start='2023-01-06 20:00', periods=3000, freq='1min')
+        times = times[(times.dayofweek < 5)]
+        count = len(times)
+        close = 1.1 + np.cumsum(np.random.randn(count)) * 0.0001
+        self.bars = pd.DataFrame({
+            'time': times,
+            'open': close + np.random.randn(count) * 0.00005,
+            'high': close + 0.0003,
+            'low': close - 0.0003,
+            'close': close,
+            'tick_volume': np.random.randint(1, 100, count),
+            'spread': np.random.randint(0, 20, count),
+        })
+        self.store = BarStore(self.tmp_dir)
+        self.store.write('EURUSD', 'M1', self.bars)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _expected(self, rule):
+        # pandas resample ile aynı sonucu vermelidir
+        expected = self.bars.set_index('time').resample(rule, label='left', closed='left').agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last',
+            'tick_volume': 'sum', 'spread': 'last',
+        }).dropna().reset_index()
+        expected['tick_volume'] = expected['tick_volume'].astype(np.int64)
+        expected['spread'] = expected['spread'].astype(np.int64)
+        return expected
+
+    def test_timeframe_seconds(self):
+        self.assertEqual(timeframe_seconds('M3'), 180)
+        self.assertEqual(timeframe_seconds('H4'), 4 * 3600)
+        self.assertEqual(timeframe_seconds('D1'), 86400)
+        with self.assertRaises(ValueError):
+            timeframe_seconds('MN1')
+
+    def test_resample_matches_pandas(self):
+        # M3 ve H4 dahil tüm zaman dilimleri pandas resample ile aynı olmalıdır.
+        for timeframe, rule in [('M3', '3min'), ('M15', '15min'), ('H4', '4h'), ('D1', '1D')]:
+            result = resample_bars(self.bars, timeframe)
+            pd.testing.assert_frame_equal(result, self._expected(rule), check_dtype=False,
+                                          obj=timeframe)
+
+    def test_cache_derives_and_updates_incrementally(self):
+        # Türetilmiş depo yalnızca yeni taban barlar için güncellenmeli ve tam hesaplamayla aynı olmalıdır.
+        cache = ResampleCache(self.store)
+        self.store.write('EURUSD', 'M1', self.bars.iloc[:1000])
+        self.assertEqual(cache.base_timeframe('EURUSD', 'H4'), 'M1')
+        cache.get('EURUSD', 'H1')
+
+        self.store.append('EURUSD', 'M1', self.bars.iloc[1000:])
+        updated = cache.refresh('EURUSD', 'H1')
+        self.assertLess(updated, len(self._expected('1h')), "Tüm barlar yeniden hesaplandı!")
+        pd.testing.assert_frame_equal(cache.get('EURUSD', 'H1'), self._expected('1h'), check_dtype=False)
+        self.assertEqual(cache.refresh('EURUSD', 'H1'), 0)
+
+        # Türetilmiş depolar taban zaman dilimi olarak kullanılmaz
+        self.assertEqual(cache.native_timeframes('EURUSD'), ['M1'])
+
+    def test_cache_refreshes_rewritten_last_bar(self):
+        # Son taban bar satır sayısı değişmeden yerinde güncellenirse son türetilmiş bar da güncellenmelidir.
+        cache = ResampleCache(self.store)
+        cache.get('EURUSD', 'M15')
+
+        count = len(self.bars)
+        self.bars.loc[count - 1, 'high'] = 999.0
+        self.store.truncate('EURUSD', 'M1', count - 1)
+        self.store.append('EURUSD', 'M1', self.bars.iloc[count - 1:])
+        self.assertGreater(cache.refresh('EURUSD', 'M15'), 0)
+        derived = cache.get('EURUSD', 'M15')
+        self.assertEqual(derived['high'].iloc[-1], 999.0)
+        pd.testing.assert_frame_equal(derived, self._expected('15min'), check_dtype=False)
+        self.assertEqual(cache.refresh('EURUSD', 'M15'), 0)
+
+    def test_align_has_no_lookahead(self):
+        # Her taban bar yalnızca kapanmış yüksek zaman dilimi barını görmelidir.
+        higher = resample_bars(self.bars, 'H1')
+        aligned = align_timeframe(self.bars['time'].to_numpy(), 'M1', higher, 'H1')
+        self.assertEqual(len(aligned), len(self.bars))
+        self.assertTrue(np.isnan(aligned['close_H1'].iloc[0]))
+
+        # 21:59 barı kapandığında 21:00 saatlik barı tamamlanmıştır; 21:58 barında ise 20:00 barı görülür
+        times = self.bars['time']
+        at_close = aligned['close_H1'][times == pd.Timestamp('2023-01-06 21:59')].iloc[0]
+        before = aligned['close_H1'][times == pd.Timestamp('2023-01-06 21:58')].iloc[0]
+        self.assertEqual(at_close, self.bars.loc[times == pd.Timestamp('2023-01-06 21:59'), 'close'].iloc[0])
+        self.assertEqual(before, self.bars.loc[times == pd.Timestamp('2023-01-06 20:59'), 'close'].iloc[0])
+
+    def test_add_timeframes_from_csv_path(self):
+        # CSV yolundan sembol ve taban zaman dilimi çıkarılarak sütunlar eklenmelidir.
+        csv_path = os.path.join(self.tmp_dir, 'EURUSD', 'M1.csv')
+        df = add_timeframes(self.store.read('EURUSD', 'M1'), csv_path, ['M15', 'H4'])
+        for column in ['close_M15', 'high_H4', 'tick_volume_H4']:
+            self.assertIn(column, df.columns)
+        self.assertEqual(len(df), len(self.bars))
+        self.assertTrue(self.store.exists('EURUSD', 'H4'))
+
+    def test_timeframe_columns_reach_backtrader_strategy(self):
+        # Yüksek zaman dilimi sütunları backtrader akışında çizgi olarak bulunmalı ve strateji barına gelmelidir.
+        csv_path = os.path.join(self.tmp_dir, 'EURUSD', 'M1.csv')
+        df = add_timeframes(self.store.read('EURUSD', 'M1'), csv_path, ['H1'])
+        columns = timeframe_columns(df.columns, ['H1'])
+        self.assertEqual(columns[:2], ['open_H1', 'high_H1'])
+        self.assertNotIn('close', columns)
+
+        seen = []
+
+        class Recorder(BaseStrategy):
+            def initialize(self):
+                self.position = 0
+
+            def on_data(self, new_data):
+                pass
+
+            def on_bar(self, bar):
+                seen.append(bar.close_H1)
+
+            def execute(self):
+                pass
+
+        BacktesterConnector(Recorder, create_data_feed(df, 'time', 'close', columns)).run()
+        np.testing.assert_allclose(seen, df['close_H1'].to_numpy(), equal_nan=True)
+        with self.assertRaises(ValueError):
+            create_data_feed(df, 'time', 'close', ['close'])
+
+
+if __name__ == '__main__':
+    unittest.main()
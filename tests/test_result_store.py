@@ -0,0 +1,162 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from connectors.vectorized_connector import VectorizedConnector
+from core.metrics import summarize_vectorized
+from core.optimizer import ParameterSweep
+from core import result_store
+from core.result_store import KIND_BACKTEST, ResultStore, code_version, data_hash, run_key
+from core.walk_forward import WalkForward
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        np.random.seed(9)
+        periods = 2000
+        dates = pd.date_range(start='2023-01-01', periods=periods, freq='h')
+        prices = 100 + 5 * np.sin(np.linspace(0, 40, periods)) + np.random.normal(0, 0.3, periods)
+        self.data = pd.DataFrame({'time': dates, 'close': prices})
+        self.grid = {'short_window': [10, 20], 'long_window': [50, 80]}
+        self.store = ResultStore(self.tmp_dir)
+        self.addCleanup(self.store.close)
+
+    def test_keys_follow_data_params_and_settings(self):
+        # Aynı içerik aynı özeti vermeli; veri, parametre veya ayar değişikliği anahtarı değiştirmelidir.
+        digest = data_hash(self.data)
+        self.assertEqual(digest, data_hash(self.data.copy()))
+        changed = self.data.copy()
+        changed.loc[1000, 'close'] += 1e-9
+        self.assertNotEqual(digest, data_hash(changed))
+
+        settings = {'engine': 'vectorized', 'cash': 10000, 'strategy_class': MovingAverageStrategy}
+        key = run_key(digest, MovingAverageStrategy, {'short_window': 10}, settings)
+        self.assertEqual(key, run_key(digest, MovingAverageStrategy, {'short_window': 10}, dict(settings)))
+        self.assertNotEqual(key, run_key(digest, MovingAverageStrategy, {'short_window': 11}, settings))
+        self.assertNotEqual(key, run_key(digest, MovingAverageStrategy, {'short_window': 10},
+                                         {**settings, 'cash': 20000}))
+
+    def test_code_version_follows_engine_modules(self):
+        # Motor modüllerindeki (ör: emir veya metrik hesabı) değişiklikler kod sürümünü değiştirmelidir.
+        module_path = os.path.join(self.tmp_dir, 'engine_probe.py')
+        with open(module_path, 'w') as f:
+            f.write('FEE = 1\n')
+        sys.path.insert(0, self.tmp_dir)
+        self.addCleanup(sys.path.remove, self.tmp_dir)
+        with mock.patch('core.result_store.ENGINE_MODULES', ('engine_probe',)), \
+                mock.patch.dict('core.result_store._code_versions', clear=True):
+            before = code_version(MovingAverageStrategy)
+            with open(module_path, 'w') as f:
+                f.write('FEE = 2\n')
+            result_store._code_versions.clear()
+            self.assertNotEqual(before, code_version(MovingAverageStrategy))
+
+    def test_code_version_covers_each_strategy_module(self):
+        # Aynı paketten sonradan yüklenen bir strateji, öncekinin önbelleğe alınmış sürümünü almamalıdır.
+        package_path = os.path.join(self.tmp_dir, 'probe_strategies')
+        os.makedirs(package_path)
+        for name in ('__init__', 'first', 'second'):
+            with open(os.path.join(package_path, f'{name}.py'), 'w') as f:
+                f.write('' if name == '__init__' else f'class {name.title()}Strategy:\n    pass\n')
+        sys.path.insert(0, self.tmp_dir)
+        self.addCleanup(sys.path.remove, self.tmp_dir)
+        with mock.patch.dict(sys.modules), mock.patch.dict('core.result_store._code_versions', clear=True):
+            from probe_strategies.first import FirstStrategy
+            first = code_version(FirstStrategy)
+            from probe_strategies.second import SecondStrategy
+            self.assertNotEqual(first, code_version(SecondStrategy))
+
+            with open(os.path.join(package_path, 'second.py'), 'a') as f:
+                f.write('FEE = 2\n')
+            before = code_version(SecondStrategy)
+            result_store._code_versions.clear()
+            self.assertNotEqual(before, code_version(SecondStrategy))
+
+    def test_backtest_round_trip_and_query(self):
+        # Metrikler, sermaye eğrisi ve işlemler yeniden hesaplanmadan aynı şekilde geri okunmalıdır.
+        params = {'short_window': 10, 'long_window': 50}
+        results = VectorizedConnector(MovingAverageStrategy, self.data.set_index('time'), cash=10000,
+                                      stake=10, strategy_params=params).run()
+        metrics = summarize_vectorized(results)
+        digest = data_hash(self.data)
+        settings = {'engine': 'vectorized', 'cash': 10000, 'stake': 10}
+        key = run_key(digest, MovingAverageStrategy, params, settings)
+        self.assertIsNone(self.store.get(key))
+        self.store.put(key, KIND_BACKTEST, MovingAverageStrategy, params, settings, metrics,
+                       {'equity': results['equity'], 'trades': results['trades']}, data_digest=digest)
+
+        record = ResultStore(self.tmp_dir).get(key)
+        self.assertEqual(record['metrics'], metrics)
+        self.assertEqual(record['params'], params)
+        np.testing.assert_array_equal(record['equity']['equity'].to_numpy(), results['equity'].to_numpy())
+        pd.testing.assert_frame_equal(record['trades'], results['trades'], check_dtype=False)
+
+        table = self.store.runs(kind=KIND_BACKTEST, data_digest=digest)
+        self.assertEqual(table['key'].tolist(), [key])
+        self.assertEqual(table['short_window'].iloc[0], 10)
+        self.assertEqual(table['final_value'].iloc[0], metrics['final_value'])
+
+        self.store.delete(key)
+        self.assertIsNone(self.store.get(key))
+
+    def test_identical_sweep_is_served_from_store(self):
+        # İkinci tarama hiçbir kombinasyonu yeniden çalıştırmamalı ve aynı tabloyu dönmelidir.
+        sweep = ParameterSweep(MovingAverageStrategy, self.data, 'time', 'close', stake=10,
+                               engine='vectorized', max_workers=2, store=self.store)
+        first = sweep.run(self.grid, rank_by='final_value')
+        with mock.patch('core.optimizer.ProcessPoolExecutor', side_effect=AssertionError("yeniden hesaplandı")):
+            second = sweep.run(self.grid, rank_by='final_value')
+        pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+        # Yeni bir kombinasyon eklendiğinde yalnızca o kombinasyon hesaplanır
+        grid = {**self.grid, 'long_window': [50, 80, 120]}
+        table = sweep.run(grid, rank_by='final_value')
+        self.assertEqual(len(table), 6)
+        self.assertEqual(len(self.store.runs(strategy='MovingAverageStrategy')), 6)
+
+    def test_identical_walk_forward_is_served_from_store(self):
+        engine = WalkForward(MovingAverageStrategy, self.data, 'time', 'close', stake=10,
+                             engine='vectorized', max_workers=2, store=self.store)
+        first = engine.run(self.grid, 800, 400, warmup=80)
+        with mock.patch('core.walk_forward.ProcessPoolExecutor', side_effect=AssertionError("yeniden hesaplandı")):
+            second = engine.run(self.grid, 800, 400, warmup=80)
+        self.assertEqual(first['final_value'], second['final_value'])
+        pd.testing.assert_frame_equal(first['windows'], second['windows'], check_dtype=False)
+        np.testing.assert_array_equal(first['equity'].to_numpy(), second['equity'].to_numpy())
+
+        # Pencere ayarı farklıysa yeniden hesaplanır
+        third = engine.run(self.grid, 800, 400, warmup=40)
+        self.assertEqual(len(third['windows']), len(first['windows']))
+
+    def test_text_columns_round_trip(self):
+        # Metin sütunları (ör: ma_type, asset) NaN'a dönüşmeden geri okunmalıdır.
+        engine = WalkForward(MovingAverageStrategy, self.data, 'time', 'close', stake=10,
+                             engine='vectorized', max_workers=1, store=self.store)
+        grid = {**self.grid, 'ma_type': ['sma', 'ema']}
+        first = engine.run(grid, 800, 400, warmup=80)
+        with mock.patch('core.walk_forward.ProcessPoolExecutor', side_effect=AssertionError("yeniden hesaplandı")):
+            second = engine.run(grid, 800, 400, warmup=80)
+        self.assertEqual(second['windows']['ma_type'].tolist(), first['windows']['ma_type'].tolist())
+
+        trades = pd.DataFrame({'exit_time': pd.date_range('2023-01-01', periods=3, freq='h'),
+                               'asset': ['EURUSD', None, 'GBPUSD'], 'pnl_net': [1.0, None, -2.0]})
+        self.store.put('trades', KIND_BACKTEST, MovingAverageStrategy, {}, {}, {}, {'trades': trades})
+        stored = self.store.get('trades')['trades']
+        self.assertEqual(stored['asset'].tolist(), ['EURUSD', None, 'GBPUSD'])
+        pd.testing.assert_series_equal(stored['pnl_net'], trades['pnl_net'])
+
+        mixed = pd.DataFrame({'value': ['a', 1.0]})
+        with self.assertRaises(TypeError):
+            self.store.put('mixed', KIND_BACKTEST, MovingAverageStrategy, {}, {}, {}, {'values': mixed})
+        self.assertIsNone(self.store.get('mixed'))
+
+
+if __name__ == '__main__':
+    unittest.main()
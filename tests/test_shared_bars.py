@@ -0,0 +1,112 @@
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from unittest import mock
+from core import optimizer
+from core.optimizer import ParameterSweep, prepare_data, share_data
+from data.shared_bars import SharedBarsRegistry, attach_frame, can_share
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+def _worker_summary(registry):
+    # İşçide iki kez bağlanılan tablolar aynı belleği göstermeli ve salt okunur olmalıdır
+    first = registry.get('EURUSD', 'M5')
+    second = registry.get('EURUSD', 'M5')
+    close = first['close'].to_numpy()
+    return float(close.sum()), close.flags.writeable, np.shares_memory(close, second['close'].to_numpy())
+
+
+def _sweep_worker_probe(handle, params):
+    # İşçinin veri tablosu, bloğun kendisini göstermeli (yeniden hazırlanmış bir kopya değil)
+    from core import optimizer
+    close = optimizer._worker_data['close'].to_numpy()
+    shared = np.shares_memory(close, attach_frame(handle)['close'].to_numpy())
+    return shared, isinstance(optimizer._worker_data.index, pd.DatetimeIndex), optimizer._run_single(params)
+
+
+class TestSharedBars(unittest.TestCase):
+    def setUp(self):
+        periods = 5000
+        self.data = pd.DataFrame({
+            'time': pd.date_range(start='2023-01-01', periods=periods, freq='5min'),
+            'close': np.linspace(1.0, 2.0, periods),
+            'tick_volume': np.arange(periods, dtype=np.int64),
+        })
+        self.registry = SharedBarsRegistry()
+        self.addCleanup(self.registry.close)
+
+    def test_round_trip_is_read_only_view(self):
+        handle = self.registry.publish('EURUSD', 'M5', self.data)
+        self.assertLess(len(pickle.dumps(handle)), 1000)
+        frame = attach_frame(handle)
+        pd.testing.assert_frame_equal(frame, self.data)
+        with self.assertRaises(ValueError):
+            frame['close'].to_numpy()[0] = 5.0
+
+        # Zaman indeksli tablolar indeksleriyle geri kurulur
+        indexed = self.data.set_index('time')
+        restored = attach_frame(self.registry.publish('EURUSD', 'M5_indexed', indexed))
+        pd.testing.assert_frame_equal(restored, indexed)
+
+    def test_reference_counted_cleanup(self):
+        first = self.registry.publish('EURUSD', 'M5', self.data)
+        self.assertIs(self.registry.publish('EURUSD', 'M5', self.data), first)
+        self.assertEqual(self.registry.keys(), [('EURUSD', 'M5')])
+
+        self.registry.release('EURUSD', 'M5')
+        shared_memory.SharedMemory(name=first.segment).close()
+        self.registry.release('EURUSD', 'M5')
+        with self.assertRaises(KeyError):
+            self.registry.lookup('EURUSD', 'M5')
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=first.segment)
+
+    def test_workers_attach_without_copies(self):
+        self.registry.publish('EURUSD', 'M5', self.data)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_worker_summary, [self.registry] * 4))
+        for total, writeable, shared in results:
+            self.assertAlmostEqual(total, self.data['close'].sum())
+            self.assertFalse(writeable)
+            self.assertTrue(shared)
+
+        # İşçiye gönderilen kopya blokları silemez; blokları yalnızca kaydı oluşturan süreç siler
+        copy = pickle.loads(pickle.dumps(self.registry))
+        copy.close()
+        self.assertEqual(len(attach_frame(self.registry.lookup('EURUSD', 'M5'))), len(self.data))
+        segment = self.registry.lookup('EURUSD', 'M5').segment
+        self.registry.close()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=segment)
+
+    def test_vectorized_sweep_workers_use_shared_prepared_data(self):
+        # Vektörel taramada zaman indeksli veri ana süreçte hazırlanıp paylaşılmalı, işçiler kopyalamamalıdır.
+        frame = self.data.assign(close=1.0 + 0.1 * np.sin(np.linspace(0, 60, len(self.data))))
+        sweep = ParameterSweep(MovingAverageStrategy, frame, 'time', 'close', stake=10, engine='vectorized',
+                               max_workers=2)
+        with mock.patch('core.optimizer.share_data', wraps=optimizer.share_data) as shared:
+            table = sweep.run({'short_window': [10, 20], 'long_window': [50]})
+        self.assertEqual(shared.call_args[0][1].index.name, 'time')
+        self.assertEqual(len(table), 2)
+
+        params = {'short_window': 10, 'long_window': 50}
+        handle = share_data(self.registry, prepare_data(frame, sweep.settings))
+        with ProcessPoolExecutor(max_workers=1, initializer=optimizer._init_worker,
+                                 initargs=(handle, sweep.settings)) as executor:
+            shares, indexed, row = executor.submit(_sweep_worker_probe, handle, params).result()
+        self.assertTrue(shares)
+        self.assertTrue(indexed)
+        expected = table.set_index('short_window').loc[10, 'final_value']
+        self.assertAlmostEqual(row['final_value'], expected)
+
+    def test_non_numeric_frames_are_sent_as_is(self):
+        frame = self.data.assign(symbol='EURUSD')
+        self.assertFalse(can_share(frame))
+        self.assertIs(share_data(self.registry, frame), frame)
+
+
+if __name__ == '__main__':
+    unittest.main()
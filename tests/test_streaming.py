@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+import numpy as np
+import pandas as pd
+from connectors.backtester_connector import BacktesterConnector, create_data_feed, create_streaming_feed
+from core.executer import Executor
+from core.portfolio import PortfolioBacktest
+from data.bar_store import BarStream, cache_path_for, iter_bar_chunks, load_bars
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+def make_frame(periods, seed):
+    rng = np.random.default_rng(seed)
+    prices = 100 + 5 * np.sin(np.linspace(0, 40, periods) + seed) + rng.normal(0, 0.3, periods)
+    return pd.DataFrame({'time': pd.date_range('2023-01-02', periods=periods, freq='5min'),
+                         'close': prices, 'tick_volume': rng.integers(1, 100, periods)})
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.frame = make_frame(3000, 1)
+        self.csv_path = os.path.join(self.tmp_dir, 'EURUSD', 'M5.csv')
+        os.makedirs(os.path.dirname(self.csv_path))
+        self.frame.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_chunks_cover_store(self):
+        # CSV parça parça dönüştürülmeli ve parçalar birleştirildiğinde orijinal veriyi vermelidir.
+        stream = BarStream(self.csv_path, 'time', chunk_size=700)
+        chunks = list(stream)
+        self.assertEqual([len(chunk) for chunk in chunks[:-1]], [700] * (len(chunks) - 1))
+        self.assertEqual(len(stream), len(self.frame))
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), self.frame, check_dtype=False)
+        # Dönüştürülen depo load_bars tarafından da güncel kabul edilmelidir
+        pd.testing.assert_frame_equal(load_bars(self.csv_path), pd.concat(chunks, ignore_index=True))
+        self.assertEqual(len(list(iter_bar_chunks(cache_path_for(self.csv_path), 10000))), 1)
+
+    def test_executor_stream_matches_in_memory(self):
+        # Parça sınırlarında indikatör durumu korunmalı; sinyaller bellekteki çalıştırmayla aynı olmalıdır.
+        signals = Executor(MovingAverageStrategy, self.frame.set_index('time')).run()
+        counts = Executor(MovingAverageStrategy, None).run_stream(BarStream(self.csv_path, 'time', chunk_size=333))
+        self.assertEqual(counts, Counter(signals))
+
+    def test_streaming_feed_matches_pandas_feed(self):
+        # Akışlı veri akışı ve bellek tasarrufu modu, PandasData ile aynı sonuçları vermelidir.
+        expected = BacktesterConnector(MovingAverageStrategy, create_data_feed(self.frame, 'time', 'close'))
+        expected_summary = expected.summarize(expected.run())
+        streaming = BacktesterConnector(
+            MovingAverageStrategy,
+            create_streaming_feed(BarStream(self.csv_path, 'time', chunk_size=512), 'time', 'close'),
+            exactbars=True
+        )
+        self.assertEqual(streaming.summarize(streaming.run()), expected_summary)
+
+    def test_portfolio_with_streams(self):
+        # Portföyde akışlı varlıklar, yüklenmiş veriyle aynı sonucu vermelidir.
+        other = make_frame(2000, 2)
+        other_path = os.path.join(self.tmp_dir, 'GBPUSD', 'M5.csv')
+        os.makedirs(os.path.dirname(other_path))
+        other.to_csv(other_path, index=False)
+
+        loaded = PortfolioBacktest(MovingAverageStrategy, {'EURUSD': self.frame, 'GBPUSD': other}, 'time', 'close',
+                                   cash=100000, engine='backtrader').run()
+        streams = {'EURUSD': BarStream(self.csv_path, 'time', 1000), 'GBPUSD': BarStream(other_path, 'time', 1000)}
+        streamed = PortfolioBacktest(MovingAverageStrategy, streams, 'time', 'close', cash=100000,
+                                     engine='backtrader').run()
+        self.assertAlmostEqual(streamed['final_value'], loaded['final_value'], places=6)
+        pd.testing.assert_frame_equal(streamed['assets'], loaded['assets'])
+        with self.assertRaises(ValueError):
+            PortfolioBacktest(MovingAverageStrategy, streams, 'time', 'close', engine='vectorized').run()
+
+
+if __name__ == '__main__':
+    unittest.main()
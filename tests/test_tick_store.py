@@ -0,0 +1,126 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+import numpy as np
+import pandas as pd
+from data.tick_store import TickStore
+from tests.fake_mt5 import FakeMetaTrader5, make_ticks
+
+# MetaTrader5 yalnızca Windows'ta kurulabildiği için modüller sahte terminal ile içe aktarılır
+with mock.patch.dict(sys.modules, {'MetaTrader5': FakeMetaTrader5()}):
+    from data.data_source.mt5 import mt5 as mt5_module
+    from data.data_source.mt5 import fetch_data_main
+
+
+class TestTickStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        # Üç güne yayılan, ortalama 2 saniye aralıklı tickler
+        self.ticks = make_ticks(datetime(2024, 1, 1, 12), 100000, mean_interval_ms=2000, seed=3)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _assert_same(self, df, ticks):
+        self.assertEqual(len(df), len(ticks))
+        np.testing.assert_array_equal(df['time'].to_numpy().astype('datetime64[ms]').view(np.int64),
+                                      ticks['time_msc'])
+        np.testing.assert_allclose(df['bid'], ticks['bid'], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(df['ask'], ticks['ask'], rtol=0, atol=1e-12)
+
+    def test_round_trip_compressed_and_raw(self):
+        # Sıkıştırılmış ve bellek eşlemeli parçalar aynı tickleri geri vermelidir.
+        for compress in (True, False):
+            store = TickStore(os.path.join(self.tmp_dir, str(compress)), compress=compress)
+            self.assertEqual(store.append('EURUSD', self.ticks, digits=5), len(self.ticks))
+            self._assert_same(store.read('EURUSD'), self.ticks)
+            # Tickler günlük parçalara bölünür
+            self.assertEqual(len(store.chunks('EURUSD')), 3)
+
+        raw_bytes = self.ticks[['time_msc', 'bid', 'ask', 'last', 'volume_real', 'flags']].nbytes
+        folder = TickStore(os.path.join(self.tmp_dir, 'True')).path('EURUSD')
+        stored = sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder))
+        self.assertLess(stored, raw_bytes / 4, "Sıkıştırma etkili değil!")
+
+    def test_append_merges_last_day_and_skips_duplicates(self):
+        # Parça parça ekleme, tek seferde eklemeyle aynı depoyu üretmeli ve tekrar eden tickler atlanmalıdır.
+        store = TickStore(self.tmp_dir)
+        store.append('EURUSD', self.ticks[:40000])
+        self.assertEqual(store.append('EURUSD', self.ticks[30000:70000]), 30000)
+        store.append('EURUSD', pd.DataFrame(self.ticks[70000:]))
+        self._assert_same(store.read('EURUSD'), self.ticks)
+        self.assertEqual(store.count('EURUSD'), len(self.ticks))
+        self.assertEqual(store.last_time('EURUSD'), pd.Timestamp(int(self.ticks['time_msc'][-1]), unit='ms'))
+
+    def test_interrupted_merge_keeps_previous_chunk(self):
+        # Son günün parçası birleştirilirken yazım yarıda kalırsa depo önceki haliyle okunmalı,
+        # tamamlandığında eski parça dosyaları silinmelidir.
+        for compress in (True, False):
+            store = TickStore(os.path.join(self.tmp_dir, str(compress)), compress=compress)
+            store.append('EURUSD', self.ticks[:40000], digits=5)
+            with mock.patch.object(store, '_write_index', side_effect=OSError("disk dolu")):
+                with self.assertRaises(OSError):
+                    store.append('EURUSD', self.ticks[40000:45000])
+            self._assert_same(store.read('EURUSD'), self.ticks[:40000])
+
+            store.append('EURUSD', self.ticks[40000:])
+            self._assert_same(store.read('EURUSD'), self.ticks)
+            files = {entry['file'] for entry in store.chunks('EURUSD')}
+            stored = {name for name in os.listdir(store.path('EURUSD')) if name != 'index.json'}
+            self.assertEqual(stored - files, set(), "Eski parça dosyaları silinmedi!")
+
+    def test_compressed_deltas_are_narrowed(self):
+        # İlk değerler ayrı saklanmalı; zaman ve fiyat farkları int64'ten dar tiplerde tutulmalıdır.
+        store = TickStore(self.tmp_dir)
+        store.append('EURUSD', self.ticks, digits=5)
+        with np.load(os.path.join(store.path('EURUSD'), store.chunks('EURUSD')[0]['file'])) as encoded:
+            self.assertEqual(encoded['time'].dtype, np.int16)
+            self.assertEqual(encoded['bid'].dtype, np.int8)
+            self.assertEqual(encoded['time_base'][0], self.ticks['time_msc'][0])
+        self._assert_same(store.read('EURUSD'), self.ticks)
+
+    def test_append_keeps_ticks_sharing_last_millisecond(self):
+        # Son tickle aynı milisaniyedeki tickler atlanmamalı; son milisaniye yeniden eklendiğinde çiftlenmemelidir.
+        ticks = self.ticks[:1000].copy()
+        ticks['time_msc'][500:503] = ticks['time_msc'][500]
+        store = TickStore(self.tmp_dir)
+        store.append('EURUSD', ticks[:501], digits=5)
+        self.assertEqual(store.append('EURUSD', ticks[500:]), 499)
+        self.assertEqual(store.count('EURUSD'), 1000)
+        self._assert_same(store.read('EURUSD'), ticks)
+
+    def test_iter_chunks_range(self):
+        # Aralık sorgusu yalnızca ilgili günleri okumalı ve sınırları doğru kesmelidir.
+        store = TickStore(self.tmp_dir)
+        store.append('EURUSD', self.ticks)
+        chunks = list(store.iter_chunks('EURUSD', '2024-01-02 06:00', '2024-01-02 18:00'))
+        self.assertEqual(len(chunks), 1)
+        times = pd.to_datetime(self.ticks['time_msc'], unit='ms')
+        expected = ((times >= '2024-01-02 06:00') & (times < '2024-01-02 18:00')).sum()
+        self.assertEqual(len(chunks[0]['time']), expected)
+
+    def test_sync_ticks_is_incremental(self):
+        # İlk senkronizasyon son günleri, sonrakiler yalnızca yeni tickleri günlük isteklerle çekmelidir.
+        fake = FakeMetaTrader5()
+        with mock.patch.object(mt5_module, 'mt5', fake):
+            exchange = mt5_module.MT5Exchange()
+            fake.ticks['EURUSD'] = self.ticks[:60000]
+            store = TickStore(self.tmp_dir)
+            now = datetime(2024, 1, 4, tzinfo=timezone.utc)
+            added = fetch_data_main.sync_ticks(exchange, store, 'EURUSD', 5, now=now)
+            self.assertEqual(added, 60000)
+            self.assertEqual(sum(call[0] == 'copy_ticks_range' for call in fake.calls), 5)
+
+            fake.ticks['EURUSD'] = self.ticks
+            fake.calls.clear()
+            self.assertEqual(fetch_data_main.sync_ticks(exchange, store, 'EURUSD', 5, now=datetime(2024, 1, 5, tzinfo=timezone.utc)),
+                             len(self.ticks) - 60000)
+            self._assert_same(store.read('EURUSD'), self.ticks)
+
+
+if __name__ == '__main__':
+    unittest.main()
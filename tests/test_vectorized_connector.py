@@ -0,0 +1,68 @@
+import unittest
+import pandas as pd
+import numpy as np
+import backtrader as bt
+from connectors.backtester_connector import BacktesterConnector
+from connectors.vectorized_connector import VectorizedConnector
+from core.executer import Executor
+from core.optimizer import ParameterSweep
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestVectorizedConnector(unittest.TestCase):
+    def setUp(self):
+        # Birden fazla alım/satış crossover'ı içeren sentetik veri seti
+        dates = pd.date_range(start='2023-01-01', periods=1500, freq='5min')
+        np.random.seed(3)
+        prices = 100 + 5 * np.sin(np.linspace(0, 30, 1500)) + np.random.normal(0, 0.3, 1500)
+        self.data = pd.DataFrame({'close': prices}, index=dates)
+
+    def test_positions_match_incremental_strategy(self):
+        # Vektörel pozisyonlar, bar bar yürütülen stratejinin pozisyonlarıyla aynı olmalıdır.
+        executor = Executor(MovingAverageStrategy, self.data)
+        positions = []
+        for bar in self.data.itertuples():
+            executor.strategy.on_bar(bar)
+            executor.strategy.execute()
+            positions.append(executor.strategy.position)
+
+        vectorized = MovingAverageStrategy(self.data).generate_positions(self.data)
+        np.testing.assert_array_equal(vectorized, positions)
+
+    def test_parity_with_backtrader(self):
+        # Vektörel motorun sonucu, Cerebro ile olay tabanlı çalıştırmayla aynı olmalıdır.
+        frame = self.data.reset_index(names='time')
+        data_feed = bt.feeds.PandasData(
+            dataname=frame, datetime='time', open='close', high='close', low='close',
+            close='close', volume=-1, openinterest=-1
+        )
+        connector = BacktesterConnector(MovingAverageStrategy, data_feed, cash=10000,
+                                        commission=0.001, stake=10)
+        results = connector.run()
+        closed_trades = connector.summarize(results)['trade_count']
+
+        vectorized = VectorizedConnector(MovingAverageStrategy, self.data, cash=10000,
+                                         commission=0.001, stake=10).run()
+
+        self.assertAlmostEqual(vectorized['final_value'], connector.cerebro.broker.getvalue(), places=6)
+        trades = vectorized['trades']
+        self.assertEqual(int(trades['exit_price'].notna().sum()), closed_trades)
+        self.assertGreater(closed_trades, 0, "Test verisi işlem üretmedi!")
+
+    def test_custom_price_column(self):
+        # Strateji, price_column ne olursa olsun fiyatı 'close' olarak görmelidir (kernel yolu dahil).
+        frame = pd.DataFrame({'bid': self.data['close'], 'close': 1.0}, index=self.data.index)
+        for params in ({}, {'trailing_stop': 0.02}):
+            expected = VectorizedConnector(MovingAverageStrategy, self.data, stake=10, strategy_params=params).run()
+            result = VectorizedConnector(MovingAverageStrategy, frame, stake=10, price_column='bid',
+                                         strategy_params=params).run()
+            np.testing.assert_array_equal(result['positions'].to_numpy(), expected['positions'].to_numpy())
+            self.assertAlmostEqual(result['final_value'], expected['final_value'])
+
+        table = ParameterSweep(MovingAverageStrategy, frame[['bid']].reset_index(names='time'), 'time', 'bid',
+                               stake=10, engine='vectorized', max_workers=1).run({'short_window': [10, 20]})
+        self.assertEqual(len(table), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+import pandas as pd
+from core.optimizer import evaluate_params, prepare_data
+from core.walk_forward import WalkForward, date_range_positions, walk_forward_windows
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class TestWalkForward(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(5)
+        periods = 3000
+        dates = pd.date_range(start='2023-01-01', periods=periods, freq='h')
+        prices = 100 + 5 * np.sin(np.linspace(0, 60, periods)) + np.random.normal(0, 0.3, periods)
+        self.data = pd.DataFrame({'time': dates, 'close': prices})
+        self.grid = {'short_window': [10, 20], 'long_window': [50, 80]}
+
+    def test_rolling_and_anchored_windows(self):
+        times = self.data['time'].to_numpy()
+        rolling = walk_forward_windows(times, 1000, 500)
+        self.assertEqual(rolling, [(0, 1000, 1500), (500, 1500, 2000), (1000, 2000, 2500), (1500, 2500, 3000)])
+        anchored = walk_forward_windows(times, 1000, 500, anchored=True)
+        self.assertEqual([w[0] for w in anchored], [0, 0, 0, 0])
+        self.assertEqual([w[1:] for w in anchored], [w[1:] for w in rolling])
+
+        by_duration = walk_forward_windows(times, '40D', '10D')
+        self.assertEqual(by_duration[0], (0, 960, 1200))
+        self.assertEqual(by_duration[1], (240, 1200, 1440))
+
+    def test_weekend_out_of_sample_days_are_skipped(self):
+        # Yalnızca hafta içi barları olan veride hafta sonuna denk gelen örneklem dışı gün atlanmalıdır.
+        dates = pd.date_range(start='2023-01-02', periods=24 * 40, freq='h')
+        dates = dates[dates.dayofweek < 5]
+        rng = np.random.default_rng(3)
+        data = pd.DataFrame({'time': dates, 'close': 100 + np.cumsum(rng.normal(0, 0.2, len(dates)))})
+        windows = walk_forward_windows(data['time'].to_numpy(), '10D', '1D')
+        self.assertTrue(all(oos_end > oos_start for _, oos_start, oos_end in windows))
+        self.assertFalse(any(pd.Timestamp(dates[oos_start]).dayofweek >= 5 for _, oos_start, _ in windows))
+
+        result = WalkForward(MovingAverageStrategy, data, 'time', 'close', stake=10, engine='vectorized',
+                             max_workers=1).run(self.grid, '10D', '1D', warmup=20)
+        self.assertEqual(len(result['windows']), len(windows))
+        self.assertEqual(len(result['equity']), sum(end - start for _, start, end in windows))
+
+    def test_date_range_positions(self):
+        times = self.data['time'].to_numpy()
+        self.assertEqual(date_range_positions(times, '2023-01-02', '2023-01-03'), (24, 72))
+        self.assertEqual(date_range_positions(times), (0, 3000))
+
+    def test_out_of_sample_results_match_direct_runs(self):
+        engine = WalkForward(MovingAverageStrategy, self.data, 'time', 'close', cash=10000,
+                             commission=0.001, stake=10, engine='vectorized', max_workers=2)
+        result = engine.run(self.grid, 1000, 500, warmup=80, rank_by='final_value')
+        windows = result['windows']
+        self.assertEqual(len(windows), 4)
+
+        # Her pencerenin örneklem dışı getirisi, seçilen parametrelerle doğrudan çalıştırmayla aynı olmalıdır
+        settings = {**engine.settings}
+        prepared = prepare_data(self.data, settings)
+        first = windows.iloc[0]
+        _, direct = evaluate_params(prepared.iloc[920:1500], settings,
+                                    {'short_window': int(first['short_window']),
+                                     'long_window': int(first['long_window'])})
+        expected = direct['equity'].iloc[-1] / direct['equity'].iloc[79]
+        self.assertAlmostEqual(first['oos_return'], (expected - 1) * 100, places=9)
+
+        equity = result['equity']
+        self.assertEqual(len(equity), 2000)
+        self.assertTrue(equity.index.is_monotonic_increasing)
+        self.assertAlmostEqual(equity.iloc[-1], result['final_value'], places=6)
+        self.assertAlmostEqual(result['final_value'], 10000 * np.prod(1 + windows['oos_return'] / 100), places=6)
+
+    def test_overlapping_windows_rejected(self):
+        engine = WalkForward(MovingAverageStrategy, self.data, 'time', 'close', engine='vectorized')
+        with self.assertRaises(ValueError):
+            engine.run(self.grid, 1000, 500, step=250)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from core.distributed import DistributedSweep, QueueWorker
+from core.optimizer import ParameterSweep
+from core.walk_forward import WalkForward
+from core.work_queue import WorkQueue
+from data.bar_store import BarStore
+from strategy.exp_moving_average import MovingAverageStrategy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_worker(queue_path, name):
+    QueueWorker(queue_path, name=name, poll_interval=0.05).run(idle_timeout=1.0)
+
+
+class TestWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.queue_path = os.path.join(self.tmp_dir, 'queue.sqlite')
+        self.clock = FakeClock()
+
+    def open_queue(self, **kwargs):
+        queue = WorkQueue(self.queue_path, lease_seconds=10, max_attempts=2, clock=self.clock, **kwargs)
+        self.addCleanup(queue.close)
+        return queue
+
+    def test_jobs_are_leased_once_and_resubmission_is_idempotent(self):
+        coordinator, worker_a, worker_b = self.open_queue(), self.open_queue(), self.open_queue()
+        self.assertEqual(coordinator.submit('s', {'engine': 'vectorized'}, [{'n': 1}, {'n': 2}]), 2)
+        self.assertEqual(coordinator.submit('s', {'engine': 'vectorized'}, [{'n': 1}, {'n': 2}]), 0)
+
+        first, second = worker_a.lease('a'), worker_b.lease('b')
+        self.assertEqual({first['payload']['n'], second['payload']['n']}, {1, 2})
+        self.assertIsNone(worker_a.lease('a'))
+        self.assertTrue(worker_a.complete(first['id'], 'a', {'value': 1}))
+        self.assertFalse(worker_a.complete(second['id'], 'a', {'value': 2}))
+        self.assertEqual(coordinator.progress('s'), {'pending': 0, 'running': 1, 'done': 1, 'failed': 0, 'total': 2})
+        self.assertEqual(coordinator.results('s'), [(first['payload'], {'value': 1})])
+
+    def test_expired_lease_is_taken_over(self):
+        # İşçi öldüğünde kira dolar ve iş başka bir işçiye verilir; eski işçinin sonucu yok sayılır.
+        queue = self.open_queue()
+        queue.submit('s', {}, [{'n': 1}])
+        job = queue.lease('a')
+        self.clock.now += 5
+        self.assertTrue(queue.heartbeat(job['id'], 'a'))
+        self.clock.now += 9
+        self.assertIsNone(queue.lease('b'))
+        self.clock.now += 2
+        retried = queue.lease('b')
+        self.assertEqual((retried['id'], retried['attempts']), (job['id'], 2))
+        self.assertFalse(queue.complete(job['id'], 'a', {}))
+        self.assertTrue(queue.complete(job['id'], 'b', {}))
+
+    def test_failed_jobs_are_retried_up_to_max_attempts(self):
+        queue = self.open_queue()
+        queue.submit('s', {}, [{'n': 1}, {'n': 2}])
+        job = queue.lease('a')
+        queue.fail(job['id'], 'a', 'hata 1')
+        job = queue.lease('a')
+        self.assertEqual(job['attempts'], 2)
+        queue.fail(job['id'], 'a', 'hata 2')
+        self.assertEqual(queue.failures('s'), [({'n': 1}, 'hata 2')])
+
+        # Deneme hakkı biten iş kirası dolunca başarısız sayılır
+        queue.lease('a')
+        self.clock.now += 11
+        queue.lease('b')
+        self.clock.now += 11
+        self.assertIsNone(queue.lease('b'))
+        self.assertEqual(queue.progress('s')['failed'], 2)
+
+        self.assertEqual(queue.retry_failed('s'), 2)
+        self.assertEqual(queue.lease('c')['attempts'], 1)
+
+
+class TestDistributedSweep(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.queue_path = os.path.join(self.tmp_dir, 'queue.sqlite')
+        self.base_path = os.path.join(self.tmp_dir, 'bars')
+        store = BarStore(self.base_path)
+        self.frames = {}
+        for i, symbol in enumerate(['EURUSD', 'GBPUSD']):
+            rng = np.random.default_rng(i)
+            periods = 3000
+            dates = pd.date_range(start='2023-01-01', periods=periods, freq='h')
+            close = 100 + 5 * np.sin(np.linspace(0, 30 + 10 * i, periods)) + rng.normal(0, 0.3, periods)
+            self.frames[symbol] = pd.DataFrame({'time': dates, 'close': close})
+            store.write(symbol, 'H1', self.frames[symbol])
+        self.grid = {'short_window': [10, 20], 'long_window': [60, 90]}
+
+    def coordinator(self, symbols=('EURUSD', 'GBPUSD')):
+        queue = WorkQueue(self.queue_path)
+        self.addCleanup(queue.close)
+        return DistributedSweep(queue, MovingAverageStrategy, symbols, 'H1', 'time', 'close', stake=10,
+                                engine='vectorized', base_path=self.base_path)
+
+    def test_worker_processes_match_local_sweep(self):
+        coordinator = self.coordinator()
+        sweep = coordinator.submit(self.grid)
+        workers = [multiprocessing.Process(target=run_worker, args=(self.queue_path, f'w{i}')) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        progress = coordinator.wait(sweep, poll_interval=0.1, timeout=120, report=lambda progress: None)
+        for worker in workers:
+            worker.join(30)
+        self.assertEqual((progress['done'], progress['failed']), (8, 0))
+
+        table = coordinator.collect(sweep)
+        for symbol, frame in self.frames.items():
+            local = ParameterSweep(MovingAverageStrategy, frame, 'time', 'close', stake=10, engine='vectorized',
+                                   max_workers=1).run(self.grid)
+            remote = table[table['symbol'] == symbol].drop(columns='symbol').reset_index(drop=True)
+            pd.testing.assert_frame_equal(remote, local, check_dtype=False)
+
+    def test_walk_forward_windows_match_local_walk_forward(self):
+        coordinator = self.coordinator(['EURUSD'])
+        sweep = coordinator.submit(self.grid, in_sample=1000, out_of_sample=500, warmup=90)
+        self.assertEqual(QueueWorker(self.queue_path, poll_interval=0.01).run(idle_timeout=0), 16)
+        table = coordinator.collect(sweep)
+
+        local = WalkForward(MovingAverageStrategy, self.frames['EURUSD'], 'time', 'close', stake=10,
+                            engine='vectorized', max_workers=1).run(self.grid, 1000, 500, warmup=90)['windows']
+        np.testing.assert_allclose(table['oos_return'], local['oos_return'])
+        self.assertEqual(table['short_window'].tolist(), local['short_window'].tolist())
+        self.assertEqual(table['oos_start'].tolist(), [str(value) for value in local['oos_start']])
+
+    def test_failing_jobs_are_reported(self):
+        coordinator = self.coordinator(['EURUSD'])
+        sweep = coordinator.submit({'short_window': [10], 'long_window': [60], 'ma_type': ['bad']})
+        QueueWorker(self.queue_path, max_attempts=2, poll_interval=0.01).run(idle_timeout=0)
+        failures = coordinator.queue.failures(sweep)
+        self.assertEqual(len(failures), 1)
+        self.assertIn('ValueError', failures[0][1])
+
+
+if __name__ == '__main__':
+    unittest.main()